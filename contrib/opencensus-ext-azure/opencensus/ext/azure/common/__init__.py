@@ -107,6 +107,7 @@ class Options(BaseObject):
         process_options(self)
 
     _default = BaseObject(
+        compression=None,  # 'gzip' or 'deflate' to compress telemetry
         connection_string=None,
         credential=None,  # Credential class used by AAD auth
         enable_local_storage=True,
@@ -19,11 +19,26 @@ import requests
 from azure.core.exceptions import ClientAuthenticationError
 from azure.identity._exceptions import CredentialUnavailableError
 
+from opencensus.common import http_client
+
 logger = logging.getLogger(__name__)
 _MONITOR_OAUTH_SCOPE = "https://monitor.azure.com//.default"
 
 
 class TransportMixin(object):
+    _http_client = None
+
+    def _get_http_client(self):
+        """Get the HTTP client shared by the exporters with the same
+        networking options, parsing the proxies once."""
+        if self._http_client is None:
+            self._http_client = http_client.get_client(
+                timeout=self.options.timeout,
+                proxies=json.loads(self.options.proxies),
+                compression=self.options.compression,
+            )
+        return self._http_client
+
     def _transmit_from_storage(self):
         if self.storage:
             for blob in self.storage.gets():
@@ -60,12 +75,10 @@ class TransportMixin(object):
                 endpoint += '/v2.1/track'
             else:
                 endpoint += '/v2/track'
-            response = requests.post(
+            response = self._get_http_client().post(
                 url=endpoint,
-                data=json.dumps(envelopes),
+                data=http_client.iter_json_array(envelopes),
                 headers=headers,
-                timeout=self.options.timeout,
-                proxies=json.loads(self.options.proxies),
             )
         except requests.Timeout:
             logger.warning(
@@ -110,8 +110,8 @@ class AzureExporter(BaseExporter, ProcessorMixin, TransportMixin):
             data = Request(
                 id='{}'.format(sd.span_id),
                 duration=utils.timestamp_to_duration(
-                    sd.start_time,
-                    sd.end_time,
+                    sd.start_time_ns or sd.start_time,
+                    sd.end_time_ns or sd.end_time,
                 ),
                 responseCode=str(sd.status.code),
                 success=False,  # Modify based off attributes or status
@@ -147,8 +147,8 @@ class AzureExporter(BaseExporter, ProcessorMixin, TransportMixin):
                 id='{}'.format(sd.span_id),
                 resultCode=str(sd.status.code),
                 duration=utils.timestamp_to_duration(
-                    sd.start_time,
-                    sd.end_time,
+                    sd.start_time_ns or sd.start_time,
+                    sd.end_time_ns or sd.end_time,
                 ),
                 success=False,  # Modify based off attributes or status
                 properties={},
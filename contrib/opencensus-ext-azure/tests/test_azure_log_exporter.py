@@ -114,7 +114,7 @@ class TestAzureLogHandler(unittest.TestCase):
             500
         )
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_exception(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureLogHandler(
@@ -131,7 +131,7 @@ class TestAzureLogHandler(unittest.TestCase):
         post_body = requests_mock.call_args_list[0][1]['data']
         self.assertTrue('ZeroDivisionError' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_exception_with_custom_properties(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureLogHandler(
@@ -157,7 +157,7 @@ class TestAzureLogHandler(unittest.TestCase):
         self.assertTrue('key_1' in post_body)
         self.assertTrue('key_2' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_export_empty(self, request_mock):
         handler = log_exporter.AzureLogHandler(
             instrumentation_key='12345678-1234-5678-abcd-12345678abcd',
@@ -197,7 +197,7 @@ class TestAzureLogHandler(unittest.TestCase):
             '12345678-1234-5678-abcd-12345678abcd')
         handler.close()
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_record_with_custom_properties(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureLogHandler(
@@ -218,7 +218,7 @@ class TestAzureLogHandler(unittest.TestCase):
         self.assertTrue('key_1' in post_body)
         self.assertTrue('key_2' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_with_invalid_custom_properties(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureLogHandler(
@@ -244,7 +244,7 @@ class TestAzureLogHandler(unittest.TestCase):
         self.assertFalse('not_a_dict' in post_body)
         self.assertFalse('key_1' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_record_sampled(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureLogHandler(
@@ -263,7 +263,7 @@ class TestAzureLogHandler(unittest.TestCase):
         self.assertTrue('Hello_World3' in post_body)
         self.assertTrue('Hello_World4' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_record_not_sampled(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureLogHandler(
@@ -321,7 +321,7 @@ class TestAzureEventHandler(unittest.TestCase):
             500
         )
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_exception(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureEventHandler(
@@ -338,7 +338,7 @@ class TestAzureEventHandler(unittest.TestCase):
         post_body = requests_mock.call_args_list[0][1]['data']
         self.assertTrue('ZeroDivisionError' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_exception_with_custom_properties(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureEventHandler(
@@ -364,7 +364,7 @@ class TestAzureEventHandler(unittest.TestCase):
         self.assertTrue('key_1' in post_body)
         self.assertTrue('key_2' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_export_empty(self, request_mock):
         handler = log_exporter.AzureEventHandler(
             instrumentation_key='12345678-1234-5678-abcd-12345678abcd',
@@ -404,7 +404,7 @@ class TestAzureEventHandler(unittest.TestCase):
             '12345678-1234-5678-abcd-12345678abcd')
         handler.close()
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_record_with_custom_properties(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureEventHandler(
@@ -425,7 +425,7 @@ class TestAzureEventHandler(unittest.TestCase):
         self.assertTrue('key_1' in post_body)
         self.assertTrue('key_2' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_with_invalid_custom_properties(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureEventHandler(
@@ -451,7 +451,7 @@ class TestAzureEventHandler(unittest.TestCase):
         self.assertFalse('not_a_dict' in post_body)
         self.assertFalse('key_1' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_record_sampled(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureEventHandler(
@@ -470,7 +470,7 @@ class TestAzureEventHandler(unittest.TestCase):
         self.assertTrue('Hello_World3' in post_body)
         self.assertTrue('Hello_World4' in post_body)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_log_record_not_sampled(self, requests_mock):
         logger = logging.getLogger(self.id())
         handler = log_exporter.AzureEventHandler(
@@ -75,7 +75,7 @@ class TestAzureMetricsExporter(unittest.TestCase):
                 max_batch_size=-1
             ))
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_export_metrics(self, requests_mock):
         metric = create_metric()
         exporter = MetricsExporter(
@@ -99,7 +99,7 @@ class TestAzureMetricsExporter(unittest.TestCase):
 
         self.assertIsNone(exporter.export_metrics([metric]))
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_export_metrics_empty(self, requests_mock):
         exporter = MetricsExporter(
             instrumentation_key='12345678-1234-5678-abcd-12345678abcd')
@@ -107,7 +107,7 @@ class TestAzureMetricsExporter(unittest.TestCase):
 
         self.assertEqual(len(requests_mock.call_args_list), 0)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_export_metrics_full_batch(self, requests_mock):
         metric = create_metric()
         exporter = MetricsExporter(
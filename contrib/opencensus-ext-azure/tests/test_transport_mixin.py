@@ -58,7 +58,7 @@ class TestTransportMixin(unittest.TestCase):
         mixin = TransportMixin()
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = None
                 mixin._transmit_from_storage()
 
@@ -68,7 +68,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post', throw(requests.Timeout)):
+            with mock.patch('requests.Session.post', throw(requests.Timeout)):
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
             self.assertEqual(len(os.listdir(mixin.storage.path)), 1)
@@ -79,7 +79,8 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post', throw(requests.RequestException)):
+            with mock.patch('requests.Session.post',
+                            throw(requests.RequestException)):
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
             self.assertEqual(len(os.listdir(mixin.storage.path)), 1)
@@ -90,7 +91,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post', throw(CredentialUnavailableError)):  # noqa: E501
+            with mock.patch('requests.Session.post', throw(CredentialUnavailableError)):  # noqa: E501
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
             self.assertEqual(len(os.listdir(mixin.storage.path)), 0)
@@ -101,7 +102,8 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post', throw(ClientAuthenticationError)):
+            with mock.patch('requests.Session.post',
+                            throw(ClientAuthenticationError)):
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
             self.assertEqual(len(os.listdir(mixin.storage.path)), 1)
@@ -112,12 +114,12 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post', throw(Exception)):
+            with mock.patch('requests.Session.post', throw(Exception)):
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
             self.assertEqual(len(os.listdir(mixin.storage.path)), 0)
 
-    @mock.patch('requests.post', return_value=mock.Mock())
+    @mock.patch('requests.Session.post', return_value=mock.Mock())
     def test_transmission_lease_failure(self, requests_mock):
         requests_mock.return_value = MockResponse(200, 'unknown')
         mixin = TransportMixin()
@@ -138,7 +140,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(200, None)
                 del post.return_value.text
                 mixin._transmit_from_storage()
@@ -152,12 +154,50 @@ class TestTransportMixin(unittest.TestCase):
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(200, 'unknown')
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
             self.assertEqual(len(os.listdir(mixin.storage.path)), 0)
 
+    def test_http_client(self):
+        mixin = TransportMixin()
+        mixin.options = Options(
+            proxies='{"https": "https://test-proxy.com"}',
+            timeout=5.0,
+        )
+        with mock.patch('json.loads', wraps=json.loads) as loads:
+            client = mixin._get_http_client()
+            self.assertIs(mixin._get_http_client(), client)
+        loads.assert_called_once_with(mixin.options.proxies)
+        self.assertEqual(client.timeout, 5.0)
+        self.assertEqual(
+            client.session.proxies['https'], 'https://test-proxy.com')
+        with mock.patch('requests.Session.post') as post:
+            client.post('https://host', data='data')
+        self.assertEqual(post.call_args[1]['proxies'],
+                         {'https': 'https://test-proxy.com'})
+
+        other = TransportMixin()
+        other.options = Options(
+            proxies='{"https": "https://test-proxy.com"}',
+            timeout=5.0,
+        )
+        self.assertIs(other._get_http_client(), client)
+
+    def test_transmission_compressed(self):
+        import zlib
+
+        mixin = TransportMixin()
+        mixin.options = Options(compression='gzip')
+        with mock.patch('requests.Session.post') as post:
+            post.return_value = MockResponse(200, 'unknown')
+            self.assertEqual(mixin._transmit([1, 2, 3]), 0)
+        kwargs = post.call_args[1]
+        self.assertEqual(kwargs['headers']['Content-Encoding'], 'gzip')
+        self.assertEqual(
+            zlib.decompress(kwargs['data'], 16 + zlib.MAX_WBITS), b'[1, 2, 3]')
+
     def test_transmission_auth(self):
         mixin = TransportMixin()
         mixin.options = Options()
@@ -177,7 +217,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(200, 'unknown')
                 mixin._transmit_from_storage()
                 post.assert_called_with(
@@ -185,7 +225,7 @@ class TestTransportMixin(unittest.TestCase):
                     data=data,
                     headers=headers,
                     timeout=10.0,
-                    proxies={}
+                    proxies={},
                 )
             credential.get_token.assert_called_with(_MONITOR_OAUTH_SCOPE)
             self.assertIsNone(mixin.storage.get())
@@ -198,7 +238,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(206, 'unknown')
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
@@ -210,7 +250,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3, 4, 5])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(206, json.dumps({
                     'itemsReceived': 5,
                     'itemsAccepted': 3,
@@ -237,7 +277,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(206, json.dumps({
                     'itemsReceived': 3,
                     'itemsAccepted': 2,
@@ -258,7 +298,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3, 4, 5])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(206, json.dumps({
                     'itemsReceived': 5,
                     'itemsAccepted': 3,
@@ -279,7 +319,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(401, '{}')
                 mixin._transmit_from_storage()
             self.assertEqual(len(os.listdir(mixin.storage.path)), 1)
@@ -290,7 +330,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(500, '{}')
                 mixin._transmit_from_storage()
             self.assertIsNone(mixin.storage.get())
@@ -302,7 +342,7 @@ class TestTransportMixin(unittest.TestCase):
         with LocalFileStorage(os.path.join(TEST_FOLDER, self.id())) as stor:
             mixin.storage = stor
             mixin.storage.put([1, 2, 3])
-            with mock.patch('requests.post') as post:
+            with mock.patch('requests.Session.post') as post:
                 post.return_value = MockResponse(400, '{}')
                 mixin._transmit_from_storage()
             self.assertEqual(len(os.listdir(mixin.storage.path)), 0)
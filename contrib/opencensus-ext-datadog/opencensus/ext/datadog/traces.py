@@ -17,6 +17,7 @@ from datetime import datetime
 
 import bitarray
 
+from opencensus.common import http_client
 from opencensus.common.transports import sync
 from opencensus.common.utils import ISO_DATETIME_REGEX
 from opencensus.ext.datadog.transport import DDTransport
@@ -42,11 +43,28 @@ class Options(object):
     :type global_tags: dict
     :param global_tags: global_tags is a set of tags that will be
     applied to all exported spans.
+
+    :type client: :class:`~opencensus.common.http_client.HttpClient`
+    :param client: client is the HTTP client sending the traces, it defaults
+    to a client shared with the other exporters.
+
+    :type compression: str
+    :param compression: compression is the compression of the requests,
+    'gzip', 'deflate' or None, it defaults to None. It is not used when a
+    client is given.
+
+    :type compression_level: int
+    :param compression_level: compression_level is the compression level,
+    from 1 to 9.
     """
     def __init__(self, service='', trace_addr='localhost:8126',
-                 global_tags={}):
+                 global_tags={}, client=None, compression=None,
+                 compression_level=http_client.DEFAULT_COMPRESSION_LEVEL):
         self._service = service
         self._trace_addr = trace_addr
+        self._client = client
+        self._compression = compression
+        self._compression_level = compression_level
         for k, v in global_tags.items():
             if not isinstance(k, str) or not isinstance(v, str):
                 raise TypeError(
@@ -71,6 +89,24 @@ class Options(object):
         """
         return self._global_tags
 
+    @property
+    def client(self):
+        """ Specifies the HTTP client sending the traces.
+        """
+        return self._client
+
+    @property
+    def compression(self):
+        """ Specifies the compression of the requests.
+        """
+        return self._compression
+
+    @property
+    def compression_level(self):
+        """ Specifies the compression level of the requests.
+        """
+        return self._compression_level
+
 
 class DatadogTraceExporter(base_exporter.Exporter):
     """ A exporter that send traces and trace spans to Datadog.
@@ -87,7 +123,10 @@ class DatadogTraceExporter(base_exporter.Exporter):
     def __init__(self, options, transport=sync.SyncTransport):
         self._options = options
         self._transport = transport(self)
-        self._dd_transport = DDTransport(options.trace_addr)
+        self._dd_transport = DDTransport(
+            options.trace_addr, options.client,
+            compression=options.compression,
+            compression_level=options.compression_level)
 
     @property
     def transport(self):
@@ -1,6 +1,7 @@
+import json
 import platform
 
-import requests
+from opencensus.common import http_client
 
 
 class DDTransport(object):
@@ -9,9 +10,28 @@ class DDTransport(object):
     :type trace_addr: str
     :param trace_addr: trace_addr specifies the host[:port] address of the
     Datadog Trace Agent.
+
+    :type client: :class:`~opencensus.common.http_client.HttpClient`
+    :param client: client is the HTTP client sending the traces, it defaults
+    to a client shared with the other exporters.
+
+    :type compression: str
+    :param compression: compression is the compression of the requests,
+    'gzip', 'deflate' or None. It is not used when a client is given.
+
+    :type compression_level: int
+    :param compression_level: compression_level is the compression level,
+    from 1 to 9.
     """
-    def __init__(self, trace_addr):
+    def __init__(self, trace_addr, client=None, compression=None,
+                 compression_level=http_client.DEFAULT_COMPRESSION_LEVEL):
         self._trace_addr = trace_addr
+        if client is None:
+            client = http_client.get_client(
+                compression=compression,
+                compression_level=compression_level)
+        self._client = client
+        self._url = "http://" + trace_addr + "/v0.4/traces"
 
         self._headers = {
             "Datadog-Meta-Lang": "python",
@@ -41,6 +61,6 @@ class DDTransport(object):
         :param trace: Trace dictionary
         """
 
-        requests.post("http://" + self.trace_addr + "/v0.4/traces",
-                      json=trace,
-                      headers=self.headers)
+        self._client.post(self._url,
+                          data=json.dumps(trace),
+                          headers=self.headers)
@@ -1,15 +1,47 @@
-# import unittest
+import unittest
 
-# import mock
+import mock
 
-# from opencensus.ext.datadog.transport import DDTransport
+from opencensus.common import http_client
+from opencensus.ext.datadog.traces import DatadogTraceExporter, Options
+from opencensus.ext.datadog.transport import DDTransport
 
 
-# class TestTraces(unittest.TestCase):
-#     def setUp(self):
-#         pass
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        pass
 
-#     @mock.patch('requests.post', return_value=None)
-#     def test_send_traces(self, mr_mock):
-#         transport = DDTransport('test')
-#         transport.send_traces({})
+    def test_send_traces(self):
+        client = mock.Mock()
+        transport = DDTransport('test', client)
+        transport.send_traces({})
+        client.post.assert_called_once_with(
+            'http://test/v0.4/traces', data='{}', headers=transport.headers)
+
+    def test_default_client(self):
+        transport = DDTransport('test')
+        self.assertIs(transport._client, http_client.get_client())
+        self.assertIsNone(transport._client.compression)
+
+    def test_compression(self):
+        transport = DDTransport(
+            'test', compression=http_client.GZIP, compression_level=1)
+        self.assertIs(transport._client, http_client.get_client(
+            compression=http_client.GZIP, compression_level=1))
+
+    def test_compression_unknown(self):
+        with self.assertRaises(ValueError):
+            DDTransport('test', compression='br')
+
+    def test_exporter_compression(self):
+        exporter = DatadogTraceExporter(Options(
+            compression=http_client.DEFLATE, compression_level=9))
+        client = exporter._dd_transport._client
+        self.assertEqual(client.compression, http_client.DEFLATE)
+        self.assertEqual(client.compression_level, 9)
+
+    def test_exporter_client(self):
+        client = mock.Mock()
+        exporter = DatadogTraceExporter(Options(
+            client=client, compression=http_client.GZIP))
+        self.assertIs(exporter._dd_transport._client, client)
@@ -201,7 +201,12 @@ class OpencensusMiddleware(MiddlewareMixin):
                 span_context=span_context,
                 sampler=self.sampler,
                 exporter=self.exporter,
-                propagator=self.propagator)
+                propagator=self.propagator,
+                sampling_attributes={
+                    HTTP_HOST: request.get_host(),
+                    HTTP_METHOD: request.method,
+                    HTTP_PATH: str(request.path),
+                })
 
             # Span name is being set at process_view
             span = tracer.start_span()
@@ -129,6 +129,38 @@ class TestOpencensusMiddleware(unittest.TestCase):
 
         self.assertEqual(span.name, 'mock.mock.Mock')
 
+    def test_process_request_rule_based_sampler(self):
+        from opencensus.ext.django import middleware
+        from opencensus.trace.samplers import rule_based
+        from opencensus.trace.tracers import noop_tracer
+
+        django_request = RequestFactory().get('/wiki/Rabbit')
+
+        settings = type('Test', (object,), {})
+        settings.OPENCENSUS = {
+            'TRACE': {
+                'SAMPLER': rule_based.RuleBasedSampler([
+                    rule_based.SamplingRule(0, path_prefix='/wiki'),
+                ], default=samplers.AlwaysOnSampler()),
+            }
+        }
+        patch_settings = mock.patch(
+            'django.conf.settings',
+            settings)
+
+        with patch_settings:
+            middleware_obj = middleware.OpencensusMiddleware()
+
+        middleware_obj.process_request(django_request)
+        tracer = middleware._get_current_tracer()
+
+        self.assertEqual(tracer.sampling_attributes, {
+            'http.host': u'testserver',
+            'http.method': 'GET',
+            'http.path': u'/wiki/Rabbit',
+        })
+        self.assertIsInstance(tracer.tracer, noop_tracer.NoopTracer)
+
     def test_excludelist_path(self):
         from opencensus.ext.django import middleware
 
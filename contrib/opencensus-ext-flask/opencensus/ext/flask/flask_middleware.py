@@ -138,18 +138,30 @@ class FlaskMiddleware(object):
         try:
             span_context = self.propagator.from_headers(flask.request.headers)
 
+            # Set the span name as the name of the current module name
+            span_name = '[{}]{}'.format(
+                flask.request.method,
+                flask.request.url)
+            sampling_attributes = {
+                HTTP_HOST: flask.request.host,
+                HTTP_METHOD: flask.request.method,
+                HTTP_PATH: flask.request.path,
+            }
+            url_rule = flask.request.url_rule
+            if url_rule is not None:
+                sampling_attributes[HTTP_ROUTE] = url_rule.rule
+
             tracer = tracer_module.Tracer(
                 span_context=span_context,
                 sampler=self.sampler,
                 exporter=self.exporter,
-                propagator=self.propagator)
+                propagator=self.propagator,
+                sampling_name=span_name,
+                sampling_attributes=sampling_attributes)
 
             span = tracer.start_span()
             span.span_kind = span_module.SpanKind.SERVER
-            # Set the span name as the name of the current module name
-            span.name = '[{}]{}'.format(
-                flask.request.method,
-                flask.request.url)
+            span.name = span_name
             tracer.add_attribute_to_current_span(
                 HTTP_HOST, flask.request.host
             )
@@ -268,6 +268,34 @@ class TestFlaskMiddleware(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test__before_request_rule_based_sampler(self):
+        from opencensus.trace.samplers import rule_based
+        from opencensus.trace.tracers import noop_tracer
+
+        sampler = rule_based.RuleBasedSampler([
+            rule_based.SamplingRule(0, route='/wiki/<entry>'),
+        ], default=samplers.AlwaysOnSampler())
+        app = self.create_app()
+        flask_middleware.FlaskMiddleware(app=app, sampler=sampler)
+
+        with app.test_request_context(path='/wiki/Rabbit'):
+            app.preprocess_request()
+            tracer = execution_context.get_opencensus_tracer()
+            self.assertEqual(tracer.sampling_attributes, {
+                'http.host': u'localhost',
+                'http.method': u'GET',
+                'http.path': u'/wiki/Rabbit',
+                'http.route': u'/wiki/<entry>',
+            })
+            self.assertEqual(tracer.sampling_name,
+                             '[GET]http://localhost/wiki/Rabbit')
+            self.assertIsInstance(tracer.tracer, noop_tracer.NoopTracer)
+
+        with app.test_request_context(path='/'):
+            app.preprocess_request()
+            tracer = execution_context.get_opencensus_tracer()
+            self.assertNotIsInstance(tracer.tracer, noop_tracer.NoopTracer)
+
     def test__after_request_sampled(self):
         flask_trace_header = 'traceparent'
         trace_id = '2dd43a1d6b2549c6bc2a1a54c2fc0b05'
@@ -173,8 +173,10 @@ class JaegerExporter(base_exporter.Exporter):
         jaeger_spans = []
 
         for span in span_datas:
-            start_timestamp_ms = timestamp_to_microseconds(span.start_time)
-            end_timestamp_ms = timestamp_to_microseconds(span.end_time)
+            start_timestamp_ms = timestamp_to_microseconds(
+                span.start_time_ns or span.start_time)
+            end_timestamp_ms = timestamp_to_microseconds(
+                span.end_time_ns or span.end_time)
             duration_ms = end_timestamp_ms - start_timestamp_ms
 
             tags = _extract_tags(span.attributes)
@@ -45,6 +45,13 @@ class StatsExporter(object):
         """
         metric_protos = []
         for metric in metrics:
+            if (metric.descriptor.type ==
+                    metric_descriptor.MetricDescriptorType.SUMMARY):
+                # TODO: export SUMMARY metrics, #567
+                logging.warning(
+                    'Skipping summary metric %s, summaries are not '
+                    'supported yet', metric.descriptor.name)
+                continue
             metric_protos.append(_get_metric_proto(metric))
 
         self._rpc_handler.send(
@@ -169,6 +169,30 @@ class TestStatsExporter(unittest.TestCase):
             handler.send.call_args[0]
             [0].metrics[0].timeseries[0].points[0].double_value, 2.5)
 
+    def test_export_skips_summaries(self):
+        summary_view = view_module.View(
+            'summary', '', [FRONTEND_KEY], VIDEO_SIZE_MEASURE,
+            aggregation_module.SummaryAggregation())
+        sum_view = view_module.View(
+            'sum', '', [FRONTEND_KEY], VIDEO_SIZE_MEASURE,
+            aggregation_module.SumAggregation())
+        metrics = []
+        for view in (summary_view, sum_view):
+            v_data = view_data_module.ViewData(view=view,
+                                               start_time=TEST_TIME_STR,
+                                               end_time=TEST_TIME_STR)
+            v_data.record(context=tag_map_module.TagMap(), value=2.5,
+                          timestamp=None)
+            metrics.append(metric_utils.view_data_to_metric(v_data, TEST_TIME))
+
+        handler = mock.Mock(spec=ocagent.ExportRpcHandler)
+        with mock.patch('logging.warning') as mock_warning:
+            ocagent.StatsExporter(handler).export_metrics(metrics)
+
+        mock_warning.assert_called_once_with(mock.ANY, 'summary')
+        [metric_proto] = handler.send.call_args[0][0].metrics
+        self.assertEqual(metric_proto.metric_descriptor.name, 'sum')
+
     def test_export_exemplar(self):
         metric = _create_metric(
             metric_descriptor.MetricDescriptorType.CUMULATIVE_DISTRIBUTION,
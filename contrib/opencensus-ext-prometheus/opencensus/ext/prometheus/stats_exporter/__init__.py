@@ -12,22 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from six.moves.socketserver import ThreadingMixIn
+
+import math
 import re
+import threading
+import zlib
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
 
-from prometheus_client import start_http_server
+from prometheus_client import CONTENT_TYPE_LATEST, start_http_server
 from prometheus_client.core import (
     REGISTRY,
     CollectorRegistry,
     CounterMetricFamily,
     GaugeMetricFamily,
     HistogramMetricFamily,
+    SummaryMetricFamily,
     UnknownMetricFamily,
 )
+from prometheus_client.utils import floatToGoString
 
 from opencensus.common.transports import sync
 from opencensus.stats import aggregation_data as aggregation_data_module
 from opencensus.stats import base_exporter
 
+_GZIP_COMPRESSION_LEVEL = 6
+
 
 class Options(object):
     """ Options contains options for configuring the exporter.
@@ -48,16 +58,25 @@ class Options(object):
 
     :type registry: :class:`~prometheus_client.core.CollectorRegistry`
     :param registry: A Prometheus collector registry instance.
+
+    :type direct_exposition: bool
+    :param direct_exposition: Serve the text rendered by
+                              :meth:`Collector.render`, optionally gzipped,
+                              instead of going through ``prometheus_client``
+                              metric objects. Only the OpenCensus views are
+                              served then.
     """
     def __init__(self,
                  namespace='',
                  port=8000,
                  address='',
-                 registry=CollectorRegistry()):
+                 registry=CollectorRegistry(),
+                 direct_exposition=False):
         self._namespace = namespace
         self._registry = registry
         self._port = int(port)
         self._address = address
+        self._direct_exposition = direct_exposition
 
     @property
     def registry(self):
@@ -83,6 +102,202 @@ class Options(object):
         """
         return self._address
 
+    @property
+    def direct_exposition(self):
+        """ Whether to serve the text rendered by the collector
+        """
+        return self._direct_exposition
+
+
+_INT_TYPES = (int, type(1 << 64))
+
+
+def _format_value(value):
+    """Format a sample value, like prometheus_client but faster."""
+    if type(value) in _INT_TYPES:
+        return str(value)
+    value = float(value)
+    if math.isinf(value) or math.isnan(value):
+        return floatToGoString(value)
+    return repr(value)
+
+
+def _format_quantile(percentile):
+    """Format a percentile as the value of a quantile label, e.g. 99.9 as
+    0.999 rather than 0.9990000000000001."""
+    return '{:.12g}'.format(percentile / 100.0)
+
+
+def _escape_help(text):
+    return text.replace('\\', r'\\').replace('\n', r'\n')
+
+
+def _escape_label_value(value):
+    return value.replace('\\', r'\\').replace('\n', r'\n').replace(
+        '"', r'\"')
+
+
+class _ViewExposition(object):
+    """Cached text of a view's metadata, series labels and bucket bounds.
+
+    :type desc: dict
+    :param desc: The map that describes view definition
+    """
+    def __init__(self, desc):
+        self.name = desc['name']
+        self.documentation = _escape_help(desc['documentation'] or '')
+        self.label_keys = desc['labels']
+        # Header lines by aggregation data type
+        self.headers = {}
+        # Sample line prefixes by tag values
+        self.prefixes = {}
+        self.bounds = None
+        self.le_labels = None
+
+    def get_header(self, name, metric_type):
+        header = self.headers.get(metric_type)
+        if header is None:
+            header = self.headers[metric_type] = \
+                '# HELP {0} {1}\n# TYPE {0} {2}\n'.format(
+                    name, self.documentation, metric_type)
+        return header
+
+    def get_labels(self, tag_values):
+        # Prometheus requires that all tag values be strings hence
+        # the need to cast none to the empty string before exporting.
+        return ','.join(
+            '{}="{}"'.format(key, _escape_label_value(tv or ''))
+            for key, tv in zip(self.label_keys, tag_values))
+
+    def check_tag_values(self, tag_values):
+        if len(tag_values) != len(self.label_keys):
+            raise ValueError(
+                'Expected {} tag values, got {}'.format(
+                    len(self.label_keys), len(tag_values)))
+
+    def get_prefixes(self, tag_values, suffixes):
+        """Get the start of the sample lines of a series, up to the value,
+        for each sample name suffix."""
+        prefixes = self.prefixes.get(tag_values)
+        if prefixes is None:
+            self.check_tag_values(tag_values)
+            labels = self.get_labels(tag_values)
+            prefixes = self.prefixes[tag_values] = tuple(
+                self.name + suffix + ('{' + labels + '} ' if labels else ' ')
+                for suffix in suffixes)
+        return prefixes
+
+    def get_bucket_prefix(self, tag_values, suffix='_bucket', label='le'):
+        """Get the start of the bucket or quantile lines of a series, up to
+        the label value, and of the count and sum lines."""
+        prefixes = self.prefixes.get(tag_values)
+        if prefixes is None:
+            self.check_tag_values(tag_values)
+            labels = self.get_labels(tag_values)
+            series = '{' + labels + '} ' if labels else ' '
+            prefixes = self.prefixes[tag_values] = (
+                self.name + suffix + '{' + (labels + ',' if labels else '') +
+                label + '="',
+                self.name + '_count' + series,
+                self.name + '_sum' + series,
+            )
+        return prefixes
+
+    def get_le_labels(self, bounds):
+        if bounds != self.bounds:
+            if bounds != sorted(bounds):
+                raise ValueError(
+                    'Bucket bounds must be sorted: {}'.format(bounds))
+            # Formatted like the le labels of to_metric, to keep the same
+            # series when switching between the two.
+            self.le_labels = [str(bound) + '"} ' for bound in bounds]
+            self.le_labels.append('+Inf"} ')
+            self.bounds = list(bounds)
+        return self.le_labels
+
+    def prune(self, tag_value_aggregation_data_map):
+        """Drop the cached prefixes of series that no longer exist."""
+        if len(self.prefixes) > 2 * len(tag_value_aggregation_data_map):
+            self.prefixes = {
+                tag_values: prefixes
+                for tag_values, prefixes in self.prefixes.items()
+                if tag_values in tag_value_aggregation_data_map}
+
+    def render(self, items, lines):
+        """Append the exposition text of a view's series to ``lines``.
+
+        :type items: list of tuples
+        :param items: The tag values and aggregation data of each series.
+
+        :type lines: list of str
+        :param lines: The text to append to.
+        """
+        agg_type = type(items[0][1])
+        if issubclass(agg_type,
+                      aggregation_data_module.CountAggregationData):
+            name = self.name
+            if not name.endswith('_total'):
+                name += '_total'
+            lines.append(self.get_header(name, 'counter'))
+            suffix = name[len(self.name):]
+            for tag_values, agg_data in items:
+                prefix, = self.get_prefixes(tag_values, (suffix,))
+                lines.append(prefix + _format_value(agg_data.count_data) +
+                             '\n')
+
+        elif issubclass(agg_type,
+                        aggregation_data_module.DistributionAggregationData):
+            lines.append(self.get_header(self.name, 'histogram'))
+            for tag_values, agg_data in items:
+                le_labels = self.get_le_labels(agg_data.bounds)
+                bucket_prefix, count_prefix, sum_prefix = \
+                    self.get_bucket_prefix(tag_values)
+                # Prometheus buckets expect cumulative count, the +Inf
+                # bucket is the total count.
+                cum_count = 0
+                for le_label, count in zip(le_labels[:-1],
+                                           agg_data.counts_per_bucket):
+                    cum_count += count
+                    lines.append(bucket_prefix + le_label + str(cum_count) +
+                                 '\n')
+                count = _format_value(agg_data.count_data)
+                lines.append(bucket_prefix + le_labels[-1] + count + '\n')
+                lines.append(count_prefix + count + '\n')
+                lines.append(sum_prefix + _format_value(agg_data.sum) + '\n')
+
+        elif issubclass(agg_type,
+                        aggregation_data_module.SummaryAggregationData):
+            lines.append(self.get_header(self.name, 'summary'))
+            for tag_values, agg_data in items:
+                quantile_prefix, count_prefix, sum_prefix = \
+                    self.get_bucket_prefix(tag_values, '', 'quantile')
+                snapshot = agg_data.get_snapshot()
+                for vap in snapshot.value_at_percentiles:
+                    lines.append(quantile_prefix +
+                                 _format_quantile(vap.percentile) + '"} ' +
+                                 _format_value(vap.value) + '\n')
+                lines.append(count_prefix +
+                             _format_value(agg_data.count_data) + '\n')
+                lines.append(sum_prefix +
+                             _format_value(agg_data.sum_data) + '\n')
+
+        elif issubclass(agg_type,
+                        aggregation_data_module.SumAggregationData):
+            lines.append(self.get_header(self.name, 'untyped'))
+            for tag_values, agg_data in items:
+                prefix, = self.get_prefixes(tag_values, ('',))
+                lines.append(prefix + _format_value(agg_data.sum_data) + '\n')
+
+        elif issubclass(agg_type,
+                        aggregation_data_module.LastValueAggregationData):
+            lines.append(self.get_header(self.name, 'gauge'))
+            for tag_values, agg_data in items:
+                prefix, = self.get_prefixes(tag_values, ('',))
+                lines.append(prefix + _format_value(agg_data.value) + '\n')
+
+        else:
+            raise ValueError("unsupported aggregation type %s" % agg_type)
+
 
 class Collector(object):
     """ Collector represents the Prometheus Collector object
@@ -94,6 +309,8 @@ class Collector(object):
         self._registry = options.registry
         self._view_name_to_data_map = view_name_to_data_map
         self._registered_views = {}
+        self._expositions = {}
+        self._expositions_lock = threading.Lock()
 
     @property
     def options(self):
@@ -160,6 +377,7 @@ class Collector(object):
 
         :rtype: :class:`~prometheus_client.core.CounterMetricFamily` or
                 :class:`~prometheus_client.core.HistogramMetricFamily` or
+                :class:`~prometheus_client.core.SummaryMetricFamily` or
                 :class:`~prometheus_client.core.UnknownMetricFamily` or
                 :class:`~prometheus_client.core.GaugeMetricFamily`
         :returns: A Prometheus metric object
@@ -207,6 +425,22 @@ class Collector(object):
                               sum_value=agg_data.sum,)
             return metric
 
+        elif isinstance(agg_data,
+                        aggregation_data_module.SummaryAggregationData):
+            metric = SummaryMetricFamily(name=metric_name,
+                                         documentation=metric_description,
+                                         labels=label_keys)
+            labels = dict(zip(label_keys, tag_values))
+            snapshot = agg_data.get_snapshot()
+            for vap in snapshot.value_at_percentiles:
+                quantile_labels = dict(
+                    labels, quantile=_format_quantile(vap.percentile))
+                metric.add_sample(metric_name, quantile_labels, vap.value)
+            metric.add_metric(labels=tag_values,
+                              count_value=agg_data.count_data,
+                              sum_value=agg_data.sum_data)
+            return metric
+
         elif isinstance(agg_data,
                         aggregation_data_module.SumAggregationData):
             metric = UnknownMetricFamily(name=metric_name,
@@ -244,6 +478,101 @@ class Collector(object):
                 metric = self.to_metric(desc, tag_values, agg_data)
                 yield metric
 
+    def _get_exposition(self, v_name, desc):
+        exposition = self._expositions.get(v_name)
+        if exposition is None or exposition.label_keys is not desc['labels']:
+            exposition = self._expositions[v_name] = _ViewExposition(desc)
+        return exposition
+
+    def render(self):
+        """Render the statistics in the Prometheus text format.
+
+        Unlike :meth:`collect`, the text is built straight from the view
+        data, with the metadata, labels and bucket bounds of each view
+        formatted once and cached across scrapes.
+
+        :rtype: str
+        :returns: The exposition text of all registered views.
+        """
+        lines = []
+        # Scrapes may run concurrently, the lock keeps the caches coherent.
+        with self._expositions_lock:
+            for v_name, view_data in list(self.view_name_to_data_map.items()):
+                desc = self.registered_views.get(v_name)
+                if desc is None:
+                    continue
+                data_map = view_data.tag_value_aggregation_data_map
+                items = list(data_map.items())
+                if not items:
+                    continue
+                exposition = self._get_exposition(v_name, desc)
+                exposition.render(items, lines)
+                exposition.prune(data_map)
+        return ''.join(lines)
+
+    def render_bytes(self, accept_encoding=None):
+        """Render the statistics, gzipped if the client accepts it.
+
+        :type accept_encoding: str
+        :param accept_encoding: (Optional) The Accept-Encoding request header.
+
+        :rtype: tuple of bytes and list of tuples
+        :returns: The response body and headers.
+        """
+        body = self.render().encode('utf-8')
+        headers = [('Content-Type', CONTENT_TYPE_LATEST)]
+        if accept_encoding and 'gzip' in accept_encoding:
+            compressor = zlib.compressobj(
+                _GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+            headers.append(('Content-Encoding', 'gzip'))
+        return body, headers
+
+
+def make_wsgi_app(collector):
+    """Create a WSGI app serving the text rendered by a collector.
+
+    :type collector:
+        :class:`~opencensus.ext.prometheus.stats_exporter.Collector`
+    :param collector: The collector to render.
+    """
+    def prometheus_app(environ, start_response):
+        body, headers = collector.render_bytes(
+            environ.get('HTTP_ACCEPT_ENCODING'))
+        start_response('200 OK', headers)
+        return [body]
+    return prometheus_app
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _SilentHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        """Don't log each scrape."""
+
+
+def start_direct_http_server(port, addr, collector):
+    """Serve the text rendered by a collector from a daemon thread.
+
+    :type port: int
+    :param port: The port to listen on.
+
+    :type addr: str
+    :param addr: The address to listen on.
+
+    :type collector:
+        :class:`~opencensus.ext.prometheus.stats_exporter.Collector`
+    :param collector: The collector to render.
+    """
+    httpd = make_server(addr, port, make_wsgi_app(collector),
+                        _ThreadingWSGIServer, handler_class=_SilentHandler)
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return httpd
+
 
 class PrometheusStatsExporter(base_exporter.StatsExporter):
     """ Exporter exports stats to Prometheus, users need
@@ -330,6 +659,11 @@ class PrometheusStatsExporter(base_exporter.StatsExporter):
     def serve_http(self):
         """ serve_http serves the Prometheus endpoint.
         """
+        if self.options.direct_exposition:
+            start_direct_http_server(self.options.port,
+                                     str(self.options.address),
+                                     self.collector)
+            return
         start_http_server(port=self.options.port,
                           addr=str(self.options.address))
 
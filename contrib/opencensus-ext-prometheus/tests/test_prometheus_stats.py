@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import unittest
+import zlib
 from datetime import datetime
 
 import mock
+from prometheus_client import CONTENT_TYPE_LATEST
 from prometheus_client.core import Sample
+from prometheus_client.parser import text_string_to_metric_families
 
 from opencensus.ext.prometheus import stats_exporter as prometheus
 from opencensus.stats import aggregation as aggregation_module
@@ -324,3 +327,170 @@ class TestPrometheusStatsExporter(unittest.TestCase):
         self.assertEqual("demo_latency", v_name)
         label_name = prometheus.sanitize("my.org/demo/key1")
         self.assertEqual("my_org_demo_key1", label_name)
+
+
+class TestCollectorRender(unittest.TestCase):
+
+    def setUp(self):
+        self.options = prometheus.Options("test4", 8001, "localhost",
+                                          mock.Mock())
+        self.collector = prometheus.Collector(options=self.options)
+
+    def add_view(self, name, aggregation, values, columns=(FRONTEND_KEY,),
+                 description="processed video size over time"):
+        view = view_module.View(name, description, list(columns),
+                                VIDEO_SIZE_MEASURE, aggregation)
+        view_data = view_data_module.ViewData(
+            view=view, start_time=None, end_time=None)
+        for tag_value, value in values:
+            tag_map = tag_map_module.TagMap()
+            if tag_value is not None:
+                tag_map.insert(FRONTEND_KEY, tag_value_module.TagValue(
+                    tag_value))
+            view_data.record(tag_map, value, None)
+        self.collector.add_view_data(view_data)
+        return view_data
+
+    @staticmethod
+    def get_samples(families):
+        return sorted(
+            (sample.name, sorted(sample.labels.items()), float(sample.value))
+            for family in families
+            for sample in family.samples)
+
+    def test_render_matches_collect(self):
+        self.add_view("count", aggregation_module.CountAggregation(),
+                      [("ios", 1), ("ios", 1), ("web", 1)])
+        self.add_view("sum", aggregation_module.SumAggregation(),
+                      [("ios", 1.5), ("web", 2)])
+        self.add_view("last", aggregation_module.LastValueAggregation(),
+                      [("ios", 3)])
+        self.add_view("dist", VIDEO_SIZE_DISTRIBUTION,
+                      [("ios", 1 * MiB), ("ios", 20 * MiB),
+                       ("web", 300 * MiB)])
+        self.add_view("no_tags", aggregation_module.CountAggregation(),
+                      [(None, 1)], columns=())
+        self.add_view("summary", aggregation_module.SummaryAggregation(
+            [50, 99.9]), [("ios", 1), ("ios", 2), ("ios", 3), ("web", 4)])
+
+        text = self.collector.render()
+
+        self.assertEqual(
+            self.get_samples(text_string_to_metric_families(text)),
+            self.get_samples(self.collector.collect()))
+        # One header per view
+        self.assertEqual(text.count('# TYPE test4_dist histogram\n'), 1)
+        self.assertIn('test4_dist_bucket{myorg_keys_frontend="ios",'
+                      'le="16777216.0"} 1\n', text)
+        self.assertIn('test4_no_tags_total 1\n', text)
+        self.assertEqual(text.count('# TYPE test4_summary summary\n'), 1)
+        self.assertIn('test4_summary{myorg_keys_frontend="ios",'
+                      'quantile="0.999"} ', text)
+        self.assertIn('test4_summary_count{myorg_keys_frontend="ios"} 3\n',
+                      text)
+        self.assertIn('test4_summary_sum{myorg_keys_frontend="ios"} 6\n',
+                      text)
+
+    def test_render_escape(self):
+        view_data = self.add_view(
+            "escape", aggregation_module.CountAggregation(), [],
+            description='help\\\n"x"')
+        view_data.tag_value_aggregation_data_map[('a"b\\c\nd',)] = \
+            view_data.view.new_aggregation_data()
+
+        text = self.collector.render()
+
+        self.assertIn('# HELP test4_escape_total help\\\\\\n"x"\n', text)
+        family, = text_string_to_metric_families(text)
+        self.assertEqual(family.samples[0].labels,
+                         {'myorg_keys_frontend': 'a"b\\c\nd'})
+
+    def test_render_caches(self):
+        view_data = self.add_view(
+            "cached", aggregation_module.CountAggregation(), [("ios", 1)])
+        first = self.collector.render()
+        exposition = self.collector._expositions['test4_cached']
+        prefixes = exposition.prefixes[(u"ios",)]
+
+        self.assertEqual(self.collector.render(), first)
+        self.assertIs(exposition.prefixes[(u"ios",)], prefixes)
+
+        # Series that no longer exist are dropped from the cache
+        view_data._tag_value_aggregation_data_map = {}
+        self.add_view("cached", aggregation_module.CountAggregation(),
+                      [("web", 1), ("other", 1), ("third", 1)])
+        self.collector.render()
+        self.add_view("cached", aggregation_module.CountAggregation(),
+                      [("web", 1)])
+        self.collector.render()
+        self.assertEqual(list(exposition.prefixes), [(u"web",)])
+
+    def test_render_skips_empty_and_unregistered(self):
+        self.add_view("empty", aggregation_module.CountAggregation(), [])
+        self.collector.view_name_to_data_map['unregistered'] = mock.Mock()
+
+        self.assertEqual(self.collector.render(), '')
+
+    def test_render_invalid(self):
+        view_data = self.add_view(
+            "invalid", aggregation_module.CountAggregation(), [("ios", 1)])
+        view_data.tag_value_aggregation_data_map[(u"ios",)] = mock.Mock()
+
+        with self.assertRaises(ValueError):
+            self.collector.render()
+
+    def test_render_invalid_tag_values(self):
+        view_data = self.add_view(
+            "invalid", aggregation_module.CountAggregation(), [])
+        view_data.tag_value_aggregation_data_map[(u"ios", u"extra")] = \
+            view_data.view.new_aggregation_data()
+
+        with self.assertRaises(ValueError):
+            self.collector.render()
+
+    def test_render_unsorted_bounds(self):
+        view_data = self.add_view("unsorted", VIDEO_SIZE_DISTRIBUTION, [])
+        agg_data = view_data.view.new_aggregation_data()
+        agg_data._bounds = [2.0, 1.0]
+        view_data.tag_value_aggregation_data_map[(u"ios",)] = agg_data
+
+        with self.assertRaises(ValueError):
+            self.collector.render()
+
+    def test_render_bytes_gzip(self):
+        self.add_view("gzip", aggregation_module.CountAggregation(),
+                      [("ios", 1)])
+
+        body, headers = self.collector.render_bytes()
+        self.assertEqual(body, self.collector.render().encode('utf-8'))
+        self.assertNotIn(('Content-Encoding', 'gzip'), headers)
+
+        gzipped, headers = self.collector.render_bytes('gzip, deflate')
+        self.assertIn(('Content-Encoding', 'gzip'), headers)
+        self.assertEqual(
+            zlib.decompress(gzipped, 16 + zlib.MAX_WBITS), body)
+
+    def test_make_wsgi_app(self):
+        self.add_view("wsgi", aggregation_module.CountAggregation(),
+                      [("ios", 1)])
+        start_response = mock.Mock()
+        app = prometheus.make_wsgi_app(self.collector)
+
+        body = app({}, start_response)
+
+        self.assertEqual(body, [self.collector.render().encode('utf-8')])
+        start_response.assert_called_once_with(
+            '200 OK', [('Content-Type', CONTENT_TYPE_LATEST)])
+
+    @mock.patch('opencensus.ext.prometheus.stats_exporter'
+                '.start_direct_http_server')
+    def test_exporter_direct_exposition(self, mock_start):
+        options = prometheus.Options("test4", 9006, direct_exposition=True)
+        collector = prometheus.Collector(options=options)
+        with mock.patch('opencensus.ext.prometheus.stats_exporter'
+                        '.REGISTRY'):
+            prometheus.PrometheusStatsExporter(
+                options=options, gatherer=options.registry,
+                collector=collector)
+
+        mock_start.assert_called_once_with(9006, '', collector)
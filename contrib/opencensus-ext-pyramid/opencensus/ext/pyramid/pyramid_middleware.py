@@ -80,18 +80,25 @@ class OpenCensusTweenFactory(object):
         try:
             span_context = self.propagator.from_headers(request.headers)
 
+            # Set the span name as the name of the current module name
+            span_name = '[{}]{}'.format(
+                request.method,
+                request.path)
+
             tracer = tracer_module.Tracer(
                 span_context=span_context,
                 sampler=self.sampler,
                 exporter=self.exporter,
-                propagator=self.propagator)
+                propagator=self.propagator,
+                sampling_name=span_name,
+                sampling_attributes={
+                    HTTP_HOST: request.host_url,
+                    HTTP_METHOD: request.method,
+                    HTTP_PATH: request.path,
+                })
 
             span = tracer.start_span()
-
-            # Set the span name as the name of the current module name
-            span.name = '[{}]{}'.format(
-                request.method,
-                request.path)
+            span.name = span_name
 
             span.span_kind = span_module.SpanKind.SERVER
             tracer.add_attribute_to_current_span(
@@ -167,6 +167,40 @@ class TestPyramidMiddleware(unittest.TestCase):
         span_context = tracer.span_context
         self.assertEqual(span_context.trace_id, trace_id)
 
+    def test__before_request_rule_based_sampler(self):
+        from opencensus.trace.samplers import rule_based
+
+        def dummy_handler(request):
+            return Response()  # pragma: NO COVER
+
+        mock_registry = mock.Mock(spec=Registry)
+        mock_registry.settings = {
+            'OPENCENSUS': {
+                'TRACE': {
+                    'SAMPLER': rule_based.RuleBasedSampler([
+                        rule_based.SamplingRule(0, path_prefix='/wiki'),
+                    ], default=samplers.AlwaysOnSampler()),
+                }
+            }
+        }
+
+        middleware = pyramid_middleware.OpenCensusTweenFactory(
+            dummy_handler,
+            mock_registry,
+        )
+
+        request = DummyRequest(registry=mock_registry, path='/wiki/Rabbit')
+        middleware._before_request(request)
+        tracer = execution_context.get_opencensus_tracer()
+
+        self.assertEqual(tracer.sampling_name, '[GET]/wiki/Rabbit')
+        self.assertEqual(tracer.sampling_attributes, {
+            'http.host': u'http://example.com',
+            'http.method': 'GET',
+            'http.path': u'/wiki/Rabbit',
+        })
+        self.assertIsInstance(tracer.tracer, noop_tracer.NoopTracer)
+
     def test__before_request_excludelist(self):
         pyramid_trace_header = 'traceparent'
         trace_id = '2dd43a1d6b2549c6bc2a1a54c2fc0b05'
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import itertools
+import logging
 import os
 import platform
 import re
@@ -37,6 +38,8 @@ from opencensus.metrics.export import metric as metric_module
 from opencensus.metrics.export import metric_descriptor
 from opencensus.stats import stats
 
+logger = logging.getLogger(__name__)
+
 MAX_TIME_SERIES_PER_UPLOAD = 200
 OPENCENSUS_TASK = "opencensus_task"
 OPENCENSUS_TASK_DESCRIPTION = "Opencensus task identifier"
@@ -152,7 +155,7 @@ class StackdriverStatsExporter(object):
         return self._client
 
     def export_metrics(self, metrics):
-        metrics = list(metrics)
+        metrics = _skip_summaries(metrics)
         for metric in metrics:
             self.register_metric_descriptor(metric.descriptor)
         ts_batches = self.create_batched_time_series(metrics)
@@ -302,6 +305,22 @@ class StackdriverStatsExporter(object):
         return sd_md
 
 
+def _skip_summaries(metrics):
+    """Get the list of metrics but summaries, which Stackdriver doesn't
+    support, logging a warning for each one."""
+    supported = []
+    for metric in metrics:
+        if (metric.descriptor.type ==
+                metric_descriptor.MetricDescriptorType.SUMMARY):
+            # TODO: export SUMMARY metrics, #567
+            logger.warning(
+                "Skipping summary metric %s, Stackdriver doesn't support "
+                "summaries", metric.descriptor.name)
+        else:
+            supported.append(metric)
+    return supported
+
+
 def set_monitored_resource(series, option_resource_type):
     """Set this series' monitored resource and labels.
 
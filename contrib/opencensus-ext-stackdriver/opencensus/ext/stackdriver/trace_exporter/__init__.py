@@ -13,10 +13,10 @@
 # limitations under the License.
 
 import os
-from collections import defaultdict
 
 from google.cloud.trace.client import Client
 
+from opencensus.common import utils
 from opencensus.common.monitored_resource import (
     aws_identity_doc_utils,
     gcp_metadata_config,
@@ -25,7 +25,7 @@ from opencensus.common.monitored_resource import (
 )
 from opencensus.common.transports.async_ import AsyncTransport
 from opencensus.common.version import __version__
-from opencensus.trace import attributes_helper, base_exporter, span_data
+from opencensus.trace import attributes_helper, base_exporter
 from opencensus.trace.attributes import Attributes
 
 # Agent
@@ -128,6 +128,21 @@ def set_monitored_resource_attributes(span):
                             label_value_prefix='aws:')
 
 
+def get_environment_attributes():
+    """Get the attributes :func:`set_attributes` sets in this environment.
+
+    :rtype: dict
+    :returns: The attribute map of the GAE, common and monitored resource
+              attributes.
+    """
+    span = {'attributes': {}}
+    if is_gae_environment():
+        set_gae_attributes(span)
+    set_common_attributes(span)
+    set_monitored_resource_attributes(span)
+    return span['attributes']['attributeMap']
+
+
 def set_common_attributes(span):
     """Set the common attributes."""
     common = {
@@ -197,20 +212,7 @@ class StackdriverExporter(base_exporter.Exporter):
             SpanData tuples to emit
         """
         project = 'projects/{}'.format(self.project_id)
-
-        # Map each span data to it's corresponding trace id
-        trace_span_map = defaultdict(list)
-        for sd in span_datas:
-            trace_span_map[sd.context.trace_id] += [sd]
-
-        stackdriver_spans = []
-        # Write spans to Stackdriver
-        for _, sds in trace_span_map.items():
-            # convert to the legacy trace json for easier refactoring
-            # TODO: refactor this to use the span data directly
-            trace = span_data.format_legacy_trace_json(sds)
-            stackdriver_spans.extend(self.translate_to_stackdriver(trace))
-
+        stackdriver_spans = self.translate_span_datas(span_datas)
         self.client.batch_write_spans(project, {'spans': stackdriver_spans})
 
     def export(self, span_datas):
@@ -222,6 +224,72 @@ class StackdriverExporter(base_exporter.Exporter):
         """
         self.transport.export(span_datas)
 
+    def translate_span_datas(self, span_datas):
+        """Translate span data to Stackdriver format.
+
+        Gives the spans :meth:`translate_to_stackdriver` gives for the legacy
+        trace dictionaries of the span data, without building them.
+
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param span_datas: The span data to translate.
+
+        :rtype: list
+        :returns: Spans in Google Cloud StackDriver Trace format.
+        """
+        environment_attributes = get_environment_attributes()
+        span_name_format = 'projects/{}/traces/{{}}/spans/{{}}'.format(
+            self.project_id)
+        return [
+            self._translate_span_data(
+                sd, span_name_format, environment_attributes)
+            for sd in span_datas
+        ]
+
+    def _translate_span_data(self, sd, span_name_format,
+                             environment_attributes):
+        if sd.attributes:
+            attribute_map = _translate_attributes(sd.attributes)
+            attribute_map.update(environment_attributes)
+        else:
+            attribute_map = dict(environment_attributes)
+
+        time_events = []
+        if sd.annotations:
+            time_events.extend(
+                {'time': aa.timestamp,
+                 'annotation': aa.format_annotation_json()}
+                for aa in sd.annotations)
+        if sd.message_events:
+            time_events.extend(
+                {'time': aa.timestamp,
+                 'message_event': aa.format_message_event_json()}
+                for aa in sd.message_events)
+
+        span_json = {
+            'name': span_name_format.format(sd.context.trace_id, sd.span_id),
+            'displayName': utils.get_truncatable_str(sd.name),
+            'startTime': sd.start_time,
+            'endTime': sd.end_time,
+            'spanId': str(sd.span_id),
+            'attributes': {'attributeMap': attribute_map},
+            'links': {
+                'link': [link.format_link_json() for link in sd.links]
+            } if sd.links else None,
+            'status': sd.status.format_status_json()
+            if sd.status is not None else None,
+            'stackTrace': sd.stack_trace.format_stack_trace_json()
+            if sd.stack_trace is not None else None,
+            'timeEvents': {'timeEvent': time_events} if time_events else None,
+            'sameProcessAsParentSpan': sd.same_process_as_parent_span,
+            'childSpanCount': sd.child_span_count,
+        }
+
+        if sd.parent_span_id is not None:
+            span_json['parentSpanId'] = str(sd.parent_span_id)
+
+        return span_json
+
     def translate_to_stackdriver(self, trace):
         """Translate the spans json to Stackdriver format.
 
@@ -288,6 +356,25 @@ class StackdriverExporter(base_exporter.Exporter):
         return attribute_map
 
 
+def _translate_attributes(attributes):
+    """Format span attributes and map their keys to Stackdriver's."""
+    attribute_map = Attributes(attributes).format_attributes_json()[
+        'attributeMap']
+    for attribute_key in list(attribute_map):
+        new_key = ATTRIBUTE_MAPPING.get(attribute_key)
+        if new_key is None:
+            continue
+        value = attribute_map.pop(attribute_key)
+        if new_key == '/http/status_code':
+            # workaround: Stackdriver expects status to be str
+            value = {'string_value': {
+                'truncated_byte_count': 0,
+                'value': str(attributes[attribute_key]),
+            }}
+        attribute_map[new_key] = value
+    return attribute_map
+
+
 ATTRIBUTE_MAPPING = {
     'component': '/component',
     'error.message': '/error/message',
@@ -627,6 +627,109 @@ class Test_set_attributes_gae(unittest.TestCase):
         self.assertEqual(span, expected)
 
 
+class TestTranslateSpanDatas(unittest.TestCase):
+    def make_span_datas(self):
+        import datetime
+
+        from opencensus.trace import link, stack_trace, status, time_event
+
+        time = datetime.datetime(2017, 8, 15, 18, 2, 26, 71158)
+        span_datas = []
+        for trace_id, span_id, parent_span_id, attributes in (
+                ('6e0c63257de34c92bf9efcd03927272e', '1111', None,
+                 {'http.status_code': 200, 'http.method': 'GET',
+                  'key': 'value', 'int': 1, 'none': None}),
+                ('6e0c63257de34c92bf9efcd03927272f', '2222', '1111', None),
+                ('6e0c63257de34c92bf9efcd03927272e', '3333', '1111',
+                 {'http.status_code': 404, 'g.co/agent': 'overridden'})):
+            span_datas.append(span_data_module.SpanData(
+                name='span{}'.format(span_id),
+                context=span_context.SpanContext(trace_id=trace_id),
+                span_id=span_id,
+                parent_span_id=parent_span_id,
+                attributes=attributes,
+                start_time='2017-08-15T18:02:26.071158Z',
+                end_time='2017-08-15T18:02:36.071158Z',
+                child_span_count=1,
+                stack_trace=stack_trace.StackTrace(
+                    stack_trace_hash_id='111') if parent_span_id else None,
+                annotations=[
+                    time_event.Annotation(
+                        timestamp=time, description='annotation'),
+                ] if parent_span_id else None,
+                message_events=[
+                    time_event.MessageEvent(timestamp=time, id=0),
+                ] if attributes else None,
+                links=[link.Link('1111', span_id='6e0c63257de34c92')]
+                if attributes else None,
+                status=status.Status(code=0, message='ok')
+                if parent_span_id else None,
+                same_process_as_parent_span=bool(parent_span_id),
+                span_kind=0,
+            ))
+        return span_datas
+
+    def translate_legacy(self, exporter, span_datas):
+        stackdriver_spans = []
+        for sd in span_datas:
+            trace = span_data_module.format_legacy_trace_json([sd])
+            stackdriver_spans.extend(exporter.translate_to_stackdriver(trace))
+        return stackdriver_spans
+
+    @mock.patch('opencensus.ext.stackdriver.trace_exporter.'
+                'monitored_resource.get_instance')
+    def test_translate_span_datas(self, gmr_mock):
+        import os
+
+        mock_resource = mock.Mock()
+        mock_resource.get_type.return_value = 'gce_instance'
+        mock_resource.get_labels.return_value = {
+            'project_id': 'my_project',
+            'instance_id': 'my_instance',
+            'zone': 'zone1',
+        }
+        exporter = trace_exporter.StackdriverExporter(client=_Client())
+        span_datas = self.make_span_datas()
+
+        for resource in (None, mock_resource):
+            gmr_mock.return_value = resource
+            for environ in ({}, {trace_exporter._APPENGINE_FLEXIBLE_ENV_VM:
+                                 'vm', 'GAE_SERVICE': 'service'}):
+                with mock.patch.dict(os.environ, environ):
+                    self.assertEqual(
+                        exporter.translate_span_datas(span_datas),
+                        self.translate_legacy(exporter, span_datas))
+
+    @mock.patch('opencensus.ext.stackdriver.trace_exporter.'
+                'monitored_resource.get_instance',
+                return_value=None)
+    def test_translate_span_datas_str_status_code(self, mr_mock):
+        exporter = trace_exporter.StackdriverExporter(client=_Client())
+        span_data = self.make_span_datas()[0]._replace(
+            attributes={'http.status_code': '200'})
+
+        [span] = exporter.translate_span_datas([span_data])
+        self.assertEqual(
+            span['attributes']['attributeMap']['/http/status_code'],
+            {'string_value': {'truncated_byte_count': 0, 'value': '200'}})
+
+    @mock.patch('opencensus.ext.stackdriver.trace_exporter.'
+                'monitored_resource.get_instance',
+                return_value=None)
+    def test_emit_translates_once_per_batch(self, mr_mock):
+        client = mock.Mock()
+        client.project = 'PROJECT'
+        exporter = trace_exporter.StackdriverExporter(client=client)
+        span_datas = self.make_span_datas()
+
+        exporter.emit(span_datas)
+
+        mr_mock.assert_called_once_with()
+        client.batch_write_spans.assert_called_once_with(
+            'projects/PROJECT',
+            {'spans': self.translate_legacy(exporter, span_datas)})
+
+
 class TestMonitoredResourceAttributes(unittest.TestCase):
     @mock.patch('opencensus.ext.stackdriver.trace_exporter.'
                 'monitored_resource.get_instance')
@@ -24,13 +24,9 @@ from opencensus.common.version import __version__
 from opencensus.ext.stackdriver import stats_exporter as stackdriver
 from opencensus.metrics import label_key, label_value
 from opencensus.metrics import transport as transport_module
-from opencensus.metrics.export import (
-    metric,
-    metric_descriptor,
-    point,
-    time_series,
-    value,
-)
+from opencensus.metrics.export import metric, metric_descriptor, point
+from opencensus.metrics.export import summary as summary_module
+from opencensus.metrics.export import time_series, value
 from opencensus.stats import aggregation as aggregation_module
 from opencensus.stats import aggregation_data as aggregation_data_module
 from opencensus.stats import execution_context
@@ -535,6 +531,47 @@ class TestStackdriverStatsExporter(unittest.TestCase):
         [sd_arg] = exporter.client.create_time_series.call_args[0][1]
         self.assertEqual(sd_arg.points[0].value.int64_value, 123)
 
+    @mock.patch('opencensus.ext.stackdriver.stats_exporter.'
+                'set_monitored_resource')
+    def test_export_metrics_skips_summaries(self, mock_set_resource):
+        dt = datetime(2019, 3, 20, 21, 34, 0, 537954)
+        lv = label_value.LabelValue('val')
+
+        def make_metric(name, type_, val):
+            desc = metric_descriptor.MetricDescriptor(
+                name=name,
+                description='description',
+                unit='unit',
+                type_=type_,
+                label_keys=[label_key.LabelKey('key', 'description')])
+            return metric.Metric(descriptor=desc, time_series=[
+                time_series.TimeSeries(
+                    label_values=[lv],
+                    points=[point.Point(value=val, timestamp=dt)],
+                    start_timestamp=utils.to_iso_str(dt))])
+
+        summary = value.ValueSummary(summary_module.Summary(
+            1, 2.0, summary_module.Snapshot(1, 2.0)))
+        metrics = [
+            make_metric(
+                'summary', metric_descriptor.MetricDescriptorType.SUMMARY,
+                summary),
+            make_metric(
+                'gauge', metric_descriptor.MetricDescriptorType.GAUGE_INT64,
+                value.ValueLong(value=123)),
+        ]
+
+        exporter = stackdriver.StackdriverStatsExporter(client=mock.Mock())
+        with mock.patch('opencensus.ext.stackdriver.stats_exporter.logger'
+                        '.warning') as mock_warning:
+            exporter.export_metrics(iter(metrics))
+
+        mock_warning.assert_called_once_with(mock.ANY, 'summary')
+        self.assertEqual(
+            exporter.client.create_metric_descriptor.call_count, 1)
+        [sd_arg] = exporter.client.create_time_series.call_args[0][1]
+        self.assertEqual(sd_arg.points[0].value.int64_value, 123)
+
 
 class MockPeriodicMetricTask(object):
     """Testing mock of metrics.transport.PeriodicMetricTask.
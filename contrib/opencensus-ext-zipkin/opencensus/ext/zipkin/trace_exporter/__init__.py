@@ -16,12 +16,12 @@
 
 import json
 import logging
+from json.encoder import encode_basestring_ascii
 
-import requests
-
+from opencensus.common import http_client
 from opencensus.common.transports import sync
 from opencensus.common.utils import check_str_length, timestamp_to_microseconds
-from opencensus.trace import base_exporter
+from opencensus.trace import base_exporter, span_encoder
 
 DEFAULT_ENDPOINT = '/api/v2/spans'
 DEFAULT_HOST_NAME = 'localhost'
@@ -65,6 +65,16 @@ class ZipkinExporter(base_exporter.Exporter):
                       and implement :meth:`.Transport.export`. Defaults to
                       :class:`.SyncTransport`. The other option is
                       :class:`.AsyncTransport`.
+
+    :type client: :class:`~opencensus.common.http_client.HttpClient`
+    :param client: (Optional) The HTTP client sending the spans, defaults
+                   to a client shared with the other exporters. Use a client
+                   with compression to compress the spans.
+
+    :type streaming: bool
+    :param streaming: (Optional) Whether to encode the spans one at a time
+                      with :class:`ZipkinJsonEncoder`, instead of translating
+                      the whole batch to dictionaries first.
     """
 
     def __init__(
@@ -76,16 +86,24 @@ class ZipkinExporter(base_exporter.Exporter):
             protocol=DEFAULT_PROTOCOL,
             transport=sync.SyncTransport,
             ipv4=None,
-            ipv6=None):
+            ipv6=None,
+            client=None,
+            streaming=False):
         self.service_name = service_name
         self.host_name = host_name
         self.port = port
         self.endpoint = endpoint
         self.protocol = protocol
         self.url = self.get_url
+        if client is None:
+            client = http_client.get_client()
+        self.client = client
         self.transport = transport(self)
         self.ipv4 = ipv4
         self.ipv6 = ipv6
+        self.encoder = None
+        if streaming:
+            self.encoder = ZipkinJsonEncoder(self._get_local_endpoint())
 
     @property
     def get_url(self):
@@ -105,22 +123,48 @@ class ZipkinExporter(base_exporter.Exporter):
         """
 
         try:
-            zipkin_spans = self.translate_to_zipkin(span_datas)
-            result = requests.post(
-                url=self.url,
-                data=json.dumps(zipkin_spans),
-                headers=ZIPKIN_HEADERS)
+            result = self._post(span_datas)
 
             if result.status_code not in SUCCESS_STATUS_CODE:
                 logging.error(
-                    "Failed to send spans to Zipkin server! Spans are {}"
-                    .format(zipkin_spans))
+                    "Failed to send {} spans to Zipkin server! Status code "
+                    "is {}".format(len(span_datas), result.status_code))
         except Exception as e:  # pragma: NO COVER
             logging.error(getattr(e, 'message', e))
 
+    def _post(self, span_datas):
+        """Encode the spans and post them to the Zipkin server.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response of the Zipkin server.
+        """
+        if self.encoder is None:
+            zipkin_spans = self.translate_to_zipkin(span_datas)
+            data = http_client.iter_json_array(zipkin_spans)
+        else:
+            data = self.encoder.iter_encode(span_datas)
+        return self.client.post(
+            url=self.url,
+            data=data,
+            headers=ZIPKIN_HEADERS)
+
     def export(self, span_datas):
         self.transport.export(span_datas)
 
+    def _get_local_endpoint(self):
+        local_endpoint = {
+            'serviceName': self.service_name,
+            'port': self.port,
+        }
+
+        if self.ipv4 is not None:
+            local_endpoint['ipv4'] = self.ipv4
+
+        if self.ipv6 is not None:
+            local_endpoint['ipv6'] = self.ipv6
+
+        return local_endpoint
+
     def translate_to_zipkin(self, span_datas):
         """Translate the opencensus spans to zipkin spans.
 
@@ -133,23 +177,16 @@ class ZipkinExporter(base_exporter.Exporter):
         :returns: List of zipkin format spans.
         """
 
-        local_endpoint = {
-            'serviceName': self.service_name,
-            'port': self.port,
-        }
-
-        if self.ipv4 is not None:
-            local_endpoint['ipv4'] = self.ipv4
-
-        if self.ipv6 is not None:
-            local_endpoint['ipv6'] = self.ipv6
+        local_endpoint = self._get_local_endpoint()
 
         zipkin_spans = []
 
         for span in span_datas:
             # Timestamp in zipkin spans is int of microseconds.
-            start_timestamp_mus = timestamp_to_microseconds(span.start_time)
-            end_timestamp_mus = timestamp_to_microseconds(span.end_time)
+            start_timestamp_mus = timestamp_to_microseconds(
+                span.start_time_ns or span.start_time)
+            end_timestamp_mus = timestamp_to_microseconds(
+                span.end_time_ns or span.end_time)
             duration_mus = end_timestamp_mus - start_timestamp_mus
 
             zipkin_span = {
@@ -181,20 +218,90 @@ class ZipkinExporter(base_exporter.Exporter):
         return zipkin_spans
 
 
+class ZipkinJsonEncoder(span_encoder.SpanEncoder):
+    """Encode span data as a Zipkin v2 JSON array, one span at a time and
+    without building the span dictionaries.
+
+    Gives the same JSON as :meth:`ZipkinExporter.translate_to_zipkin`.
+
+    :type local_endpoint: dict
+    :param local_endpoint: The local endpoint of the spans.
+    """
+
+    def __init__(self, local_endpoint):
+        self._local_endpoint = json.dumps(local_endpoint)
+
+    def iter_encode(self, span_datas):
+        yield '['
+        separator = ''
+        for span in span_datas:
+            yield separator
+            yield self._encode_span(span)
+            separator = ', '
+        yield ']'
+
+    def _encode_span(self, span):
+        # Timestamp in zipkin spans is int of microseconds.
+        start_timestamp_mus = timestamp_to_microseconds(
+            span.start_time_ns or span.start_time)
+        end_timestamp_mus = timestamp_to_microseconds(
+            span.end_time_ns or span.end_time)
+        duration_mus = end_timestamp_mus - start_timestamp_mus
+
+        parts = [
+            '{"traceId": ', span_encoder.encode_json(span.context.trace_id),
+            ', "id": ', encode_basestring_ascii(str(span.span_id)),
+            ', "name": ', span_encoder.encode_json(span.name),
+            ', "timestamp": ', str(int(round(start_timestamp_mus))),
+            ', "duration": ', str(int(round(duration_mus))),
+            ', "localEndpoint": ', self._local_endpoint,
+            ', "tags": {',
+        ]
+
+        separator = ''
+        for attribute_key, attribute_value in (span.attributes or {}).items():
+            value = _format_tag_value(attribute_key, attribute_value)
+            if value is not None:
+                parts.append(separator)
+                parts.append(span_encoder.encode_json(attribute_key))
+                parts.append(': ')
+                parts.append(encode_basestring_ascii(value))
+                separator = ', '
+
+        parts.append('}, "annotations": ')
+        parts.append(json.dumps(_extract_annotations_from_span(span)))
+
+        if span.span_kind is not None:
+            kind = SPAN_KIND_MAP.get(span.span_kind)
+            if kind is not None:
+                parts.append(', "kind": "{}"'.format(kind))
+
+        if span.parent_span_id is not None:
+            parts.append(', "parentId": ')
+            parts.append(encode_basestring_ascii(str(span.parent_span_id)))
+
+        parts.append('}')
+        return ''.join(parts)
+
+
+def _format_tag_value(attribute_key, attribute_value):
+    if isinstance(attribute_value, (int, bool, float)):
+        return str(attribute_value)
+    elif isinstance(attribute_value, str):
+        res, _ = check_str_length(str_to_check=attribute_value)
+        return res
+    logging.warning('Could not serialize tag %s', attribute_key)
+    return None
+
+
 def _extract_tags_from_span(attr):
     if attr is None:
         return {}
     tags = {}
     for attribute_key, attribute_value in attr.items():
-        if isinstance(attribute_value, (int, bool, float)):
-            value = str(attribute_value)
-        elif isinstance(attribute_value, str):
-            res, _ = check_str_length(str_to_check=attribute_value)
-            value = res
-        else:
-            logging.warning('Could not serialize tag %s', attribute_key)
-            continue
-        tags[attribute_key] = value
+        value = _format_tag_value(attribute_key, attribute_value)
+        if value is not None:
+            tags[attribute_key] = value
     return tags
 
 
@@ -0,0 +1,80 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Export the spans data to Zipkin Collector from an asyncio event loop.
+
+This module requires Python 3.5+.
+"""
+
+from opencensus.common.transports import asyncio_
+from opencensus.ext.zipkin.trace_exporter import (
+    DEFAULT_ENDPOINT,
+    DEFAULT_HOST_NAME,
+    DEFAULT_PORT,
+    DEFAULT_PROTOCOL,
+    SUCCESS_STATUS_CODE,
+    ZipkinExporter,
+)
+
+
+class AsyncioZipkinExporter(ZipkinExporter):
+    """Export the spans to Zipkin without blocking the event loop.
+
+    Spans are sent by an :class:`.AsyncioTransport`, which runs
+    :meth:`emit` in the loop's default executor, so the requests share the
+    connection pool of the :class:`~opencensus.common.http_client.HttpClient`.
+    Failed requests raise, and are counted in the transport's ``failed``.
+
+    See :class:`.ZipkinExporter` for the parameters.
+    """
+
+    def __init__(
+            self,
+            service_name='my_service',
+            host_name=DEFAULT_HOST_NAME,
+            port=DEFAULT_PORT,
+            endpoint=DEFAULT_ENDPOINT,
+            protocol=DEFAULT_PROTOCOL,
+            transport=asyncio_.AsyncioTransport,
+            ipv4=None,
+            ipv6=None,
+            client=None,
+            streaming=False):
+        super(AsyncioZipkinExporter, self).__init__(
+            service_name=service_name,
+            host_name=host_name,
+            port=port,
+            endpoint=endpoint,
+            protocol=protocol,
+            transport=transport,
+            ipv4=ipv4,
+            ipv6=ipv6,
+            client=client,
+            streaming=streaming)
+
+    def emit(self, span_datas):
+        """Send SpanData tuples to Zipkin server, default using the v2 API.
+
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param list of opencensus.trace.span_data.SpanData span_datas:
+            SpanData tuples to emit
+
+        :raises: :class:`IOError` if the Zipkin server rejects the spans.
+        """
+        result = self._post(span_datas)
+        if result.status_code not in SUCCESS_STATUS_CODE:
+            raise IOError(
+                "Failed to send {} spans to Zipkin server! Status code "
+                "is {}".format(len(span_datas), result.status_code))
@@ -0,0 +1,135 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import unittest
+
+import mock
+
+from opencensus.common import http_client
+from opencensus.common.transports import asyncio_
+from opencensus.ext.zipkin.trace_exporter import asyncio_ as trace_exporter
+
+
+class TestAsyncioZipkinExporter(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        all_tasks = getattr(asyncio, 'all_tasks', None) or \
+            asyncio.Task.all_tasks
+        tasks = all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(asyncio.wait_for(coro, 5))
+
+    def emit(self, exporter, span_datas):
+        return self.run_async(
+            self.loop.run_in_executor(None, exporter.emit, span_datas))
+
+    def _serve(self, status):
+        requests = []
+
+        async def handle(reader, writer):
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+            requests.append((head, await reader.readexactly(length)))
+            writer.write(
+                'HTTP/1.1 {} Status\r\nContent-Length: 0\r\n\r\n'.format(
+                    status).encode())
+            await writer.drain()
+            writer.close()
+
+        server = self.run_async(
+            asyncio.start_server(handle, '127.0.0.1', 0))
+        self.addCleanup(server.close)
+        return server.sockets[0].getsockname()[1], requests
+
+    def test_constructor(self):
+        exporter = trace_exporter.AsyncioZipkinExporter(
+            service_name='my_service', port=2333)
+
+        self.assertEqual(exporter.url, 'http://localhost:2333/api/v2/spans')
+        self.assertIsInstance(exporter.transport, asyncio_.AsyncioTransport)
+        self.assertIs(exporter.client, http_client.get_client())
+
+    @mock.patch.object(trace_exporter.AsyncioZipkinExporter,
+                       'translate_to_zipkin')
+    def test_emit_succeeded(self, translate_mock):
+        trace = [{'test': 'this_is_for_test'}]
+        translate_mock.return_value = trace
+        port, requests = self._serve(202)
+        exporter = trace_exporter.AsyncioZipkinExporter(
+            host_name='127.0.0.1', port=port)
+
+        self.emit(exporter, [])
+
+        head, body = requests[0]
+        self.assertTrue(head.startswith(b'POST /api/v2/spans HTTP/1.1\r\n'))
+        self.assertIn(b'Content-Type: application/json\r\n', head)
+        self.assertEqual(json.loads(body.decode('utf-8')), trace)
+
+    @mock.patch.object(trace_exporter.AsyncioZipkinExporter,
+                       'translate_to_zipkin')
+    def test_emit_failed(self, translate_mock):
+        translate_mock.return_value = []
+        port, _ = self._serve(400)
+        exporter = trace_exporter.AsyncioZipkinExporter(
+            host_name='127.0.0.1', port=port)
+
+        with self.assertRaisesRegex(IOError, 'Status code is 400'):
+            self.emit(exporter, [])
+
+    @mock.patch.object(trace_exporter.AsyncioZipkinExporter,
+                       'translate_to_zipkin')
+    def test_export(self, translate_mock):
+        translate_mock.return_value = []
+        port, requests = self._serve(202)
+        exporter = trace_exporter.AsyncioZipkinExporter(
+            host_name='127.0.0.1', port=port)
+
+        async def export():
+            exporter.export(['span'])
+            await exporter.transport.flush_async()
+
+        self.run_async(export())
+
+        translate_mock.assert_called_once_with(['span'])
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(exporter.transport.emitted, 1)
+
+    @mock.patch.object(trace_exporter.AsyncioZipkinExporter,
+                       'translate_to_zipkin')
+    def test_export_failed(self, translate_mock):
+        translate_mock.return_value = []
+        port, _ = self._serve(400)
+        exporter = trace_exporter.AsyncioZipkinExporter(
+            host_name='127.0.0.1', port=port)
+
+        async def export():
+            exporter.export(['span'])
+            await exporter.transport.flush_async()
+
+        with mock.patch('opencensus.common.transports.asyncio_.logger'):
+            self.run_async(export())
+
+        self.assertEqual(exporter.transport.emitted, 0)
+        self.assertEqual(exporter.transport.failed, 1)
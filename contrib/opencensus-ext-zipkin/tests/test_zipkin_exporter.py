@@ -17,6 +17,7 @@ from datetime import datetime
 
 import mock
 
+from opencensus.common import http_client
 from opencensus.ext.zipkin import trace_exporter
 from opencensus.trace import span_context
 from opencensus.trace import span_data as span_data_module
@@ -46,6 +47,35 @@ class TestZipkinExporter(unittest.TestCase):
         self.assertEqual(exporter.endpoint, endpoint)
         self.assertEqual(exporter.url, expected_url)
         self.assertEqual(exporter.ipv4, ipv4)
+        self.assertIs(exporter.client, http_client.get_client())
+
+    def test_constructor_client(self):
+        client = http_client.HttpClient(timeout=1.0)
+        exporter = trace_exporter.ZipkinExporter(client=client)
+
+        self.assertIs(exporter.client, client)
+
+    @mock.patch('requests.Session.post')
+    @mock.patch.object(trace_exporter.ZipkinExporter, 'translate_to_zipkin')
+    def test_emit_compressed(self, translate_mock, requests_mock):
+        import json
+        import zlib
+
+        trace = [{'test': 'this_is_for_test'}] * 10
+
+        exporter = trace_exporter.ZipkinExporter(
+            client=http_client.HttpClient(compression=http_client.GZIP))
+        requests_mock.return_value.status_code = 202
+        translate_mock.return_value = trace
+        exporter.emit([])
+
+        kwargs = requests_mock.call_args[1]
+        self.assertEqual(kwargs['headers']['Content-Encoding'], 'gzip')
+        self.assertEqual(
+            kwargs['headers']['Content-Type'], 'application/json')
+        self.assertEqual(
+            zlib.decompress(kwargs['data'], 16 + zlib.MAX_WBITS),
+            json.dumps(trace).encode('utf-8'))
 
     def test_export(self):
         exporter = trace_exporter.ZipkinExporter(
@@ -54,12 +84,12 @@ class TestZipkinExporter(unittest.TestCase):
 
         self.assertTrue(exporter.transport.export_called)
 
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     @mock.patch.object(trace_exporter.ZipkinExporter, 'translate_to_zipkin')
     def test_emit_succeeded(self, translate_mock, requests_mock):
         import json
 
-        trace = {'test': 'this_is_for_test'}
+        trace = [{'test': 'this_is_for_test'}]
 
         exporter = trace_exporter.ZipkinExporter(service_name='my_service')
         response = mock.Mock()
@@ -71,14 +101,16 @@ class TestZipkinExporter(unittest.TestCase):
         requests_mock.assert_called_once_with(
             url=exporter.url,
             data=json.dumps(trace),
-            headers=trace_exporter.ZIPKIN_HEADERS)
+            headers=trace_exporter.ZIPKIN_HEADERS,
+            timeout=http_client.DEFAULT_TIMEOUT,
+            proxies={})
 
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     @mock.patch.object(trace_exporter.ZipkinExporter, 'translate_to_zipkin')
     def test_emit_failed(self, translate_mock, requests_mock):
         import json
 
-        trace = {'test': 'this_is_for_test'}
+        trace = [{'test': 'this_is_for_test'}]
 
         exporter = trace_exporter.ZipkinExporter(service_name='my_service')
         response = mock.Mock()
@@ -90,7 +122,9 @@ class TestZipkinExporter(unittest.TestCase):
         requests_mock.assert_called_once_with(
             url=exporter.url,
             data=json.dumps(trace),
-            headers=trace_exporter.ZIPKIN_HEADERS)
+            headers=trace_exporter.ZIPKIN_HEADERS,
+            timeout=http_client.DEFAULT_TIMEOUT,
+            proxies={})
 
     def test_translate_to_zipkin_span_kind_none(self):
         trace_id = '6e0c63257de34c92bf9efcd03927272e'
@@ -439,6 +473,74 @@ class TestZipkinExporter(unittest.TestCase):
         self.assertEqual(
             trace_exporter._extract_tags_from_span(attributes), {})
 
+    def test_streaming_encoder(self):
+        import json
+
+        time = datetime(2017, 8, 15, 18, 2, 26, 71158)
+        annotations = [
+            time_event.Annotation(timestamp=time, description='annotation'),
+        ]
+        span_datas = []
+        for span_kind, parent_span_id, attributes in (
+                (0, '6e0c63257de34c93', {'key': u'value "é"', 'int': 1}),
+                (1, None, {'bool': False, 'float': 0.1, 'bad': {}}),
+                (2, '6e0c63257de34c94', None),
+                (None, '6e0c63257de34c95', {'long': 'v' * 300})):
+            span_datas.append(span_data_module.SpanData(
+                name='span_{}'.format(span_kind),
+                context=span_context.SpanContext(
+                    trace_id='6e0c63257de34c92bf9efcd03927272e'),
+                span_id='6e0c63257de34c92',
+                parent_span_id=parent_span_id,
+                attributes=attributes,
+                start_time='2017-08-15T18:02:26.071158Z',
+                end_time='2017-08-15T18:02:36.071158Z',
+                child_span_count=None,
+                stack_trace=None,
+                annotations=annotations if span_kind else None,
+                message_events=None,
+                links=None,
+                status=None,
+                same_process_as_parent_span=None,
+                span_kind=span_kind,
+            ))
+
+        for kwargs in ({}, {'ipv4': '10.0.0.1'}, {'ipv6': '::1'}):
+            exporter = trace_exporter.ZipkinExporter(
+                service_name='my_service', streaming=True, **kwargs)
+            self.assertEqual(
+                exporter.encoder.encode(span_datas),
+                json.dumps(exporter.translate_to_zipkin(span_datas)))
+            self.assertEqual(exporter.encoder.encode([]), '[]')
+
+    @mock.patch('requests.Session.post')
+    def test_emit_streaming(self, requests_mock):
+        span_datas = [span_data_module.SpanData(
+            name='span',
+            context=span_context.SpanContext(
+                trace_id='6e0c63257de34c92bf9efcd03927272e'),
+            span_id='6e0c63257de34c92',
+            parent_span_id=None,
+            attributes=None,
+            start_time='2017-08-15T18:02:26.071158Z',
+            end_time='2017-08-15T18:02:36.071158Z',
+            child_span_count=None,
+            stack_trace=None,
+            annotations=None,
+            message_events=None,
+            links=None,
+            status=None,
+            same_process_as_parent_span=None,
+            span_kind=None,
+        )]
+        exporter = trace_exporter.ZipkinExporter(streaming=True)
+        requests_mock.return_value.status_code = 202
+        exporter.emit(span_datas)
+
+        self.assertEqual(
+            requests_mock.call_args[1]['data'],
+            exporter.encoder.encode(span_datas))
+
 
 class MockTransport(object):
     def __init__(self, exporter=None):
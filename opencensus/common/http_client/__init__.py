@@ -0,0 +1,241 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""HTTP clients shared by the exporters, keeping connections alive between
+requests instead of opening a new TCP and TLS connection for every batch.
+
+The clients use the ``requests`` package, which the exporters using them
+depend on.
+"""
+
+import six
+
+import json
+import os
+import threading
+import zlib
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10.0  # in secs
+
+GZIP = 'gzip'
+DEFLATE = 'deflate'
+DEFAULT_COMPRESSION_LEVEL = 6
+
+# Compressing with the gzip window bits writes a gzip header and trailer,
+# HTTP's deflate encoding is the zlib format
+_WBITS = {
+    GZIP: 16 + zlib.MAX_WBITS,
+    DEFLATE: zlib.MAX_WBITS,
+}
+
+# The size of the uncompressed data passed to the compressor at once
+_COMPRESS_BUFFER_SIZE = 64 * 1024
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _iter_chunks(data):
+    if isinstance(data, (bytes, six.text_type)):
+        data = (data,)
+    for chunk in data:
+        if isinstance(chunk, six.text_type):
+            chunk = chunk.encode('utf-8')
+        yield chunk
+
+
+def compress(data, compression=GZIP, level=DEFAULT_COMPRESSION_LEVEL):
+    """Compress data, one chunk at a time if given an iterable of chunks.
+
+    Compressing chunks as they are produced avoids joining them into an
+    uncompressed copy of the whole body first.
+
+    :type data: bytes or str or iterable
+    :param data: The data, or an iterable of bytes or str chunks.
+
+    :type compression: str
+    :param compression: (Optional) The format, :data:`GZIP` or
+                        :data:`DEFLATE`.
+
+    :type level: int
+    :param level: (Optional) The compression level, from 1 to 9.
+
+    :rtype: bytes
+    :returns: The compressed data.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[compression])
+    output = []
+    # Small chunks are buffered and compressed together, compressing
+    # each one separately costs more than encoding it
+    pending = []
+    pending_size = 0
+    for chunk in _iter_chunks(data):
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= _COMPRESS_BUFFER_SIZE:
+            output.append(compressor.compress(b''.join(pending)))
+            del pending[:]
+            pending_size = 0
+    output.append(compressor.compress(b''.join(pending)))
+    output.append(compressor.flush())
+    return b''.join(output)
+
+
+def iter_json_array(items):
+    """Encode a list as a JSON array, one item at a time.
+
+    Joining the chunks gives the same string as :func:`json.dumps`.
+
+    :type items: list
+    :param items: The JSON serializable items.
+
+    :rtype: iterator
+    :returns: The str chunks of the JSON array.
+    """
+    yield '['
+    separator = ''
+    for item in items:
+        yield separator
+        yield json.dumps(item)
+        separator = ', '
+    yield ']'
+
+
+class HttpClient(object):
+    """An HTTP client keeping a pool of persistent connections per host.
+
+    The client is thread-safe, its session is created on first use and
+    again in forked processes, which must not share the parent's sockets.
+
+    :type pool_size: int
+    :param pool_size: (Optional) The maximum number of connections kept
+                      alive per host.
+
+    :type timeout: float
+    :param timeout: (Optional) The connect and read timeout of requests in
+                    seconds, None to wait forever.
+
+    :type proxies: dict
+    :param proxies: (Optional) The proxy URLs by URL scheme.
+
+    :type compression: str
+    :param compression: (Optional) The compression of request bodies,
+                        :data:`GZIP`, :data:`DEFLATE` or None.
+
+    :type compression_level: int
+    :param compression_level: (Optional) The compression level, from 1 to
+                              9.
+    """
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 proxies=None, compression=None,
+                 compression_level=DEFAULT_COMPRESSION_LEVEL):
+        if compression is not None and compression not in _WBITS:
+            raise ValueError(
+                'Unknown compression {!r}, must be one of {}'.format(
+                    compression, sorted(_WBITS)))
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.proxies = dict(proxies or {})
+        self.compression = compression
+        self.compression_level = compression_level
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The :class:`requests.Session` of this process."""
+        session = self._session
+        if session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._make_session()
+                    self._pid = os.getpid()
+                session = self._session
+        return session
+
+    def _make_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.proxies.update(self.proxies)
+        return session
+
+    def post(self, url, data, headers=None, timeout=None):
+        """Send a POST request, reusing a pooled connection if possible.
+
+        :type url: str
+        :param url: The request URL.
+
+        :type data: bytes or str or iterable
+        :param data: The request body, or an iterable of its str chunks,
+                     which are compressed as they are produced.
+
+        :type headers: dict
+        :param headers: (Optional) The request headers.
+
+        :type timeout: float
+        :param timeout: (Optional) The timeout of this request in seconds,
+                        defaults to the timeout of the client.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response.
+        """
+        if self.compression is not None:
+            data = compress(data, self.compression, self.compression_level)
+            headers = dict(headers or {})
+            headers['Content-Encoding'] = self.compression
+        elif not isinstance(data, (bytes, six.text_type)):
+            data = ''.join(data)
+        if timeout is None:
+            timeout = self.timeout
+        # Proxies set on the session rank below the proxy environment
+        # variables, the configured ones must be passed with the request
+        return self.session.post(
+            url=url, data=data, headers=headers, timeout=timeout,
+            proxies=self.proxies)
+
+    def close(self):
+        """Close the pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+def get_client(pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+               proxies=None, compression=None,
+               compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """Get the client shared by the exporters using the same options.
+
+    See :class:`HttpClient` for the options.
+
+    :rtype: :class:`HttpClient`
+    :returns: The shared client, created on first use.
+    """
+    key = (pool_size, timeout, tuple(sorted((proxies or {}).items())),
+           compression, compression_level)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = HttpClient(
+                pool_size=pool_size, timeout=timeout, proxies=proxies,
+                compression=compression,
+                compression_level=compression_level)
+    return client
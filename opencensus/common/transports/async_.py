@@ -18,21 +18,102 @@ import atexit
 import logging
 import threading
 
+from opencensus.common import utils
 from opencensus.common.transports import base
 from opencensus.trace import execution_context
 
 _DEFAULT_GRACE_PERIOD = 5.0  # Seconds
 _DEFAULT_MAX_BATCH_SIZE = 600
+_DEFAULT_MAX_QUEUE_SIZE = 10000
 _DEFAULT_WAIT_PERIOD = 60.0  # Seconds
 _WORKER_THREAD_NAME = 'opencensus.common.Worker'
+_EMITTER_THREAD_NAME = 'opencensus.common.Worker.Emitter'
 _WORKER_TERMINATOR = object()
 
+# What to do with new data when the queue is full
+DROP_NEWEST = 'drop_newest'
+DROP_OLDEST = 'drop_oldest'
+BLOCK = 'block'
+_DROP_POLICIES = (DROP_NEWEST, DROP_OLDEST, BLOCK)
+
 logger = logging.getLogger(__name__)
 
 
+class _BoundedQueue(queue.Queue):
+    """A queue that holds at most ``max_size`` data items.
+
+    When the queue is full, new data is dropped, replaces the oldest data or
+    waits for room for up to ``block_timeout`` seconds and is then dropped,
+    depending on ``drop_policy``. The worker terminator is never dropped.
+
+    :type max_size: int
+    :param max_size: The maximum number of items in the queue, unbounded if
+                     it's not positive.
+
+    :type drop_policy: str
+    :param drop_policy: One of ``DROP_NEWEST``, ``DROP_OLDEST`` and ``BLOCK``.
+
+    :type block_timeout: float
+    :param block_timeout: The time to wait for room with the ``BLOCK``
+                          policy.
+    """
+    def __init__(self, max_size, drop_policy=DROP_NEWEST, block_timeout=None):
+        if drop_policy not in _DROP_POLICIES:
+            raise ValueError('Unknown drop policy: {}'.format(drop_policy))
+        queue.Queue.__init__(self, 0)
+        self.max_size = max_size
+        self.drop_policy = drop_policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def put(self, item, block=True, timeout=None):
+        if self.max_size <= 0 or item is _WORKER_TERMINATOR:
+            return queue.Queue.put(self, item, block, timeout)
+
+        with self.not_full:
+            if self._qsize() >= self.max_size and \
+                    self.drop_policy == BLOCK and block:
+                if timeout is None:
+                    timeout = self.block_timeout
+                deadline = _monotonic() + (timeout or 0)
+                while self._qsize() >= self.max_size:
+                    remaining = deadline - _monotonic()
+                    if remaining <= 0:
+                        break
+                    self.not_full.wait(remaining)
+
+            if self._qsize() >= self.max_size and not self._drop_oldest():
+                self.dropped += 1
+                return
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _drop_oldest(self):
+        """Drop the oldest data item if the policy allows it."""
+        if self.drop_policy != DROP_OLDEST:
+            return False
+        for index, item in enumerate(self.queue):
+            if item is not _WORKER_TERMINATOR:
+                del self.queue[index]
+                self.unfinished_tasks -= 1
+                self.dropped += 1
+                return True
+        return False
+
+
+def _monotonic():
+    return utils.monotonic_ns() / 1e9
+
+
 class _Worker(object):
     """A background thread that exports batches of data.
 
+    A batch is exported once it has ``max_batch_size`` items or
+    ``wait_period`` seconds after its first item was queued, whichever comes
+    first. With ``export_threads`` above one, the batches are handed to a
+    pool of threads so that several exports can be in flight at once.
+
     :type exporter: :class:`~opencensus.trace.base_exporter.Exporter` or
                     :class:`~opencensus.stats.base_exporter.StatsExporter`
     :param exporter: Instance of Exporter object.
@@ -46,46 +127,124 @@ class _Worker(object):
                            in the background thread.
 
     :type wait_period: int
-    :param wait_period: The amount of time to wait before sending the next
-                        batch of data.
+    :param wait_period: The maximum amount of time to wait for a batch to
+                        fill up before sending it.
+
+    :type max_queue_size: int
+    :param max_queue_size: The maximum number of items waiting to be
+                           exported. Not bounded if it's not positive.
+
+    :type drop_policy: str
+    :param drop_policy: What to do with new items when the queue is full.
+                        ``DROP_NEWEST`` (the default) drops them,
+                        ``DROP_OLDEST`` drops the oldest queued item instead
+                        and ``BLOCK`` waits for up to ``grace_period``
+                        seconds for room before dropping them.
+
+    :type export_threads: int
+    :param export_threads: The number of threads calling the exporter.
     """
     def __init__(self, exporter,
                  grace_period=_DEFAULT_GRACE_PERIOD,
                  max_batch_size=_DEFAULT_MAX_BATCH_SIZE,
-                 wait_period=_DEFAULT_WAIT_PERIOD):
+                 wait_period=_DEFAULT_WAIT_PERIOD,
+                 max_queue_size=_DEFAULT_MAX_QUEUE_SIZE,
+                 drop_policy=DROP_NEWEST,
+                 export_threads=1):
+        if export_threads < 1:
+            raise ValueError('export_threads must be at least 1')
         self.exporter = exporter
         self._grace_period = grace_period
         self._max_batch_size = max_batch_size
         self._wait_period = wait_period
-        self._queue = queue.Queue(0)
+        self._queue = _BoundedQueue(
+            max_queue_size, drop_policy, block_timeout=grace_period)
+        self._export_threads = export_threads
         self._lock = threading.Lock()
+        self._counters_lock = threading.Lock()
         self._event = threading.Event()
         self._thread = None
+        self._emit_queue = None
+        self._emit_threads = []
+        self._reported_dropped = 0
+        self.emitted = 0
+        self.failed = 0
 
     @property
     def is_alive(self):
         """Returns True is the background thread is running."""
         return self._thread is not None and self._thread.is_alive()
 
+    @property
+    def dropped(self):
+        """The number of items dropped because the queue was full."""
+        return self._queue.dropped
+
+    @property
+    def load(self):
+        """The fraction of the queue in use, 0 if the queue isn't bounded."""
+        if self._queue.max_size <= 0:
+            return 0.0
+        return min(float(self._queue.qsize()) / self._queue.max_size, 1.0)
+
     def _get_items(self):
         """Get multiple items from a Queue.
 
         Gets at least one (blocking) and at most ``max_batch_size`` items
-        (non-blocking) from a given Queue. Does not mark the items as done.
+        from a given Queue, waiting up to ``wait_period`` after the first
+        item for more. Does not wait once the worker is stopping. Does not
+        mark the items as done.
 
         :rtype: Sequence
         :returns: A sequence of items retrieved from the queue.
         """
-        items = [self._queue.get()]
+        item = self._queue.get()
+        items = [item]
+        stopping = item is _WORKER_TERMINATOR
+        deadline = _monotonic() + self._wait_period
 
         while len(items) < self._max_batch_size:
+            remaining = deadline - _monotonic()
             try:
-                items.append(self._queue.get_nowait())
+                if stopping or remaining <= 0 or self._event.is_set():
+                    item = self._queue.get_nowait()
+                else:
+                    item = self._queue.get(timeout=remaining)
             except queue.Empty:
                 break
+            items.append(item)
+            stopping = stopping or item is _WORKER_TERMINATOR
 
         return items
 
+    def _emit(self, data, count):
+        """Export a batch of data and mark its ``count`` items as done."""
+        if data:
+            try:
+                self.exporter.emit(data)
+            except Exception:
+                logger.exception(
+                    '%s failed to emit data.'
+                    'Dropping %s objects from queue.',
+                    self.exporter.__class__.__name__,
+                    len(data))
+                with self._counters_lock:
+                    self.failed += len(data)
+            else:
+                with self._counters_lock:
+                    self.emitted += len(data)
+
+        for _ in range(count):
+            self._queue.task_done()
+
+    def _report_dropped(self):
+        dropped = self._queue.dropped
+        if dropped != self._reported_dropped:
+            logger.warning(
+                '%s items were dropped because the export queue was full.',
+                dropped - self._reported_dropped)
+            self._reported_dropped = dropped
+
     def _thread_main(self):
         """The entry point for the worker thread.
 
@@ -109,28 +268,31 @@ class _Worker(object):
                 else:
                     data.extend(item)
 
-            if data:
-                try:
-                    self.exporter.emit(data)
-                except Exception:
-                    logger.exception(
-                        '%s failed to emit data.'
-                        'Dropping %s objects from queue.',
-                        self.exporter.__class__.__name__,
-                        len(data))
-                    pass
-
-            for _ in range(len(items)):
-                self._queue.task_done()
-
-            # self._event is set at exit, at which point we start draining the
-            # queue immediately. If self._event is unset, block for
-            # self.wait_period between each batch of exports.
-            self._event.wait(self._wait_period)
+            if self._emit_queue is None:
+                self._emit(data, len(items))
+            else:
+                # Blocks while all the export threads are busy.
+                self._emit_queue.put((data, len(items)))
+
+            self._report_dropped()
 
             if quit_:
                 break
 
+        if self._emit_queue is not None:
+            for _ in self._emit_threads:
+                self._emit_queue.put(_WORKER_TERMINATOR)
+
+    def _emit_thread_main(self):
+        """The entry point for the export threads."""
+        execution_context.set_is_exporter(True)
+
+        while True:
+            batch = self._emit_queue.get()
+            if batch is _WORKER_TERMINATOR:
+                break
+            self._emit(*batch)
+
     def start(self):
         """Starts the background thread.
 
@@ -141,6 +303,17 @@ class _Worker(object):
             if self.is_alive:
                 return
 
+            if self._export_threads > 1:
+                self._emit_queue = queue.Queue(self._export_threads)
+                self._emit_threads = []
+                for _ in range(self._export_threads):
+                    thread = threading.Thread(
+                        target=self._emit_thread_main,
+                        name=_EMITTER_THREAD_NAME)
+                    thread.daemon = True
+                    thread.start()
+                    self._emit_threads.append(thread)
+
             self._thread = threading.Thread(
                 target=self._thread_main, name=_WORKER_THREAD_NAME)
             self._thread.daemon = True
@@ -164,11 +337,16 @@ class _Worker(object):
             return True
 
         with self._lock:
+            deadline = _monotonic() + self._grace_period
             self._queue.put_nowait(_WORKER_TERMINATOR)
             self._thread.join(timeout=self._grace_period)
+            for thread in self._emit_threads:
+                thread.join(timeout=max(deadline - _monotonic(), 0))
 
-            success = not self.is_alive
+            success = not self.is_alive and not any(
+                thread.is_alive() for thread in self._emit_threads)
             self._thread = None
+            self._emit_threads = []
 
             return success
 
@@ -176,13 +354,17 @@ class _Worker(object):
         """Callback that attempts to send pending data before termination."""
         if not self.is_alive:
             return
-        # Stop blocking between export batches
+        # Stop waiting for batches to fill up
         self._event.set()
         self.stop()
 
     def enqueue(self, data):
-        """Queues data to be written by the background thread."""
-        self._queue.put_nowait(data)
+        """Queues data to be written by the background thread.
+
+        If the queue is full, the data is handled according to the worker's
+        drop policy.
+        """
+        self._queue.put(data)
 
     def flush(self):
         """Submit any pending data."""
@@ -205,20 +387,40 @@ class AsyncTransport(base.Transport):
                            in the background thread.
 
     :type wait_period: int
-    :param wait_period: The amount of time to wait before sending the next
-                        batch of data.
+    :param wait_period: The maximum amount of time to wait for a batch to
+                        fill up before sending it.
+
+    :type max_queue_size: int
+    :param max_queue_size: The maximum number of exports waiting to be sent.
+                           Not bounded if it's not positive.
+
+    :type drop_policy: str
+    :param drop_policy: What to do with new data when the queue is full,
+                        one of :data:`DROP_NEWEST`, :data:`DROP_OLDEST` and
+                        :data:`BLOCK`. The number of dropped exports is
+                        available as ``transport.worker.dropped``.
+
+    :type export_threads: int
+    :param export_threads: The number of threads sending batches, more than
+                           one allows several batches to be in flight.
     """
 
     def __init__(self, exporter,
                  grace_period=_DEFAULT_GRACE_PERIOD,
                  max_batch_size=_DEFAULT_MAX_BATCH_SIZE,
-                 wait_period=_DEFAULT_WAIT_PERIOD):
+                 wait_period=_DEFAULT_WAIT_PERIOD,
+                 max_queue_size=_DEFAULT_MAX_QUEUE_SIZE,
+                 drop_policy=DROP_NEWEST,
+                 export_threads=1):
         self.exporter = exporter
         self.worker = _Worker(
             exporter,
             grace_period,
             max_batch_size,
             wait_period,
+            max_queue_size,
+            drop_policy,
+            export_threads,
         )
         self.worker.start()
 
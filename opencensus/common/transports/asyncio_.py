@@ -0,0 +1,312 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transport and helpers to export from an asyncio event loop.
+
+Exporters used with :class:`AsyncioTransport` or :func:`get_exporter_task`
+can define ``emit`` and ``export_metrics`` as coroutine functions, which
+are awaited on the event loop. Blocking ``emit`` and ``export_metrics``
+methods are run in the loop's default executor instead, e.g. to send
+requests with an :class:`~opencensus.common.http_client.HttpClient`::
+
+    class MyExporter(base_exporter.Exporter):
+        def __init__(self):
+            self.transport = AsyncioTransport(self)
+            self.client = http_client.get_client()
+
+        def emit(self, span_datas):
+            self.client.post(URL, encode(span_datas))
+
+        def export(self, span_datas):
+            self.transport.export(span_datas)
+
+See
+:class:`~opencensus.ext.zipkin.trace_exporter.asyncio_.AsyncioZipkinExporter`
+for a complete exporter.
+
+This module requires Python 3.5+.
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+
+from opencensus.common.transports import base
+from opencensus.trace import execution_context
+
+_DEFAULT_GRACE_PERIOD = 5.0  # Seconds
+_DEFAULT_MAX_BATCH_SIZE = 600
+_DEFAULT_MAX_QUEUE_SIZE = 10000
+_DEFAULT_WAIT_PERIOD = 60.0  # Seconds
+_DEFAULT_INTERVAL = 60  # Seconds
+
+logger = logging.getLogger(__name__)
+
+
+def _get_running_loop():
+    """Get the event loop running in the current thread, or None."""
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:  # pragma: NO COVER
+        # Python < 3.7
+        return asyncio._get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _call_in_exporter_context(func, *args):
+    # Suppress tracking of requests made by blocking exporters
+    execution_context.set_is_exporter(True)
+    try:
+        return func(*args)
+    finally:
+        execution_context.set_is_exporter(False)
+
+
+async def _call_exporter(func, *args):
+    """Await ``func`` if it is a coroutine function, otherwise run it in the
+    default executor of the running loop."""
+    if asyncio.iscoroutinefunction(func):
+        return await func(*args)
+    loop = _get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(_call_in_exporter_context, func, *args))
+
+
+class AsyncioTransport(base.Transport):
+    """Transport that exports batches of data from an asyncio event loop.
+
+    Data is queued without blocking and exported by a task on the loop, so
+    no thread is needed for exporters with a coroutine ``emit`` method. A
+    batch is exported once it has ``max_batch_size`` items or
+    ``wait_period`` seconds after its first item was queued.
+
+    :type exporter: :class:`~opencensus.trace.base_exporter.Exporter` or
+                    :class:`~opencensus.stats.base_exporter.StatsExporter`
+    :param exporter: Instance of Exporter object.
+
+    :type loop: :class:`asyncio.AbstractEventLoop`
+    :param loop: (Optional) The event loop to export from. Defaults to the
+                 loop running when data is first exported.
+
+    :type grace_period: float
+    :param grace_period: The amount of time :meth:`flush` waits for pending
+                         data to be submitted.
+
+    :type max_batch_size: int
+    :param max_batch_size: The maximum number of items to send at a time.
+
+    :type wait_period: float
+    :param wait_period: The maximum amount of time to wait for a batch to
+                        fill up before sending it.
+
+    :type max_queue_size: int
+    :param max_queue_size: The maximum number of items waiting to be
+                           exported, new items are dropped when the queue is
+                           full. Not bounded if it's not positive.
+    """
+    def __init__(self, exporter,
+                 loop=None,
+                 grace_period=_DEFAULT_GRACE_PERIOD,
+                 max_batch_size=_DEFAULT_MAX_BATCH_SIZE,
+                 wait_period=_DEFAULT_WAIT_PERIOD,
+                 max_queue_size=_DEFAULT_MAX_QUEUE_SIZE):
+        self.exporter = exporter
+        self.loop = loop
+        self._grace_period = grace_period
+        self._max_batch_size = max_batch_size
+        self._wait_period = wait_period
+        self._max_queue_size = max_queue_size
+        self._queue = None
+        self._batch_ready = None
+        self._task = None
+        self._flushing = False
+        self.dropped = 0
+        self.emitted = 0
+        self.failed = 0
+
+    def _start(self):
+        """Create the queue and the export task, on the loop's thread."""
+        if self._task is None or self._task.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue(max(self._max_queue_size, 0))
+                self._batch_ready = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+    def _enqueue(self, data):
+        self._start()
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.dropped += 1
+        # The export task holds the first item of the batch it waits for.
+        if self._queue.qsize() >= self._max_batch_size - 1:
+            self._batch_ready.set()
+
+    def export(self, datas):
+        """Queue data to be exported by the loop.
+
+        Can be called from the loop or from other threads, doesn't block.
+        """
+        running_loop = _get_running_loop()
+        if self.loop is None:
+            if running_loop is None:
+                raise RuntimeError(
+                    'AsyncioTransport needs an event loop, export from a '
+                    'running loop or pass the loop to the transport.')
+            self.loop = running_loop
+
+        if running_loop is self.loop:
+            self._enqueue(datas)
+        else:
+            self.loop.call_soon_threadsafe(self._enqueue, datas)
+
+    async def _get_items(self):
+        """Get at least one and at most ``max_batch_size`` items.
+
+        Waits up to ``wait_period`` after the first item for the batch to
+        fill up, unless the transport is being flushed.
+        """
+        items = [await self._queue.get()]
+
+        if self._queue.qsize() < self._max_batch_size - 1 and \
+                not self._flushing:
+            self._batch_ready.clear()
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(), self._wait_period)
+            except asyncio.TimeoutError:
+                pass
+
+        while len(items) < self._max_batch_size:
+            try:
+                items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        return items
+
+    async def _emit(self, data):
+        try:
+            await _call_exporter(self.exporter.emit, data)
+        except Exception:
+            logger.exception(
+                '%s failed to emit data.'
+                'Dropping %s objects from queue.',
+                self.exporter.__class__.__name__,
+                len(data))
+            self.failed += len(data)
+        else:
+            self.emitted += len(data)
+
+    async def _run(self):
+        # Used to suppress tracking of requests in this task
+        execution_context.set_is_exporter(True)
+
+        while True:
+            items = await self._get_items()
+            data = list(itertools.chain.from_iterable(items))
+            if data:
+                await self._emit(data)
+            for _ in items:
+                self._queue.task_done()
+
+    async def flush_async(self):
+        """Wait until all queued data is exported."""
+        if self._queue is None:
+            return
+        self._start()
+        self._flushing = True
+        self._batch_ready.set()
+        try:
+            await self._queue.join()
+        finally:
+            self._flushing = False
+
+    def flush(self):
+        """Submit any pending data, waiting up to ``grace_period`` seconds.
+
+        Must not be called from the loop's thread, use
+        ``await transport.flush_async()`` there instead.
+        """
+        if self.loop is None or self.loop.is_closed():
+            return
+        if _get_running_loop() is self.loop:
+            raise RuntimeError(
+                'flush() would block the event loop, '
+                'await flush_async() instead.')
+        future = asyncio.run_coroutine_threadsafe(
+            self.flush_async(), self.loop)
+        try:
+            future.result(self._grace_period)
+        except Exception:
+            future.cancel()
+            logger.warning('Failed to flush pending data.', exc_info=True)
+
+    async def close(self):
+        """Export the pending data and stop the export task."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self.flush_async(), self._grace_period)
+        except asyncio.TimeoutError:
+            logger.warning('Timed out exporting pending data.')
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def get_exporter_task(metric_producers, exporter, interval=None):
+    """Get a task on the running loop that periodically exports metrics.
+
+    The asyncio counterpart of
+    :func:`opencensus.metrics.transport.get_exporter_thread`. Every
+    ``interval`` seconds the task gets the metrics of all producers and
+    exports them with ``exporter.export_metrics``, which can be a coroutine
+    function. Cancel the task to stop exporting.
+
+    :type metric_producers:
+    list(:class:`opencensus.metrics.export.metric_producer.MetricProducer`)
+    :param metric_producers: The list of metric producers to use to get metrics
+
+    :type exporter: :class:`opencensus.stats.base_exporter.MetricsExporter`
+    :param exporter: The exporter to use to export metrics.
+
+    :type interval: int or float
+    :param interval: Seconds between export calls.
+
+    :rtype: :class:`asyncio.Task`
+    :return: The running task.
+    """
+    if interval is None:
+        interval = _DEFAULT_INTERVAL
+
+    async def export_periodically():
+        # Used to suppress tracking of requests in this task
+        execution_context.set_is_exporter(True)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                metrics = list(itertools.chain.from_iterable(
+                    producer.get_metrics() for producer in metric_producers))
+                await _call_exporter(exporter.export_metrics, metrics)
+            except Exception as ex:
+                logger.exception(
+                    "Error handling metric export: {}".format(ex))
+
+    return asyncio.ensure_future(export_periodically())
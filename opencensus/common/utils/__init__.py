@@ -19,6 +19,8 @@ except ImportError:
 
 import calendar
 import datetime
+import numbers
+import time
 import weakref
 
 UTF8 = 'utf-8'
@@ -28,6 +30,8 @@ MAX_LENGTH = 128
 
 ISO_DATETIME_REGEX = '%Y-%m-%dT%H:%M:%S.%fZ'
 
+_EPOCH = datetime.datetime(1970, 1, 1)
+
 
 def get_truncatable_str(str_to_convert):
     """Truncate a string if exceed limit and record the truncated bytes
@@ -58,6 +62,8 @@ def check_str_length(str_to_check, limit=MAX_LENGTH):
     """
     str_bytes = str_to_check.encode(UTF8)
     str_len = len(str_bytes)
+    if str_len <= limit and type(str_to_check) is str:
+        return (str_to_check, 0)
     truncated_byte_count = 0
 
     if str_len > limit:
@@ -76,11 +82,53 @@ def to_iso_str(ts=None):
     return ts.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
+def time_ns():
+    """Get the current time as an integer number of nanoseconds since the
+    epoch."""
+    try:
+        return time.time_ns()
+    except AttributeError:  # pragma: NO COVER
+        return int(time.time() * 1e9)
+
+
+def monotonic_ns():
+    """Get the value of a monotonic clock in integer nanoseconds, only
+    meaningful to measure the time elapsed between two calls."""
+    try:
+        return time.perf_counter_ns()
+    except AttributeError:
+        pass
+    try:
+        # Python 3.5 and 3.6
+        return int(time.perf_counter() * 1e9)
+    except AttributeError:
+        # Python 2 has no monotonic clock
+        return int(time.time() * 1e9)
+
+
+def ns_to_datetime(timestamp_ns):
+    """Convert nanoseconds since the epoch into a naive UTC datetime."""
+    return _EPOCH + datetime.timedelta(microseconds=timestamp_ns // 1000)
+
+
+def ns_to_iso_str(timestamp_ns):
+    """Get an ISO 8601 string for a time in nanoseconds since the epoch."""
+    # Same format as to_iso_str, isoformat is faster than strftime but
+    # omits zero microseconds
+    iso_str = ns_to_datetime(timestamp_ns).isoformat()
+    if len(iso_str) == 19:
+        return iso_str + '.000000Z'
+    return iso_str + 'Z'
+
+
 def timestamp_to_microseconds(timestamp):
     """Convert a timestamp string into a microseconds value
-    :param timestamp
+    :param timestamp: ISO 8601 timestamp string, or an integer number of
+        nanoseconds since the epoch
     :return time in microseconds
     """
+    if isinstance(timestamp, numbers.Integral):
+        return timestamp / 1e3
     timestamp_str = datetime.datetime.strptime(timestamp, ISO_DATETIME_REGEX)
     epoch_time_secs = calendar.timegm(timestamp_str.timetuple())
     epoch_time_mus = epoch_time_secs * 1e6 + timestamp_str.microsecond
@@ -14,7 +14,17 @@
 
 import six
 
-from opencensus.metrics.export import gauge, metric_descriptor
+import threading
+from datetime import datetime
+
+from opencensus.metrics.export import (
+    gauge,
+    metric,
+    metric_descriptor,
+    point,
+    time_series,
+    value,
+)
 
 
 class CumulativePointLong(gauge.GaugePointLong):
@@ -59,16 +69,89 @@ class CumulativePointDouble(gauge.GaugePointDouble):
             super(CumulativePointDouble, self).add(val)
 
 
-class LongCumulativeMixin(object):
+class CumulativeMixin(object):
+    """Mixin exporting cumulative measures as totals or as deltas.
+
+    With `delta`, `get_metric` reports how much each measurement increased
+    since the previous call, as a point whose time series starts at the
+    previous call, or when the measure was created for the first call. The
+    measurements that did not increase are left out, so idle time series
+    are not exported at all.
+
+    The measurements themselves are never reset, so points returned by
+    `get_or_create_time_series` can be kept and updated as usual.
+
+    :type delta: bool
+    :param delta: Whether to export the increase of the measurements since
+        the previous export instead of their totals.
+    """
+
+    def __init__(self, name, description, unit, label_keys, delta=False):
+        super(CumulativeMixin, self).__init__(
+            name, description, unit, label_keys)
+        self._delta = delta
+        self._delta_lock = threading.Lock()
+        # The time and reported value of each measurement at the last export
+        self._delta_start = datetime.utcnow()
+        self._reported_values = {}
+
+    @property
+    def delta(self):
+        """Whether the increase since the previous export is exported"""
+        return self._delta
+
+    def get_metric(self, timestamp):
+        """Get a metric including all current or increased time series.
+
+        Without `delta`, see
+        :meth:`opencensus.metrics.export.gauge.BaseGauge.get_metric`.
+
+        :type timestamp: :class:`datetime.datetime`
+        :param timestamp: Recording time to report, usually the current time.
+
+        :rtype: :class:`opencensus.metrics.export.metric.Metric` or None
+        :return: A converted metric for all current measurements, or for the
+            increased ones with `delta`.
+        """
+        if not self._delta:
+            return super(CumulativeMixin, self).get_metric(timestamp)
+
+        with self._points_lock:
+            points = list(self.points.items())
+        ts_list = []
+        with self._delta_lock:
+            start = self._delta_start
+            reported_values = {}
+            for lv, gp in points:
+                val = gp.get_value()
+                if val is None:
+                    continue
+                reported_values[lv] = val
+                increase = val - self._reported_values.get(lv, 0)
+                if increase:
+                    ts_list.append(time_series.TimeSeries(
+                        lv,
+                        [point.Point(self.value_type(increase), timestamp)],
+                        start))
+            self._reported_values = reported_values
+            self._delta_start = timestamp
+        if not ts_list:
+            return None
+        return metric.Metric(self.descriptor, ts_list)
+
+
+class LongCumulativeMixin(CumulativeMixin):
     """Type mixin for long-valued cumulative measures."""
     descriptor_type = metric_descriptor.MetricDescriptorType.CUMULATIVE_INT64
     point_type = CumulativePointLong
+    value_type = value.ValueLong
 
 
-class DoubleCumulativeMixin(object):
+class DoubleCumulativeMixin(CumulativeMixin):
     """Type mixin for float-valued cumulative measures."""
     descriptor_type = metric_descriptor.MetricDescriptorType.CUMULATIVE_DOUBLE
     point_type = CumulativePointDouble
+    value_type = value.ValueDouble
 
 
 class LongCumulative(LongCumulativeMixin, gauge.Gauge):
@@ -27,7 +27,8 @@ class _MetricDescriptorTypeMeta(type):
             MetricDescriptorType.GAUGE_DISTRIBUTION,
             MetricDescriptorType.CUMULATIVE_INT64,
             MetricDescriptorType.CUMULATIVE_DOUBLE,
-            MetricDescriptorType.CUMULATIVE_DISTRIBUTION
+            MetricDescriptorType.CUMULATIVE_DISTRIBUTION,
+            MetricDescriptorType.SUMMARY
         }
 
 
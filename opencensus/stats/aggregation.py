@@ -17,9 +17,17 @@ import logging
 from opencensus.metrics.export.metric_descriptor import MetricDescriptorType
 from opencensus.stats import aggregation_data
 from opencensus.stats import measure as measure_module
+from opencensus.stats import quantile_sketch
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_BUCKETS = 160
+DEFAULT_MAX_SCALE = 20
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+DEFAULT_WINDOW = 60.0
+DEFAULT_WINDOW_SLICES = 6
+
 
 class SumAggregation(object):
     """Sum Aggregation describes that data collected and aggregated with this
@@ -114,6 +122,131 @@ class DistributionAggregation(object):
         return MetricDescriptorType.CUMULATIVE_DISTRIBUTION
 
 
+class ExponentialDistributionAggregation(object):
+    """Exponential Distribution Aggregation indicates that the desired
+    aggregation is a histogram distribution with exponential buckets, whose
+    resolution is reduced as needed to keep the number of buckets bounded
+
+    The bounds of the buckets are powers of ``2 ** (2 ** -scale)``, see
+    :class:`~opencensus.stats.aggregation_data.
+    ExponentialDistributionAggregationData`. With the default 160 buckets,
+    values within a range of 1 to 10**6 are recorded at scale 3, i.e. with
+    buckets 9% wide.
+
+    :type max_buckets: int
+    :param max_buckets: the maximum number of buckets of positive values
+
+    :type max_scale: int
+    :param max_scale: the scale to start recording at, the largest scale of
+                      the buckets
+
+    """
+
+    def __init__(self, max_buckets=DEFAULT_MAX_BUCKETS,
+                 max_scale=DEFAULT_MAX_SCALE):
+        if max_buckets < 2:
+            raise ValueError("max_buckets must be at least 2")
+        self._max_buckets = max_buckets
+        self._max_scale = max_scale
+
+    @property
+    def max_buckets(self):
+        """The maximum number of buckets of positive values"""
+        return self._max_buckets
+
+    @property
+    def max_scale(self):
+        """The largest scale of the buckets"""
+        return self._max_scale
+
+    def new_aggregation_data(self, measure=None):
+        """Get a new AggregationData for this aggregation."""
+        return aggregation_data.ExponentialDistributionAggregationData(
+            self._max_buckets, self._max_scale)
+
+    @staticmethod
+    def get_metric_type(measure):
+        """Get the MetricDescriptorType for the metric produced by this
+        aggregation and measure.
+        """
+        return MetricDescriptorType.CUMULATIVE_DISTRIBUTION
+
+
+class SummaryAggregation(object):
+    """Summary Aggregation indicates that the desired aggregation is the
+    count and sum of the data, with percentiles estimated over a sliding
+    window
+
+    The percentiles are estimated with a mergeable quantile sketch, see
+    :class:`~opencensus.stats.quantile_sketch.QuantileSketch`, whose memory
+    is bounded by ``max_buckets`` per slice of the window. Summaries are
+    meant for non-negative values such as latencies, negative values are
+    counted as zeros.
+
+    :type percentiles: list(float)
+    :param percentiles: the percentiles to report, between 0 and 100
+
+    :type relative_accuracy: float
+    :param relative_accuracy: the maximum relative error of the percentiles
+
+    :type max_buckets: int
+    :param max_buckets: the maximum number of buckets of each sketch
+
+    :type window: float
+    :param window: the length of the sliding window in seconds, or None to
+                   report the percentiles of all the recorded values
+
+    :type window_slices: int
+    :param window_slices: the number of slices the window moves by
+
+    """
+
+    def __init__(self, percentiles=DEFAULT_PERCENTILES,
+                 relative_accuracy=quantile_sketch.DEFAULT_RELATIVE_ACCURACY,
+                 max_buckets=quantile_sketch.DEFAULT_MAX_BUCKETS,
+                 window=DEFAULT_WINDOW, window_slices=DEFAULT_WINDOW_SLICES):
+        percentiles = list(percentiles)
+        if not percentiles:
+            raise ValueError("percentiles must not be empty")
+        if percentiles != sorted(set(percentiles)):
+            raise ValueError("percentiles must be strictly increasing")
+        if not (0 < percentiles[0] and percentiles[-1] <= 100):
+            raise ValueError("percentiles must be in the interval "
+                             "(0.0, 100.0]")
+        if window_slices < 1:
+            raise ValueError("window_slices must be positive")
+        # Fail early on invalid sketch options
+        quantile_sketch.QuantileSketch(relative_accuracy, max_buckets)
+        self._percentiles = percentiles
+        self._relative_accuracy = relative_accuracy
+        self._max_buckets = max_buckets
+        self._window = window
+        self._window_slices = window_slices
+
+    @property
+    def percentiles(self):
+        """The percentiles to report"""
+        return self._percentiles
+
+    @property
+    def window(self):
+        """The length of the sliding window in seconds"""
+        return self._window
+
+    def new_aggregation_data(self, measure=None):
+        """Get a new AggregationData for this aggregation."""
+        return aggregation_data.SummaryAggregationData(
+            self._percentiles, self._relative_accuracy, self._max_buckets,
+            self._window, self._window_slices)
+
+    @staticmethod
+    def get_metric_type(measure):
+        """Get the MetricDescriptorType for the metric produced by this
+        aggregation and measure.
+        """
+        return MetricDescriptorType.SUMMARY
+
+
 class LastValueAggregation(object):
     """Describes that the data collected with this method will
     overwrite the last recorded value
@@ -12,14 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import copy
 import logging
+import math
+import sys
 
-from opencensus.metrics.export import point, value
-from opencensus.stats import bucket_boundaries
+from opencensus.common import utils
+from opencensus.metrics.export import point, summary, value
+from opencensus.stats import bucket_boundaries, quantile_sketch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 logger = logging.getLogger(__name__)
 
+_LOG2E = 1 / math.log(2)
+_MAX_FLOAT = sys.float_info.max
+# Exponential bucket bounds between 1 and 2 by scale, up to the max scale
+_SUB_BOUNDS = {}
+_MAX_SUB_BOUNDS_SCALE = 10
+
 
 class SumAggregationData(object):
     """Sum Aggregation Data is the aggregated data for the Sum aggregation
@@ -50,6 +65,14 @@ class SumAggregationData(object):
         """
         self._sum_data += value
 
+    def add_samples(self, values, timestamp=None, attachments=None):
+        """Adds the sum of a batch of samples to the current sum data"""
+        self._sum_data += sum(values)
+
+    def merge(self, other):
+        """Fold the sum of another Sum Aggregation Data into this one"""
+        self._sum_data += other.sum_data
+
     @property
     def sum_data(self):
         """The current sum data"""
@@ -96,6 +119,14 @@ class CountAggregationData(object):
         the count data"""
         self._count_data = self._count_data + 1
 
+    def add_samples(self, values, timestamp=None, attachments=None):
+        """Adds the number of samples in a batch to the count data"""
+        self._count_data += len(values)
+
+    def merge(self, other):
+        """Fold the count of another Count Aggregation Data into this one"""
+        self._count_data += other.count_data
+
     @property
     def count_data(self):
         """The current count data"""
@@ -240,20 +271,86 @@ class DistributionAggregationData(object):
         self._sum_of_sqd_deviations = self._sum_of_sqd_deviations + (
             (value - old_mean) * (value - self._mean_data))
 
-    def increment_bucket_count(self, value):
-        """Increment the bucket count based on a given value from the user"""
-        if len(self._bounds) == 0:
-            self._counts_per_bucket[0] += 1
-            return 0
+    def merge(self, other):
+        """Fold another Distribution Aggregation Data with the same bounds
+        into this one.
+
+        Merging partial distributions gives the same result as recording
+        every sample into one.
+        """
+        if other.bounds != self._bounds:
+            raise ValueError("cannot merge distributions with different "
+                             "bounds")
+        if other.count_data == 0:
+            return
+
+        for ii, count in enumerate(other.counts_per_bucket):
+            self._counts_per_bucket[ii] += count
+        if self._exemplars is not None and other.exemplars is not None:
+            for ii, exemplar in other.exemplars.items():
+                if exemplar is not None:
+                    self._exemplars[ii] = exemplar
+
+        self._add_moments(other.count_data, other.mean_data,
+                          other.sum_of_sqd_deviations)
 
-        for ii, bb in enumerate(self._bounds):
-            if value < bb:
-                self._counts_per_bucket[ii] += 1
-                return ii
+    def add_samples(self, values, timestamp=None, attachments=None):
+        """Adding a batch of samples to Distribution Aggregation Data
+
+        This has the same result as calling `add_sample` for each value in
+        turn, but the mean and sum of squared deviations are only updated
+        once per batch. If NumPy is installed the bucket counts are computed
+        with `searchsorted` and `bincount`.
+        """
+        if numpy is not None:
+            values = numpy.asarray(values, dtype=float)
+            count = len(values)
+            if count == 0:
+                return
+            buckets = numpy.searchsorted(self._bounds, values, side='right')
+            bucket_counts = numpy.bincount(
+                buckets, minlength=len(self._counts_per_bucket))
+            for ii, bucket_count in enumerate(bucket_counts.tolist()):
+                self._counts_per_bucket[ii] += bucket_count
+            mean = float(values.mean())
+            sum_of_sqd_deviations = float(numpy.square(values - mean).sum())
+            buckets, values = buckets.tolist(), values.tolist()
         else:
-            last_bucket_index = len(self._bounds)
-            self._counts_per_bucket[last_bucket_index] += 1
-            return last_bucket_index
+            values = list(values)
+            count = len(values)
+            if count == 0:
+                return
+            buckets = [self.increment_bucket_count(vv) for vv in values]
+            mean = math.fsum(values) / count
+            sum_of_sqd_deviations = math.fsum(
+                (vv - mean) * (vv - mean) for vv in values)
+
+        if attachments is not None and self.exemplars is not None:
+            # Only the last value in each bucket would be kept as exemplar.
+            last_values = dict(zip(buckets, values))
+            for bucket, last_value in last_values.items():
+                self.exemplars[bucket] = Exemplar(
+                    last_value, timestamp, attachments)
+
+        self._add_moments(count, mean, sum_of_sqd_deviations)
+
+    def _add_moments(self, count, mean, sum_of_sqd_deviations):
+        """Combine the count, mean and sum of squared deviations of another
+        set of samples with the ones of this distribution, using the pairwise
+        update from Chan et al."""
+        total_count = self._count_data + count
+        delta = mean - self._mean_data
+        self._sum_of_sqd_deviations = (
+            self._sum_of_sqd_deviations + sum_of_sqd_deviations +
+            delta * delta * self._count_data * count / total_count)
+        self._mean_data = self._mean_data + delta * count / total_count
+        self._count_data = total_count
+
+    def increment_bucket_count(self, value):
+        """Increment the bucket count based on a given value from the user"""
+        bucket = bisect.bisect_right(self._bounds, value)
+        self._counts_per_bucket[bucket] += 1
+        return bucket
 
     def to_point(self, timestamp):
         """Get a Point conversion of this aggregation.
@@ -300,6 +397,425 @@ class DistributionAggregationData(object):
         )
 
 
+def _get_sub_bounds(scale):
+    """Get the lower bounds of the buckets between 1 and 2 at a scale"""
+    sub_bounds = _SUB_BOUNDS.get(scale)
+    if sub_bounds is None:
+        sub_buckets = 1 << scale
+        sub_bounds = _SUB_BOUNDS[scale] = [
+            2.0 ** (float(sub_index) / sub_buckets)
+            for sub_index in range(sub_buckets)]
+    return sub_bounds
+
+
+def get_exponential_bucket_index(value, scale):
+    """Get the index of the exponential bucket of a positive value.
+
+    At scale ``s`` the bucket ``i`` holds the values in
+    ``[2 ** (i / 2 ** s), 2 ** ((i + 1) / 2 ** s))``. The binary exponent of
+    the value gives the index at scales up to 0. At positive scales the
+    offset within that power of two is found by bisecting the bounds of the
+    mantissa, or above scale 10 from its logarithm, which may be off by one
+    next to the bucket bounds due to rounding.
+
+    :type value: float
+    :param value: The positive value.
+
+    :type scale: int
+    :param scale: The scale of the buckets.
+
+    :rtype: int
+    :returns: The index of the bucket.
+    """
+    mantissa, exponent = math.frexp(value)
+    # value == 2 * mantissa * 2 ** (exponent - 1), with 1 <= 2 * mantissa < 2
+    exponent -= 1
+    if scale <= 0:
+        return exponent >> -scale
+    if scale <= _MAX_SUB_BOUNDS_SCALE:
+        sub_index = bisect.bisect_right(
+            _get_sub_bounds(scale), 2 * mantissa) - 1
+        return (exponent << scale) + sub_index
+    sub_buckets = 1 << scale
+    sub_index = int(math.log(2 * mantissa) * _LOG2E * sub_buckets)
+    return (exponent << scale) + min(sub_index, sub_buckets - 1)
+
+
+def get_exponential_bucket_bound(index, scale):
+    """Get the lower bound of an exponential bucket, see
+    :func:`get_exponential_bucket_index`.
+
+    :type index: int
+    :param index: The index of the bucket.
+
+    :type scale: int
+    :param scale: The scale of the buckets.
+
+    :rtype: float
+    :returns: The smallest value of the bucket.
+    """
+    if scale <= 0:
+        return math.ldexp(1.0, index << -scale)
+    sub_buckets = 1 << scale
+    return math.ldexp(2.0 ** (float(index & (sub_buckets - 1)) / sub_buckets),
+                      index >> scale)
+
+
+class ExponentialDistributionAggregationData(DistributionAggregationData):
+    """Distribution Aggregation Data with exponential buckets whose scale is
+    reduced as needed to keep the number of buckets bounded.
+
+    Positive values are counted in buckets whose bounds are powers of
+    ``2 ** (2 ** -scale)``. The recorded range starts at the largest scale
+    and halves the resolution of the buckets, merging them in pairs, each
+    time it doesn't fit in ``max_buckets`` buckets. Zero, negative and NaN
+    values are counted in a bucket below all the others.
+
+    The buckets are converted to explicit bounds, starting at the lower
+    bound of the smallest recorded bucket and without the upper bound of the
+    largest one, so that exporters handle them as other distributions.
+    Exemplars are not recorded.
+
+    :type max_buckets: int
+    :param max_buckets: the maximum number of buckets of positive values
+
+    :type max_scale: int
+    :param max_scale: the initial scale of the buckets
+
+    """
+
+    def __init__(self, max_buckets, max_scale):
+        super(ExponentialDistributionAggregationData, self).__init__(0, 0, 0)
+        self._max_buckets = max_buckets
+        self._scale = max_scale
+        # count of the zero, negative and NaN values
+        self._zero_count = 0
+        # counts of the positive values by bucket index
+        self._bucket_counts = {}
+        self._min_index = None
+        self._max_index = None
+
+    @property
+    def max_buckets(self):
+        """The maximum number of buckets of positive values"""
+        return self._max_buckets
+
+    @property
+    def scale(self):
+        """The current scale of the buckets"""
+        return self._scale
+
+    @property
+    def zero_count(self):
+        """The count of zero, negative and NaN values"""
+        return self._zero_count
+
+    @property
+    def bucket_counts(self):
+        """The counts of the positive values by bucket index"""
+        return self._bucket_counts
+
+    @property
+    def bounds(self):
+        """The lower bounds of the buckets of positive values"""
+        if not self._bucket_counts:
+            return []
+        return [get_exponential_bucket_bound(index, self._scale)
+                for index in range(self._min_index, self._max_index + 1)]
+
+    @property
+    def counts_per_bucket(self):
+        """The counts of the bucket of non-positive values and of the
+        buckets of positive values"""
+        if not self._bucket_counts:
+            return [self._zero_count]
+        get = self._bucket_counts.get
+        counts = [self._zero_count]
+        counts.extend(get(index, 0)
+                      for index in range(self._min_index, self._max_index + 1))
+        return counts
+
+    def _get_scale_change(self, low, high):
+        """Get the scale reduction needed for buckets low to high to fit"""
+        change = 0
+        while (high >> change) - (low >> change) >= self._max_buckets:
+            change += 1
+        return change
+
+    def _downscale(self, change):
+        """Reduce the scale, merging the buckets"""
+        self._scale -= change
+        if not change or self._min_index is None:
+            return
+        bucket_counts = {}
+        for index, count in self._bucket_counts.items():
+            index >>= change
+            bucket_counts[index] = bucket_counts.get(index, 0) + count
+        self._bucket_counts = bucket_counts
+        self._min_index >>= change
+        self._max_index >>= change
+
+    def increment_bucket_count(self, value):
+        """Increment the bucket count based on a given value from the user"""
+        if not value > 0:
+            self._zero_count += 1
+            return 0
+        if value > _MAX_FLOAT:
+            value = _MAX_FLOAT
+        index = get_exponential_bucket_index(value, self._scale)
+        bucket_counts = self._bucket_counts
+        if index in bucket_counts:
+            bucket_counts[index] += 1
+            return 0
+        if self._min_index is None:
+            self._min_index = self._max_index = index
+        elif index < self._min_index or index > self._max_index:
+            low = min(index, self._min_index)
+            high = max(index, self._max_index)
+            change = self._get_scale_change(low, high)
+            if change:
+                self._downscale(change)
+                index >>= change
+            self._min_index = min(index, self._min_index)
+            self._max_index = max(index, self._max_index)
+        self._bucket_counts[index] = self._bucket_counts.get(index, 0) + 1
+        return 0
+
+    def add_samples(self, values, timestamp=None, attachments=None):
+        """Adding a batch of samples to Exponential Distribution Aggregation
+        Data"""
+        values = list(values)
+        count = len(values)
+        if count == 0:
+            return
+        for vv in values:
+            self.increment_bucket_count(vv)
+        mean = math.fsum(values) / count
+        sum_of_sqd_deviations = math.fsum(
+            (vv - mean) * (vv - mean) for vv in values)
+        self._add_moments(count, mean, sum_of_sqd_deviations)
+
+    def merge(self, other):
+        """Fold another Exponential Distribution Aggregation Data into this
+        one, at the smallest scale of the two or lower if the merged
+        buckets don't fit."""
+        if not isinstance(other, ExponentialDistributionAggregationData):
+            raise ValueError("cannot merge exponential and explicit "
+                             "distributions")
+        if other.count_data == 0:
+            return
+
+        self._zero_count += other.zero_count
+        if other.bucket_counts:
+            self._downscale(max(self._scale - other.scale, 0))
+            other_change = other.scale - self._scale
+            low = other._min_index >> other_change
+            high = other._max_index >> other_change
+            if self._min_index is not None:
+                low = min(low, self._min_index)
+                high = max(high, self._max_index)
+            change = self._get_scale_change(low, high)
+            self._downscale(change)
+            other_change += change
+            self._min_index = low >> change
+            self._max_index = high >> change
+            for index, count in other.bucket_counts.items():
+                index >>= other_change
+                self._bucket_counts[index] = \
+                    self._bucket_counts.get(index, 0) + count
+
+        self._add_moments(other.count_data, other.mean_data,
+                          other.sum_of_sqd_deviations)
+
+
+class SummaryAggregationData(object):
+    """Summary Aggregation Data is the count and sum of the aggregated data,
+    with a quantile sketch of the values recorded over a sliding window
+
+    The window is made of ``window_slices`` slices, each with its own
+    sketch. The sketches of the slices started within the last ``window``
+    seconds are merged to estimate the percentiles, and the older ones are
+    dropped, so the window covers between ``window`` minus one slice and
+    ``window`` seconds.
+
+    :type percentiles: list(float)
+    :param percentiles: the percentiles of the snapshot, between 0 and 100
+                        in increasing order
+
+    :type relative_accuracy: float
+    :param relative_accuracy: the maximum relative error of the percentiles
+
+    :type max_buckets: int
+    :param max_buckets: the maximum number of buckets of each sketch
+
+    :type window: float
+    :param window: the length of the sliding window in seconds, or None to
+                   estimate the percentiles of all the recorded values
+
+    :type window_slices: int
+    :param window_slices: the number of slices of the window
+
+    """
+
+    def __init__(self, percentiles, relative_accuracy, max_buckets,
+                 window=None, window_slices=1):
+        self._percentiles = percentiles
+        self._relative_accuracy = relative_accuracy
+        self._max_buckets = max_buckets
+        self._count_data = 0
+        self._sum_data = 0
+        if window is None:
+            self._window_ns = self._slice_ns = None
+        else:
+            self._window_ns = int(window * 1e9)
+            self._slice_ns = max(self._window_ns // window_slices, 1)
+        # start times and sketches of the slices of the window, oldest first
+        self._slices = []
+        # end time of the last slice, recording into it until then
+        self._slice_end_ns = 0
+
+    def __repr__(self):
+        return ("{}({})"
+                .format(
+                    type(self).__name__,
+                    self.count_data,
+                ))
+
+    @property
+    def count_data(self):
+        """The number of values recorded"""
+        return self._count_data
+
+    @property
+    def sum_data(self):
+        """The sum of the values recorded, counting negative ones as 0"""
+        return self._sum_data
+
+    @property
+    def percentiles(self):
+        """The percentiles of the snapshot"""
+        return self._percentiles
+
+    def _get_slice_start(self, now_ns):
+        if self._slice_ns is None:
+            return 0
+        return now_ns - now_ns % self._slice_ns
+
+    def _expire_slices(self, now_ns):
+        """Drop the slices that started before the window"""
+        if self._window_ns is None:
+            return
+        slices = self._slices
+        expired = 0
+        while expired < len(slices) and \
+                slices[expired][0] <= now_ns - self._window_ns:
+            expired += 1
+        if expired:
+            del slices[:expired]
+
+    def _get_sketch(self):
+        """Get the sketch of the current slice"""
+        slices = self._slices
+        if self._window_ns is None:
+            if not slices:
+                slices.append((0, quantile_sketch.QuantileSketch(
+                    self._relative_accuracy, self._max_buckets)))
+            return slices[0][1]
+        now_ns = utils.monotonic_ns()
+        if now_ns < self._slice_end_ns:
+            return slices[-1][1]
+        start_ns = self._get_slice_start(now_ns)
+        self._slice_end_ns = start_ns + self._slice_ns
+        if not slices or slices[-1][0] != start_ns:
+            self._expire_slices(now_ns)
+            slices.append((start_ns, quantile_sketch.QuantileSketch(
+                self._relative_accuracy, self._max_buckets)))
+        return slices[-1][1]
+
+    def add_sample(self, value, timestamp=None, attachments=None):
+        """Adds a sample to the count, sum and sketch of the current slice"""
+        self._count_data += 1
+        if value > 0:
+            self._sum_data += value
+        self._get_sketch().add(value)
+
+    def add_samples(self, values, timestamp=None, attachments=None):
+        """Adds a batch of samples to the count, sum and sketch of the
+        current slice"""
+        if not len(values):
+            return
+        sketch = self._get_sketch()
+        for vv in values:
+            self._count_data += 1
+            if vv > 0:
+                self._sum_data += vv
+            sketch.add(vv)
+
+    def merge(self, other):
+        """Fold the count, sum and slices of another Summary Aggregation Data
+        with the same options into this one"""
+        if other.percentiles != self._percentiles:
+            raise ValueError("cannot merge summaries with different "
+                             "percentiles")
+        self._count_data += other.count_data
+        self._sum_data += other.sum_data
+        sketches = dict(self._slices)
+        for start_ns, other_sketch in other._slices:
+            sketch = sketches.get(start_ns)
+            if sketch is None:
+                sketches[start_ns] = copy.deepcopy(other_sketch)
+            else:
+                sketch.merge(other_sketch)
+        self._slices = sorted(sketches.items(), key=lambda item: item[0])
+
+    def get_window_sketch(self):
+        """Get a sketch of the values recorded in the window.
+
+        :rtype: :class:`~opencensus.stats.quantile_sketch.QuantileSketch`
+        :return: A new sketch merging the sketches of the window.
+        """
+        if self._window_ns is not None:
+            self._expire_slices(utils.monotonic_ns())
+        window_sketch = quantile_sketch.QuantileSketch(
+            self._relative_accuracy, self._max_buckets)
+        for _, sketch in self._slices:
+            window_sketch.merge(sketch)
+        return window_sketch
+
+    def get_snapshot(self):
+        """Get the count, sum and percentiles of the values recorded in the
+        window.
+
+        :rtype: :class: `opencensus.metrics.export.summary.Snapshot`
+        :return: The snapshot of the window, without percentiles if no value
+        was recorded in it.
+        """
+        sketch = self.get_window_sketch()
+        values = sketch.get_quantiles(
+            [percentile / 100.0 for percentile in self._percentiles])
+        value_at_percentiles = [] if values is None else [
+            summary.ValueAtPercentile(percentile, vv)
+            for percentile, vv in zip(self._percentiles, values)]
+        return summary.Snapshot(sketch.count, sketch.sum,
+                                value_at_percentiles)
+
+    def to_point(self, timestamp):
+        """Get a Point conversion of this aggregation.
+
+        :type timestamp: :class: `datetime.datetime`
+        :param timestamp: The time to report the point as having been recorded.
+
+        :rtype: :class: `opencensus.metrics.export.point.Point`
+        :return: a :class: `opencensus.metrics.export.value.ValueSummary`
+        -valued Point with the count and sum of all the values and the
+        snapshot of the window.
+        """
+        return point.Point(
+            value.ValueSummary(summary.Summary(
+                self.count_data, self.sum_data, self.get_snapshot())),
+            timestamp)
+
+
 class LastValueAggregationData(object):
     """
     LastValue Aggregation Data is the value of aggregated data
@@ -330,6 +846,12 @@ class LastValueAggregationData(object):
         the current recorded value"""
         self._value = value
 
+    def add_samples(self, values, timestamp=None, attachments=None):
+        """Overwrites the current recorded value with the last sample of a
+        batch"""
+        if len(values):
+            self._value = values[-1]
+
     @property
     def value(self):
         """The current value recorded"""
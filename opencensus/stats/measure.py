@@ -47,6 +47,27 @@ class BaseMeasure(object):
         """The unit of the current measure"""
         return self._unit
 
+    def bind(self, tags=None):
+        """Bind the measure to a set of tags, to record values without
+        looking up the views and tag values every time.
+
+        Use :meth:`~opencensus.stats.stats_recorder.StatsRecorder.bind` to
+        record into another measure to view map.
+
+        :type tags: :class: '~opencensus.tags.tag_map.TagMap'
+        :param tags: (Optional) the tags to record the values with, read from
+                     the current runtime context if None
+
+        :rtype: :class:`~opencensus.stats.measure_to_view_map.BoundMeasure`
+        :returns: a handle recording values of the measure with the tags into
+                  the views of :data:`opencensus.stats.stats.stats`
+        """
+        # Imported here as the stats singleton depends on this module. The
+        # measure to view map of a new StatsRecorder would be the one of the
+        # current thread's runtime context, not the singleton's.
+        from opencensus.stats.stats import stats
+        return stats.stats_recorder.bind(self, tags)
+
 
 class MeasureInt(BaseMeasure):
     """Creates an Integer Measure"""
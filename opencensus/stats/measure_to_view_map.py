@@ -13,11 +13,16 @@
 # limitations under the License.
 
 import copy
+import functools
 import logging
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 
+from opencensus.common import utils
+from opencensus.stats import aggregation as aggregation_module
 from opencensus.stats import metric_utils
 from opencensus.stats import view_data as view_data_module
+from opencensus.tags import TagContext
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +31,42 @@ class MeasureToViewMap(object):
     """Measure To View Map stores a map from names of Measures to
     specific View Datas
 
+    :type sharded: bool
+    :param sharded: record sum, count and distribution views into
+                    per-thread shards that are only merged when the view data
+                    is read, see
+                    :class:`~opencensus.stats.view_data.ShardedViewData`.
+
+    :type deferred_export: bool
+    :param deferred_export: don't copy and export the recorded view datas on
+                            every record, but only mark them as changed and
+                            export one copy of each changed view data when
+                            :meth:`export_pending` is called.
+
+    :type delta: bool
+    :param delta: make :meth:`get_metrics` return the values recorded since
+                  its previous call, with the time series starting at that
+                  call, and drop the series recorded so far, so that the
+                  series that are not recorded again are not exported.
+
     """
 
-    def __init__(self):
+    # Aggregations whose data can be recorded in shards and merged later.
+    _SHARDABLE_AGGREGATIONS = (aggregation_module.SumAggregation,
+                               aggregation_module.CountAggregation,
+                               aggregation_module.DistributionAggregation,
+                               aggregation_module.
+                               ExponentialDistributionAggregation,
+                               aggregation_module.SummaryAggregation)
+
+    def __init__(self, sharded=False, deferred_export=False, delta=False):
+        self._sharded = sharded
+        self._delta = delta
+        self._deferred_export = deferred_export
+        # stores the view datas recorded since the last deferred export,
+        # keyed by view name
+        self._pending_export = OrderedDict()
+        self._pending_export_lock = threading.Lock()
         # stores the one-to-many mapping from Measures to View Datas
         self._measure_to_view_data_list_map = defaultdict(list)
         # stores a map from the registered View names to the Views
@@ -39,6 +77,9 @@ class MeasureToViewMap(object):
         self._exported_views = set()
         # Stores the registered exporters
         self._exporters = []
+        # Incremented whenever a view data is added, so that bound measures
+        # know when to bind again
+        self._views_version = 0
 
     @property
     def exported_views(self):
@@ -50,6 +91,45 @@ class MeasureToViewMap(object):
         """registered exporters"""
         return self._exporters
 
+    @property
+    def sharded(self):
+        """whether sum, count and distribution views are recorded into
+        per-thread shards"""
+        return self._sharded
+
+    @sharded.setter
+    def sharded(self, sharded):
+        self._check_no_views('sharded')
+        self._sharded = sharded
+
+    @property
+    def delta(self):
+        """whether get_metrics returns the values recorded since its previous
+        call"""
+        return self._delta
+
+    @delta.setter
+    def delta(self, delta):
+        self._check_no_views('delta')
+        self._delta = delta
+
+    def _check_no_views(self, option):
+        # The view datas of registered views are created for the options
+        if self._registered_views:
+            raise ValueError(
+                '{} must be set before registering views'.format(option))
+
+    @property
+    def deferred_export(self):
+        """whether recorded view datas are exported by export_pending"""
+        return self._deferred_export
+
+    @deferred_export.setter
+    def deferred_export(self, deferred_export):
+        self._deferred_export = deferred_export
+        if not deferred_export:
+            self.export_pending()
+
     def get_view(self, view_name, timestamp):
         """get the View Data from the given View name"""
         view = self._registered_views.get(view_name)
@@ -103,9 +183,48 @@ class MeasureToViewMap(object):
         self._registered_views[view.name] = view
         if registered_measure is None:
             self._registered_measures[measure.name] = measure
+        if view.limits_series:
+            view_data = view_data_module.ViewData(
+                view=view, start_time=timestamp, end_time=timestamp,
+                max_series=view.max_series, idle_timeout=view.idle_timeout,
+                evict_lru=view.evict_lru, delta=self._delta)
+        elif self._sharded and isinstance(view.aggregation,
+                                          self._SHARDABLE_AGGREGATIONS):
+            view_data = view_data_module.ShardedViewData(
+                view=view, start_time=timestamp, end_time=timestamp)
+        else:
+            view_data = view_data_module.ViewData(
+                view=view, start_time=timestamp, end_time=timestamp,
+                delta=self._delta)
         self._measure_to_view_data_list_map[view.measure.name].append(
-            view_data_module.ViewData(view=view, start_time=timestamp,
-                                      end_time=timestamp))
+            view_data)
+        self._views_version += 1
+
+    def bind(self, measure, tags=None):
+        """binds a measure to a set of tags for recording without lookups
+
+        :type measure: :class: '~opencensus.stats.measure.BaseMeasure'
+        :param measure: the measure to record values of
+
+        :type tags: :class: '~opencensus.tags.tag_map.TagMap'
+        :param tags: (Optional) the tags to record the values with, read from
+                     the current runtime context if None
+
+        :rtype: :class:`BoundMeasure`
+        :returns: a handle recording values of the measure with the tags
+        """
+        return BoundMeasure(self, measure, tags)
+
+    def get_view_datas(self, measure):
+        """get the view datas recording a measure
+
+        :rtype: list(:class: `~opencensus.stats.view_data.ViewData`)
+        :returns: the view datas of the measure's views, or an empty list if
+                  another measure with the same name is registered
+        """
+        if measure != self._registered_measures.get(measure.name):
+            return []
+        return list(self._measure_to_view_data_list_map.get(measure.name, ()))
 
     def record(self, tags, measurement_map, timestamp, attachments=None):
         """records stats with a set of tags"""
@@ -113,23 +232,87 @@ class MeasureToViewMap(object):
         for measure, value in measurement_map.items():
             if measure != self._registered_measures.get(measure.name):
                 return
-            view_datas = []
-            for measure_name, view_data_list \
-                    in self._measure_to_view_data_list_map.items():
-                if measure_name == measure.name:
-                    view_datas.extend(view_data_list)
+            view_datas = self._measure_to_view_data_list_map.get(
+                measure.name, ())
             for view_data in view_datas:
                 view_data.record(
                     context=tags, value=value, timestamp=timestamp,
                     attachments=attachments)
+            if self._deferred_export:
+                self._mark_pending_export(view_datas)
+            else:
+                self.export(view_datas)
+
+    def record_many(self, measurements, timestamp, attachments=None):
+        """records a batch of stats, each with its own set of tags
+
+        The views of each measure are only looked up once per batch, and the
+        values recorded for the same view and tag values are added to its
+        aggregation data at once.
+
+        :type measurements: list(tuple(:class:
+            `~opencensus.tags.tag_map.TagMap`, dict))
+        :param measurements: pairs of tags and a map from measures to the
+            values to record with those tags.
+        """
+        view_datas_by_measure = {}
+        samples_by_view_data = OrderedDict()
+        for tags, measurement_map in measurements:
+            for measure, value in measurement_map.items():
+                view_datas = view_datas_by_measure.get(measure)
+                if view_datas is None:
+                    if measure != self._registered_measures.get(measure.name):
+                        view_datas = ()
+                    else:
+                        view_datas = self._measure_to_view_data_list_map.get(
+                            measure.name, ())
+                    view_datas_by_measure[measure] = view_datas
+                for view_data in view_datas:
+                    samples = samples_by_view_data.get(view_data)
+                    if samples is None:
+                        samples = samples_by_view_data[view_data] = []
+                    samples.append((tags, value))
+
+        for view_data, samples in samples_by_view_data.items():
+            view_data.record_many(samples, timestamp, attachments)
+        self._export_recorded(list(samples_by_view_data))
+
+    def _export_recorded(self, view_datas):
+        """export or mark for the next deferred export the recorded view
+        datas"""
+        if self._deferred_export:
+            self._mark_pending_export(view_datas)
+        elif view_datas:
             self.export(view_datas)
 
+    def _mark_pending_export(self, view_datas):
+        """remember the view datas to export on the next export_pending"""
+        if not view_datas or not self.exporters:
+            return
+        with self._pending_export_lock:
+            for view_data in view_datas:
+                self._pending_export[view_data.view.name] = view_data
+
+    def export_pending(self):
+        """export a copy of each view data recorded since the last call
+
+        Each changed view data is copied once no matter how many times it was
+        recorded, and the copies are sent to the registered exporters in a
+        single ``export`` call.
+        """
+        with self._pending_export_lock:
+            if not self._pending_export:
+                return
+            view_datas = list(self._pending_export.values())
+            self._pending_export.clear()
+        self.export(view_datas)
+
     # TODO: deprecate
     def export(self, view_datas):
         """export view datas to registered exporters"""
-        view_datas_copy = \
-            [self.copy_and_finalize_view_data(vd) for vd in view_datas]
         if len(self.exporters) > 0:
+            view_datas_copy = \
+                [self.copy_and_finalize_view_data(vd) for vd in view_datas]
             for e in self.exporters:
                 try:
                     e.export(view_datas_copy)
@@ -146,18 +329,126 @@ class MeasureToViewMap(object):
         :param timestamp: The timestamp to use for metric conversions, usually
         the current time.
 
+        Idle series are evicted from views with an idle timeout first, and
+        the views with limited series add metrics of the values recorded
+        into their overflow series and of their evicted series, see
+        :func:`~opencensus.stats.metric_utils.get_series_limit_metrics`.
+
+        In delta mode, the series of each view are swapped out and the
+        metrics, including those of the series limits, have the values
+        recorded since the previous call, see
+        :meth:`~opencensus.stats.view_data.ViewData.take_delta`.
+
         :rtype: Iterator[:class: `opencensus.metrics.export.metric.Metric`]
         """
+        limited_view_datas = []
         for vdl in self._measure_to_view_data_list_map.values():
             for vd in vdl:
+                if vd.view.limits_series:
+                    vd.evict_idle_series()
+                if self._delta:
+                    vd = vd.take_delta()
+                if vd.view.limits_series:
+                    limited_view_datas.append(vd)
                 metric = metric_utils.view_data_to_metric(vd, timestamp)
                 if metric is not None:
                     yield metric
+        for metric in metric_utils.get_series_limit_metrics(
+                limited_view_datas, timestamp):
+            yield metric
 
     # TODO(issue #470): remove this method once we export immutable stats.
     def copy_and_finalize_view_data(self, view_data):
         view_data_copy = copy.copy(view_data)
-        tvdam_copy = copy.deepcopy(view_data.tag_value_aggregation_data_map)
+        tvdam_copy = copy.deepcopy(
+            view_data_copy.tag_value_aggregation_data_map)
         view_data_copy._tag_value_aggregation_data_map = tvdam_copy
+        view_data_copy._series_start_ns = dict(view_data._series_start_ns)
         view_data_copy.end()
         return view_data_copy
+
+
+class BoundMeasure(object):
+    """A handle recording values of a measure with a fixed set of tags
+
+    Binding resolves the tag values of every view of the measure once, so
+    that :meth:`record` only has to update the aggregation data of each view.
+    Views registered later are picked up by binding again on the next
+    :meth:`record`.
+
+    :type measure_to_view_map: :class:`MeasureToViewMap`
+    :param measure_to_view_map: the measure to view map to record into
+
+    :type measure: :class: '~opencensus.stats.measure.BaseMeasure'
+    :param measure: the measure to record values of
+
+    :type tags: :class: '~opencensus.tags.tag_map.TagMap'
+    :param tags: (Optional) the tags to record the values with, read from the
+                 current runtime context if None
+
+    """
+    def __init__(self, measure_to_view_map, measure, tags=None):
+        if tags is None:
+            tags = TagContext.get()
+        self._measure_to_view_map = measure_to_view_map
+        self._measure = measure
+        self._tags = dict() if tags is None else dict(tags.map)
+        # The views version, recording functions and view datas of the last
+        # binding, the version is None if the binding is incomplete
+        self._binding = None
+
+    @property
+    def measure(self):
+        """the measure of the recorded values"""
+        return self._measure
+
+    @property
+    def tags(self):
+        """the map from tag keys to the tag values of the recorded values"""
+        return self._tags
+
+    def _bind(self):
+        mtvm = self._measure_to_view_map
+        version = mtvm._views_version
+        view_datas = mtvm.get_view_datas(self._measure)
+        add_samples = []
+        tags = self._tags
+        for view_data in view_datas:
+            tag_values = tuple(tags.get(tag_key)
+                               for tag_key in view_data.view.columns)
+            add_sample = view_data.bind(tag_values)
+            if add_sample is None:
+                # Bind again once the series exists
+                version = None
+                add_sample = functools.partial(
+                    view_data.record_tag_values, tag_values)
+            add_samples.append(add_sample)
+        self._binding = (version, add_samples, view_datas)
+        return self._binding
+
+    def record(self, value, attachments=None):
+        """records a value of the measure with the bound tags
+
+        :type value: int or float
+        :param value: the non-negative value to record
+
+        :type attachments: dict
+        :param attachments: (Optional) the contextual information of an
+                            exemplar of the value
+        """
+        if value < 0:
+            logger.warning("Dropping values, value to record must be "
+                           "non-negative")
+            return
+        binding = self._binding
+        if binding is None or \
+                binding[0] != self._measure_to_view_map._views_version:
+            binding = self._bind()
+        _, add_samples, view_datas = binding
+        if not view_datas:
+            return
+        # The timestamp is only used by the exemplars of attachments
+        timestamp = None if attachments is None else utils.to_iso_str()
+        for add_sample in add_samples:
+            add_sample(value, timestamp, attachments)
+        self._measure_to_view_map._export_recorded(view_datas)
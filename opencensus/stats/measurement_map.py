@@ -116,3 +116,34 @@ class MeasurementMap(object):
                 timestamp=utils.to_iso_str(),
                 attachments=self.attachments
         )
+
+    def record_many(self, measurements):
+        """records a batch of measurements, each with its own tag_map.
+
+        Measurements that include a negative value are dropped. The batch
+        is recorded with this map's attachments and a single timestamp.
+
+        :type measurements: list(tuple(:class:
+            `~opencensus.tags.tag_map.TagMap`, dict))
+        :param measurements: pairs of a tag_map and a map from measures to
+            values. If the tag_map is None the tags are read from the current
+            runtime context.
+        """
+        current_tags = None
+        batch = []
+        for tags, measurement_map in measurements:
+            if any(value < 0 for value in measurement_map.values()):
+                logger.warning("Dropping values, value to record must be "
+                               "non-negative")
+                continue
+            if tags is None:
+                if current_tags is None:
+                    current_tags = TagContext.get()
+                tags = current_tags
+            batch.append((tags, measurement_map))
+
+        self.measure_to_view_map.record_many(
+                measurements=batch,
+                timestamp=utils.to_iso_str(),
+                attachments=self.attachments
+        )
@@ -15,8 +15,31 @@
 Utilities to convert stats data models to metrics data models.
 """
 
-from opencensus.metrics import label_value
-from opencensus.metrics.export import metric, metric_descriptor, time_series
+from opencensus.metrics import label_key, label_value
+from opencensus.metrics.export import (
+    metric,
+    metric_descriptor,
+    point,
+    time_series,
+    value,
+)
+
+OVERFLOW_COUNT_METRIC_NAME = 'opencensus.io/view/overflow_count'
+EVICTED_SERIES_METRIC_NAME = 'opencensus.io/view/evicted_series_count'
+VIEW_LABEL_KEY = label_key.LabelKey('view', 'The name of the view')
+
+_OVERFLOW_COUNT_DESCRIPTOR = metric_descriptor.MetricDescriptor(
+    OVERFLOW_COUNT_METRIC_NAME,
+    'The number of values recorded into the overflow series of a view',
+    '1',
+    metric_descriptor.MetricDescriptorType.CUMULATIVE_INT64,
+    [VIEW_LABEL_KEY])
+_EVICTED_SERIES_DESCRIPTOR = metric_descriptor.MetricDescriptor(
+    EVICTED_SERIES_METRIC_NAME,
+    'The number of series evicted from a view',
+    '1',
+    metric_descriptor.MetricDescriptorType.CUMULATIVE_INT64,
+    [VIEW_LABEL_KEY])
 
 
 def is_gauge(md_type):
@@ -60,20 +83,56 @@ def view_data_to_metric(view_data, timestamp):
     :rtype: :class: `opencensus.metrics.export.metric.Metric`
     :return: A converted Metric.
     """
-    if not view_data.tag_value_aggregation_data_map:
+    tag_value_aggregation_data_map = view_data.tag_value_aggregation_data_map
+    if not tag_value_aggregation_data_map:
         return None
 
     md = view_data.view.get_metric_descriptor()
 
     # TODO: implement gauges
-    if is_gauge(md.type):
-        ts_start = None  # pragma: NO COVER
-    else:
-        ts_start = view_data.start_time
+    is_cumulative = not is_gauge(md.type)
 
     ts_list = []
-    for tag_vals, agg_data in view_data.tag_value_aggregation_data_map.items():
+    for tag_vals, agg_data in tag_value_aggregation_data_map.items():
         label_values = get_label_values(tag_vals)
         point = agg_data.to_point(timestamp)
+        # Series re-created after an eviction start when they were created
+        ts_start = view_data.get_series_start_time(tag_vals) \
+            if is_cumulative else None
         ts_list.append(time_series.TimeSeries(label_values, [point], ts_start))
     return metric.Metric(md, ts_list)
+
+
+def get_series_limit_metrics(view_datas, timestamp):
+    """Get the metrics of the series limits of ViewDatas.
+
+    :type view_datas: list(:class: `opencensus.stats.view_data.ViewData`)
+    :param view_datas: The ViewDatas of views with limited series.
+
+    :type timestamp: :class: `datetime.datetime`
+    :param timestamp: The time to set on the metrics' points, usually the
+    current time.
+
+    :rtype: list(:class: `opencensus.metrics.export.metric.Metric`)
+    :return: The metrics of the number of values recorded into the overflow
+    series and of the number of evicted series, with one time series per
+    view, or no metrics if there are no ViewDatas.
+    """
+    if not view_datas:
+        return []
+    overflow_ts_list = []
+    evicted_ts_list = []
+    for view_data in view_datas:
+        label_values = [label_value.LabelValue(view_data.view.name)]
+        overflow_ts_list.append(time_series.TimeSeries(
+            label_values,
+            [point.Point(value.ValueLong(view_data.overflow_count),
+                         timestamp)],
+            view_data.start_time))
+        evicted_ts_list.append(time_series.TimeSeries(
+            label_values,
+            [point.Point(value.ValueLong(view_data.evicted_count),
+                         timestamp)],
+            view_data.start_time))
+    return [metric.Metric(_OVERFLOW_COUNT_DESCRIPTOR, overflow_ts_list),
+            metric.Metric(_EVICTED_SERIES_DESCRIPTOR, evicted_ts_list)]
@@ -0,0 +1,193 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A mergeable sketch estimating the quantiles of non-negative values, in
+the manner of DDSketch (Masson et al., "DDSketch: A Fast and Fully-Mergeable
+Quantile Sketch with Relative-Error Guarantees", VLDB 2019).
+"""
+
+import math
+import sys
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+_MAX_FLOAT = sys.float_info.max
+
+
+class QuantileSketch(object):
+    """Count values in buckets of logarithmically increasing width, so that
+    the estimated quantiles are within a relative accuracy of the values.
+
+    The bucket ``i`` holds the values in ``(gamma ** (i - 1), gamma ** i]``
+    with ``gamma = (1 + relative_accuracy) / (1 - relative_accuracy)``.
+    Once there are more than ``max_buckets`` buckets the lowest ones are
+    collapsed into one, which only loses accuracy for the lowest quantiles.
+    Zero, negative and NaN values are counted as zeros, and infinite values
+    in the bucket of the largest float.
+
+    Sketches with the same relative accuracy can be merged, with the same
+    result as adding all the values to one sketch.
+
+    :type relative_accuracy: float
+    :param relative_accuracy: the maximum relative error of the quantiles,
+                              between 0 and 1
+
+    :type max_buckets: int
+    :param max_buckets: the maximum number of buckets of positive values
+
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY,
+                 max_buckets=DEFAULT_MAX_BUCKETS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+        self._relative_accuracy = relative_accuracy
+        self._max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self._bucket_counts = {}
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0
+
+    def __repr__(self):
+        return ("{}({})"
+                .format(
+                    type(self).__name__,
+                    self.count,
+                ))
+
+    @property
+    def relative_accuracy(self):
+        """The maximum relative error of the quantiles"""
+        return self._relative_accuracy
+
+    @property
+    def max_buckets(self):
+        """The maximum number of buckets of positive values"""
+        return self._max_buckets
+
+    @property
+    def count(self):
+        """The number of values added"""
+        return self._count
+
+    @property
+    def sum(self):
+        """The sum of the values added, counting non-positive ones as 0"""
+        return self._sum
+
+    @property
+    def zero_count(self):
+        """The number of zero, negative and NaN values added"""
+        return self._zero_count
+
+    @property
+    def bucket_counts(self):
+        """The counts of the positive values by bucket index"""
+        return self._bucket_counts
+
+    def add(self, value):
+        """Add a value to the sketch.
+
+        :type value: int or float
+        :param value: The value to add.
+        """
+        self._count += 1
+        if not value > 0:
+            self._zero_count += 1
+            return
+        self._sum += value
+        if value > _MAX_FLOAT:
+            value = _MAX_FLOAT
+        index = int(math.ceil(math.log(value) * self._multiplier))
+        bucket_counts = self._bucket_counts
+        if index in bucket_counts:
+            bucket_counts[index] += 1
+        else:
+            bucket_counts[index] = 1
+            if len(bucket_counts) > self._max_buckets:
+                self._collapse()
+
+    def merge(self, other):
+        """Add the values of another sketch with the same relative accuracy
+        to this one.
+
+        :type other: :class:`QuantileSketch`
+        :param other: The sketch to merge.
+        """
+        if other.relative_accuracy != self._relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative "
+                             "accuracies")
+        self._count += other.count
+        self._sum += other.sum
+        self._zero_count += other.zero_count
+        bucket_counts = self._bucket_counts
+        for index, count in other.bucket_counts.items():
+            bucket_counts[index] = bucket_counts.get(index, 0) + count
+        if len(bucket_counts) > self._max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        """Fold the lowest buckets into the lowest kept one"""
+        indexes = sorted(self._bucket_counts)
+        lowest = indexes[-self._max_buckets]
+        bucket_counts = self._bucket_counts
+        for index in indexes[:-self._max_buckets]:
+            bucket_counts[lowest] += bucket_counts.pop(index)
+
+    def get_quantiles(self, quantiles):
+        """Estimate the values at several quantiles in one pass.
+
+        :type quantiles: list of float
+        :param quantiles: The quantiles between 0 and 1, in increasing order.
+
+        :rtype: list of float
+        :returns: The estimated values, or None if the sketch is empty.
+        """
+        if not self._count:
+            return None
+        values = []
+        bucket_counts = self._bucket_counts
+        indexes = iter(sorted(bucket_counts))
+        cumulative_count = self._zero_count
+        value = 0.0
+        for quantile in quantiles:
+            # The rank of the value, counting from 0
+            rank = quantile * (self._count - 1)
+            while cumulative_count <= rank:
+                index = next(indexes)
+                cumulative_count += bucket_counts[index]
+                # The value with the smallest relative error to the bounds,
+                # capped as the bound of the last bucket may overflow
+                value = min(self._gamma ** (index - 1) *
+                            (2 * self._gamma / (self._gamma + 1)),
+                            _MAX_FLOAT)
+            values.append(value)
+        return values
+
+    def get_quantile(self, quantile):
+        """Estimate the value at a quantile.
+
+        :type quantile: float
+        :param quantile: The quantile between 0 and 1.
+
+        :rtype: float
+        :returns: The estimated value, or None if the sketch is empty.
+        """
+        values = self.get_quantiles([quantile])
+        return None if values is None else values[0]
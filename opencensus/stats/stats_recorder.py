@@ -32,3 +32,28 @@ class StatsRecorder(object):
         :returns a MeasurementMap for recording multiple measurements
         """
         return MeasurementMap(self.measure_to_view_map)
+
+    def bind(self, measure, tags=None):
+        """Binds a measure to a set of tags for recording without lookups.
+
+        :type measure: :class: '~opencensus.stats.measure.BaseMeasure'
+        :param measure: the measure to record values of
+
+        :type tags: :class: '~opencensus.tags.tag_map.TagMap'
+        :param tags: (Optional) the tags to record the values with, read from
+            the current runtime context if None
+
+        :rtype: :class:`~opencensus.stats.measure_to_view_map.BoundMeasure`
+        :returns: a handle recording values of the measure with the tags
+        """
+        return self.measure_to_view_map.bind(measure, tags)
+
+    def record_many(self, measurements):
+        """Records a batch of measurements, each with its own tag_map.
+
+        :type measurements: list(tuple(:class:
+            `~opencensus.tags.tag_map.TagMap`, dict))
+        :param measurements: pairs of a tag_map and a map from measures to
+            values, see :meth:`MeasurementMap.record_many`.
+        """
+        self.new_measurement_map().record_many(measurements)
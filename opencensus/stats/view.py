@@ -38,14 +38,42 @@ class View(object):
     :type aggregation: :class: '~opencensus.stats.aggregation.BaseAggregation'
     :param aggregation: the aggregation the view will support
 
+    :type max_series: int
+    :param max_series: (Optional) the maximum number of tag value tuples the
+                       view aggregates separately, the values recorded with
+                       other tag values are aggregated together in an
+                       overflow series whose tag values are all
+                       :data:`~opencensus.stats.view_data.OVERFLOW_TAG_VALUE`
+
+    :type idle_timeout: float
+    :param idle_timeout: (Optional) drop the series not recorded for this
+                         many seconds, when the view data is read and when
+                         making room for a new series
+
+    :type evict_lru: bool
+    :param evict_lru: (Optional) once there are ``max_series`` series, drop
+                      the least recently recorded one to make room for a new
+                      series instead of recording it into the overflow series
+
+    Views with any of these options are never recorded in shards, and an
+    evicted series starts over from a new aggregation if it is recorded
+    again.
     """
 
-    def __init__(self, name, description, columns, measure, aggregation):
+    def __init__(self, name, description, columns, measure, aggregation,
+                 max_series=None, idle_timeout=None, evict_lru=False):
+        if max_series is not None and max_series < 1:
+            raise ValueError("max_series must be positive")
+        if evict_lru and max_series is None:
+            raise ValueError("evict_lru requires max_series")
         self._name = name
         self._description = description
         self._columns = columns
         self._measure = measure
         self._aggregation = aggregation
+        self._max_series = max_series
+        self._idle_timeout = idle_timeout
+        self._evict_lru = evict_lru
 
         # Cache the converted MetricDescriptor here to avoid creating it each
         # time we convert a ViewData that realizes this View into a Metric.
@@ -77,6 +105,26 @@ class View(object):
         """the aggregation of the current view"""
         return self._aggregation
 
+    @property
+    def max_series(self):
+        """the maximum number of series of the current view"""
+        return self._max_series
+
+    @property
+    def idle_timeout(self):
+        """the time in seconds after which idle series are dropped"""
+        return self._idle_timeout
+
+    @property
+    def evict_lru(self):
+        """whether to drop the least recently recorded series for new ones"""
+        return self._evict_lru
+
+    @property
+    def limits_series(self):
+        """whether the series of the current view are limited or evicted"""
+        return self._max_series is not None or self._idle_timeout is not None
+
     def new_aggregation_data(self):
         """Get a new AggregationData for this view.
 
@@ -12,8 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+
 from opencensus.common import utils
 
+# The tag values of the series aggregating the values of the tag value tuples
+# over the limit of a view
+OVERFLOW_TAG_VALUE = '__overflow__'
+
 
 class ViewData(object):
     """View Data is the aggregated data for a particular view
@@ -27,16 +37,62 @@ class ViewData(object):
     :type end_time: datetime
     :param end_time: the end time for this view data
 
+    :type max_series: int
+    :param max_series: (Optional) the maximum number of series, not counting
+                       the overflow series, see
+                       :class:`~opencensus.stats.view.View`
+
+    :type idle_timeout: float
+    :param idle_timeout: (Optional) the time in seconds after which series
+                         that are not recorded can be evicted
+
+    :type evict_lru: bool
+    :param evict_lru: (Optional) whether to evict the least recently recorded
+                      series to make room for new ones
+
+    :type delta: bool
+    :param delta: (Optional) whether the view data is read with
+                  :meth:`take_delta`, which makes recording take a lock so
+                  that no value is lost while the series are swapped out
+
+    Recording also takes a lock when the series are limited, as series can
+    then be evicted by other recording threads and by exports.
     """
     def __init__(self,
                  view,
                  start_time,
-                 end_time):
+                 end_time,
+                 max_series=None,
+                 idle_timeout=None,
+                 evict_lru=False,
+                 delta=False):
         self._view = view
         self._start_time = start_time
         self._end_time = end_time
+        # start() and end() record nanoseconds since the epoch, which are
+        # only formatted when the times are read.
+        self._start_time_ns = None
+        self._end_time_ns = None
         self._tag_value_aggregation_data_map = {}
 
+        self._max_series = max_series
+        self._idle_timeout_ns = None if idle_timeout is None \
+            else int(idle_timeout * 1e9)
+        self._evict_lru = evict_lru
+        self._overflow_tag_values = None
+        self._overflow_count = 0
+        self._evicted_count = 0
+        # The last record time of each series but the overflow one, least
+        # recently recorded first, if series can be evicted
+        self._last_recorded_ns = OrderedDict() \
+            if evict_lru or idle_timeout is not None else None
+        # The start time of each series created after a series was evicted,
+        # which only holds the values recorded since it was re-created
+        self._series_start_ns = {}
+        self._lock = threading.Lock() \
+            if delta or max_series is not None or \
+            self._last_recorded_ns is not None else None
+
     @property
     def view(self):
         """the current view in the view data"""
@@ -47,11 +103,15 @@ class ViewData(object):
     @property
     def start_time(self):
         """the current start time in the view data"""
+        if self._start_time is None and self._start_time_ns is not None:
+            self._start_time = utils.ns_to_iso_str(self._start_time_ns)
         return self._start_time
 
     @property
     def end_time(self):
         """the current end time in the view data"""
+        if self._end_time is None and self._end_time_ns is not None:
+            self._end_time = utils.ns_to_iso_str(self._end_time_ns)
         return self._end_time
 
     @property
@@ -59,13 +119,174 @@ class ViewData(object):
         """the current tag value aggregation map in the view data"""
         return self._tag_value_aggregation_data_map
 
+    @property
+    def overflow_count(self):
+        """the number of values recorded into the overflow series"""
+        return self._overflow_count
+
+    @property
+    def evicted_count(self):
+        """the number of series evicted"""
+        return self._evicted_count
+
+    def _get_series_count(self):
+        count = len(self._tag_value_aggregation_data_map)
+        if self._overflow_tag_values is not None:
+            count -= 1
+        return count
+
+    def get_series_start_time(self, tag_values):
+        """gets the start time of the series with a tuple of tag values
+
+        :rtype: str
+        :returns: the time the series was created at if it was created after
+                  a series was evicted, the start time of the view data
+                  otherwise
+        """
+        start_time_ns = self._series_start_ns.get(tag_values)
+        if start_time_ns is None:
+            return self.start_time
+        return utils.ns_to_iso_str(start_time_ns)
+
+    def _evict(self, tuple_vals):
+        if self._tag_value_aggregation_data_map.pop(tuple_vals, None) \
+                is None:
+            return
+        self._series_start_ns.pop(tuple_vals, None)
+        self._evicted_count += 1
+
+    def evict_idle_series(self):
+        """evicts the series not recorded within the idle timeout
+
+        :rtype: int
+        :returns: the number of series evicted
+        """
+        if self._idle_timeout_ns is None:
+            return 0
+        with self._lock:
+            return self._evict_idle_series()
+
+    def _evict_idle_series(self):
+        """evicts the idle series, with the lock held"""
+        last_recorded_ns = self._last_recorded_ns
+        deadline_ns = utils.monotonic_ns() - self._idle_timeout_ns
+        evicted = 0
+        while last_recorded_ns:
+            tuple_vals = next(iter(last_recorded_ns))
+            if last_recorded_ns[tuple_vals] > deadline_ns:
+                break
+            del last_recorded_ns[tuple_vals]
+            self._evict(tuple_vals)
+            evicted += 1
+        return evicted
+
+    def _make_room(self):
+        """evicts series to make room for a new one, if allowed
+
+        :rtype: bool
+        :returns: whether there is room for a new series
+        """
+        if self._idle_timeout_ns is not None:
+            self._evict_idle_series()
+        if self._get_series_count() < self._max_series:
+            return True
+        if self._evict_lru and self._last_recorded_ns:
+            tuple_vals, _ = self._last_recorded_ns.popitem(last=False)
+            self._evict(tuple_vals)
+            return True
+        return False
+
+    def _get_aggregation_data(self, tuple_vals, count=1):
+        """gets the aggregation data to record values with the tag values
+        into, creating the series or falling back to the overflow series
+        when it doesn't exist"""
+        tvadm = self._tag_value_aggregation_data_map
+        agg_data = tvadm.get(tuple_vals)
+        if agg_data is None:
+            if self._max_series is not None and \
+                    self._get_series_count() >= self._max_series and \
+                    not self._make_room():
+                self._overflow_count += count
+                if self._overflow_tag_values is None:
+                    self._overflow_tag_values = \
+                        (OVERFLOW_TAG_VALUE,) * len(self.view.columns)
+                agg_data = tvadm.get(self._overflow_tag_values)
+                if agg_data is None:
+                    agg_data = tvadm[self._overflow_tag_values] = \
+                        self.view.new_aggregation_data()
+                return agg_data
+            agg_data = tvadm[tuple_vals] = self.view.new_aggregation_data()
+            if self._evicted_count or self._series_start_ns:
+                self._series_start_ns[tuple_vals] = utils.time_ns()
+        if self._last_recorded_ns is not None:
+            self._last_recorded_ns.pop(tuple_vals, None)
+            self._last_recorded_ns[tuple_vals] = utils.monotonic_ns()
+        return agg_data
+
+    def _swap_series(self):
+        """removes all the series and resets the overflow and evicted
+        series counts, returning the old aggregation map, series start times
+        and counts"""
+        tvadm = self._tag_value_aggregation_data_map
+        series_start_ns = self._series_start_ns
+        overflow_count = self._overflow_count
+        evicted_count = self._evicted_count
+        self._tag_value_aggregation_data_map = {}
+        self._series_start_ns = {}
+        self._overflow_tag_values = None
+        self._overflow_count = 0
+        self._evicted_count = 0
+        if self._last_recorded_ns is not None:
+            self._last_recorded_ns = OrderedDict()
+        return tvadm, series_start_ns, overflow_count, evicted_count
+
+    def _end_interval(self, tag_value_aggregation_data_map, end_time_ns):
+        """starts a new interval at `end_time_ns`, returning a view data of
+        the ended one with the given aggregation map"""
+        view_data = ViewData(self._view, self._start_time, None)
+        view_data._start_time_ns = self._start_time_ns
+        view_data._end_time_ns = end_time_ns
+        view_data._tag_value_aggregation_data_map = \
+            tag_value_aggregation_data_map
+        self._start_time = None
+        self._start_time_ns = end_time_ns
+        return view_data
+
+    def take_delta(self):
+        """ends the current interval, removing the series recorded in it
+
+        The next interval starts without any series, so the series that are
+        not recorded again are dropped, and the overflow and evicted series
+        counts of the ended interval move to the returned view data.
+
+        :rtype: :class:`ViewData`
+        :returns: a view data with the series recorded in the ended interval,
+                  starting at the end of the previous interval, or at the
+                  start of this view data for the first one
+        """
+        end_time_ns = utils.time_ns()
+        if self._lock is None:
+            tvadm, series_start_ns, overflow_count, evicted_count = \
+                self._swap_series()
+        else:
+            with self._lock:
+                tvadm, series_start_ns, overflow_count, evicted_count = \
+                    self._swap_series()
+        view_data = self._end_interval(tvadm, end_time_ns)
+        view_data._series_start_ns = series_start_ns
+        view_data._overflow_count = overflow_count
+        view_data._evicted_count = evicted_count
+        return view_data
+
     def start(self):
         """sets the start time for the view data"""
-        self._start_time = utils.to_iso_str()
+        self._start_time = None
+        self._start_time_ns = utils.time_ns()
 
     def end(self):
         """sets the end time for the view data"""
-        self._end_time = utils.to_iso_str()
+        self._end_time = None
+        self._end_time_ns = utils.time_ns()
 
     def get_tag_values(self, tags, columns):
         """function to get the tag values from tags and columns"""
@@ -88,9 +309,266 @@ class ViewData(object):
             tags = context.map
         tag_values = self.get_tag_values(tags=tags,
                                          columns=self.view.columns)
-        tuple_vals = tuple(tag_values)
-        if tuple_vals not in self.tag_value_aggregation_data_map:
-            self.tag_value_aggregation_data_map[tuple_vals] = \
-                self.view.new_aggregation_data()
-        self.tag_value_aggregation_data_map.get(tuple_vals).\
-            add_sample(value, timestamp, attachments)
+        self.record_tag_values(tuple(tag_values), value, timestamp,
+                               attachments)
+
+    def record_tag_values(self, tag_values, value, timestamp,
+                          attachments=None):
+        """records a value with a tuple of tag values, one for each of the
+        view's columns"""
+        if self._lock is not None:
+            with self._lock:
+                self._get_aggregation_data(tag_values).add_sample(
+                    value, timestamp, attachments)
+            return
+        agg_data = self._tag_value_aggregation_data_map.get(tag_values)
+        if agg_data is None:
+            agg_data = self._get_aggregation_data(tag_values)
+        agg_data.add_sample(value, timestamp, attachments)
+
+    def bind(self, tag_values):
+        """gets a function recording values with a tuple of tag values
+
+        The function takes the value, timestamp and attachments to record.
+        If the series is only ever added to, it is the ``add_sample`` method
+        of the series' aggregation data, otherwise it records with
+        :meth:`record_tag_values`.
+
+        :type tag_values: tuple
+        :param tag_values: the tag values, one for each of the view's columns
+
+        :rtype: function or None
+        :returns: the recording function, or None if the series doesn't exist
+                  yet and can be bound once it does
+        """
+        if self._lock is not None:
+            return functools.partial(self.record_tag_values, tag_values)
+        agg_data = self._tag_value_aggregation_data_map.get(tag_values)
+        if agg_data is None:
+            return None
+        return agg_data.add_sample
+
+    def group_by_tag_values(self, samples):
+        """group the values of (context, value) samples by the view's tag
+        values
+
+        :rtype: :class:`collections.OrderedDict`
+        :returns: a map from tag value tuples to lists of values
+        """
+        columns = self.view.columns
+        values_by_tag_values = OrderedDict()
+        for context, value in samples:
+            tags = dict() if context is None else context.map
+            tuple_vals = tuple(tags.get(tag_key) for tag_key in columns)
+            values = values_by_tag_values.get(tuple_vals)
+            if values is None:
+                values_by_tag_values[tuple_vals] = [value]
+            else:
+                values.append(value)
+        return values_by_tag_values
+
+    def record_many(self, samples, timestamp, attachments=None):
+        """records a batch of (context, value) samples, adding the values
+        for each set of tag values to the aggregation data at once"""
+        values_by_tag_values = self.group_by_tag_values(samples)
+        if self._lock is None:
+            self._record_values(values_by_tag_values, timestamp, attachments)
+        else:
+            with self._lock:
+                self._record_values(
+                    values_by_tag_values, timestamp, attachments)
+
+    def _record_values(self, values_by_tag_values, timestamp, attachments):
+        for tuple_vals, values in values_by_tag_values.items():
+            agg_data = self._get_aggregation_data(tuple_vals, len(values))
+            agg_data.add_samples(values, timestamp, attachments)
+
+
+def _merge_into(tag_value_aggregation_data_map, other, copy_func=None):
+    """merges the series of a tag value aggregation map into another one,
+    adding the aggregation data of the other map, or copies of it made with
+    `copy_func`, as the new series"""
+    for tuple_vals, agg_data in other.items():
+        merged_agg_data = tag_value_aggregation_data_map.get(tuple_vals)
+        if merged_agg_data is not None:
+            merged_agg_data.merge(agg_data)
+        elif copy_func is None:
+            tag_value_aggregation_data_map[tuple_vals] = agg_data
+        else:
+            tag_value_aggregation_data_map[tuple_vals] = copy_func(agg_data)
+
+
+class _ViewDataShard(object):
+    """The aggregation data recorded by a single thread for a view.
+
+    The lock is only ever contended between the owning thread and a reader
+    merging the shards, so recording does not block other threads.
+    """
+    __slots__ = ('lock', 'tag_value_aggregation_data_map', 'owner_ref')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tag_value_aggregation_data_map = {}
+        self.owner_ref = None
+
+
+class _ShardOwner(object):
+    """Held by the thread-local storage of the thread owning a shard, so
+    that it is released when the thread exits."""
+    __slots__ = ('__weakref__',)
+
+
+class ShardedViewData(ViewData):
+    """View Data that records into per-thread shards
+
+    Each recording thread gets its own map from tag values to aggregation
+    data, so concurrent recorders never touch the same aggregation objects.
+    The shards are merged into a new map when
+    :attr:`tag_value_aggregation_data_map` is read, which makes reads more
+    expensive and recording cheaper than with :class:`ViewData`.
+
+    The view's aggregation data must support ``merge``. Note that a non-zero
+    initial value of a sum or count aggregation is counted once per shard.
+    The shards of threads that exited are folded into a single map the next
+    time the shards are read or a thread creates its shard.
+
+    :type view: :class: '~opencensus.stats.view.View'
+    :param view: The view associated with this view data
+
+    :type start_time: datetime
+    :param start_time: the start time for this view data
+
+    :type end_time: datetime
+    :param end_time: the end time for this view data
+
+    """
+    def __init__(self,
+                 view,
+                 start_time,
+                 end_time):
+        super(ShardedViewData, self).__init__(view, start_time, end_time)
+        self._shards = []
+        # The shards of the threads that exited, appended by the weakref
+        # callbacks, which can't take locks as they run in any thread
+        self._dead_shards = []
+        # The series of the folded dead shards
+        self._retired = {}
+        self._shards_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _fold_dead_shards(self):
+        """merges the dead shards into the retired series and drops them,
+        with the shards lock held"""
+        dead_shards = self._dead_shards
+        while dead_shards:
+            shard = dead_shards.pop()
+            self._shards.remove(shard)
+            with shard.lock:
+                _merge_into(self._retired,
+                            shard.tag_value_aggregation_data_map)
+                shard.tag_value_aggregation_data_map = {}
+
+    @property
+    def tag_value_aggregation_data_map(self):
+        """a merged copy of the tag value aggregation map of every shard"""
+        merged = {}
+        with self._shards_lock:
+            self._fold_dead_shards()
+            _merge_into(merged, self._retired, copy.deepcopy)
+            for shard in self._shards:
+                with shard.lock:
+                    _merge_into(merged, shard.tag_value_aggregation_data_map,
+                                copy.deepcopy)
+        return merged
+
+    def take_delta(self):
+        """ends the current interval, removing the series recorded in it
+        from every shard
+
+        Each shard's series are swapped out under the shard's lock, so every
+        recorded value is counted in exactly one interval.
+
+        :rtype: :class:`ViewData`
+        :returns: a view data with the series recorded in the ended interval
+        """
+        end_time_ns = utils.time_ns()
+        tvadms = []
+        with self._shards_lock:
+            self._fold_dead_shards()
+            tvadms.append(self._retired)
+            self._retired = {}
+            for shard in self._shards:
+                with shard.lock:
+                    tvadms.append(shard.tag_value_aggregation_data_map)
+                    shard.tag_value_aggregation_data_map = {}
+
+        merged = {}
+        for tvadm in tvadms:
+            _merge_into(merged, tvadm)
+        return self._end_interval(merged, end_time_ns)
+
+    def _get_shard(self):
+        """get the current thread's shard, creating it on first use"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _ViewDataShard()
+            owner = _ShardOwner()
+            dead_shards = self._dead_shards
+            shard.owner_ref = weakref.ref(
+                owner, lambda _, shard=shard: dead_shards.append(shard))
+            with self._shards_lock:
+                self._fold_dead_shards()
+                self._shards.append(shard)
+            self._local.owner = owner
+            self._local.shard = shard
+            return shard
+
+    def __copy__(self):
+        view_data = ViewData(self.view, self._start_time, self._end_time)
+        view_data._start_time_ns = self._start_time_ns
+        view_data._end_time_ns = self._end_time_ns
+        view_data._tag_value_aggregation_data_map = \
+            self.tag_value_aggregation_data_map
+        return view_data
+
+    def record(self, context, value, timestamp, attachments=None):
+        """records the view data against context in this thread's shard"""
+        if context is None:
+            tags = dict()
+        else:
+            tags = context.map
+        self.record_tag_values(
+            tuple(tags.get(tag_key) for tag_key in self.view.columns),
+            value, timestamp, attachments)
+
+    def record_tag_values(self, tag_values, value, timestamp,
+                          attachments=None):
+        """records a value with a tuple of tag values in this thread's
+        shard"""
+        shard = self._get_shard()
+        with shard.lock:
+            agg_data = shard.tag_value_aggregation_data_map.get(tag_values)
+            if agg_data is None:
+                agg_data = self.view.new_aggregation_data()
+                shard.tag_value_aggregation_data_map[tag_values] = agg_data
+            agg_data.add_sample(value, timestamp, attachments)
+
+    def bind(self, tag_values):
+        """gets a function recording values with a tuple of tag values into
+        the shard of the recording thread, see :meth:`ViewData.bind`"""
+        return functools.partial(self.record_tag_values, tag_values)
+
+    def record_many(self, samples, timestamp, attachments=None):
+        """records a batch of (context, value) samples in this thread's
+        shard"""
+        values_by_tag_values = self.group_by_tag_values(samples)
+        shard = self._get_shard()
+        with shard.lock:
+            tvadm = shard.tag_value_aggregation_data_map
+            for tuple_vals, values in values_by_tag_values.items():
+                agg_data = tvadm.get(tuple_vals)
+                if agg_data is None:
+                    agg_data = self.view.new_aggregation_data()
+                    tvadm[tuple_vals] = agg_data
+                agg_data.add_samples(values, timestamp, attachments)
@@ -12,26 +12,69 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+
 from opencensus.common import utils
+from opencensus.metrics import transport
 from opencensus.stats import execution_context
 from opencensus.stats.measure_to_view_map import MeasureToViewMap
 
 
+def _export_pending_at_exit(weak_export_pending):
+    export_pending = weak_export_pending()
+    if export_pending is not None:
+        export_pending()
+
+
 class ViewManager(object):
     """View Manager allows the registering of Views for collecting stats
-    and receiving stats data as View Data"""
+    and receiving stats data as View Data
+
+    The recording options of the measure to view map are set before
+    registering views, e.g. for the global view manager::
+
+        stats.view_manager.sharded = True
+        stats.view_manager.delta = True
+        stats.view_manager.register_view(view)
+    """
     def __init__(self):
         self.time = utils.to_iso_str()
         if execution_context.get_measure_to_view_map() == {}:
             execution_context.set_measure_to_view_map(MeasureToViewMap())
 
         self._measure_view_map = execution_context.get_measure_to_view_map()
+        self._export_task = None
+        self._export_at_exit = False
 
     @property
     def measure_to_view_map(self):
         """the current measure to view map for the View Manager"""
         return self._measure_view_map
 
+    @property
+    def sharded(self):
+        """whether sum, count and distribution views are recorded into
+        per-thread shards, see
+        :class:`~opencensus.stats.view_data.ShardedViewData`. Raises
+        ValueError if set after registering views."""
+        return self.measure_to_view_map.sharded
+
+    @sharded.setter
+    def sharded(self, sharded):
+        self.measure_to_view_map.sharded = sharded
+
+    @property
+    def delta(self):
+        """whether the metrics of the views have the values recorded since
+        they were last collected, see
+        :meth:`~opencensus.stats.measure_to_view_map.MeasureToViewMap.get_metrics`.
+        Raises ValueError if set after registering views."""  # noqa: E501
+        return self.measure_to_view_map.delta
+
+    @delta.setter
+    def delta(self, delta):
+        self.measure_to_view_map.delta = delta
+
     def register_view(self, view):
         """registers the given view"""
         self.measure_to_view_map.register_view(view=view, timestamp=self.time)
@@ -53,3 +96,47 @@ class ViewManager(object):
     def unregister_exporter(self, exporter):
         """unregister the exporter"""
         self.measure_to_view_map.exporters.remove(exporter)
+
+    def defer_export(self, interval=None):
+        """Export recorded view data in batches instead of on every record.
+
+        Registered exporters then receive one copy of each view data that
+        changed since the previous batch, either every `interval` seconds or
+        whenever :meth:`export_pending` is called, e.g. when a scrape
+        endpoint is hit. The view data recorded since the last batch is
+        exported at exit, or by :meth:`stop_deferred_export`.
+
+        :type interval: int or float
+        :param interval: Seconds between exports. If None, view data is only
+            exported by :meth:`export_pending`.
+
+        :rtype: :class:`opencensus.metrics.transport.PeriodicMetricTask`
+        :return: The running export thread, or None if `interval` is None.
+        """
+        self.measure_to_view_map.deferred_export = True
+        if not self._export_at_exit:
+            # Registered before the export thread starts, so that exit
+            # handlers registered later run first and record their last
+            # values. A weak reference doesn't keep the manager alive.
+            atexit.register(_export_pending_at_exit,
+                            utils.get_weakref(self.export_pending))
+            self._export_at_exit = True
+        if interval is not None and self._export_task is None:
+            self._export_task = transport.PeriodicMetricTask(
+                interval, self.measure_to_view_map.export_pending,
+                name=type(self).__name__)
+            self._export_task.start()
+        return self._export_task
+
+    def export_pending(self):
+        """export the view data recorded since the last deferred export"""
+        self.measure_to_view_map.export_pending()
+
+    def stop_deferred_export(self):
+        """Export the view data recorded since the last batch, stop the
+        export thread and go back to exporting on every record."""
+        export_task, self._export_task = self._export_task, None
+        if export_task is not None:
+            # Exports the pending view data before stopping
+            export_task.close()
+        self.measure_to_view_map.deferred_export = False
@@ -18,8 +18,6 @@ import six
 
 import logging
 
-from google.protobuf.internal.encoder import _VarintBytes
-
 from opencensus.tags import tag_map as tag_map_module
 
 # Used for decoding hex bytes to hex string.
@@ -29,6 +27,41 @@ VERSION_ID = 0
 TAG_FIELD_ID = 0
 TAG_MAP_SERIALIZED_SIZE_LIMIT = 8192
 
+# Varints longer than this can't encode a length within the size limit
+_MAX_VARINT_BYTES = 5
+
+
+def _encode_varint(value, encoded_bytes):
+    """Append the base 128 varint encoding of a non-negative int."""
+    while value > 0x7f:
+        encoded_bytes.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded_bytes.append(value)
+
+
+def _decode_varint(buffer, pos):
+    """Decode the varint at ``pos``, return its value and the next position.
+    """
+    limit = min(len(buffer), pos + _MAX_VARINT_BYTES)
+    result = 0
+    shift = 0
+    while pos < limit:
+        byte = buffer[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+    raise ValueError("Truncated or invalid varint.")
+
+
+if six.PY3:
+    def _decode_utf8(view):
+        return str(view, UTF8)
+else:  # pragma: NO COVER
+    def _decode_utf8(view):
+        return str(view)
+
 
 class BinarySerializer(object):
     def from_byte_array(self, binary):
@@ -45,65 +78,62 @@ class BinarySerializer(object):
             return self._parse_tags(buffer)
 
     def to_byte_array(self, tag_context):
-        encoded_bytes = b''
-        encoded_bytes += _VarintBytes(VERSION_ID)
+        encoded_bytes = bytearray()
+        _encode_varint(VERSION_ID, encoded_bytes)
         total_chars = 0
         for tag in tag_context:
             tag_key, tag_value = tag
             total_chars += len(tag_key)
             total_chars += len(tag_value)
-            encoded_bytes = self._encode_tag(
-                tag_key, tag_value, encoded_bytes)
+            self._encode_tag(tag_key, tag_value, encoded_bytes)
         if total_chars <= TAG_MAP_SERIALIZED_SIZE_LIMIT:
-            return encoded_bytes
+            return bytes(encoded_bytes)
         else:  # pragma: NO COVER
             logging.warning("Size of the tag context exceeds the maximum size")
 
     def _parse_tags(self, buffer):
+        if six.PY2:  # pragma: NO COVER
+            # Indexing a memoryview gives one character strings in python 2
+            buffer = bytearray(buffer)
         tag_context = tag_map_module.TagMap()
         limit = len(buffer)
         total_chars = 0
         i = 1
         while i < limit:
-            field_id = buffer[i] if six.PY3 else ord(buffer[i])
+            field_id = buffer[i]
             if field_id == TAG_FIELD_ID:
-                i += 1
-                key = self._decode_string(buffer, i)
-                i += len(key)
+                key, i = self._decode_string(buffer, i + 1)
                 total_chars += len(key)
-                i += 1
-                val = self._decode_string(buffer, i)
-                i += len(val)
+                val, i = self._decode_string(buffer, i)
                 total_chars += len(val)
-                i += 1
                 if total_chars > \
                         TAG_MAP_SERIALIZED_SIZE_LIMIT:  # pragma: NO COVER
                     logging.warning("Size of the tag context exceeds maximum")
                     break
                 else:
-                    tag_context.insert(str(key), str(val))
+                    tag_context.insert(key, val)
             else:
                 break
         return tag_context
 
     def _encode_tag(self, tag_key, tag_value, encoded_bytes):
-        encoded_bytes += _VarintBytes(TAG_FIELD_ID)
-        encoded_bytes = self._encode_string(tag_key, encoded_bytes)
-        encoded_bytes = self._encode_string(tag_value, encoded_bytes)
-        return encoded_bytes
+        _encode_varint(TAG_FIELD_ID, encoded_bytes)
+        self._encode_string(tag_key, encoded_bytes)
+        self._encode_string(tag_value, encoded_bytes)
 
     def _encode_string(self, input_str, encoded_bytes):
-        encoded_bytes += _VarintBytes(len(input_str))
-        encoded_bytes += input_str.encode(UTF8)
-        return encoded_bytes
+        data = input_str.encode(UTF8)
+        _encode_varint(len(data), encoded_bytes)
+        encoded_bytes += data
 
     def _decode_string(self, buffer, pos):
-        length = buffer[pos] if six.PY3 else ord(buffer[pos])
-        builder = ""
-        i = 1
-        while i <= length:
-            bytes_to_decode = buffer[pos + i] if six.PY3 \
-                else ord(buffer[pos + i])
-            builder += _VarintBytes(bytes_to_decode).decode()
-            i += 1
-        return builder
+        """Decode the length-prefixed string at ``pos``.
+
+        :rtype: tuple
+        :returns: The string and the position following it.
+        """
+        length, start = _decode_varint(buffer, pos)
+        end = start + length
+        if end > len(buffer):
+            raise ValueError("Truncated tag context.")
+        return _decode_utf8(buffer[start:end]), end
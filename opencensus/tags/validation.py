@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+
+# Printable ascii characters, from space to tilde
+_LEGAL_CHARS = re.compile(r'[ -~]*\Z')
+
 
 def is_legal_chars(value):
-    return all(32 <= ord(char) <= 126 for char in value)
+    return _LEGAL_CHARS.match(value) is not None
 
 
 def is_valid_tag_name(name):
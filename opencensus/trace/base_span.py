@@ -19,6 +19,7 @@ class BaseSpan(object):
     """Base class for Opencensus spans.
     Subclasses of :class:`BaseSpan` must implement the below methods.
     """
+    __slots__ = ()
 
     @staticmethod
     def on_create(callback):
@@ -14,12 +14,43 @@
 
 """Export the trace spans to a local file."""
 
-import json
+import atexit
+import datetime
+import errno
+import gzip
+import io
+import os
+import re
+import shutil
+import threading
+import weakref
 
+from opencensus.common import utils
 from opencensus.common.transports import sync
-from opencensus.trace import base_exporter, span_data
+from opencensus.trace import base_exporter, span_encoder
 
 DEFAULT_FILENAME = 'opencensus-traces.json'
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# Suffix of rotated segments, sorting in the order they were rotated
+_SEGMENT_SUFFIX_FORMAT = '%Y%m%dT%H%M%S.%fZ'
+_GZIP_EXTENSION = '.gz'
+# Matches the suffixes of _SEGMENT_SUFFIX_FORMAT, with the underscores added
+# on collisions and the extension of compressed segments
+_SEGMENT_SUFFIX_PATTERN = r'\.\d{8}T\d{6}\.\d{6}Z_*(?:\.gz)?\Z'
+
+# The streaming exporters, closed at exit without keeping them alive.
+# Registered on import, before the transports register their own exit
+# handlers, so that these export the pending spans first.
+_streaming_exporters = weakref.WeakSet()
+
+
+def _close_streaming_exporters():
+    for exporter in list(_streaming_exporters):
+        exporter.close()
+
+
+atexit.register(_close_streaming_exporters)
 
 
 class FileExporter(base_exporter.Exporter):
@@ -38,12 +69,21 @@ class FileExporter(base_exporter.Exporter):
     :param file_mode: The file mode to open the output file with.
                       Defaults to w+
 
+    :type encoder: :class:`~opencensus.trace.span_encoder.SpanEncoder`
+    :param encoder: (Optional) The encoder writing the spans to the file.
+                    Defaults to :class:`.LegacyJsonEncoder`, use
+                    :class:`.StreamingLegacyJsonEncoder` to write the same
+                    JSON one span at a time.
     """
 
     def __init__(self, file_name=DEFAULT_FILENAME,
                  transport=sync.SyncTransport,
-                 file_mode='w+'):
+                 file_mode='w+',
+                 encoder=None):
+        if encoder is None:
+            encoder = span_encoder.LegacyJsonEncoder()
         self.file_name = file_name
+        self.encoder = encoder
         self.transport = transport(self)
         self.file_mode = file_mode
 
@@ -55,11 +95,7 @@ class FileExporter(base_exporter.Exporter):
             SpanData tuples to emit
         """
         with open(self.file_name, self.file_mode) as file:
-            # convert to the legacy trace json for easier refactoring
-            # TODO: refactor this to use the span data directly
-            legacy_trace_json = span_data.format_legacy_trace_json(span_datas)
-            trace_str = json.dumps(legacy_trace_json)
-            file.write(trace_str)
+            self.encoder.write(span_datas, file)
 
     def export(self, span_datas):
         """
@@ -69,3 +105,207 @@ class FileExporter(base_exporter.Exporter):
             SpanData tuples to export
         """
         self.transport.export(span_datas)
+
+
+class StreamingFileExporter(base_exporter.Exporter):
+    """Append spans to a file kept open, one JSON record per line.
+
+    Each line is the legacy trace JSON of a single span by default. The
+    file is rotated once it reaches ``max_bytes`` or is ``rotate_interval``
+    seconds old: it is renamed with a UTC timestamp suffix, e.g.
+    ``opencensus-traces.json.20210513T120000.000000Z``, optionally gzipped,
+    and a new file is started. Call :meth:`close` to flush the file, which
+    also happens at exit.
+
+    :type file_name: str
+    :param file_name: The name of the output file.
+
+    :type transport: :class:`type`
+    :param transport: Class for creating new transport objects. It should
+                      extend from the base_exporter :class:`.Transport` type
+                      and implement :meth:`.Transport.export`. Defaults to
+                      :class:`.SyncTransport`. The other option is
+                      :class:`.AsyncTransport`.
+
+    :type encoder: :class:`~opencensus.trace.span_encoder.SpanEncoder`
+    :param encoder: (Optional) The encoder of a record, called with a
+                    single span. Defaults to
+                    :class:`.StreamingLegacyJsonEncoder`.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) Rotate the file before it exceeds this
+                      size, None to not rotate by size.
+
+    :type rotate_interval: float
+    :param rotate_interval: (Optional) Rotate the file after this many
+                            seconds, None to not rotate by time.
+
+    :type backup_count: int
+    :param backup_count: (Optional) The number of rotated segments to keep,
+                         None to keep them all.
+
+    :type compress: bool
+    :param compress: (Optional) Whether to gzip rotated segments.
+
+    :type fsync_interval: float
+    :param fsync_interval: (Optional) Sync the file to disk after a batch if
+                           this many seconds have passed since the last
+                           sync, 0 to sync every batch, None to leave it to
+                           the OS. Rotated segments are synced unless None.
+
+    :type buffer_size: int
+    :param buffer_size: (Optional) The size of the write buffer, which is
+                        flushed after every batch.
+    """
+
+    def __init__(self, file_name=DEFAULT_FILENAME,
+                 transport=sync.SyncTransport,
+                 encoder=None,
+                 max_bytes=None,
+                 rotate_interval=None,
+                 backup_count=None,
+                 compress=False,
+                 fsync_interval=None,
+                 buffer_size=DEFAULT_BUFFER_SIZE):
+        if encoder is None:
+            encoder = span_encoder.StreamingLegacyJsonEncoder()
+        self.file_name = file_name
+        self.encoder = encoder
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+
+        self._lock = threading.Lock()
+        # Serializes compressing and pruning the rotated segments, without
+        # blocking the threads writing to the new file
+        self._segments_lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._opened_ns = 0
+        self._synced_ns = 0
+        self._segment_pattern = re.compile(
+            re.escape(os.path.basename(file_name)) + _SEGMENT_SUFFIX_PATTERN)
+        _streaming_exporters.add(self)
+        self.transport = transport(self)
+
+    def emit(self, span_datas):
+        """
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param list of opencensus.trace.span_data.SpanData span_datas:
+            SpanData tuples to emit
+        """
+        # Rotated segments are compressed and pruned once the lock is
+        # released, so that other threads can keep writing to the new file
+        segments = []
+        with self._lock:
+            if self._file is not None and self.rotate_interval is not None \
+                    and utils.monotonic_ns() - self._opened_ns >= \
+                    self.rotate_interval * 1e9:
+                segments.append(self._rotate())
+            for sd in span_datas:
+                record = self.encoder.encode([sd]).encode('utf-8') + b'\n'
+                if self._file is None:
+                    self._open()
+                if self.max_bytes is not None and self._size and \
+                        self._size + len(record) > self.max_bytes:
+                    segments.append(self._rotate())
+                    self._open()
+                self._file.write(record)
+                self._size += len(record)
+            if self._file is not None:
+                self._file.flush()
+                if self.fsync_interval is not None and \
+                        utils.monotonic_ns() - self._synced_ns >= \
+                        self.fsync_interval * 1e9:
+                    self._fsync()
+        for segment in segments:
+            self._finish_segment(segment)
+
+    def export(self, span_datas):
+        """
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param list of opencensus.trace.span_data.SpanData span_datas:
+            SpanData tuples to export
+        """
+        self.transport.export(span_datas)
+
+    def close(self):
+        """Flush and close the file, the next spans reopen it."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                if self.fsync_interval is not None:
+                    self._fsync()
+                self._file.close()
+                self._file = None
+
+    def _open(self):
+        self._file = io.open(self.file_name, 'ab', self.buffer_size)
+        self._size = self._file.tell()
+        self._opened_ns = self._synced_ns = utils.monotonic_ns()
+
+    def _fsync(self):
+        os.fsync(self._file.fileno())
+        self._synced_ns = utils.monotonic_ns()
+
+    def _rotate(self):
+        """Close the file and move it to a new segment.
+
+        :rtype: str
+        :returns: The path of the segment.
+        """
+        self._file.flush()
+        if self.fsync_interval is not None:
+            self._fsync()
+        self._file.close()
+        self._file = None
+
+        segment = '{}.{}'.format(
+            self.file_name,
+            datetime.datetime.utcnow().strftime(_SEGMENT_SUFFIX_FORMAT))
+        while os.path.exists(segment) or \
+                os.path.exists(segment + _GZIP_EXTENSION):
+            # The clock went backwards or has a coarse resolution
+            segment += '_'
+        os.rename(self.file_name, segment)
+        return segment
+
+    def _finish_segment(self, segment):
+        """Compress a rotated segment and remove the old ones."""
+        with self._segments_lock:
+            if self.compress:
+                try:
+                    source = open(segment, 'rb')
+                except (IOError, OSError) as e:
+                    if e.errno != errno.ENOENT:
+                        raise
+                    # Already pruned after a newer segment was finished
+                    return
+                with source:
+                    with gzip.open(segment + _GZIP_EXTENSION,
+                                   'wb') as target:
+                        shutil.copyfileobj(source, target)
+                os.remove(segment)
+            if self.backup_count is not None:
+                self._remove_old_segments()
+
+    def _remove_old_segments(self):
+        directory = os.path.dirname(self.file_name)
+        # A segment whose compression was interrupted is listed twice
+        segments = sorted(set(
+            name[:-len(_GZIP_EXTENSION)]
+            if name.endswith(_GZIP_EXTENSION) else name
+            for name in os.listdir(directory or os.curdir)
+            if self._segment_pattern.match(name)))
+        for name in segments[:max(len(segments) - self.backup_count, 0)]:
+            for path in (name, name + _GZIP_EXTENSION):
+                try:
+                    os.remove(os.path.join(directory, path))
+                except OSError:
+                    # Not compressed, or removed by another process
+                    pass
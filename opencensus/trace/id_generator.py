@@ -0,0 +1,153 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generators for trace and span IDs."""
+
+import binascii
+import os
+import random
+import weakref
+
+_INVALID_TRACE_ID = '0' * 32
+_INVALID_SPAN_ID = '0' * 16
+
+# Number of random bytes read from os.urandom at once
+DEFAULT_POOL_SIZE = 4096
+
+# The pooled generators, to be reset in a forked child so that it doesn't
+# hand out the same IDs as its parent.
+_pooled_generators = weakref.WeakSet()
+
+
+def _reset_pooled_generators():
+    for generator in list(_pooled_generators):
+        generator.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pooled_generators)
+
+
+class IdGenerator(object):
+    """Base class for opencensus trace and span ID generators.
+
+    Subclasses must override :meth:`generate_trace_id` and
+    :meth:`generate_span_id`. The IDs returned are used without validation,
+    so they must be lowercase hex strings and not all zero.
+    """
+
+    def generate_trace_id(self):
+        """Generate a new trace ID.
+
+        :rtype: str
+        :returns: A 32 character hex string.
+        """
+        raise NotImplementedError
+
+    def generate_span_id(self):
+        """Generate a new span ID.
+
+        :rtype: str
+        :returns: A 16 character hex string.
+        """
+        raise NotImplementedError
+
+
+class RandomIdGenerator(IdGenerator):
+    """Generate IDs with :func:`random.getrandbits`."""
+
+    def generate_trace_id(self):
+        trace_id = '%032x' % random.getrandbits(128)
+        if trace_id == _INVALID_TRACE_ID:
+            return self.generate_trace_id()
+        return trace_id
+
+    def generate_span_id(self):
+        span_id = '%016x' % random.getrandbits(64)
+        if span_id == _INVALID_SPAN_ID:
+            return self.generate_span_id()
+        return span_id
+
+
+class UrandomIdGenerator(IdGenerator):
+    """Generate IDs from a pool of random bytes.
+
+    The pool is filled from :func:`os.urandom`, hex encoded and split into
+    IDs in bulk, so generating an ID is usually a single ``next`` call on a
+    list iterator, which is thread safe.
+
+    The pool is reset after a fork on Python 3.7+. On older versions call
+    :meth:`reset` in the child process after forking.
+
+    :type pool_size: int
+    :param pool_size: The number of random bytes to read at once.
+    """
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
+        self.pool_size = pool_size
+        self.reset()
+        _pooled_generators.add(self)
+
+    def reset(self):
+        """Discard the IDs left in the pool."""
+        self._trace_ids = iter(())
+        self._span_ids = iter(())
+
+    def _new_ids(self, length, invalid_id):
+        hex_pool = binascii.hexlify(os.urandom(self.pool_size))
+        if not isinstance(hex_pool, str):
+            hex_pool = hex_pool.decode('ascii')
+        ids = [hex_pool[ii:ii + length]
+               for ii in range(0, len(hex_pool) - length + 1, length)]
+        return iter([id_ for id_ in ids if id_ != invalid_id])
+
+    def generate_trace_id(self):
+        trace_id = next(self._trace_ids, None)
+        while trace_id is None:
+            trace_ids = self._new_ids(32, _INVALID_TRACE_ID)
+            self._trace_ids = trace_ids
+            trace_id = next(trace_ids, None)
+        return trace_id
+
+    def generate_span_id(self):
+        span_id = next(self._span_ids, None)
+        while span_id is None:
+            span_ids = self._new_ids(16, _INVALID_SPAN_ID)
+            self._span_ids = span_ids
+            span_id = next(span_ids, None)
+        return span_id
+
+
+if hasattr(os, 'register_at_fork'):
+    _id_generator = UrandomIdGenerator()
+else:  # pragma: NO COVER
+    _id_generator = RandomIdGenerator()
+
+
+def get_id_generator():
+    """Get the ID generator used for new traces and spans.
+
+    :rtype: :class:`IdGenerator`
+    :returns: The current ID generator.
+    """
+    return _id_generator
+
+
+def set_id_generator(id_generator):
+    """Set the ID generator used for new traces and spans.
+
+    :type id_generator: :class:`IdGenerator`
+    :param id_generator: The ID generator to use.
+    """
+    global _id_generator
+    _id_generator = id_generator
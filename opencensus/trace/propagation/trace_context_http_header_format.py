@@ -22,12 +22,36 @@ from opencensus.trace.trace_options import TraceOptions
 
 _TRACEPARENT_HEADER_NAME = 'traceparent'
 _TRACESTATE_HEADER_NAME = 'tracestate'
+_OPTIONAL_WHITESPACE = ' \t'
+_INVALID_TRACE_ID = '0' * 32
+_INVALID_SPAN_ID = '0' * 16
+# version-trace_id-span_id-trace_flags, and the fields of later versions
 _TRACEPARENT_HEADER_FORMAT = \
-    '^[ \t]*([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})' + \
-    '(-.*)?[ \t]*$'
+    r'([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-[^\n]*)?\Z'
 _TRACEPARENT_HEADER_FORMAT_RE = re.compile(_TRACEPARENT_HEADER_FORMAT)
 
 
+def _parse_traceparent(header):
+    """Parse a traceparent header with a single match.
+
+    :rtype: tuple
+    :returns: The trace ID, span ID and trace flags, or None if the header is
+              invalid.
+    """
+    match = _TRACEPARENT_HEADER_FORMAT_RE.match(
+        header.strip(_OPTIONAL_WHITESPACE))
+    if match is None:
+        return None
+    version, trace_id, span_id, trace_flags, rest = match.groups()
+    if version == 'ff' or trace_id == _INVALID_TRACE_ID or \
+            span_id == _INVALID_SPAN_ID:
+        return None
+    # Version 00 has no more fields, later versions may add some
+    if rest and version == '00':
+        return None
+    return trace_id, span_id, trace_flags
+
+
 class TraceContextPropagator(object):
     """Propagator for processing the trace context HTTP header format."""
 
@@ -47,28 +71,16 @@ class TraceContextPropagator(object):
         if header is None:
             return SpanContext()
 
-        match = re.search(_TRACEPARENT_HEADER_FORMAT_RE, header)
-        if not match:
-            return SpanContext()
-
-        version = match.group(1)
-        trace_id = match.group(2)
-        span_id = match.group(3)
-        trace_options = match.group(4)
-
-        if trace_id == '0' * 32 or span_id == '0' * 16:
-            return SpanContext()
-
-        if version == '00':
-            if match.group(5):
-                return SpanContext()
-        if version == 'ff':
+        traceparent = _parse_traceparent(header)
+        if traceparent is None:
             return SpanContext()
+        trace_id, span_id, trace_flags = traceparent
 
         span_context = SpanContext(
             trace_id=trace_id,
             span_id=span_id,
-            trace_options=TraceOptions(trace_options),
+            # The flags are hex, TraceOptions takes a decimal string
+            trace_options=TraceOptions(str(int(trace_flags, 16))),
             from_header=True)
 
         header = headers.get(_TRACESTATE_HEADER_NAME)
@@ -77,8 +89,7 @@ class TraceContextPropagator(object):
         try:
             tracestate = TracestateStringFormatter().from_string(header)
             if tracestate.is_valid():
-                span_context.tracestate = \
-                    TracestateStringFormatter().from_string(header)
+                span_context.tracestate = tracestate
         except ValueError:
             pass
         return span_context
@@ -12,32 +12,73 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
+import threading
+from collections import OrderedDict
 
-from opencensus.trace.tracestate import _KEY_FORMAT, _VALUE_FORMAT, Tracestate
+from opencensus.trace.tracestate import (
+    _KEY_VALIDATION_RE,
+    _VALUE_VALIDATION_RE,
+    Tracestate,
+)
 
-_DELIMITER_FORMAT = '[ \t]*,[ \t]*'
-_MEMBER_FORMAT = '(%s)(=)(%s)' % (_KEY_FORMAT, _VALUE_FORMAT)
+# Number of recently parsed tracestate headers to keep
+_CACHE_SIZE = 256
+_OPTIONAL_WHITESPACE = ' \t'
 
-_DELIMITER_FORMAT_RE = re.compile(_DELIMITER_FORMAT)
-_MEMBER_FORMAT_RE = re.compile(_MEMBER_FORMAT)
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _parse_members(string):
+    """Split a tracestate header into validated key-value pairs.
+
+    :rtype: tuple
+    :returns: The key-value pairs, or the error message if the header is
+              invalid.
+    """
+    members = []
+    keys = set()
+    for member in string.split(','):
+        member = member.strip(_OPTIONAL_WHITESPACE)
+        # Empty list members are allowed
+        if not member:
+            continue
+        key, eq, value = member.partition('=')
+        if not eq or not _KEY_VALIDATION_RE.match(key) or \
+                not _VALUE_VALIDATION_RE.match(value):
+            return 'illegal key-value format %r' % (member)
+        if key in keys:
+            return 'conflict key {!r}'.format(key)
+        keys.add(key)
+        members.append((key, value))
+    return tuple(members)
+
+
+def _get_members(string):
+    """Get the key-value pairs of a tracestate header, from the cache of
+    recently parsed headers if possible."""
+    with _cache_lock:
+        members = _cache.pop(string, None)
+        if members is not None:
+            # Most recently used last
+            _cache[string] = members
+            return members
+
+    members = _parse_members(string)
+    with _cache_lock:
+        _cache[string] = members
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return members
 
 
 class TracestateStringFormatter(object):
     def from_string(self, string):
-        tracestate = Tracestate()
-        for member in re.split(_DELIMITER_FORMAT_RE, string):
-            match = _MEMBER_FORMAT_RE.match(member)
-            if not match:
-                raise ValueError('illegal key-value format %r' % (member))
-            key, eq, value = match.groups()
-            if key in tracestate:
-                raise ValueError('conflict key {!r}'.format(key))
-            tracestate[key] = value
-        return tracestate
+        members = _get_members(string)
+        if not isinstance(members, tuple):
+            raise ValueError(members)
+        return Tracestate._from_members(members)
 
     def to_string(self, tracestate):
-        return ','.join(map(
-            lambda key: key + '=' + tracestate[key],
-            tracestate
-        ))
+        return ','.join([key + '=' + value
+                         for key, value in tracestate.items()])
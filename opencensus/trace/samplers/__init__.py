@@ -12,8 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import threading
+
+from opencensus.common import utils
 
 DEFAULT_SAMPLING_RATE = 1e-4
+DEFAULT_ADJUST_INTERVAL = 1.0  # Seconds
+DEFAULT_HIGH_LOAD = 0.5
+
+_MAX_LOWER_LONG = 0xffffffffffffffff
+
+logger = logging.getLogger(__name__)
 
 
 class Sampler(object):
@@ -33,6 +43,29 @@ class Sampler(object):
         """
         raise NotImplementedError
 
+    def should_sample_request(self, span_context, name=None,
+                              attributes=None):
+        """Whether to sample this request, given what is known about it.
+
+        Samplers that take the request into account, like
+        :class:`~opencensus.trace.samplers.rule_based.RuleBasedSampler`,
+        override this. By default, follows :meth:`should_sample`.
+
+        :type span_context: :class:`opencensus.trace.span_context.SpanContext`
+        :param span_context: The span context.
+
+        :type name: str
+        :param name: (Optional) The name of the root span of the request.
+
+        :type attributes: dict
+        :param attributes: (Optional) Attributes of the request, e.g. its HTTP
+                           method, path and route.
+
+        :rtype: bool
+        :returns: Whether to sample the request.
+        """
+        return self.should_sample(span_context)
+
 
 class AlwaysOnSampler(Sampler):
     """Sampler that samples every request, regardless of trace options."""
@@ -77,10 +110,189 @@ class ProbabilitySampler(Sampler):
             return True
 
         lower_long = get_lower_long_from_trace_id(span_context.trace_id)
-        bound = self.rate * 0xffffffffffffffff
+        bound = self.rate * _MAX_LOWER_LONG
         return lower_long <= bound
 
 
+class RateLimitingSampler(Sampler):
+    """Sample at most a given number of requests per second.
+
+    Uses a token bucket, so that up to ``burst`` requests can be sampled at
+    once after a quiet period. Requests whose parent was sampled are always
+    sampled, so that traces aren't broken, and don't count against the
+    limit.
+
+    :type traces_per_second: float
+    :param traces_per_second: The maximum sustained number of sampled
+                              requests per second.
+
+    :type burst: float
+    :param burst: (Optional) The maximum number of requests sampled at once.
+                  Defaults to ``traces_per_second``, and at least 1.
+    """
+    def __init__(self, traces_per_second, burst=None):
+        if traces_per_second < 0:
+            raise ValueError('Traces per second must not be negative.')
+        if burst is None:
+            burst = max(traces_per_second, 1)
+        self.traces_per_second = traces_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._tokens_per_ns = traces_per_second / 1e9
+        self._last_ns = utils.monotonic_ns()
+        self._lock = threading.Lock()
+
+    def should_sample(self, span_context):
+        """Take a token from the bucket if there's one left.
+
+        :type span_context: :class:`opencensus.trace.span_context.SpanContext`
+        :param span_context: The span context.
+
+        :rtype: bool
+        :returns: Whether to sample the request according to the context.
+        """
+        if span_context.trace_options.get_enabled():
+            return True
+
+        now_ns = utils.monotonic_ns()
+        with self._lock:
+            tokens = min(
+                self.burst,
+                self._tokens + (now_ns - self._last_ns) * self._tokens_per_ns)
+            self._last_ns = now_ns
+            if tokens < 1:
+                self._tokens = tokens
+                return False
+            self._tokens = tokens - 1
+            return True
+
+
+class AdaptiveSampler(Sampler):
+    """Sample requests at a rate adjusted to the observed traffic.
+
+    Every ``interval`` seconds the sampling rate is set so that about
+    ``traces_per_second`` requests would have been sampled in the last
+    interval. If ``load`` is given and reports a load above ``high_load``,
+    e.g. because the exporter queue is filling up, the rate is lowered
+    further, down to 0 when the load is 1.
+
+    Like :class:`ProbabilitySampler`, the decision is deterministic
+    according to the trace ID, and requests whose parent was sampled are
+    always sampled.
+
+    To follow the queue of an exporter using an
+    :class:`~opencensus.common.transports.async_.AsyncTransport`::
+
+        AdaptiveSampler(10, load=lambda: exporter.transport.worker.load)
+
+    :type traces_per_second: float
+    :param traces_per_second: The target number of sampled requests per
+                              second.
+
+    :type initial_rate: float
+    :param initial_rate: (Optional) The rate of sampling until the first
+                         adjustment. Defaults to
+                         :data:`DEFAULT_SAMPLING_RATE`.
+
+    :type min_rate: float
+    :param min_rate: The lowest rate of sampling.
+
+    :type max_rate: float
+    :param max_rate: The highest rate of sampling.
+
+    :type interval: float
+    :param interval: Seconds between adjustments of the rate.
+
+    :type load: callable
+    :param load: (Optional) A function returning the exporter load, between
+                 0 and 1.
+
+    :type high_load: float
+    :param high_load: The load above which the rate is lowered.
+    """
+    def __init__(self, traces_per_second,
+                 initial_rate=None,
+                 min_rate=0.0,
+                 max_rate=1.0,
+                 interval=DEFAULT_ADJUST_INTERVAL,
+                 load=None,
+                 high_load=DEFAULT_HIGH_LOAD):
+        if traces_per_second < 0:
+            raise ValueError('Traces per second must not be negative.')
+        if not 0 <= min_rate <= max_rate <= 1:
+            raise ValueError('Rates must be between 0 and 1, and min_rate '
+                             'must not be greater than max_rate.')
+        if not 0 <= high_load < 1:
+            raise ValueError('High load must be between 0 and 1.')
+        if initial_rate is None:
+            initial_rate = DEFAULT_SAMPLING_RATE
+        self.traces_per_second = traces_per_second
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.load = load
+        self.high_load = high_load
+        self._interval_ns = int(interval * 1e9)
+        self._bound = self._clamp(initial_rate) * _MAX_LOWER_LONG
+        self._requests = 0
+        self._next_adjust_ns = utils.monotonic_ns() + self._interval_ns
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """The current rate of sampling."""
+        return self._bound / _MAX_LOWER_LONG
+
+    def _clamp(self, rate):
+        return min(max(rate, self.min_rate), self.max_rate)
+
+    def _get_load_factor(self):
+        try:
+            load = self.load()
+        except Exception:
+            logger.exception('Failed to get the exporter load.')
+            return 1.0
+        if load <= self.high_load:
+            return 1.0
+        return max(1.0 - load, 0.0) / (1.0 - self.high_load)
+
+    def _adjust(self, now_ns):
+        """Set the rate from the requests seen since the last adjustment.
+
+        Must hold the lock.
+        """
+        elapsed_ns = now_ns - self._next_adjust_ns + self._interval_ns
+        requests_per_second = self._requests * 1e9 / elapsed_ns
+        rate = self.max_rate
+        if requests_per_second > 0:
+            rate = min(self.traces_per_second / requests_per_second, rate)
+        if self.load is not None:
+            rate *= self._get_load_factor()
+        self._bound = self._clamp(rate) * _MAX_LOWER_LONG
+        self._requests = 0
+        self._next_adjust_ns = now_ns + self._interval_ns
+
+    def should_sample(self, span_context):
+        """Count the request and make the sampling decision based on the
+        lower 8 bytes of the trace ID and the current rate.
+
+        :type span_context: :class:`opencensus.trace.span_context.SpanContext`
+        :param span_context: The span context.
+
+        :rtype: bool
+        :returns: Whether to sample the request according to the context.
+        """
+        if span_context.trace_options.get_enabled():
+            return True
+
+        now_ns = utils.monotonic_ns()
+        with self._lock:
+            self._requests += 1
+            if now_ns >= self._next_adjust_ns:
+                self._adjust(now_ns)
+            bound = self._bound
+        return get_lower_long_from_trace_id(span_context.trace_id) <= bound
+
+
 def get_lower_long_from_trace_id(trace_id):
     """Returns the lower 8 bytes of the trace ID as a long value, assuming
     little endian order.
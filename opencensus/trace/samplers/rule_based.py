@@ -0,0 +1,203 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sample requests with rules matching their name, route, method and
+attributes, e.g.::
+
+    sampler = RuleBasedSampler([
+        SamplingRule(0.0, path_prefix='/healthz'),
+        SamplingRule(1.0, path_prefix='/api/checkout', methods=['POST']),
+        SamplingRule(RateLimitingSampler(10), route='/api/users/<id>'),
+    ], default=ProbabilitySampler(0.01))
+
+The web integrations pass the request method, path, host and, when known,
+route to the sampler as attributes.
+"""
+
+from six import iteritems
+
+from opencensus.trace import attributes_helper, samplers
+
+HTTP_METHOD = attributes_helper.COMMON_ATTRIBUTES['HTTP_METHOD']
+HTTP_PATH = attributes_helper.COMMON_ATTRIBUTES['HTTP_PATH']
+HTTP_ROUTE = attributes_helper.COMMON_ATTRIBUTES['HTTP_ROUTE']
+
+
+def _split_path(path):
+    return [segment for segment in path.split('/') if segment]
+
+
+class SamplingRule(object):
+    """A rule selecting the sampler of matching requests.
+
+    A request matches if it matches all the given criteria, a rule without
+    criteria matches all requests.
+
+    :type sampler: float or :class:`~opencensus.trace.samplers.Sampler`
+    :param sampler: The sampler of matching requests, or their rate of
+                    sampling.
+
+    :type name: str
+    :param name: (Optional) The span name.
+
+    :type path_prefix: str
+    :param path_prefix: (Optional) The leading segments of the request path,
+                        ``/api/users`` matches ``/api/users`` and
+                        ``/api/users/1`` but not ``/api/users1``.
+
+    :type route: str
+    :param route: (Optional) The route template, e.g. ``/users/<id>``.
+
+    :type methods: list of str
+    :param methods: (Optional) The HTTP methods.
+
+    :type attributes: dict
+    :param attributes: (Optional) Attribute values the request must have.
+    """
+    def __init__(self, sampler, name=None, path_prefix=None, route=None,
+                 methods=None, attributes=None):
+        if not isinstance(sampler, samplers.Sampler):
+            sampler = samplers.ProbabilitySampler(sampler)
+        self.sampler = sampler
+        self.name = name
+        self.path_prefix = path_prefix
+        self.route = route
+        self.methods = None if methods is None else frozenset(
+            method.upper() for method in methods)
+        self.attributes = dict(attributes or {})
+
+    def matches(self, name, attributes):
+        """Whether the request matches this rule, ignoring the path.
+
+        :type name: str
+        :param name: The span name, or None.
+
+        :type attributes: dict
+        :param attributes: The request attributes.
+
+        :rtype: bool
+        :returns: True if the name, route, method and attributes match.
+        """
+        if self.name is not None and name != self.name:
+            return False
+        if self.route is not None and \
+                attributes.get(HTTP_ROUTE) != self.route:
+            return False
+        if self.methods is not None and \
+                attributes.get(HTTP_METHOD) not in self.methods:
+            return False
+        for key, value in iteritems(self.attributes):
+            if attributes.get(key, self) != value:
+                return False
+        return True
+
+
+class _PathNode(object):
+    __slots__ = ('children', 'rules')
+
+    def __init__(self):
+        self.children = {}
+        # Indexes of the rules whose prefix ends at this node
+        self.rules = []
+
+
+class RuleBasedSampler(samplers.Sampler):
+    """Sample each request with the sampler of the first matching rule.
+
+    Rules with a path prefix are indexed in a trie of path segments, so
+    finding the rules matching a path takes one dict lookup per segment
+    instead of comparing the path with every prefix.
+
+    :type rules: list of :class:`SamplingRule`
+    :param rules: The rules, in order of precedence.
+
+    :type default: :class:`~opencensus.trace.samplers.Sampler`
+    :param default: (Optional) The sampler of requests no rule matches, and
+                    of requests without name and attributes. Defaults to
+                    :class:`~opencensus.trace.samplers.ProbabilitySampler`.
+    """
+    def __init__(self, rules, default=None):
+        if default is None:
+            default = samplers.ProbabilitySampler()
+        self.rules = list(rules)
+        self.default = default
+
+        self._root = _PathNode()
+        # Indexes of the rules without path prefix
+        self._unindexed = []
+        for index, rule in enumerate(self.rules):
+            if rule.path_prefix is None:
+                self._unindexed.append(index)
+                continue
+            node = self._root
+            for segment in _split_path(rule.path_prefix):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _PathNode()
+                node = child
+            node.rules.append(index)
+
+    def _get_candidates(self, path):
+        """Get the indexes of the rules that may match a path, in order."""
+        candidates = list(self._unindexed)
+        node = self._root
+        candidates.extend(node.rules)
+        if path:
+            for segment in _split_path(path):
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                candidates.extend(node.rules)
+        candidates.sort()
+        return candidates
+
+    def get_sampler(self, name=None, attributes=None):
+        """Get the sampler of the first rule matching a request.
+
+        :type name: str
+        :param name: (Optional) The span name.
+
+        :type attributes: dict
+        :param attributes: (Optional) The request attributes.
+
+        :rtype: :class:`~opencensus.trace.samplers.Sampler`
+        :returns: The sampler of the matching rule, or the default one.
+        """
+        attributes = attributes or {}
+        for index in self._get_candidates(attributes.get(HTTP_PATH)):
+            rule = self.rules[index]
+            if rule.matches(name, attributes):
+                return rule.sampler
+        return self.default
+
+    def should_sample(self, span_context):
+        return self.default.should_sample(span_context)
+
+    def should_sample_request(self, span_context, name=None,
+                              attributes=None):
+        """Follow the decision of the sampler of the first matching rule.
+
+        :type span_context: :class:`opencensus.trace.span_context.SpanContext`
+        :param span_context: The span context.
+
+        :type name: str
+        :param name: (Optional) The span name.
+
+        :type attributes: dict
+        :param attributes: (Optional) The request attributes.
+
+        :rtype: bool
+        :returns: Whether to sample the request.
+        """
+        return self.get_sampler(name, attributes).should_sample(span_context)
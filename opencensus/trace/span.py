@@ -42,11 +42,23 @@ MAX_NUM_LINKS = 32
 
 
 class BoundedList(Sequence):
-    """An append only list with a fixed max size."""
-    def __init__(self, maxlen):
+    """An append only list with a fixed max size.
+
+    :type maxlen: int
+    :param maxlen: The maximum number of items to keep.
+
+    :type lock: :class:`threading.Lock`
+    :param lock: (Optional) The lock guarding the list, used to share a
+                 single lock between the collections of a span.
+    """
+    __slots__ = ('dropped', '_dq', '_lock')
+
+    def __init__(self, maxlen, lock=None):
         self.dropped = 0
         self._dq = deque(maxlen=maxlen)
-        self._lock = threading.Lock()
+        if lock is None:
+            lock = threading.Lock()
+        self._lock = lock
 
     def __repr__(self):
         return ("{}({}, maxlen={})"
@@ -79,22 +91,34 @@ class BoundedList(Sequence):
             self._dq.extend(seq)
 
     @classmethod
-    def from_seq(cls, maxlen, seq):
+    def from_seq(cls, maxlen, seq, lock=None):
         seq = tuple(seq)
         if len(seq) > maxlen:
             raise ValueError
-        bounded_list = cls(maxlen)
+        bounded_list = cls(maxlen, lock)
         bounded_list._dq = deque(seq, maxlen=maxlen)
         return bounded_list
 
 
 class BoundedDict(MutableMapping):
-    """A dict with a fixed max capacity."""
-    def __init__(self, maxlen):
+    """A dict with a fixed max capacity.
+
+    :type maxlen: int
+    :param maxlen: The maximum number of items to keep.
+
+    :type lock: :class:`threading.Lock`
+    :param lock: (Optional) The lock guarding the dict, used to share a
+                 single lock between the collections of a span.
+    """
+    __slots__ = ('maxlen', 'dropped', '_dict', '_lock')
+
+    def __init__(self, maxlen, lock=None):
         self.maxlen = maxlen
         self.dropped = 0
         self._dict = OrderedDict()
-        self._lock = threading.Lock()
+        if lock is None:
+            lock = threading.Lock()
+        self._lock = lock
 
     def __repr__(self):
         return ("{}({}, maxlen={})"
@@ -126,11 +150,11 @@ class BoundedDict(MutableMapping):
         return len(self._dict)
 
     @classmethod
-    def from_map(cls, maxlen, mapping):
+    def from_map(cls, maxlen, mapping, lock=None):
         mapping = OrderedDict(mapping)
         if len(mapping) > maxlen:
             raise ValueError
-        bounded_dict = cls(maxlen)
+        bounded_dict = cls(maxlen, lock)
         bounded_dict._dict = mapping
         return bounded_dict
 
@@ -141,7 +165,144 @@ class SpanKind(object):
     CLIENT = 2
 
 
-class Span(base_span.BaseSpan):
+class _SpanMixin(base_span.BaseSpan):
+    """The behaviour shared by :class:`Span` and :class:`CompactSpan`."""
+    __slots__ = ()
+
+    @property
+    def children(self):
+        """The child spans of the current span."""
+        return self._child_spans
+
+    @property
+    def start_time(self):
+        """The start time of the span as an ISO 8601 string."""
+        if self._start_time is None and self.start_time_ns is not None:
+            self._start_time = utils.ns_to_iso_str(self.start_time_ns)
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, start_time):
+        self._start_time = start_time
+        self.start_time_ns = None
+
+    @property
+    def end_time(self):
+        """The end time of the span as an ISO 8601 string."""
+        if self._end_time is None and self.end_time_ns is not None:
+            self._end_time = utils.ns_to_iso_str(self.end_time_ns)
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, end_time):
+        self._end_time = end_time
+        self.end_time_ns = None
+
+    def add_attribute(self, attribute_key, attribute_value):
+        """Add attribute to span.
+
+        :type attribute_key: str
+        :param attribute_key: Attribute key.
+
+        :type attribute_value:str
+        :param attribute_value: Attribute value.
+        """
+        self.attributes[attribute_key] = attribute_value
+
+    def add_annotation(self, description, **attrs):
+        """Add an annotation to span.
+
+        :type description: str
+        :param description: A user-supplied message describing the event.
+                        The maximum length for the description is 256 bytes.
+
+        :type attrs: kwargs
+        :param attrs: keyworded arguments e.g. failed=True, name='Caching'
+        """
+        self.annotations.append(time_event.Annotation(
+            datetime.utcnow(),
+            description,
+            attributes_module.Attributes(attrs)
+        ))
+
+    def add_message_event(self, message_event):
+        """Add a message event to this span.
+
+        :type message_event: :class:`opencensus.trace.time_event.MessageEvent`
+        :param message_event: The message event to attach to this span.
+        """
+        self.message_events.append(message_event)
+
+    def add_link(self, link):
+        """Add a Link.
+
+        :type link: :class: `~opencensus.trace.link.Link`
+        :param link: A Link object.
+        """
+        if isinstance(link, link_module.Link):
+            self.links.append(link)
+        else:
+            raise TypeError("Type Error: received {}, but requires Link.".
+                            format(type(link).__name__))
+
+    def set_status(self, status):
+        """Sets span status.
+
+        :type code: :class: `~opencensus.trace.status.Status`
+        :param code: A Status object.
+        """
+        if isinstance(status, status_module.Status):
+            self.status = status
+        else:
+            raise TypeError("Type Error: received {}, but requires Status.".
+                            format(type(status).__name__))
+
+    def start(self):
+        """Set the start time for a span."""
+        self._start_time = None
+        self.start_time_ns = utils.time_ns()
+        self._start_monotonic_ns = utils.monotonic_ns()
+
+    def finish(self):
+        """Set the end time for a span.
+
+        The end time of a started span is measured on a monotonic clock, so
+        the span's duration is not affected by changes to the system time.
+        """
+        self._end_time = None
+        if self.start_time_ns is not None and \
+                self._start_monotonic_ns is not None:
+            self.end_time_ns = self.start_time_ns + (
+                utils.monotonic_ns() - self._start_monotonic_ns)
+        else:
+            self.end_time_ns = utils.time_ns()
+
+    def __iter__(self):
+        """Iterate through the span tree."""
+        for span in chain.from_iterable(map(iter, self.children)):
+            yield span
+        yield self
+
+    def __enter__(self):
+        """Start a span."""
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Finish a span."""
+        if traceback is not None:
+            self.stack_trace =\
+                stack_trace_module.StackTrace.from_traceback(traceback)
+        if exception_value is not None:
+            self.status = status_module.Status.from_exception(exception_value)
+        if self.context_tracer is not None:
+            self.context_tracer.end_span()
+            return
+
+        self.finish()
+
+
+class Span(_SpanMixin):
     """A span is an individual timed event which forms a node of the trace
     tree. Each span has its name, span id and parent id. The parent id
     indicates the causal relationships between the individual spans in a
@@ -229,8 +390,11 @@ class Span(base_span.BaseSpan):
             span_kind=SpanKind.UNSPECIFIED):
         self.name = name
         self.parent_span = parent_span
+        # start() and finish() record the times in nanoseconds since the
+        # epoch, the ISO 8601 strings are only formatted when read.
         self.start_time = start_time
         self.end_time = end_time
+        self._start_monotonic_ns = None
 
         if span_id is None:
             span_id = generate_span_id()
@@ -282,11 +446,6 @@ class Span(base_span.BaseSpan):
     def on_create(callback):
         Span._on_create_callbacks.append(callback)
 
-    @property
-    def children(self):
-        """The child spans of the current span."""
-        return self._child_spans
-
     def span(self, name='child_span'):
         """Create a child span for the current span and append it to the child
         spans list.
@@ -301,96 +460,181 @@ class Span(base_span.BaseSpan):
         self._child_spans.append(child_span)
         return child_span
 
-    def add_attribute(self, attribute_key, attribute_value):
-        """Add attribute to span.
 
-        :type attribute_key: str
-        :param attribute_key: Attribute key.
+class CompactSpan(_SpanMixin):
+    """A span with a smaller memory footprint than :class:`Span`.
 
-        :type attribute_value:str
-        :param attribute_value: Attribute value.
-        """
-        self.attributes[attribute_key] = attribute_value
+    The span stores its fields in ``__slots__`` and only allocates the
+    attributes, annotations, message events and links collections and the
+    status on first access, so spans that are never annotated stay small.
+    All collections of a span share a single lock. Unlike :class:`Span`,
+    arbitrary attributes can't be set on instances.
 
-    def add_annotation(self, description, **attrs):
-        """Add an annotation to span.
+    The arguments are the same as for :class:`Span`.
+    """
+    __slots__ = (
+        'name',
+        'parent_span',
+        '_start_time',
+        '_end_time',
+        'start_time_ns',
+        'end_time_ns',
+        '_start_monotonic_ns',
+        'span_id',
+        'stack_trace',
+        'same_process_as_parent_span',
+        '_child_spans',
+        'context_tracer',
+        'span_kind',
+        '_attributes',
+        '_annotations',
+        '_message_events',
+        '_links',
+        '_status',
+        '_lock',
+    )
 
-        :type description: str
-        :param description: A user-supplied message describing the event.
-                        The maximum length for the description is 256 bytes.
+    def __init__(
+            self,
+            name,
+            parent_span=None,
+            attributes=None,
+            start_time=None,
+            end_time=None,
+            span_id=None,
+            stack_trace=None,
+            annotations=None,
+            message_events=None,
+            links=None,
+            status=None,
+            same_process_as_parent_span=None,
+            context_tracer=None,
+            span_kind=SpanKind.UNSPECIFIED):
+        self.name = name
+        self.parent_span = parent_span
+        self.start_time = start_time
+        self.end_time = end_time
+        self._start_monotonic_ns = None
+        self._lock = threading.Lock()
 
-        :type attrs: kwargs
-        :param attrs: keyworded arguments e.g. failed=True, name='Caching'
-        """
-        self.annotations.append(time_event.Annotation(
-            datetime.utcnow(),
-            description,
-            attributes_module.Attributes(attrs)
-        ))
+        if span_id is None:
+            span_id = generate_span_id()
 
-    def add_message_event(self, message_event):
-        """Add a message event to this span.
+        self._attributes = None
+        if attributes:
+            self._attributes = BoundedDict.from_map(
+                MAX_NUM_ATTRIBUTES, attributes, self._lock)
 
-        :type message_event: :class:`opencensus.trace.time_event.MessageEvent`
-        :param message_event: The message event to attach to this span.
-        """
-        self.message_events.append(message_event)
+        self._annotations = None
+        if annotations:
+            self._annotations = BoundedList.from_seq(
+                MAX_NUM_ANNOTATIONS, annotations, self._lock)
 
-    def add_link(self, link):
-        """Add a Link.
+        self._message_events = None
+        if message_events:
+            self._message_events = BoundedList.from_seq(
+                MAX_NUM_MESSAGE_EVENTS, message_events, self._lock)
 
-        :type link: :class: `~opencensus.trace.link.Link`
-        :param link: A Link object.
-        """
-        if isinstance(link, link_module.Link):
-            self.links.append(link)
-        else:
-            raise TypeError("Type Error: received {}, but requires Link.".
-                            format(type(link).__name__))
+        self._links = None
+        if links:
+            self._links = BoundedList.from_seq(
+                MAX_NUM_LINKS, links, self._lock)
 
-    def set_status(self, status):
-        """Sets span status.
+        self._status = status
+        self.span_id = span_id
+        self.stack_trace = stack_trace
+        self.same_process_as_parent_span = same_process_as_parent_span
+        self._child_spans = []
+        self.context_tracer = context_tracer
+        self.span_kind = span_kind
+        for callback in Span._on_create_callbacks:
+            callback(self)
 
-        :type code: :class: `~opencensus.trace.status.Status`
-        :param code: A Status object.
-        """
-        if isinstance(status, status_module.Status):
-            self.status = status
-        else:
-            raise TypeError("Type Error: received {}, but requires Status.".
-                            format(type(status).__name__))
+    @staticmethod
+    def on_create(callback):
+        Span.on_create(callback)
 
-    def start(self):
-        """Set the start time for a span."""
-        self.start_time = utils.to_iso_str()
+    @property
+    def attributes(self):
+        """The attributes of the span, created on first access."""
+        if self._attributes is None:
+            with self._lock:
+                if self._attributes is None:
+                    self._attributes = BoundedDict(
+                        MAX_NUM_ATTRIBUTES, self._lock)
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes):
+        self._attributes = attributes
 
-    def finish(self):
-        """Set the end time for a span."""
-        self.end_time = utils.to_iso_str()
+    @property
+    def annotations(self):
+        """The annotations of the span, created on first access."""
+        if self._annotations is None:
+            with self._lock:
+                if self._annotations is None:
+                    self._annotations = BoundedList(
+                        MAX_NUM_ANNOTATIONS, self._lock)
+        return self._annotations
+
+    @annotations.setter
+    def annotations(self, annotations):
+        self._annotations = annotations
 
-    def __iter__(self):
-        """Iterate through the span tree."""
-        for span in chain.from_iterable(map(iter, self.children)):
-            yield span
-        yield self
+    @property
+    def message_events(self):
+        """The message events of the span, created on first access."""
+        if self._message_events is None:
+            with self._lock:
+                if self._message_events is None:
+                    self._message_events = BoundedList(
+                        MAX_NUM_MESSAGE_EVENTS, self._lock)
+        return self._message_events
+
+    @message_events.setter
+    def message_events(self, message_events):
+        self._message_events = message_events
 
-    def __enter__(self):
-        """Start a span."""
-        self.start()
-        return self
+    @property
+    def links(self):
+        """The links of the span, created on first access."""
+        if self._links is None:
+            with self._lock:
+                if self._links is None:
+                    self._links = BoundedList(MAX_NUM_LINKS, self._lock)
+        return self._links
+
+    @links.setter
+    def links(self, links):
+        self._links = links
 
-    def __exit__(self, exception_type, exception_value, traceback):
-        """Finish a span."""
-        if traceback is not None:
-            self.stack_trace =\
-                stack_trace_module.StackTrace.from_traceback(traceback)
-        if exception_value is not None:
-            self.status = status_module.Status.from_exception(exception_value)
-        if self.context_tracer is not None:
-            self.context_tracer.end_span()
-            return
+    @property
+    def status(self):
+        """The status of the span, OK unless set otherwise."""
+        if self._status is None:
+            with self._lock:
+                if self._status is None:
+                    self._status = status_module.Status.as_ok()
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
 
-        self.finish()
+    def span(self, name='child_span'):
+        """Create a child span for the current span and append it to the child
+        spans list.
+
+        :type name: str
+        :param name: (Optional) The name of the child span.
+
+        :rtype: :class: `~opencensus.trace.span.CompactSpan`
+        :returns: A child CompactSpan to be added to the current span.
+        """
+        child_span = CompactSpan(name, parent_span=self)
+        self._child_spans.append(child_span)
+        return child_span
 
 
 def format_span_json(span):
@@ -17,9 +17,9 @@
 import six
 
 import logging
-import random
 import re
 
+from opencensus.trace import id_generator as id_generator_module
 from opencensus.trace import trace_options as trace_options_module
 
 _INVALID_TRACE_ID = '0' * 32
@@ -58,14 +58,15 @@ class SpanContext(object):
             trace_options=None,
             tracestate=None,
             from_header=False):
-        if trace_id is None:
-            trace_id = generate_trace_id()
-
         if trace_options is None:
             trace_options = trace_options_module.TraceOptions(DEFAULT_OPTIONS)
 
         self.from_header = from_header
-        self.trace_id = self._check_trace_id(trace_id)
+        # Generated trace IDs are valid, only check the ones passed in.
+        if trace_id is None:
+            self.trace_id = generate_trace_id()
+        else:
+            self.trace_id = self._check_trace_id(trace_id)
         self.span_id = self._check_span_id(span_id)
         self.trace_options = trace_options
         self.tracestate = tracestate
@@ -153,16 +154,22 @@ def generate_span_id():
     """Return the random generated span ID for a span. Must be a 16 character
     hexadecimal encoded string
 
+    The ID is created by the generator set with
+    :func:`opencensus.trace.id_generator.set_id_generator`.
+
     :rtype: str
     :returns: 16 digit randomly generated hex trace id.
     """
-    return '{:016x}'.format(random.getrandbits(64))
+    return id_generator_module.get_id_generator().generate_span_id()
 
 
 def generate_trace_id():
     """Generate a random 32 char hex trace_id.
 
+    The ID is created by the generator set with
+    :func:`opencensus.trace.id_generator.set_id_generator`.
+
     :rtype: str
     :returns: 32 digit randomly generated hex trace id.
     """
-    return '{:032x}'.format(random.getrandbits(128))
+    return id_generator_module.get_id_generator().generate_trace_id()
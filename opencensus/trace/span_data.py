@@ -35,8 +35,11 @@ _SpanData = collections.namedtuple(
         'status',
         'same_process_as_parent_span',
         'span_kind',
+        'start_time_ns',
+        'end_time_ns',
     ),
 )
+_SpanData.__new__.__defaults__ = (None, None)
 
 
 class SpanData(_SpanData):
@@ -99,9 +102,31 @@ class SpanData(_SpanData):
                         of span (valid values defined by :class:
                         `opencensus.trace.span.SpanKind`)
 
+    :type start_time_ns: int
+    :param start_time_ns: (Optional) Start time in nanoseconds since the epoch,
+                          used to format `start_time` if it is None.
+
+    :type end_time_ns: int
+    :param end_time_ns: (Optional) End time in nanoseconds since the epoch,
+                        used to format `end_time` if it is None.
+
     """
     __slots__ = ()
 
+    @property
+    def start_time(self):
+        start_time = _SpanData.start_time.__get__(self)
+        if start_time is None and self.start_time_ns is not None:
+            return utils.ns_to_iso_str(self.start_time_ns)
+        return start_time
+
+    @property
+    def end_time(self):
+        end_time = _SpanData.end_time.__get__(self)
+        if end_time is None and self.end_time_ns is not None:
+            return utils.ns_to_iso_str(self.end_time_ns)
+        return end_time
+
 
 def _format_legacy_span_json(span_data):
     """
@@ -0,0 +1,195 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encode span data in the wire format of an exporter.
+
+Encoders produce the encoded spans as str chunks, which can be written to
+a file object or compressed as they are produced, e.g.::
+
+    with open('traces.json', 'w') as file:
+        StreamingLegacyJsonEncoder().write(span_datas, file)
+"""
+
+import six
+
+import json
+from json.encoder import encode_basestring_ascii
+
+from opencensus.common import utils
+from opencensus.trace import span_data as span_data_module
+
+
+def encode_json(value):
+    """Encode a JSON value like :func:`json.dumps`, quickly for strings."""
+    if isinstance(value, six.string_types):
+        return encode_basestring_ascii(value)
+    return json.dumps(value)
+
+
+def _encode_truncatable_str(value):
+    value, truncated_byte_count = utils.check_str_length(value)
+    return '{{"value": {}, "truncated_byte_count": {}}}'.format(
+        encode_basestring_ascii(value), truncated_byte_count)
+
+
+def _encode_attribute_value(value):
+    # Same types and order of checks as attributes._format_attribute_value
+    if isinstance(value, bool):
+        return '{"bool_value": true}' if value else '{"bool_value": false}'
+    elif isinstance(value, int):
+        return '{{"int_value": {}}}'.format(int(value))
+    elif isinstance(value, six.string_types):
+        return '{{"string_value": {}}}'.format(_encode_truncatable_str(value))
+    elif isinstance(value, float):
+        return '{{"double_value": {}}}'.format(json.dumps(value))
+    return None
+
+
+class SpanEncoder(object):
+    """Base class of the span data encoders."""
+
+    def iter_encode(self, span_datas):
+        """Encode span data one chunk at a time.
+
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param span_datas: The span data to encode.
+
+        :rtype: iterator
+        :returns: The str chunks of the encoded span data.
+        """
+        raise NotImplementedError  # pragma: NO COVER
+
+    def encode(self, span_datas):
+        """Encode span data.
+
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param span_datas: The span data to encode.
+
+        :rtype: str
+        :returns: The encoded span data.
+        """
+        return ''.join(self.iter_encode(span_datas))
+
+    def write(self, span_datas, file):
+        """Write encoded span data to a file object, one chunk at a time.
+
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param span_datas: The span data to encode.
+
+        :type file: file object
+        :param file: The text file to write to.
+        """
+        for chunk in self.iter_encode(span_datas):
+            file.write(chunk)
+
+
+class LegacyJsonEncoder(SpanEncoder):
+    """Encode span data as the JSON of the legacy trace dictionary, see
+    :func:`~opencensus.trace.span_data.format_legacy_trace_json`.
+    """
+
+    def iter_encode(self, span_datas):
+        yield json.dumps(span_data_module.format_legacy_trace_json(span_datas))
+
+
+class StreamingLegacyJsonEncoder(SpanEncoder):
+    """Encode span data as the JSON of the legacy trace dictionary, one span
+    at a time and without building the dictionary.
+
+    Gives the same JSON as :class:`LegacyJsonEncoder`.
+    """
+
+    def iter_encode(self, span_datas):
+        if not span_datas:
+            yield '{}'
+            return
+        top_span = span_datas[0]
+        trace_id = top_span.context.trace_id if top_span.context is not None \
+            else None
+        assert trace_id is not None
+        yield '{{"traceId": {}, "spans": ['.format(encode_json(trace_id))
+        separator = ''
+        for span_data in span_datas:
+            yield separator
+            yield self._encode_span(span_data)
+            separator = ', '
+        yield ']}'
+
+    def _encode_span(self, span_data):
+        parts = [
+            '{"displayName": ', _encode_truncatable_str(span_data.name),
+            ', "spanId": ', encode_json(span_data.span_id),
+            ', "startTime": ', encode_json(span_data.start_time),
+            ', "endTime": ', encode_json(span_data.end_time),
+            ', "childSpanCount": ', encode_json(span_data.child_span_count),
+            ', "kind": ', encode_json(span_data.span_kind),
+        ]
+
+        if span_data.parent_span_id is not None:
+            parts.append(', "parentSpanId": ')
+            parts.append(encode_json(span_data.parent_span_id))
+
+        if span_data.attributes:
+            parts.append(', "attributes": {"attributeMap": {')
+            separator = ''
+            for key, value in span_data.attributes.items():
+                value = _encode_attribute_value(value)
+                if value is not None:
+                    parts.append(separator)
+                    parts.append(encode_basestring_ascii(
+                        utils.check_str_length(key)[0]))
+                    parts.append(': ')
+                    parts.append(value)
+                    separator = ', '
+            parts.append('}}')
+
+        if span_data.stack_trace is not None:
+            parts.append(', "stackTrace": ')
+            parts.append(json.dumps(
+                span_data.stack_trace.format_stack_trace_json()))
+
+        time_events = []
+        if span_data.annotations:
+            time_events.extend(
+                {'time': aa.timestamp,
+                 'annotation': aa.format_annotation_json()}
+                for aa in span_data.annotations)
+        if span_data.message_events:
+            time_events.extend(
+                {'time': aa.timestamp,
+                 'message_event': aa.format_message_event_json()}
+                for aa in span_data.message_events)
+        if time_events:
+            parts.append(', "timeEvents": ')
+            parts.append(json.dumps({'timeEvent': time_events}))
+
+        if span_data.links:
+            parts.append(', "links": ')
+            parts.append(json.dumps({
+                'link': [link.format_link_json() for link in span_data.links]
+            }))
+
+        if span_data.status is not None:
+            parts.append(', "status": ')
+            parts.append(json.dumps(span_data.status.format_status_json()))
+
+        if span_data.same_process_as_parent_span is not None:
+            parts.append(', "sameProcessAsParentSpan": ')
+            parts.append(encode_json(span_data.same_process_as_parent_span))
+
+        parts.append('}')
+        return ''.join(parts)
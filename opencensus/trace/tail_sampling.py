@@ -0,0 +1,358 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tail-based sampling: decide whether to export a trace once it's done.
+
+Use it with a sampler that samples every request, e.g.::
+
+    exporter = TailSamplingExporter(
+        ZipkinExporter(...),
+        policies=[ErrorPolicy(), LatencyPolicy(percentile=99)],
+        rate=0.05)
+    tracer = Tracer(exporter=exporter, sampler=AlwaysOnSampler())
+"""
+
+from six import iteritems
+
+import bisect
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+from opencensus.common import utils
+from opencensus.common.schedule import PeriodicTask
+from opencensus.trace import base_exporter
+from opencensus.trace.samplers import get_lower_long_from_trace_id
+
+DEFAULT_DECISION_WAIT = 10.0  # Seconds
+DEFAULT_MAX_TRACES = 10000
+DEFAULT_MAX_SPANS_PER_TRACE = 1000
+DEFAULT_RATE = 0.05
+
+logger = logging.getLogger(__name__)
+
+
+def _get_time_us(timestamp_ns, timestamp):
+    if timestamp_ns is None and timestamp is None:
+        return None
+    return utils.timestamp_to_microseconds(timestamp_ns or timestamp)
+
+
+def get_trace_duration(span_datas):
+    """Get the time from the first span start to the last span end.
+
+    :type span_datas: list of :class:`~opencensus.trace.span_data.SpanData`
+    :param span_datas: The spans of a trace.
+
+    :rtype: float
+    :returns: The duration in seconds, 0 if the spans don't have times.
+    """
+    starts = [_get_time_us(sd.start_time_ns, sd.start_time)
+              for sd in span_datas]
+    ends = [_get_time_us(sd.end_time_ns, sd.end_time) for sd in span_datas]
+    starts = [start for start in starts if start is not None]
+    ends = [end for end in ends if end is not None]
+    if not starts or not ends:
+        return 0.0
+    return max(max(ends) - min(starts), 0) / 1e6
+
+
+class Policy(object):
+    """Base class for tail sampling policies.
+
+    Subclasses must override :meth:`should_keep`.
+    """
+
+    def should_keep(self, span_datas):
+        """Whether to export a finished trace.
+
+        :type span_datas: list of :class:`~opencensus.trace.span_data.SpanData`
+        :param span_datas: The buffered spans of the trace.
+
+        :rtype: bool
+        :returns: True to export the trace.
+        """
+        raise NotImplementedError
+
+
+class ErrorPolicy(Policy):
+    """Keep traces with a span whose status isn't OK."""
+
+    def should_keep(self, span_datas):
+        return any(sd.status is not None and not sd.status.is_ok
+                   for sd in span_datas)
+
+
+class LatencyPolicy(Policy):
+    """Keep slow traces.
+
+    A trace is slow if it takes at least ``threshold`` seconds, or if it's
+    in the given ``percentile`` of the last ``window`` trace durations.
+
+    :type percentile: float
+    :param percentile: (Optional) The percentile of recent durations, in
+                       the range (0, 100), above which traces are kept.
+
+    :type threshold: float
+    :param threshold: (Optional) The duration in seconds above which traces
+                      are always kept.
+
+    :type window: int
+    :param window: The number of recent durations to compute the percentile
+                   from.
+    """
+    def __init__(self, percentile=None, threshold=None, window=1000):
+        if percentile is None and threshold is None:
+            raise ValueError('Either percentile or threshold is required.')
+        if percentile is not None and not 0 < percentile < 100:
+            raise ValueError('Percentile must be between 0 and 100.')
+        self.percentile = percentile
+        self.threshold = threshold
+        self.window = window
+        self._durations = deque()
+        self._sorted_durations = []
+        self._lock = threading.Lock()
+
+    def _add_duration(self, duration):
+        """Get the percentile of the recent durations, then record the new
+        duration. Returns None if there are no recent durations."""
+        with self._lock:
+            sorted_durations = self._sorted_durations
+            percentile = None
+            if sorted_durations:
+                index = int(len(sorted_durations) * self.percentile / 100.)
+                percentile = sorted_durations[index]
+
+            if len(self._durations) == self.window:
+                oldest = self._durations.popleft()
+                del sorted_durations[
+                    bisect.bisect_left(sorted_durations, oldest)]
+            self._durations.append(duration)
+            bisect.insort(sorted_durations, duration)
+            return percentile
+
+    def should_keep(self, span_datas):
+        duration = get_trace_duration(span_datas)
+        keep = self.threshold is not None and duration >= self.threshold
+        if self.percentile is not None:
+            percentile = self._add_duration(duration)
+            keep = keep or (percentile is not None and duration >= percentile)
+        return keep
+
+
+class AttributePolicy(Policy):
+    """Keep traces with a span that has the given attribute.
+
+    :type key: str
+    :param key: The attribute key.
+
+    :type values: collection
+    :param values: (Optional) The attribute values to keep traces for. If
+                   not given, any value matches.
+    """
+    def __init__(self, key, values=None):
+        self.key = key
+        self.values = None if values is None else frozenset(values)
+
+    def should_keep(self, span_datas):
+        for sd in span_datas:
+            if not sd.attributes or self.key not in sd.attributes:
+                continue
+            if self.values is None or sd.attributes[self.key] in self.values:
+                return True
+        return False
+
+
+class _TraceBuffer(object):
+    __slots__ = ('deadline', 'span_datas')
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.span_datas = []
+
+
+class TailSamplingExporter(base_exporter.Exporter):
+    """An exporter that buffers whole traces and only forwards the traces
+    kept by its policies to another exporter.
+
+    The spans of a trace are buffered until its root span ends, or for
+    ``decision_wait`` seconds after its first span ended. A trace is
+    then kept if any of the policies keeps it, and otherwise with
+    probability ``rate`` based on its trace ID. Spans of a trace that
+    arrive after its decision follow that decision.
+
+    A span completes its trace if it has no parent, or if
+    ``same_process_as_parent_span`` is False. Traces continued from another
+    process are decided after ``decision_wait``.
+
+    :type exporter: :class:`~opencensus.trace.base_exporter.Exporter`
+    :param exporter: The exporter to forward kept traces to.
+
+    :type policies: list of :class:`Policy`
+    :param policies: (Optional) The policies that keep traces.
+
+    :type rate: float
+    :param rate: The probability to keep traces no policy keeps.
+
+    :type decision_wait: float
+    :param decision_wait: Seconds to wait for a trace to complete.
+
+    :type max_traces: int
+    :param max_traces: The maximum number of buffered traces, the oldest
+                       trace is decided early when there are more.
+
+    :type max_spans_per_trace: int
+    :param max_spans_per_trace: The maximum number of buffered spans per
+                                trace, later spans are dropped.
+    """
+    def __init__(self, exporter,
+                 policies=None,
+                 rate=DEFAULT_RATE,
+                 decision_wait=DEFAULT_DECISION_WAIT,
+                 max_traces=DEFAULT_MAX_TRACES,
+                 max_spans_per_trace=DEFAULT_MAX_SPANS_PER_TRACE):
+        if not 0 <= rate <= 1:
+            raise ValueError('Rate must between 0 and 1.')
+        self.exporter = exporter
+        self.policies = list(policies or ())
+        self.rate = rate
+        self.decision_wait = decision_wait
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces = OrderedDict()
+        # Recent decisions, for spans that arrive after them
+        self._decisions = OrderedDict()
+        self._lock = threading.Lock()
+        self._task = None
+        self.traces_kept = 0
+        self.traces_dropped = 0
+        self.spans_dropped = 0
+
+    def _start(self):
+        if self._task is None:
+            self._task = PeriodicTask(
+                max(self.decision_wait / 2., 0.1), self._decide_expired,
+                name='{} Worker'.format(type(self).__name__))
+            self._task.daemon = True
+            self._task.start()
+
+    def _should_keep(self, trace_id, span_datas):
+        keep = False
+        # Run all policies, so that they see every trace.
+        for policy in self.policies:
+            try:
+                keep = policy.should_keep(span_datas) or keep
+            except Exception:
+                logger.exception('Tail sampling policy %s failed.',
+                                 type(policy).__name__)
+        return keep or get_lower_long_from_trace_id(trace_id) <= \
+            self.rate * 0xffffffffffffffff
+
+    def _remember(self, trace_id, keep):
+        self._decisions[trace_id] = keep
+        if len(self._decisions) > self.max_traces:
+            self._decisions.popitem(last=False)
+        if keep:
+            self.traces_kept += 1
+        else:
+            self.traces_dropped += 1
+
+    def _buffer(self, span_datas):
+        """Buffer span datas and pop the traces that are ready.
+
+        Must hold the lock.
+        """
+        complete = []
+        late = []
+        deadline = time.time() + self.decision_wait
+        for sd in span_datas:
+            trace_id = sd.context.trace_id
+            decision = self._decisions.get(trace_id)
+            if decision is not None:
+                if decision:
+                    late.append(sd)
+                continue
+            trace = self._traces.get(trace_id)
+            if trace is None:
+                trace = self._traces[trace_id] = _TraceBuffer(deadline)
+            if len(trace.span_datas) < self.max_spans_per_trace:
+                trace.span_datas.append(sd)
+            else:
+                self.spans_dropped += 1
+            if sd.parent_span_id is None or \
+                    sd.same_process_as_parent_span is False:
+                complete.append(trace_id)
+
+        ready = [(trace_id, self._traces.pop(trace_id))
+                 for trace_id in complete if trace_id in self._traces]
+        while len(self._traces) > self.max_traces:
+            ready.append(self._traces.popitem(last=False))
+        return ready, late
+
+    def _pop_expired(self, now):
+        """Pop the traces whose wait expired. Must hold the lock."""
+        expired = []
+        # Traces are ordered by their first span
+        while self._traces:
+            trace_id, trace = next(iteritems(self._traces))
+            if trace.deadline > now:
+                break
+            del self._traces[trace_id]
+            expired.append((trace_id, trace))
+        return expired
+
+    def _decide(self, traces, late=()):
+        to_export = list(late)
+        for trace_id, trace in traces:
+            keep = self._should_keep(trace_id, trace.span_datas)
+            with self._lock:
+                self._remember(trace_id, keep)
+            if keep:
+                to_export.extend(trace.span_datas)
+        if to_export:
+            self.exporter.export(to_export)
+
+    def _decide_expired(self):
+        try:
+            with self._lock:
+                expired = self._pop_expired(time.time())
+            self._decide(expired)
+        except Exception:
+            logger.exception('Failed to export tail sampled traces.')
+
+    def emit(self, span_datas):
+        """Buffer the span datas, see :meth:`export`."""
+        self.export(span_datas)
+
+    def export(self, span_datas):
+        """Buffer the span datas and export the traces that are kept.
+
+        :type span_datas: list of :class:
+            `~opencensus.trace.span_data.SpanData`
+        :param list of opencensus.trace.span_data.SpanData span_datas:
+            SpanData tuples to export
+        """
+        self._start()
+        with self._lock:
+            ready, late = self._buffer(span_datas)
+            ready.extend(self._pop_expired(time.time()))
+        self._decide(ready, late)
+
+    def flush(self):
+        """Decide on all buffered traces now, e.g. before shutting down."""
+        with self._lock:
+            traces = list(self._traces.items())
+            self._traces.clear()
+        self._decide(traces)
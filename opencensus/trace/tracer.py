@@ -36,13 +36,31 @@ class Tracer(object):
                      :class:`.Fileexporter`, :class:`.Printexporter`,
                      :class:`.Loggingexporter`, :class:`.Zipkinexporter`,
                      :class:`.GoogleCloudexporter`
+
+    :type span_class: type
+    :param span_class: (Optional) The class of the spans to create, pass
+                       :class:`~opencensus.trace.span.CompactSpan` to reduce
+                       the memory used by live spans. Defaults to
+                       :class:`~opencensus.trace.span.Span`.
+
+    :type sampling_name: str
+    :param sampling_name: (Optional) The name of the request's root span, for
+                          samplers that take the request into account.
+
+    :type sampling_attributes: dict
+    :param sampling_attributes: (Optional) Attributes of the request, e.g. its
+                                HTTP method and path, for samplers that take
+                                the request into account.
     """
     def __init__(
             self,
             span_context=None,
             sampler=None,
             exporter=None,
-            propagator=None):
+            propagator=None,
+            span_class=None,
+            sampling_name=None,
+            sampling_attributes=None):
         if span_context is None:
             span_context = SpanContext()
 
@@ -60,6 +78,9 @@ class Tracer(object):
         self.sampler = sampler
         self.exporter = exporter
         self.propagator = propagator
+        self.span_class = span_class
+        self.sampling_name = sampling_name
+        self.sampling_attributes = sampling_attributes
         self.tracer = self.get_tracer()
         self.store_tracer()
 
@@ -71,6 +92,11 @@ class Tracer(object):
         :rtype: bool
         :returns: Whether to trace the request or not.
         """
+        if isinstance(self.sampler, samplers.Sampler):
+            return self.sampler.should_sample_request(
+                self.span_context,
+                self.sampling_name,
+                self.sampling_attributes)
         return self.sampler.should_sample(self.span_context)
 
     def get_tracer(self):
@@ -81,7 +107,8 @@ class Tracer(object):
             self.span_context.trace_options.set_enabled(True)
             return context_tracer.ContextTracer(
                 exporter=self.exporter,
-                span_context=self.span_context)
+                span_context=self.span_context,
+                span_class=self.span_class)
         return noop_tracer.NoopTracer()
 
     def store_tracer(self):
@@ -28,19 +28,28 @@ class ContextTracer(base.Tracer):
     :type span_context: :class:`~opencensus.trace.span_context.SpanContext`
     :param span_context: SpanContext encapsulates the current context within
                          the request's trace.
+
+    :type span_class: type
+    :param span_class: (Optional) The class of the spans to create, either
+                       :class:`~opencensus.trace.span.Span` (the default) or
+                       :class:`~opencensus.trace.span.CompactSpan`.
     """
 
-    def __init__(self, exporter=None, span_context=None):
+    def __init__(self, exporter=None, span_context=None, span_class=None):
         if exporter is None:
             exporter = print_exporter.PrintExporter()
 
         if span_context is None:
             span_context = SpanContext()
 
+        if span_class is None:
+            span_class = trace_span.Span
+
         self.exporter = exporter
         self.span_context = span_context
         self.trace_id = span_context.trace_id
         self.root_span_id = span_context.span_id
+        self.span_class = span_class
 
         self._spans_list_condition = threading.Condition()
         # List of spans to report
@@ -84,7 +93,7 @@ class ContextTracer(base.Tracer):
             parent_span = base.NullContextManager(
                 span_id=self.span_context.span_id)
 
-        span = trace_span.Span(
+        span = self.span_class(
             name,
             parent_span=parent_span,
             context_tracer=self)
@@ -111,7 +120,8 @@ class ContextTracer(base.Tracer):
         self.span_context.span_id = cur_span.parent_span.span_id if \
             cur_span.parent_span else None
 
-        if isinstance(cur_span.parent_span, trace_span.Span):
+        if isinstance(cur_span.parent_span,
+                      (trace_span.Span, trace_span.CompactSpan)):
             execution_context.set_current_span(cur_span.parent_span)
         else:
             execution_context.set_current_span(None)
@@ -159,8 +169,10 @@ class ContextTracer(base.Tracer):
                 parent_span_id=ss.parent_span.span_id if
                 ss.parent_span else None,
                 attributes=ss.attributes,
-                start_time=ss.start_time,
-                end_time=ss.end_time,
+                # Leave formatting the times to exporters that need strings.
+                start_time=ss.start_time if ss.start_time_ns is None
+                else None,
+                end_time=ss.end_time if ss.end_time_ns is None else None,
                 child_span_count=len(ss.children),
                 stack_trace=ss.stack_trace,
                 annotations=ss.annotations,
@@ -168,7 +180,9 @@ class ContextTracer(base.Tracer):
                 links=ss.links,
                 status=ss.status,
                 same_process_as_parent_span=ss.same_process_as_parent_span,
-                span_kind=ss.span_kind
+                span_kind=ss.span_kind,
+                start_time_ns=ss.start_time_ns,
+                end_time_ns=ss.end_time_ns
             )
             for ss in span
         ]
@@ -22,22 +22,33 @@ _KEY_FORMAT = _KEY_WITHOUT_VENDOR_FORMAT + '|' + _KEY_WITH_VENDOR_FORMAT
 _VALUE_FORMAT = \
     r'[\x20-\x2b\x2d-\x3c\x3e-\x7e]{0,255}[\x21-\x2b\x2d-\x3c\x3e-\x7e]'
 
-_KEY_VALIDATION_RE = re.compile('^' + _KEY_FORMAT + '$')
-_VALUE_VALIDATION_RE = re.compile('^' + _VALUE_FORMAT + '$')
+# Anchored with \Z, $ would also match before a trailing newline
+_KEY_VALIDATION_RE = re.compile('(?:' + _KEY_FORMAT + r')\Z')
+_VALUE_VALIDATION_RE = re.compile('(?:' + _VALUE_FORMAT + r')\Z')
 
 
 class Tracestate(OrderedDict):
     def __setitem__(self, key, value):
         if not isinstance(key, str):
             raise ValueError('key must be an instance of str')
-        if not re.match(_KEY_VALIDATION_RE, key):
+        if not _KEY_VALIDATION_RE.match(key):
             raise ValueError('illegal key provided')
         if not isinstance(value, str):
             raise ValueError('value must be an instance of str')
-        if not re.match(_VALUE_VALIDATION_RE, value):
+        if not _VALUE_VALIDATION_RE.match(value):
             raise ValueError('illegal value provided')
         super(Tracestate, self).__setitem__(key, value)
 
+    @classmethod
+    def _from_members(cls, members):
+        """Create a tracestate from key-value pairs that were already
+        validated."""
+        tracestate = cls()
+        setitem = OrderedDict.__setitem__
+        for key, value in members:
+            setitem(tracestate, key, value)
+        return tracestate
+
     def append(self, key, value):
         if self.get(key):
             del self[key]
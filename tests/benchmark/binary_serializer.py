@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark encoding and decoding tag maps with the binary serializer.
+
+Reports the mean time of a call in microseconds and the throughput in
+megabytes of serialized tags per second.
+
+Usage: python tests/benchmark/binary_serializer.py
+"""
+
+import timeit
+
+from opencensus.tags import Tag, TagKey, TagMap, TagValue
+from opencensus.tags.propagation import binary_serializer
+
+CALLS = 2000
+# (tags, key length, value length), values stay below 128 characters so
+# their lengths fit a single varint byte
+CASES = (
+    (3, 8, 8),
+    (16, 16, 32),
+    (32, 32, 120),
+)
+
+
+def make_tag_map(tags, key_length, value_length):
+    return TagMap(tags=[
+        Tag(TagKey('k{}'.format(i).ljust(key_length, 'k')),
+            TagValue('v{}'.format(i).ljust(value_length, 'v')))
+        for i in range(tags)
+    ])
+
+
+def call_cost(func):
+    """Get the mean time of a call in microseconds."""
+    return min(timeit.repeat(func, number=CALLS, repeat=3)) / CALLS * 1e6
+
+
+def main():
+    serializer = binary_serializer.BinarySerializer()
+    print("{:>16} {:>8} {:>12} {:>12} {:>10} {:>10}".format(
+        "case", "bytes", "encode us", "decode us", "enc MB/s", "dec MB/s"))
+    for tags, key_length, value_length in CASES:
+        tag_map = make_tag_map(tags, key_length, value_length)
+        binary = serializer.to_byte_array(tag_map)
+        assert serializer.from_byte_array(binary).map == tag_map.map
+        encode = call_cost(lambda: serializer.to_byte_array(tag_map))
+        decode = call_cost(lambda: serializer.from_byte_array(binary))
+        print("{:>16} {:>8} {:>12.2f} {:>12.2f} {:>10.1f} {:>10.1f}".format(
+            '{}x{}+{}'.format(tags, key_length, value_length), len(binary),
+            encode, decode, len(binary) / encode, len(binary) / decode))
+
+
+if __name__ == '__main__':
+    main()
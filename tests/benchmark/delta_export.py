@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark exporting a high-cardinality view with cumulative and delta
+metrics.
+
+A view has many series but only a few of them are recorded between two
+exports. Cumulative metrics include every series ever recorded, delta
+metrics only the recently recorded ones. Also compare the cost of a record,
+which takes a lock in delta mode unless the view data is sharded.
+
+Usage: python tests/benchmark/delta_export.py
+"""
+
+import timeit
+
+from opencensus.stats import aggregation as aggregation_module
+from opencensus.stats import measure as measure_module
+from opencensus.stats import view as view_module
+from opencensus.stats.measure_to_view_map import MeasureToViewMap
+from opencensus.tags import tag_key as tag_key_module
+from opencensus.tags import tag_map as tag_map_module
+
+KEY = tag_key_module.TagKey("key")
+MEASURE = measure_module.MeasureFloat("latency", "latency", "ms")
+VIEW = view_module.View(
+    "latency_view", "latency", [KEY], MEASURE,
+    aggregation_module.DistributionAggregation([1, 5, 10, 50, 100, 500]))
+CARDINALITY = 10000
+ACTIVE = 100
+RECORDS = 10000
+
+
+def make_map(delta, sharded=False):
+    mtvm = MeasureToViewMap(sharded=sharded, delta=delta)
+    mtvm.register_view(VIEW, None)
+    return mtvm
+
+
+def export_cost(delta):
+    """Get the number of exported series and the export time in ms."""
+    mtvm = make_map(delta)
+    for ii in range(CARDINALITY):
+        mtvm.record(tag_map_module.TagMap({KEY: str(ii)}), {MEASURE: 1.0},
+                    None)
+    list(mtvm.get_metrics(None))
+    tag_maps = [tag_map_module.TagMap({KEY: str(ii)}) for ii in range(ACTIVE)]
+    for tag_map in tag_maps:
+        mtvm.record(tag_map, {MEASURE: 3.0}, None)
+
+    def export():
+        return list(mtvm.get_metrics(None))
+
+    [metric] = export()
+    for tag_map in tag_maps:
+        mtvm.record(tag_map, {MEASURE: 3.0}, None)
+    cost = timeit.timeit(export, number=1) * 1e3
+    return len(metric.time_series), cost
+
+
+def record_cost(delta, sharded):
+    """Get the mean time of a record in microseconds."""
+    mtvm = make_map(delta, sharded)
+    tag_map = tag_map_module.TagMap({KEY: "0"})
+    measurement = {MEASURE: 3.0}
+
+    def record():
+        mtvm.record(tag_map, measurement, None)
+
+    return min(timeit.repeat(record, number=RECORDS, repeat=3)) \
+        / RECORDS * 1e6
+
+
+def main():
+    print("{} series, {} recorded between exports".format(
+        CARDINALITY, ACTIVE))
+    print("{:>12} {:>10} {:>12} {:>12} {:>14}".format(
+        "mode", "series", "export (ms)", "record (us)",
+        "sharded (us)"))
+    for delta in (False, True):
+        series, cost = export_cost(delta)
+        print("{:>12} {:>10} {:>12.2f} {:>12.2f} {:>14.2f}".format(
+            "delta" if delta else "cumulative", series, cost,
+            record_cost(delta, False), record_cost(delta, True)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare explicit and exponential distribution aggregations recording
+latencies spread over six orders of magnitude.
+
+Prints the cost of a sample, the number of exported buckets and the largest
+ratio between the bounds of a bucket holding samples.
+
+Usage: python tests/benchmark/exponential_histogram.py
+"""
+
+import random
+import timeit
+
+from opencensus.stats import aggregation as aggregation_module
+
+SAMPLES = 10000
+
+
+def make_values():
+    rng = random.Random(0)
+    return [rng.lognormvariate(2, 2.5) for _ in range(SAMPLES)]
+
+
+def get_max_ratio(agg_data):
+    """Get the largest ratio between the bounds of a non-empty bucket."""
+    bounds = agg_data.bounds
+    counts = agg_data.counts_per_bucket
+    return max(bounds[ii] / bounds[ii - 1]
+               for ii in range(1, len(bounds)) if counts[ii])
+
+
+def run(name, aggregation, values):
+    agg_data = aggregation.new_aggregation_data()
+
+    def record():
+        for value in values:
+            agg_data.add_sample(value, None, None)
+
+    cost = min(timeit.repeat(record, number=1, repeat=3)) / SAMPLES * 1e9
+    print("{:<28} {:>10.0f} {:>8} {:>10.3f}".format(
+        name, cost, len(agg_data.counts_per_bucket),
+        get_max_ratio(agg_data)))
+
+
+def main():
+    values = make_values()
+    print("{:<28} {:>10} {:>8} {:>10}".format(
+        "aggregation", "ns/sample", "buckets", "max ratio"))
+    run("explicit, powers of 10", aggregation_module.DistributionAggregation(
+        [10 ** ii for ii in range(-3, 5)]), values)
+    run("explicit, powers of 1.1", aggregation_module.DistributionAggregation(
+        [1.1 ** ii for ii in range(-72, 98)]), values)
+    for max_buckets in (20, 160):
+        run("exponential, {} buckets".format(max_buckets),
+            aggregation_module.ExponentialDistributionAggregation(
+                max_buckets), values)
+
+
+if __name__ == '__main__':
+    main()
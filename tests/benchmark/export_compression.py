@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark compressing exported span payloads.
+
+Encodes 1000 Zipkin spans and reports the request body size and the CPU
+time spent encoding and compressing it, for each compression setting.
+Requires the Zipkin exporter.
+
+Usage: python tests/benchmark/export_compression.py
+"""
+
+import json
+import random
+import time
+
+from opencensus.common import http_client
+from opencensus.ext.zipkin.trace_exporter import ZipkinExporter
+from opencensus.trace import span_context, span_data
+from opencensus.trace.span import SpanKind
+
+SPANS = 1000
+REPEAT = 20
+START_TIME_NS = 1600000000 * 10 ** 9
+
+
+def make_span_datas():
+    rand = random.Random(0)
+    span_datas = []
+    for ii in range(SPANS):
+        start_time_ns = START_TIME_NS + rand.randint(0, 10 ** 9)
+        span_datas.append(span_data.SpanData(
+            name='/api/users/{}'.format(ii % 20),
+            context=span_context.SpanContext(
+                trace_id='{:032x}'.format(rand.getrandbits(128))),
+            span_id='{:016x}'.format(rand.getrandbits(64)),
+            parent_span_id='{:016x}'.format(rand.getrandbits(64)),
+            attributes={
+                'http.method': 'GET',
+                'http.route': '/api/users/<id>',
+                'http.status_code': 200,
+                'http.url': 'https://example.com/api/users/{}'.format(ii),
+            },
+            start_time=None,
+            end_time=None,
+            child_span_count=0,
+            stack_trace=None,
+            annotations=None,
+            message_events=None,
+            links=None,
+            status=None,
+            same_process_as_parent_span=None,
+            span_kind=SpanKind.SERVER,
+            start_time_ns=start_time_ns,
+            end_time_ns=start_time_ns + rand.randint(10 ** 5, 10 ** 8),
+        ))
+    return span_datas
+
+
+def encode(zipkin_spans, compression, level):
+    if compression is None:
+        return json.dumps(zipkin_spans).encode('utf-8')
+    return http_client.compress(
+        http_client.iter_json_array(zipkin_spans), compression, level)
+
+
+def cpu_cost(func):
+    """Get the CPU time of a call in milliseconds per 1000 spans."""
+    costs = []
+    for _ in range(3):
+        start = time.process_time()
+        for _ in range(REPEAT):
+            func()
+        costs.append(time.process_time() - start)
+    return min(costs) / REPEAT * 1e3 * 1000 / SPANS
+
+
+def main():
+    exporter = ZipkinExporter(service_name='benchmark')
+    zipkin_spans = exporter.translate_to_zipkin(make_span_datas())
+
+    print("{:>12} {:>12} {:>8} {:>14}".format(
+        "compression", "bytes/1k", "ratio", "CPU ms/1k"))
+    raw = None
+    for compression, level in ((None, None),
+                               (http_client.GZIP, 1),
+                               (http_client.GZIP, 6),
+                               (http_client.GZIP, 9),
+                               (http_client.DEFLATE, 6)):
+        body = encode(zipkin_spans, compression, level)
+        raw = raw or len(body)
+        cpu = cpu_cost(lambda: encode(zipkin_spans, compression, level))
+        name = 'none' if compression is None else '{}-{}'.format(
+            compression, level)
+        print("{:>12} {:>12} {:>8.2f} {:>14.2f}".format(
+            name, len(body) * 1000 // SPANS, float(raw) / len(body), cpu))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark a Prometheus scrape of many series.
+
+Compares rendering through ``prometheus_client`` metric objects, which is
+what ``start_http_server`` does, with ``Collector.render`` and its gzipped
+output. Requires opencensus-ext-prometheus.
+
+Usage: python tests/benchmark/prometheus_scrape.py [series]
+"""
+
+import sys
+import timeit
+
+from prometheus_client import generate_latest
+from prometheus_client.core import CollectorRegistry
+
+from opencensus.ext.prometheus import stats_exporter as prometheus
+from opencensus.stats import aggregation as aggregation_module
+from opencensus.stats import measure as measure_module
+from opencensus.stats import view as view_module
+from opencensus.stats import view_data as view_data_module
+from opencensus.tags import tag_key as tag_key_module
+from opencensus.tags import tag_map as tag_map_module
+from opencensus.tags import tag_value as tag_value_module
+
+DEFAULT_SERIES = 50000
+KEY = tag_key_module.TagKey("route")
+MEASURE = measure_module.MeasureFloat("latency", "request latency", "ms")
+AGGREGATIONS = (
+    ("count", aggregation_module.CountAggregation()),
+    ("sum", aggregation_module.SumAggregation()),
+    ("latency", aggregation_module.DistributionAggregation(
+        [1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0])),
+)
+
+
+def make_collector(series):
+    """Get a collector with ``series`` series spread over the views."""
+    collector = prometheus.Collector(
+        options=prometheus.Options("bench", registry=CollectorRegistry()))
+    per_view = series // len(AGGREGATIONS)
+    for name, aggregation in AGGREGATIONS:
+        view = view_module.View(
+            name, "benchmark view", [KEY], MEASURE, aggregation)
+        view_data = view_data_module.ViewData(view, None, None)
+        for ii in range(per_view):
+            tag_map = tag_map_module.TagMap()
+            tag_map.insert(KEY, tag_value_module.TagValue("/r/%d" % ii))
+            view_data.record(tag_map, ii % 300, None)
+        collector.add_view_data(view_data)
+    return collector
+
+
+def scrape_cost(func):
+    """Get the best time of a scrape in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=5)) * 1e3
+
+
+def main():
+    series = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SERIES
+    collector = make_collector(series)
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    print("{} series".format(series))
+    print("{:>24} {:>10} {:>12}".format("case", "ms", "bytes"))
+    for name, func in (
+            ("prometheus_client", lambda: generate_latest(registry)),
+            ("render", lambda: collector.render().encode('utf-8')),
+            ("render_bytes gzip",
+             lambda: collector.render_bytes('gzip')[0]),
+    ):
+        print("{:>24} {:>10.1f} {:>12}".format(
+            name, scrape_cost(func), len(func())))
+
+
+if __name__ == '__main__':
+    main()
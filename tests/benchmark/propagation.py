@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark extracting and injecting span contexts with the HTTP
+propagators.
+
+Reports the mean time of a call in microseconds.
+
+Usage: python tests/benchmark/propagation.py
+"""
+
+import timeit
+
+from opencensus.trace.propagation import (
+    b3_format,
+    google_cloud_format,
+    trace_context_http_header_format,
+)
+from opencensus.trace.span_context import SpanContext
+from opencensus.trace.trace_options import TraceOptions
+
+CALLS = 100000
+TRACE_ID = '6e0c63257de34c92bf9efcd03927272e'
+SPAN_ID = '6e0c63257de34c92'
+
+TRACE_CONTEXT_HEADERS = {
+    'traceparent': '00-{}-{}-01'.format(TRACE_ID, SPAN_ID),
+}
+TRACE_CONTEXT_TRACESTATE_HEADERS = dict(
+    TRACE_CONTEXT_HEADERS,
+    tracestate='congo=t61rcWkgMzE,rojo=00f067aa0ba902b7,vendor@tenant=abc')
+B3_HEADERS = {
+    'x-b3-traceid': TRACE_ID,
+    'x-b3-spanid': SPAN_ID,
+    'x-b3-sampled': '1',
+}
+B3_SINGLE_HEADERS = {
+    'b3': '{}-{}-1'.format(TRACE_ID, SPAN_ID),
+}
+GOOGLE_CLOUD_HEADERS = {
+    'X-Cloud-Trace-Context': '{}/{};o=1'.format(TRACE_ID, int(SPAN_ID, 16)),
+}
+
+
+def make_cases():
+    trace_context = trace_context_http_header_format.TraceContextPropagator()
+    b3 = b3_format.B3FormatPropagator()
+    google_cloud = google_cloud_format.GoogleCloudFormatPropagator()
+    span_context = trace_context.from_headers(
+        TRACE_CONTEXT_TRACESTATE_HEADERS)
+    plain_span_context = SpanContext(
+        trace_id=TRACE_ID, span_id=SPAN_ID, trace_options=TraceOptions('1'))
+
+    return (
+        ('w3c from_headers',
+         lambda: trace_context.from_headers(TRACE_CONTEXT_HEADERS)),
+        ('w3c+tracestate from_headers',
+         lambda: trace_context.from_headers(
+             TRACE_CONTEXT_TRACESTATE_HEADERS)),
+        ('w3c to_headers',
+         lambda: trace_context.to_headers(plain_span_context)),
+        ('w3c+tracestate to_headers',
+         lambda: trace_context.to_headers(span_context)),
+        ('b3 from_headers', lambda: b3.from_headers(B3_HEADERS)),
+        ('b3 single from_headers',
+         lambda: b3.from_headers(B3_SINGLE_HEADERS)),
+        ('b3 to_headers', lambda: b3.to_headers(plain_span_context)),
+        ('google from_headers',
+         lambda: google_cloud.from_headers(GOOGLE_CLOUD_HEADERS)),
+        ('google to_headers',
+         lambda: google_cloud.to_headers(plain_span_context)),
+    )
+
+
+def call_cost(func):
+    """Get the mean time of a call in microseconds."""
+    return min(timeit.repeat(func, number=CALLS, repeat=3)) / CALLS * 1e6
+
+
+def main():
+    print("{:>28} {:>10}".format("case", "us"))
+    for name, func in make_cases():
+        print("{:>28} {:>10.3f}".format(name, call_cost(func)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark generating IDs and creating span contexts and spans.
+
+Each case is run with every ID generator, and reports the mean time of a
+call in microseconds.
+
+Usage: python tests/benchmark/span_context.py
+"""
+
+import timeit
+
+from opencensus.trace import id_generator as id_generator_module
+from opencensus.trace.span import CompactSpan, Span
+from opencensus.trace.span_context import (
+    SpanContext,
+    generate_span_id,
+    generate_trace_id,
+)
+
+CALLS = 100000
+TRACE_ID = '6e0c63257de34c92bf9efcd03927272e'
+SPAN_ID = '6e0c63257de34c92'
+
+CASES = (
+    ('generate_span_id', generate_span_id),
+    ('generate_trace_id', generate_trace_id),
+    ('SpanContext()', SpanContext),
+    ('SpanContext(ids)',
+     lambda: SpanContext(trace_id=TRACE_ID, span_id=SPAN_ID)),
+    ('Span(name)', lambda: Span('span')),
+    ('CompactSpan(name)', lambda: CompactSpan('span')),
+)
+
+GENERATORS = (
+    id_generator_module.RandomIdGenerator,
+    id_generator_module.UrandomIdGenerator,
+)
+
+
+def call_cost(func):
+    """Get the mean time of a call in microseconds."""
+    return min(timeit.repeat(func, number=CALLS, repeat=3)) / CALLS * 1e6
+
+
+def main():
+    default = id_generator_module.get_id_generator()
+    print(("{:>20}" + " {:>20}" * len(GENERATORS)).format(
+        "case", *(gen.__name__ + " (us)" for gen in GENERATORS)))
+    try:
+        for name, func in CASES:
+            costs = []
+            for generator_class in GENERATORS:
+                id_generator_module.set_id_generator(generator_class())
+                costs.append(call_cost(func))
+            print(("{:>20}" + " {:>20.3f}" * len(costs)).format(
+                name, *costs))
+    finally:
+        id_generator_module.set_id_generator(default)
+
+
+if __name__ == '__main__':
+    main()
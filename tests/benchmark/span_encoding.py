@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark encoding span data into a file object.
+
+Writes batches of 1000 spans in the legacy trace JSON and Zipkin formats,
+with the encoders building dictionaries first and the streaming ones, and
+reports the time per batch and the peak memory allocated while encoding.
+Requires Python 3 for tracemalloc, and the Zipkin exporter.
+
+Usage: python tests/benchmark/span_encoding.py
+"""
+
+import timeit
+import tracemalloc
+
+from export_compression import make_span_datas
+from opencensus.common import http_client
+from opencensus.ext.zipkin.trace_exporter import ZipkinExporter
+from opencensus.trace import span_encoder
+
+CALLS = 20
+
+
+class NullFile(object):
+    """A file object discarding what is written."""
+
+    def write(self, data):
+        pass
+
+
+def write_zipkin_dicts(exporter, span_datas, file):
+    zipkin_spans = exporter.translate_to_zipkin(span_datas)
+    for chunk in http_client.iter_json_array(zipkin_spans):
+        file.write(chunk)
+
+
+def make_cases():
+    exporter = ZipkinExporter(service_name='benchmark')
+    streaming_exporter = ZipkinExporter(
+        service_name='benchmark', streaming=True)
+    legacy = span_encoder.LegacyJsonEncoder()
+    streaming_legacy = span_encoder.StreamingLegacyJsonEncoder()
+
+    return (
+        ('legacy dicts', legacy.write),
+        ('legacy streaming', streaming_legacy.write),
+        ('zipkin dicts',
+         lambda span_datas, file: write_zipkin_dicts(
+             exporter, span_datas, file)),
+        ('zipkin streaming', streaming_exporter.encoder.write),
+    )
+
+
+def peak_memory(func):
+    """Get the peak memory allocated by a call in kilobytes."""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024.0
+
+
+def main():
+    span_datas = make_span_datas()
+    file = NullFile()
+    print("{:>18} {:>12} {:>14}".format("encoder", "ms/1k", "peak KiB/1k"))
+    for name, write in make_cases():
+        def func():
+            write(span_datas, file)
+        cost = min(timeit.repeat(func, number=CALLS, repeat=3)) / CALLS
+        print("{:>18} {:>12.2f} {:>14.0f}".format(
+            name, cost * 1e3, peak_memory(func)))
+
+
+if __name__ == '__main__':
+    main()
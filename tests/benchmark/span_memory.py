@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the memory used by live spans.
+
+Creates many started spans and reports the bytes allocated per span, both
+for bare spans (e.g. DB spans) and for spans with a single attribute.
+Requires Python 3 for tracemalloc.
+
+Usage: python tests/benchmark/span_memory.py
+"""
+
+import gc
+import tracemalloc
+
+from opencensus.trace.span import CompactSpan, Span
+
+SPANS = 100000
+
+
+def bytes_per_span(span_class, add_attribute):
+    """Get the mean number of bytes allocated for a live span."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    spans = []
+    for ii in range(SPANS):
+        span = span_class('db_query', span_id='6e0c63257de34c92')
+        span.start()
+        if add_attribute:
+            span.add_attribute('db.statement', 'SELECT 1')
+        spans.append(span)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del spans
+    return float(after - before) / SPANS
+
+
+def main():
+    print("{:>14} {:>12} {:>12}".format(
+        "span", "bare (B)", "1 attr (B)"))
+    for span_class in (Span, CompactSpan):
+        print("{:>14} {:>12.0f} {:>12.0f}".format(
+            span_class.__name__,
+            bytes_per_span(span_class, False),
+            bytes_per_span(span_class, True)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark translating span data to Stackdriver spans.
+
+Reports the CPU time per span of emitting a batch of 1000 spans to a
+client discarding them, and of translating the spans through the legacy
+trace dictionaries. Requires the Stackdriver exporter.
+
+Usage: python tests/benchmark/stackdriver_export.py
+"""
+
+import time
+from collections import defaultdict
+
+from export_compression import make_span_datas
+from opencensus.common.monitored_resource import monitored_resource
+from opencensus.ext.stackdriver import trace_exporter
+from opencensus.trace import span_data
+
+REPEAT = 20
+
+
+class NullClient(object):
+    project = 'benchmark'
+
+    def batch_write_spans(self, name, spans):
+        pass
+
+
+def translate_legacy(exporter, span_datas):
+    trace_span_map = defaultdict(list)
+    for sd in span_datas:
+        trace_span_map[sd.context.trace_id].append(sd)
+    stackdriver_spans = []
+    for sds in trace_span_map.values():
+        trace = span_data.format_legacy_trace_json(sds)
+        stackdriver_spans.extend(exporter.translate_to_stackdriver(trace))
+    return stackdriver_spans
+
+
+def cpu_cost(func, spans):
+    """Get the CPU time of a call in microseconds per span."""
+    costs = []
+    for _ in range(3):
+        start = time.process_time()
+        for _ in range(REPEAT):
+            func()
+        costs.append(time.process_time() - start)
+    return min(costs) / REPEAT / spans * 1e6
+
+
+def main():
+    # Skip detecting the environment, which queries metadata servers
+    monitored_resource.get_instance = lambda: None
+
+    exporter = trace_exporter.StackdriverExporter(client=NullClient())
+    base_span_datas = make_span_datas()
+    print("{:>26} {:>12}".format("case", "CPU us/span"))
+    for traces in (1000, 10):
+        contexts = [sd.context for sd in base_span_datas[:traces]]
+        span_datas = [
+            sd._replace(context=contexts[ii % traces])
+            for ii, sd in enumerate(base_span_datas)
+        ]
+        for name, func in (
+                ('legacy', lambda: translate_legacy(exporter, span_datas)),
+                ('emit', lambda: exporter.emit(span_datas))):
+            print("{:>26} {:>12.2f}".format(
+                '{} ({} traces)'.format(name, traces),
+                cpu_cost(func, len(span_datas))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the cost of recording a measurement with a registered exporter.
+
+With eager export every record copies the whole view data, so the cost grows
+with the number of tag value tuples in the view. With deferred export the
+cost of a record doesn't depend on it.
+
+Usage: python tests/benchmark/stats_export.py
+"""
+
+import timeit
+
+from opencensus.stats import aggregation as aggregation_module
+from opencensus.stats import measure as measure_module
+from opencensus.stats import view as view_module
+from opencensus.stats.measure_to_view_map import MeasureToViewMap
+from opencensus.tags import tag_key as tag_key_module
+from opencensus.tags import tag_map as tag_map_module
+
+KEY = tag_key_module.TagKey("key")
+MEASURE = measure_module.MeasureFloat("latency", "latency", "ms")
+VIEW = view_module.View(
+    "latency_view", "latency", [KEY], MEASURE,
+    aggregation_module.DistributionAggregation([1, 5, 10, 50, 100, 500]))
+RECORDS = 200
+
+
+class NoopExporter(object):
+    def export(self, view_datas):
+        pass
+
+
+def record_cost(cardinality, deferred_export):
+    """Get the mean time of a record in microseconds."""
+    mtvm = MeasureToViewMap(deferred_export=True)
+    mtvm.exporters.append(NoopExporter())
+    mtvm.register_view(VIEW, None)
+    for ii in range(cardinality):
+        mtvm.record(tag_map_module.TagMap({KEY: str(ii)}), {MEASURE: 1.0},
+                    None)
+    mtvm.deferred_export = deferred_export
+    tag_map = tag_map_module.TagMap({KEY: "0"})
+    measurement = {MEASURE: 3.0}
+
+    def record():
+        mtvm.record(tag_map, measurement, None)
+
+    return min(timeit.repeat(record, number=RECORDS, repeat=3)) \
+        / RECORDS * 1e6
+
+
+def main():
+    print("{:>12} {:>14} {:>14}".format(
+        "cardinality", "eager (us)", "deferred (us)"))
+    for cardinality in (1, 10, 100, 1000):
+        print("{:>12} {:>14.2f} {:>14.2f}".format(
+            cardinality,
+            record_cost(cardinality, False),
+            record_cost(cardinality, True)))
+
+
+if __name__ == '__main__':
+    main()
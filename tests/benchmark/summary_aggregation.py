@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the summary aggregation recording latencies.
+
+Prints the cost of a sample, the number of sketch buckets in the window,
+the cost of a snapshot and the relative error of the reported percentiles.
+
+Usage: python tests/benchmark/summary_aggregation.py
+"""
+
+import random
+import timeit
+
+from opencensus.stats import aggregation as aggregation_module
+
+SAMPLES = 100000
+
+
+def main():
+    rng = random.Random(0)
+    values = [rng.lognormvariate(2, 1.5) for _ in range(SAMPLES)]
+    aggregation = aggregation_module.SummaryAggregation([50, 90, 99, 99.9])
+    agg_data = aggregation.new_aggregation_data()
+
+    def record():
+        for value in values:
+            agg_data.add_sample(value, None, None)
+
+    record_cost = timeit.timeit(record, number=1) / SAMPLES * 1e9
+    snapshot_cost = min(timeit.repeat(
+        agg_data.get_snapshot, number=10, repeat=3)) / 10 * 1e6
+    print("record: {:.0f} ns/sample".format(record_cost))
+    print("snapshot: {:.0f} us, {} buckets".format(
+        snapshot_cost, len(agg_data.get_window_sketch().bucket_counts)))
+
+    values.sort()
+    for vap in agg_data.get_snapshot().value_at_percentiles:
+        exact = values[int(vap.percentile / 100.0 * (SAMPLES - 1))]
+        print("p{:<5g} {:10.3f} {:10.3f} {:+.2%}".format(
+            vap.percentile, exact, vap.value, vap.value / exact - 1))
+
+
+if __name__ == '__main__':
+    main()
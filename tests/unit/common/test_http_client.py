@@ -0,0 +1,175 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from six.moves import BaseHTTPServer
+
+import gzip
+import io
+import json
+import os
+import threading
+import unittest
+import zlib
+
+import mock
+
+from opencensus.common import http_client
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append(
+            (self.client_address, dict(self.headers), body))
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.requests = []
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={'poll_interval': 0.01})
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.server_port)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_post_keeps_connection_alive(self):
+        client = http_client.HttpClient()
+        for _ in range(3):
+            response = client.post(self.url, data=b'data')
+            self.assertEqual(response.status_code, 200)
+        client.close()
+
+        self.assertEqual(len(self.server.requests), 3)
+        addresses = set(address for address, _, _ in self.server.requests)
+        self.assertEqual(len(addresses), 1)
+
+    def test_post_compress(self):
+        client = http_client.HttpClient(compression=http_client.GZIP)
+        client.post(self.url, data=u'{"key": "value"}',
+                    headers={'Content-Type': 'application/json'})
+        client.close()
+
+        _, headers, body = self.server.requests[0]
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        with gzip.GzipFile(fileobj=io.BytesIO(body)) as gzip_file:
+            self.assertEqual(gzip_file.read(), b'{"key": "value"}')
+
+    def test_post_deflate_chunks(self):
+        client = http_client.HttpClient(
+            compression=http_client.DEFLATE, compression_level=1)
+        client.post(self.url, data=iter([u'[1', u', 2]']))
+        client.close()
+
+        _, headers, body = self.server.requests[0]
+        self.assertEqual(headers['Content-Encoding'], 'deflate')
+        self.assertEqual(zlib.decompress(body), b'[1, 2]')
+
+    def test_post_chunks(self):
+        client = http_client.HttpClient()
+        with mock.patch('requests.Session.post') as post:
+            client.post('http://localhost', data=iter(['[1', ', 2]']))
+        self.assertEqual(post.call_args[1]['data'], '[1, 2]')
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            http_client.HttpClient(compression='br')
+
+    def test_post_timeout(self):
+        client = http_client.HttpClient(timeout=3.0)
+        with mock.patch('requests.Session.post') as post:
+            client.post('http://localhost', data='data')
+            post.assert_called_once_with(
+                url='http://localhost', data='data', headers=None,
+                timeout=3.0, proxies={})
+            client.post('http://localhost', data='data', timeout=1.0)
+            self.assertEqual(post.call_args[1]['timeout'], 1.0)
+
+    def test_post_proxies_override_environment(self):
+        client = http_client.HttpClient(proxies={'http': self.url})
+        env_proxy = 'http://127.0.0.1:1'
+        with mock.patch.dict(os.environ, {'HTTP_PROXY': env_proxy,
+                                          'http_proxy': env_proxy,
+                                          'NO_PROXY': '', 'no_proxy': ''}):
+            response = client.post('http://example.invalid/path',
+                                   data=b'data')
+        client.close()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_session(self):
+        client = http_client.HttpClient(
+            pool_size=3, proxies={'https': 'https://proxy'})
+        session = client.session
+
+        self.assertIs(client.session, session)
+        self.assertEqual(session.proxies, {'https': 'https://proxy'})
+        self.assertEqual(
+            session.get_adapter('https://host')._pool_maxsize, 3)
+
+        client.close()
+        self.assertIsNot(client.session, session)
+
+    def test_session_after_fork(self):
+        client = http_client.HttpClient()
+        session = client.session
+
+        with mock.patch('os.getpid', return_value=-1):
+            self.assertIsNot(client.session, session)
+
+    def test_get_client(self):
+        client = http_client.get_client(timeout=1.0, proxies={'http': 'p'})
+
+        self.assertIs(
+            http_client.get_client(timeout=1.0, proxies={'http': 'p'}),
+            client)
+        self.assertIsNot(http_client.get_client(timeout=1.0), client)
+        self.assertEqual(client.timeout, 1.0)
+        self.assertEqual(client.proxies, {'http': 'p'})
+
+    def test_compress(self):
+        data = b'span' * 100
+        compressed = http_client.compress(data)
+
+        self.assertLess(len(compressed), len(data))
+        with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as gzip_file:
+            self.assertEqual(gzip_file.read(), data)
+
+    def test_compress_chunks(self):
+        # Larger than the compression buffer
+        chunks = [u'span' * 100] * 200 + [b'end']
+        compressed = http_client.compress(chunks, http_client.DEFLATE, 9)
+
+        self.assertEqual(
+            zlib.decompress(compressed), b'span' * 20000 + b'end')
+
+    def test_iter_json_array(self):
+        for items in ([], [1], [{'a': [1, 2]}, 'b', None]):
+            self.assertEqual(
+                ''.join(http_client.iter_json_array(items)),
+                json.dumps(items))
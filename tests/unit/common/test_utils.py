@@ -25,7 +25,9 @@ try:
 except ImportError:
     from opencensus.common.backports import WeakMethod
 
+import datetime
 import gc
+import time
 import unittest
 import weakref
 
@@ -76,6 +78,55 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(expected_result, result)
         self.assertEqual(truncated_byte_count, 5)
 
+    def test_check_str_length_within_limit(self):
+        self.assertEqual(utils.check_str_length('test', 4), ('test', 0))
+        self.assertEqual(utils.check_str_length(u'测', 3), (u'测', 0))
+        self.assertEqual(utils.check_str_length(u'测', 2), ('', 1))
+
+    def test_time_ns(self):
+        before = int(time.time() * 1e9)
+        time_ns = utils.time_ns()
+        self.assertIsInstance(time_ns, int)
+        self.assertLessEqual(before // 1000000, time_ns // 1000000)
+
+    def test_monotonic_ns(self):
+        first = utils.monotonic_ns()
+        self.assertLessEqual(first, utils.monotonic_ns())
+
+    def test_monotonic_ns_perf_counter(self):
+        mock_time = mock.Mock(spec=['perf_counter', 'time'])
+        mock_time.perf_counter.return_value = 1.5
+        with mock.patch.object(utils, 'time', mock_time):
+            self.assertEqual(utils.monotonic_ns(), 1500000000)
+        self.assertFalse(mock_time.time.called)
+
+    def test_monotonic_ns_wall_clock(self):
+        mock_time = mock.Mock(spec=['time'])
+        mock_time.time.return_value = 2.5
+        with mock.patch.object(utils, 'time', mock_time):
+            self.assertEqual(utils.monotonic_ns(), 2500000000)
+
+    def test_ns_to_iso_str(self):
+        timestamp_ns = 1546300800123456789
+        self.assertEqual(
+            datetime.datetime(2019, 1, 1, 0, 0, 0, 123456),
+            utils.ns_to_datetime(timestamp_ns))
+        self.assertEqual('2019-01-01T00:00:00.123456Z',
+                         utils.ns_to_iso_str(timestamp_ns))
+        for timestamp_ns in (0, 1546300800000000000, 1546300800000999999,
+                             1546300800999999999):
+            self.assertEqual(
+                utils.to_iso_str(utils.ns_to_datetime(timestamp_ns)),
+                utils.ns_to_iso_str(timestamp_ns))
+
+    def test_timestamp_to_microseconds(self):
+        self.assertEqual(
+            1546300800123456,
+            utils.timestamp_to_microseconds('2019-01-01T00:00:00.123456Z'))
+        self.assertEqual(
+            1546300800123456.789,
+            utils.timestamp_to_microseconds(1546300800123456789))
+
     def test_uniq(self):
         self.assertEqual(
             list(utils.uniq(['a', 'b', 'a', 'c', 'c'])), ['a', 'b', 'c'])
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import unittest
 
 import mock
@@ -19,6 +20,61 @@ import mock
 from opencensus.common.transports import async_
 
 
+class Test_BoundedQueue(unittest.TestCase):
+
+    def test_constructor_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            async_._BoundedQueue(1, 'drop_everything')
+
+    def test_unbounded(self):
+        bounded_queue = async_._BoundedQueue(0)
+        for ii in range(10):
+            bounded_queue.put(ii)
+
+        self.assertEqual(bounded_queue.qsize(), 10)
+        self.assertEqual(bounded_queue.dropped, 0)
+
+    def test_drop_newest(self):
+        bounded_queue = async_._BoundedQueue(2, async_.DROP_NEWEST)
+        for ii in range(4):
+            bounded_queue.put(ii)
+        bounded_queue.put_nowait(async_._WORKER_TERMINATOR)
+
+        self.assertEqual(list(bounded_queue.queue),
+                         [0, 1, async_._WORKER_TERMINATOR])
+        self.assertEqual(bounded_queue.dropped, 2)
+        self.assertEqual(bounded_queue.unfinished_tasks, 3)
+
+    def test_drop_oldest(self):
+        bounded_queue = async_._BoundedQueue(2, async_.DROP_OLDEST)
+        bounded_queue.put(0)
+        bounded_queue.put_nowait(async_._WORKER_TERMINATOR)
+        for ii in range(1, 4):
+            bounded_queue.put(ii)
+
+        self.assertEqual(list(bounded_queue.queue),
+                         [async_._WORKER_TERMINATOR, 3])
+        self.assertEqual(bounded_queue.dropped, 3)
+        self.assertEqual(bounded_queue.unfinished_tasks, 2)
+
+    def test_block(self):
+        bounded_queue = async_._BoundedQueue(
+            1, async_.BLOCK, block_timeout=0)
+        bounded_queue.put(0)
+        bounded_queue.put(1)
+
+        self.assertEqual(list(bounded_queue.queue), [0])
+        self.assertEqual(bounded_queue.dropped, 1)
+
+        thread = threading.Thread(target=bounded_queue.put, args=(2, True, 5))
+        thread.start()
+        self.assertEqual(bounded_queue.get(), 0)
+        thread.join()
+
+        self.assertEqual(list(bounded_queue.queue), [2])
+        self.assertEqual(bounded_queue.dropped, 1)
+
+
 class Test_Worker(unittest.TestCase):
 
     def _start_worker(self, worker):
@@ -237,6 +293,90 @@ class Test_Worker(unittest.TestCase):
         # and the data was dropped.
         self.assertEqual(worker._queue.qsize(), 0)
 
+    def test__get_items_batch_full(self):
+        worker = async_._Worker(mock.Mock(), max_batch_size=2)
+        worker.enqueue([1])
+        worker.enqueue([2])
+        worker.enqueue([3])
+
+        # Returns as soon as the batch is full, without waiting.
+        self.assertEqual(worker._get_items(), [[1], [2]])
+
+    def test__get_items_wait_period(self):
+        worker = async_._Worker(mock.Mock(), wait_period=0.01)
+        worker.enqueue([1])
+
+        self.assertEqual(worker._get_items(), [[1]])
+
+    def test__get_items_stopping(self):
+        worker = async_._Worker(mock.Mock())
+        worker.enqueue([1])
+        worker._queue.put_nowait(async_._WORKER_TERMINATOR)
+
+        self.assertEqual(worker._get_items(),
+                         [[1], async_._WORKER_TERMINATOR])
+
+    @mock.patch('opencensus.common.transports.async_.logger')
+    def test__thread_main_counters(self, mock_logger):
+        exporter = mock.Mock()
+        exporter.emit.side_effect = [None, Exception]
+        worker = async_._Worker(exporter, max_batch_size=2, wait_period=0,
+                                max_queue_size=4)
+
+        for ii in range(6):
+            worker.enqueue([ii, ii])
+        worker._queue.put_nowait(async_._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        self.assertEqual(worker.emitted, 4)
+        self.assertEqual(worker.failed, 4)
+        self.assertEqual(worker.dropped, 2)
+        mock_logger.warning.assert_called_once_with(
+            '%s items were dropped because the export queue was full.', 2)
+
+    def test_load(self):
+        worker = async_._Worker(mock.Mock(), max_queue_size=4)
+        self.assertEqual(worker.load, 0)
+
+        worker.enqueue([1])
+        self.assertEqual(worker.load, 0.25)
+
+        worker = async_._Worker(mock.Mock(), max_queue_size=0)
+        worker.enqueue([1])
+        self.assertEqual(worker.load, 0)
+
+    def test_export_threads(self):
+        second_emit = threading.Event()
+
+        class Exporter(object):
+            def __init__(self):
+                self.exported = []
+
+            def emit(self, data):
+                self.exported.extend(data)
+                if len(self.exported) == 1:
+                    # Only returns if another batch is emitted concurrently
+                    second_emit.wait(5)
+                else:
+                    second_emit.set()
+
+        exporter = Exporter()
+        worker = async_._Worker(exporter, max_batch_size=1, wait_period=0,
+                                export_threads=2)
+        worker.start()
+        worker.enqueue([1])
+        worker.enqueue([2])
+        worker.flush()
+
+        self.assertTrue(second_emit.is_set())
+        self.assertEqual(sorted(exporter.exported), [1, 2])
+        self.assertTrue(worker.stop())
+        self.assertEqual(worker._emit_threads, [])
+
+    def test_export_threads_invalid(self):
+        with self.assertRaises(ValueError):
+            async_._Worker(mock.Mock(), export_threads=0)
+
     def test_flush(self):
         from six.moves import queue
 
@@ -0,0 +1,222 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import unittest
+
+import mock
+
+from opencensus.common.transports import asyncio_
+from opencensus.trace import execution_context
+
+
+class AsyncExporter(object):
+    def __init__(self, fail=False):
+        self.exported = []
+        self.fail = fail
+
+    async def emit(self, data):
+        if self.fail:
+            raise Exception('This exporter is broken')
+        self.exported.append(data)
+
+    async def export_metrics(self, metrics):
+        self.exported.append(metrics)
+
+
+class AsyncioTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        all_tasks = getattr(asyncio, 'all_tasks', None) or \
+            asyncio.Task.all_tasks
+        tasks = all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(
+            asyncio.wait_for(coro, 5))
+
+
+class TestAsyncioTransport(AsyncioTestCase):
+
+    def test_coroutine_emit(self):
+        exporter = AsyncExporter()
+        transport = asyncio_.AsyncioTransport(exporter)
+
+        async def test():
+            transport.export([1, 2])
+            transport.export([3])
+            await transport.flush_async()
+            await transport.close()
+
+        self.run_async(test())
+
+        self.assertIs(transport.loop, self.loop)
+        self.assertEqual(exporter.exported, [[1, 2, 3]])
+        self.assertEqual(transport.emitted, 3)
+        self.assertIsNone(transport._task)
+
+    def test_blocking_emit(self):
+        exporter = mock.Mock()
+        threads = []
+
+        def emit(data):
+            threads.append(threading.current_thread())
+            self.assertTrue(execution_context.is_exporter())
+
+        exporter.emit.side_effect = emit
+        transport = asyncio_.AsyncioTransport(exporter)
+
+        async def test():
+            transport.export([1])
+            await transport.flush_async()
+
+        self.run_async(test())
+
+        exporter.emit.assert_called_once_with([1])
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_batch_full(self):
+        exporter = AsyncExporter()
+        transport = asyncio_.AsyncioTransport(exporter, max_batch_size=2)
+
+        async def test():
+            transport.export([1])
+            transport.export([2])
+            transport.export([3])
+            while not exporter.exported:
+                await asyncio.sleep(0)
+
+        self.run_async(test())
+
+        self.assertEqual(exporter.exported, [[1, 2]])
+
+    def test_wait_period(self):
+        exporter = AsyncExporter()
+        transport = asyncio_.AsyncioTransport(exporter, wait_period=0.01)
+
+        async def test():
+            transport.export([1])
+            while not exporter.exported:
+                await asyncio.sleep(0.01)
+
+        self.run_async(test())
+
+        self.assertEqual(exporter.exported, [[1]])
+
+    def test_dropped(self):
+        exporter = AsyncExporter()
+        transport = asyncio_.AsyncioTransport(exporter, max_queue_size=1)
+
+        async def test():
+            for ii in range(3):
+                transport.export([ii])
+            await transport.flush_async()
+
+        self.run_async(test())
+
+        self.assertEqual(exporter.exported, [[0]])
+        self.assertEqual(transport.dropped, 2)
+
+    @mock.patch('opencensus.common.transports.asyncio_.logger')
+    def test_emit_failed(self, mock_logger):
+        exporter = AsyncExporter(fail=True)
+        transport = asyncio_.AsyncioTransport(exporter)
+
+        async def test():
+            transport.export([1, 2])
+            await transport.flush_async()
+
+        self.run_async(test())
+
+        self.assertEqual(transport.failed, 2)
+        self.assertEqual(transport.emitted, 0)
+        self.assertTrue(mock_logger.exception.called)
+
+    def test_export_without_loop(self):
+        transport = asyncio_.AsyncioTransport(AsyncExporter())
+        with self.assertRaises(RuntimeError):
+            transport.export([1])
+
+    def test_export_from_thread(self):
+        exporter = AsyncExporter()
+        transport = asyncio_.AsyncioTransport(exporter, loop=self.loop)
+
+        def export_and_flush():
+            transport.export([1])
+            transport.flush()
+
+        self.run_async(self.loop.run_in_executor(None, export_and_flush))
+
+        self.assertEqual(exporter.exported, [[1]])
+
+    def test_flush(self):
+        transport = asyncio_.AsyncioTransport(AsyncExporter())
+        # Nothing to flush yet
+        transport.flush()
+
+        async def test():
+            transport.export([1])
+            transport.flush()
+
+        with self.assertRaises(RuntimeError):
+            self.run_async(test())
+
+    def test_close_not_started(self):
+        transport = asyncio_.AsyncioTransport(AsyncExporter())
+        self.run_async(transport.flush_async())
+        self.run_async(transport.close())
+
+
+class TestGetExporterTask(AsyncioTestCase):
+
+    def test_export_metrics(self):
+        exporter = AsyncExporter()
+        producer = mock.Mock()
+        producer.get_metrics.return_value = [1, 2]
+
+        async def test():
+            task = asyncio_.get_exporter_task(
+                [producer, producer], exporter, interval=0.01)
+            while not exporter.exported:
+                await asyncio.sleep(0.01)
+            task.cancel()
+
+        self.run_async(test())
+
+        self.assertEqual(exporter.exported[0], [1, 2, 1, 2])
+
+    @mock.patch('opencensus.common.transports.asyncio_.logger')
+    def test_export_metrics_failed(self, mock_logger):
+        exporter = mock.Mock()
+        exporter.export_metrics.side_effect = Exception
+
+        async def test():
+            task = asyncio_.get_exporter_task([], exporter, interval=0.01)
+            while not mock_logger.exception.called:
+                await asyncio.sleep(0.01)
+            task.cancel()
+
+        self.run_async(test())
+
+        exporter.export_metrics.assert_called_with([])
@@ -133,6 +133,57 @@ class TestLongCumulative(unittest.TestCase):
         self.assertEqual(metric.time_series[0].points[0].value.value, 3)
         self.assertEqual(metric.time_series[1].points[0].value.value, 4)
 
+    def test_get_metric_delta(self):
+        long_cumulative = cumulative.LongCumulative(
+            Mock(), Mock(), Mock(), [Mock()], delta=True)
+        self.assertTrue(long_cumulative.delta)
+        self.assertIsNone(long_cumulative.get_metric(Mock()))
+
+        lv1 = [Mock()]
+        lv2 = [Mock()]
+        point1 = long_cumulative.get_or_create_time_series(lv1)
+        point2 = long_cumulative.get_or_create_time_series(lv2)
+        point1.add(2)
+        point2.add(4)
+        timestamp1 = Mock()
+        metric = long_cumulative.get_metric(timestamp1)
+        self.assertEqual(metric.descriptor, long_cumulative.descriptor)
+        self.assertEqual(
+            [2, 4], [ts.points[0].value.value for ts in metric.time_series])
+        self.assertIsInstance(metric.time_series[0].points[0].value,
+                              value_module.ValueLong)
+        self.assertEqual(metric.time_series[0].points[0].timestamp,
+                         timestamp1)
+
+        # Only the increased time series are reported, starting at the
+        # previous export
+        point1.add(3)
+        point2.add(0)
+        timestamp2 = Mock()
+        metric = long_cumulative.get_metric(timestamp2)
+        [ts] = metric.time_series
+        self.assertEqual(ts.label_values, tuple(lv1))
+        self.assertEqual(ts.start_timestamp, timestamp1)
+        self.assertEqual(ts.points[0].value.value, 3)
+
+        self.assertIsNone(long_cumulative.get_metric(Mock()))
+
+    def test_get_metric_delta_derived(self):
+        derived_cumulative = cumulative.DerivedDoubleCumulative(
+            Mock(), Mock(), Mock(), [], delta=True)
+        mock_fn = Mock()
+        mock_fn.return_value = 1.5
+        derived_cumulative.create_default_time_series(mock_fn)
+
+        [ts] = derived_cumulative.get_metric(Mock()).time_series
+        self.assertEqual(ts.points[0].value.value, 1.5)
+        self.assertIsInstance(ts.points[0].value, value_module.ValueDouble)
+
+        mock_fn.return_value = 2.5
+        [ts] = derived_cumulative.get_metric(Mock()).time_series
+        self.assertEqual(ts.points[0].value.value, 1.0)
+        self.assertIsNone(derived_cumulative.get_metric(Mock()))
+
 
 class TestDoubleCumulative(unittest.TestCase):
 
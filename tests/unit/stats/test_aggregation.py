@@ -119,3 +119,67 @@ class TestDistributionAggregation(unittest.TestCase):
 
         da2 = aggregation_module.DistributionAggregation([-2, -1])
         self.assertEqual(da2.new_aggregation_data().bounds, [])
+
+
+class TestExponentialDistributionAggregation(unittest.TestCase):
+    def test_new_aggregation_data_defaults(self):
+        exp_aggregation = \
+            aggregation_module.ExponentialDistributionAggregation()
+        agg_data = exp_aggregation.new_aggregation_data()
+        self.assertEqual(agg_data.max_buckets, 160)
+        self.assertEqual(agg_data.scale, 20)
+        self.assertEqual([], agg_data.bounds)
+
+    def test_new_aggregation_data_explicit(self):
+        exp_aggregation = \
+            aggregation_module.ExponentialDistributionAggregation(
+                max_buckets=10, max_scale=2)
+        self.assertEqual(exp_aggregation.max_buckets, 10)
+        self.assertEqual(exp_aggregation.max_scale, 2)
+        agg_data = exp_aggregation.new_aggregation_data()
+        self.assertEqual(agg_data.max_buckets, 10)
+        self.assertEqual(agg_data.scale, 2)
+
+    def test_init_bad_max_buckets(self):
+        with self.assertRaises(ValueError):
+            aggregation_module.ExponentialDistributionAggregation(
+                max_buckets=1)
+
+    def test_get_metric_type(self):
+        self.assertEqual(
+            aggregation_module.ExponentialDistributionAggregation
+            .get_metric_type(mock.Mock()),
+            aggregation_module.MetricDescriptorType.CUMULATIVE_DISTRIBUTION)
+
+
+class TestSummaryAggregation(unittest.TestCase):
+    def test_new_aggregation_data_defaults(self):
+        summary_aggregation = aggregation_module.SummaryAggregation()
+        self.assertEqual(summary_aggregation.percentiles, [50, 90, 99])
+        self.assertEqual(summary_aggregation.window, 60)
+        agg_data = summary_aggregation.new_aggregation_data()
+        self.assertEqual(agg_data.percentiles, [50, 90, 99])
+        self.assertEqual(agg_data.count_data, 0)
+
+    def test_new_aggregation_data_explicit(self):
+        summary_aggregation = aggregation_module.SummaryAggregation(
+            percentiles=(25, 75), window=None)
+        agg_data = summary_aggregation.new_aggregation_data()
+        self.assertEqual(agg_data.percentiles, [25, 75])
+
+    def test_init_bad_percentiles(self):
+        for percentiles in ([], [50, 50], [90, 50], [0, 50], [50, 101]):
+            with self.assertRaises(ValueError):
+                aggregation_module.SummaryAggregation(percentiles)
+
+    def test_init_bad_options(self):
+        with self.assertRaises(ValueError):
+            aggregation_module.SummaryAggregation(window_slices=0)
+        with self.assertRaises(ValueError):
+            aggregation_module.SummaryAggregation(relative_accuracy=2)
+
+    def test_get_metric_type(self):
+        self.assertEqual(
+            aggregation_module.SummaryAggregation.get_metric_type(
+                mock.Mock()),
+            aggregation_module.MetricDescriptorType.SUMMARY)
@@ -56,6 +56,24 @@ class TestSumAggregationData(unittest.TestCase):
 
         self.assertEqual(4, sum_aggregation_data.sum_data)
 
+    def test_add_samples(self):
+        sum_aggregation_data = aggregation_data_module.SumAggregationData(
+            value_type=value_module.ValueDouble, sum_data=1)
+        sum_aggregation_data.add_samples([1.5, 2, 3], None, None)
+        sum_aggregation_data.add_samples([], None, None)
+
+        self.assertEqual(7.5, sum_aggregation_data.sum_data)
+
+    def test_merge(self):
+        sum_aggregation_data = aggregation_data_module.SumAggregationData(
+            value_type=value_module.ValueLong, sum_data=1)
+        other = aggregation_data_module.SumAggregationData(
+            value_type=value_module.ValueLong, sum_data=3)
+        sum_aggregation_data.merge(other)
+
+        self.assertEqual(4, sum_aggregation_data.sum_data)
+        self.assertEqual(3, other.sum_data)
+
     def test_to_point_float(self):
         sum_data = 12.345
         timestamp = datetime(1970, 1, 1)
@@ -116,6 +134,15 @@ class TestLastValueAggregationData(unittest.TestCase):
         last_value_aggregation_data.add_sample(1, None, None)
         self.assertEqual(1, last_value_aggregation_data.value)
 
+    def test_add_samples(self):
+        last_value_aggregation_data =\
+            aggregation_data_module.LastValueAggregationData(
+                value_type=value_module.ValueLong, value=0)
+        last_value_aggregation_data.add_samples([3, 1, 2], None, None)
+        self.assertEqual(2, last_value_aggregation_data.value)
+        last_value_aggregation_data.add_samples([], None, None)
+        self.assertEqual(2, last_value_aggregation_data.value)
+
     def test_to_point_float(self):
         val = 1.2
         timestamp = datetime(1970, 1, 1)
@@ -141,6 +168,22 @@ class TestLastValueAggregationData(unittest.TestCase):
         self.assertEqual(converted_point.timestamp, timestamp)
 
 
+class TestCountAggregationData(unittest.TestCase):
+    def test_add_samples(self):
+        count_aggregation_data = \
+            aggregation_data_module.CountAggregationData(1)
+        count_aggregation_data.add_sample(5)
+        count_aggregation_data.add_samples([1, 2, 3])
+        self.assertEqual(5, count_aggregation_data.count_data)
+
+    def test_merge(self):
+        count_aggregation_data = \
+            aggregation_data_module.CountAggregationData(1)
+        count_aggregation_data.merge(
+            aggregation_data_module.CountAggregationData(3))
+        self.assertEqual(4, count_aggregation_data.count_data)
+
+
 def exemplars_equal(stats_ex, metrics_ex):
     """Compare a stats exemplar to a metrics exemplar."""
     assert isinstance(stats_ex, aggregation_data_module.Exemplar)
@@ -439,6 +482,109 @@ class TestDistributionAggregationData(unittest.TestCase):
         self.assertIsNot(0, dist_agg_data.count_data)
         self.assertEqual(3, dist_agg_data.exemplars[3].value)
 
+    def test_merge(self):
+        bounds = [1, 2, 4]
+        values_1 = [0.5, 1.5, 3]
+        values_2 = [2.5, 5, 7, 0.25]
+
+        def make_dist(values):
+            dist_agg_data = \
+                aggregation_data_module.DistributionAggregationData(
+                    0, 0, 0, None, bounds)
+            for value in values:
+                dist_agg_data.add_sample(value, None, None)
+            return dist_agg_data
+
+        expected = make_dist(values_1 + values_2)
+        dist_agg_data = make_dist(values_1)
+        dist_agg_data.merge(make_dist(values_2))
+
+        self.assertEqual(expected.count_data, dist_agg_data.count_data)
+        self.assertEqual(expected.counts_per_bucket,
+                         dist_agg_data.counts_per_bucket)
+        self.assertAlmostEqual(expected.mean_data, dist_agg_data.mean_data)
+        self.assertAlmostEqual(expected.sum_of_sqd_deviations,
+                               dist_agg_data.sum_of_sqd_deviations)
+
+        # Merging into or from an empty distribution is a copy or no-op.
+        empty = make_dist([])
+        empty.merge(dist_agg_data)
+        self.assertEqual(dist_agg_data.count_data, empty.count_data)
+        self.assertAlmostEqual(dist_agg_data.mean_data, empty.mean_data)
+        dist_agg_data.merge(make_dist([]))
+        self.assertEqual(expected.count_data, dist_agg_data.count_data)
+
+    def test_merge_exemplars(self):
+        timestamp = time.time()
+        attachments = {"One": "one"}
+        dist_agg_data = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, [1, 2])
+        other = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, [1, 2])
+        dist_agg_data.add_sample(0.5, timestamp, attachments)
+        other.add_sample(1.5, timestamp, attachments)
+        dist_agg_data.merge(other)
+
+        self.assertEqual(0.5, dist_agg_data.exemplars[0].value)
+        self.assertEqual(1.5, dist_agg_data.exemplars[1].value)
+        self.assertIsNone(dist_agg_data.exemplars[2])
+
+    def test_merge_different_bounds(self):
+        dist_agg_data = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, [1, 2])
+        other = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, [1, 3])
+        with self.assertRaises(ValueError):
+            dist_agg_data.merge(other)
+
+    def _check_add_samples(self):
+        bounds = [1, 2, 4, 8]
+        values = [0.5, 1, 1.5, 3, 9, 2, 7.5, 100, 0]
+        expected = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, bounds)
+        for value in values:
+            expected.add_sample(value, None, None)
+
+        dist_agg_data = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, bounds)
+        dist_agg_data.add_samples(values[:4])
+        dist_agg_data.add_samples(values[4:])
+        dist_agg_data.add_samples([])
+
+        self.assertEqual(expected.count_data, dist_agg_data.count_data)
+        self.assertEqual(expected.counts_per_bucket,
+                         dist_agg_data.counts_per_bucket)
+        self.assertAlmostEqual(expected.mean_data, dist_agg_data.mean_data)
+        self.assertAlmostEqual(expected.sum_of_sqd_deviations,
+                               dist_agg_data.sum_of_sqd_deviations)
+
+        no_bounds = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, None)
+        no_bounds.add_samples(values)
+        self.assertEqual([len(values)], no_bounds.counts_per_bucket)
+
+    def test_add_samples(self):
+        if aggregation_data_module.numpy is None:  # pragma: NO COVER
+            self.skipTest("numpy is not installed")
+        self._check_add_samples()
+
+    def test_add_samples_no_numpy(self):
+        with mock.patch.object(aggregation_data_module, 'numpy', None):
+            self._check_add_samples()
+
+    def test_add_samples_attachments(self):
+        timestamp = time.time()
+        attachments = {"One": "one"}
+        dist_agg_data = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, [1, 2])
+        dist_agg_data.add_samples([0.25, 0.5, 3], timestamp, attachments)
+
+        self.assertEqual(0.5, dist_agg_data.exemplars[0].value)
+        self.assertIsNone(dist_agg_data.exemplars[1])
+        self.assertEqual(3, dist_agg_data.exemplars[2].value)
+        self.assertEqual(timestamp, dist_agg_data.exemplars[2].timestamp)
+        self.assertEqual(attachments, dist_agg_data.exemplars[2].attachments)
+
     def test_increment_bucket_count(self):
         mean_data = mock.Mock()
         count_data = mock.Mock()
@@ -535,3 +681,379 @@ class TestDistributionAggregationData(unittest.TestCase):
                          80850.0)
         self.assertIsNone(converted_point.value.buckets)
         self.assertIsNone(converted_point.value.bucket_options._type)
+
+
+class TestExponentialBuckets(unittest.TestCase):
+    def test_get_exponential_bucket_index(self):
+        get_index = aggregation_data_module.get_exponential_bucket_index
+        self.assertEqual(get_index(1, 0), 0)
+        self.assertEqual(get_index(1.5, 0), 0)
+        self.assertEqual(get_index(2, 0), 1)
+        self.assertEqual(get_index(0.75, 0), -1)
+        self.assertEqual(get_index(1024, -2), 2)
+        self.assertEqual(get_index(1023, -2), 2)
+        self.assertEqual(get_index(0.5, -2), -1)
+        self.assertEqual(get_index(2 ** 0.5, 1), 1)
+        self.assertEqual(get_index(1.4, 1), 0)
+        self.assertEqual(get_index(3, 1), 3)
+        self.assertEqual(get_index(1e-320, 0), -1064)
+
+    def test_get_exponential_bucket_bound(self):
+        get_bound = aggregation_data_module.get_exponential_bucket_bound
+        self.assertEqual(get_bound(0, 0), 1)
+        self.assertEqual(get_bound(-1, 0), 0.5)
+        self.assertEqual(get_bound(2, -2), 256)
+        self.assertEqual(get_bound(-1, -2), 1.0 / 16)
+        self.assertAlmostEqual(get_bound(1, 1), 2 ** 0.5)
+        self.assertEqual(get_bound(2, 1), 2)
+        self.assertEqual(get_bound(-3, 1), 2 ** -1.5)
+
+    def test_index_bound_round_trip(self):
+        get_index = aggregation_data_module.get_exponential_bucket_index
+        get_bound = aggregation_data_module.get_exponential_bucket_bound
+        for scale in range(-5, 21):
+            for ii in range(200):
+                value = 1.37 ** (ii - 100)
+                index = get_index(value, scale)
+                self.assertLessEqual(get_bound(index, scale), value)
+                self.assertGreater(get_bound(index + 1, scale), value)
+            if scale >= 0:
+                for exponent in range(-20, 20):
+                    index = get_index(2.0 ** exponent, scale)
+                    self.assertEqual(get_bound(index, scale),
+                                     2.0 ** exponent)
+
+    def test_bounds_exact(self):
+        get_index = aggregation_data_module.get_exponential_bucket_index
+        get_bound = aggregation_data_module.get_exponential_bucket_bound
+        for scale in range(1, 11):
+            for index in range(-(1 << scale), 1 << (scale + 1)):
+                self.assertEqual(
+                    get_index(get_bound(index, scale), scale), index)
+
+
+class TestExponentialDistributionAggregationData(unittest.TestCase):
+    @staticmethod
+    def _make_one(max_buckets=160, max_scale=20):
+        return aggregation_data_module.ExponentialDistributionAggregationData(
+            max_buckets, max_scale)
+
+    def test_constructor(self):
+        agg_data = self._make_one(max_buckets=10, max_scale=3)
+        self.assertEqual(agg_data.max_buckets, 10)
+        self.assertEqual(agg_data.scale, 3)
+        self.assertEqual(agg_data.count_data, 0)
+        self.assertEqual(agg_data.zero_count, 0)
+        self.assertEqual(agg_data.bucket_counts, {})
+        self.assertEqual(agg_data.bounds, [])
+        self.assertEqual(agg_data.counts_per_bucket, [0])
+        self.assertIsNone(agg_data.exemplars)
+
+    def test_add_sample(self):
+        agg_data = self._make_one(max_scale=0)
+        for value in (1, 1.5, 2, 5, 0, -3, float('nan')):
+            agg_data.add_sample(value, None, None)
+        self.assertEqual(agg_data.count_data, 7)
+        self.assertEqual(agg_data.scale, 0)
+        self.assertEqual(agg_data.zero_count, 3)
+        self.assertEqual(agg_data.bucket_counts, {0: 2, 1: 1, 2: 1})
+        self.assertEqual(agg_data.bounds, [1, 2, 4])
+        self.assertEqual(agg_data.counts_per_bucket, [3, 2, 1, 1])
+
+    def test_add_sample_moments(self):
+        agg_data = self._make_one()
+        for value in (1, 2, 3, 4):
+            agg_data.add_sample(value, None, None)
+        self.assertEqual(agg_data.count_data, 4)
+        self.assertEqual(agg_data.mean_data, 2.5)
+        self.assertEqual(agg_data.sum_of_sqd_deviations, 5)
+        self.assertEqual(agg_data.sum, 10)
+
+    def test_add_sample_infinity(self):
+        agg_data = self._make_one(max_scale=0)
+        agg_data.add_sample(float('inf'), None, None)
+        self.assertEqual(agg_data.bucket_counts, {1023: 1})
+
+    def test_downscale(self):
+        agg_data = self._make_one(max_buckets=4, max_scale=2)
+        agg_data.add_sample(1, None, None)
+        agg_data.add_sample(2 ** 0.8, None, None)
+        self.assertEqual(agg_data.scale, 2)
+        self.assertEqual(agg_data.bucket_counts, {0: 1, 3: 1})
+
+        # Needs buckets 0 to 4 at scale 2, 0 to 2 at scale 1
+        agg_data.add_sample(2, None, None)
+        self.assertEqual(agg_data.scale, 1)
+        self.assertEqual(agg_data.bucket_counts, {0: 1, 1: 1, 2: 1})
+
+        # Needs buckets -19 to 2 at scale 1, -3 to 0 at scale -2
+        agg_data.add_sample(2 ** -9.5, None, None)
+        self.assertEqual(agg_data.scale, -2)
+        self.assertEqual(agg_data.bucket_counts, {-3: 1, 0: 3})
+        self.assertEqual(agg_data.bounds, [2 ** -12, 2 ** -8, 2 ** -4, 1])
+        self.assertEqual(agg_data.counts_per_bucket, [0, 1, 0, 0, 3])
+
+    def test_bounded_buckets(self):
+        agg_data = self._make_one(max_buckets=20)
+        for exponent in range(-1074, 1024):
+            agg_data.add_sample(2.0 ** exponent, None, None)
+        self.assertLessEqual(len(agg_data.bounds), 20)
+        self.assertEqual(sum(agg_data.counts_per_bucket), 1074 + 1024)
+
+    def test_counts_match_bounds(self):
+        import bisect
+        import random
+
+        rng = random.Random(0)
+        values = [rng.lognormvariate(0, 4) for _ in range(1000)]
+        agg_data = self._make_one(max_buckets=50)
+        for value in values:
+            agg_data.add_sample(value, None, None)
+
+        expected = [0] * len(agg_data.counts_per_bucket)
+        for value in values:
+            expected[bisect.bisect_right(agg_data.bounds, value)] += 1
+        self.assertEqual(agg_data.counts_per_bucket, expected)
+        self.assertLessEqual(len(agg_data.bounds), 50)
+
+    def test_add_samples(self):
+        values = [0.1, 1, 10, 100, 1000, -1]
+        agg_data = self._make_one(max_buckets=8)
+        agg_data.add_samples(values)
+        expected = self._make_one(max_buckets=8)
+        for value in values:
+            expected.add_sample(value, None, None)
+
+        self.assertEqual(agg_data.count_data, expected.count_data)
+        self.assertAlmostEqual(agg_data.mean_data, expected.mean_data)
+        self.assertAlmostEqual(agg_data.sum_of_sqd_deviations,
+                               expected.sum_of_sqd_deviations)
+        self.assertEqual(agg_data.scale, expected.scale)
+        self.assertEqual(agg_data.bucket_counts, expected.bucket_counts)
+
+        agg_data.add_samples([])
+        self.assertEqual(agg_data.count_data, expected.count_data)
+
+    def test_merge(self):
+        import random
+
+        rng = random.Random(0)
+        values = [rng.lognormvariate(0, 2) for _ in range(200)] + [0]
+        expected = self._make_one(max_buckets=16)
+        for value in values:
+            expected.add_sample(value, None, None)
+
+        agg_data = self._make_one(max_buckets=16)
+        other = self._make_one(max_buckets=16)
+        for value in values[:100]:
+            agg_data.add_sample(value, None, None)
+        for value in values[100:]:
+            other.add_sample(value, None, None)
+        agg_data.merge(other)
+
+        self.assertEqual(agg_data.count_data, expected.count_data)
+        self.assertAlmostEqual(agg_data.mean_data, expected.mean_data)
+        self.assertAlmostEqual(agg_data.sum_of_sqd_deviations,
+                               expected.sum_of_sqd_deviations)
+        self.assertEqual(agg_data.zero_count, expected.zero_count)
+        self.assertEqual(agg_data.scale, expected.scale)
+        self.assertEqual(agg_data.bucket_counts, expected.bucket_counts)
+
+    def test_merge_scales(self):
+        agg_data = self._make_one(max_buckets=4, max_scale=3)
+        agg_data.add_sample(1.1, None, None)
+        other = self._make_one(max_buckets=4, max_scale=0)
+        other.add_sample(1, None, None)
+        other.add_sample(4, None, None)
+
+        agg_data.merge(other)
+
+        self.assertEqual(agg_data.scale, 0)
+        self.assertEqual(agg_data.bucket_counts, {0: 2, 2: 1})
+
+        # Buckets 0 to 6 at scale 0 don't fit
+        other = self._make_one(max_buckets=4, max_scale=3)
+        other.add_sample(64, None, None)
+        agg_data.merge(other)
+
+        self.assertEqual(agg_data.scale, -1)
+        self.assertEqual(agg_data.bucket_counts, {0: 2, 1: 1, 3: 1})
+        self.assertEqual(agg_data.count_data, 4)
+
+    def test_merge_into_empty(self):
+        agg_data = self._make_one(max_scale=5)
+        other = self._make_one(max_scale=3)
+        other.add_sample(3, None, None)
+        agg_data.merge(other)
+        self.assertEqual(agg_data.scale, 3)
+        self.assertEqual(agg_data.bucket_counts, other.bucket_counts)
+        self.assertEqual(agg_data.count_data, 1)
+
+        agg_data.merge(self._make_one())
+        self.assertEqual(agg_data.count_data, 1)
+
+    def test_merge_explicit(self):
+        agg_data = self._make_one()
+        explicit = aggregation_data_module.DistributionAggregationData(
+            0, 0, 0, None, [1, 2])
+        with self.assertRaises(ValueError):
+            agg_data.merge(explicit)
+        with self.assertRaises(ValueError):
+            explicit.merge(agg_data)
+
+    def test_to_point(self):
+        timestamp = datetime(1970, 1, 1)
+        agg_data = self._make_one(max_scale=0)
+        for value in (0, 1, 3, 3):
+            agg_data.add_sample(value, None, None)
+
+        converted_point = agg_data.to_point(timestamp)
+
+        self.assertIsInstance(converted_point.value,
+                              value_module.ValueDistribution)
+        self.assertEqual(converted_point.value.count, 4)
+        self.assertEqual(converted_point.value.sum, 7)
+        self.assertEqual(converted_point.value.bucket_options.type_.bounds,
+                         [1, 2])
+        self.assertEqual([bb.count for bb in converted_point.value.buckets],
+                         [1, 1, 2])
+
+    def test_to_point_no_histogram(self):
+        agg_data = self._make_one()
+        agg_data.add_sample(0, None, None)
+        converted_point = agg_data.to_point(datetime(1970, 1, 1))
+        self.assertEqual(converted_point.value.count, 1)
+        self.assertIsNone(converted_point.value.buckets)
+
+
+class TestSummaryAggregationData(unittest.TestCase):
+    @staticmethod
+    def _make_one(percentiles=(50, 99), window=None, window_slices=1):
+        return aggregation_data_module.SummaryAggregationData(
+            list(percentiles), 0.01, 2048, window, window_slices)
+
+    def test_constructor(self):
+        agg_data = self._make_one()
+        self.assertEqual(agg_data.percentiles, [50, 99])
+        self.assertEqual(agg_data.count_data, 0)
+        self.assertEqual(agg_data.sum_data, 0)
+        self.assertEqual(repr(agg_data), 'SummaryAggregationData(0)')
+
+    def test_add_sample(self):
+        agg_data = self._make_one()
+        for value in range(1, 101):
+            agg_data.add_sample(value, None, None)
+        agg_data.add_sample(-5, None, None)
+
+        self.assertEqual(agg_data.count_data, 101)
+        self.assertEqual(agg_data.sum_data, 5050)
+        snapshot = agg_data.get_snapshot()
+        self.assertEqual(snapshot.count, 101)
+        self.assertEqual(snapshot.sum_data, 5050)
+        p50, p99 = snapshot.value_at_percentiles
+        self.assertEqual(p50.percentile, 50)
+        self.assertAlmostEqual(p50.value, 50, delta=0.5)
+        self.assertEqual(p99.percentile, 99)
+        self.assertAlmostEqual(p99.value, 99, delta=1)
+
+    def test_add_samples(self):
+        agg_data = self._make_one()
+        agg_data.add_samples([1, 2, 3])
+        agg_data.add_samples([])
+        self.assertEqual(agg_data.count_data, 3)
+        self.assertEqual(agg_data.sum_data, 6)
+        self.assertEqual(agg_data.get_window_sketch().count, 3)
+
+    @mock.patch('opencensus.common.utils.monotonic_ns')
+    def test_window(self, mock_monotonic_ns):
+        agg_data = self._make_one(window=60, window_slices=6)
+        mock_monotonic_ns.return_value = 5 * 10 ** 9
+        agg_data.add_sample(1000, None, None)
+        mock_monotonic_ns.return_value = 15 * 10 ** 9
+        agg_data.add_samples([1, 1], None, None)
+        mock_monotonic_ns.return_value = 18 * 10 ** 9
+        agg_data.add_sample(1, None, None)
+
+        snapshot = agg_data.get_snapshot()
+        self.assertEqual(snapshot.count, 4)
+        self.assertEqual(snapshot.sum_data, 1003)
+        self.assertAlmostEqual(agg_data.get_window_sketch().get_quantile(1),
+                               1000, delta=10)
+
+        # The slice started at 0s leaves the window at 60s
+        mock_monotonic_ns.return_value = 60 * 10 ** 9
+        snapshot = agg_data.get_snapshot()
+        self.assertEqual(snapshot.count, 3)
+        self.assertEqual(snapshot.sum_data, 3)
+        self.assertAlmostEqual(agg_data.get_window_sketch().get_quantile(1),
+                               1, delta=0.01)
+
+        mock_monotonic_ns.return_value = 75 * 10 ** 9
+        agg_data.add_sample(2, None, None)
+        snapshot = agg_data.get_snapshot()
+        self.assertEqual(snapshot.count, 1)
+
+        # The cumulative count and sum keep every value
+        self.assertEqual(agg_data.count_data, 5)
+        self.assertEqual(agg_data.sum_data, 1005)
+
+        mock_monotonic_ns.return_value = 200 * 10 ** 9
+        snapshot = agg_data.get_snapshot()
+        self.assertEqual(snapshot.count, 0)
+        self.assertEqual(snapshot.value_at_percentiles, [])
+
+    @mock.patch('opencensus.common.utils.monotonic_ns')
+    def test_merge(self, mock_monotonic_ns):
+        agg_data = self._make_one(window=60, window_slices=6)
+        other = self._make_one(window=60, window_slices=6)
+        mock_monotonic_ns.return_value = 5 * 10 ** 9
+        agg_data.add_sample(1, None, None)
+        other.add_sample(2, None, None)
+        mock_monotonic_ns.return_value = 15 * 10 ** 9
+        other.add_sample(3, None, None)
+
+        agg_data.merge(other)
+
+        self.assertEqual(agg_data.count_data, 3)
+        self.assertEqual(agg_data.sum_data, 6)
+        self.assertEqual(agg_data.get_snapshot().count, 3)
+        # The sketches of other are copied
+        self.assertEqual(other.get_snapshot().count, 2)
+
+        mock_monotonic_ns.return_value = 60 * 10 ** 9
+        self.assertEqual(agg_data.get_snapshot().count, 1)
+
+        mock_monotonic_ns.return_value = 61 * 10 ** 9
+        agg_data.add_sample(4, None, None)
+        self.assertEqual(agg_data.get_snapshot().count, 2)
+
+    def test_merge_different_percentiles(self):
+        agg_data = self._make_one(percentiles=[50])
+        with self.assertRaises(ValueError):
+            agg_data.merge(self._make_one(percentiles=[99]))
+
+    def test_to_point(self):
+        timestamp = datetime(1970, 1, 1)
+        agg_data = self._make_one()
+        agg_data.add_samples([1, 2, 3, 4])
+
+        converted_point = agg_data.to_point(timestamp)
+
+        self.assertIsInstance(converted_point, point.Point)
+        self.assertEqual(converted_point.timestamp, timestamp)
+        self.assertIsInstance(converted_point.value,
+                              value_module.ValueSummary)
+        summary = converted_point.value.value
+        self.assertEqual(summary.count, 4)
+        self.assertEqual(summary.sum_data, 10)
+        self.assertEqual(summary.snapshot.count, 4)
+        self.assertEqual(
+            [vap.percentile
+             for vap in summary.snapshot.value_at_percentiles],
+            [50, 99])
+
+    def test_to_point_empty(self):
+        converted_point = self._make_one().to_point(datetime(1970, 1, 1))
+        summary = converted_point.value.value
+        self.assertEqual(summary.count, 0)
+        self.assertEqual(summary.snapshot.value_at_percentiles, [])
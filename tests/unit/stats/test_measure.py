@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import unittest
 
+import mock
+
 from opencensus.stats import measure as measure_module
+from opencensus.tags import TagMap
 
 
 class TestBaseMeasure(unittest.TestCase):
@@ -39,6 +43,29 @@ class TestBaseMeasure(unittest.TestCase):
         self.assertEqual("testMeasure", measure.description)
         self.assertEqual("testUnit", measure.unit)
 
+    def test_bind(self):
+        measure = measure_module.BaseMeasure("testName", "testMeasure")
+        tags = mock.Mock()
+        with mock.patch('opencensus.stats.stats.stats') as mock_stats:
+            bound = measure.bind(tags)
+
+        self.assertIs(mock_stats.stats_recorder.bind.return_value, bound)
+        mock_stats.stats_recorder.bind.assert_called_once_with(measure, tags)
+
+    def test_bind_other_thread(self):
+        from opencensus.stats.stats import stats
+
+        measure = measure_module.BaseMeasure("testName", "testMeasure")
+        bound_measures = []
+        thread = threading.Thread(
+            target=lambda: bound_measures.append(measure.bind(TagMap())))
+        thread.start()
+        thread.join()
+
+        [bound] = bound_measures
+        self.assertIs(stats.view_manager.measure_to_view_map,
+                      bound._measure_to_view_map)
+
 
 class TestMeasureInt(unittest.TestCase):
     def test_constructor_defaults(self):
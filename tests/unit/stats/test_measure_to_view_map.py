@@ -17,10 +17,16 @@ import unittest
 import mock
 
 from opencensus.stats import measure_to_view_map as measure_to_view_map_module
-from opencensus.stats.aggregation import CountAggregation
+from opencensus.stats import metric_utils
+from opencensus.stats.aggregation import (
+    CountAggregation,
+    ExponentialDistributionAggregation,
+    LastValueAggregation,
+    SumAggregation,
+)
 from opencensus.stats.measure import BaseMeasure, MeasureInt
 from opencensus.stats.view import View
-from opencensus.stats.view_data import ViewData
+from opencensus.stats.view_data import ShardedViewData, ViewData
 from opencensus.tags import tag_key as tag_key_module
 
 METHOD_KEY = tag_key_module.TagKey("method")
@@ -194,6 +200,179 @@ class TestMeasureToViewMap(unittest.TestCase):
         self.assertIsNotNone(measure_to_view_map.
                              _measure_to_view_data_list_map[view.measure.name])
 
+    def test_register_view_sharded(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            sharded=True)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, mock.Mock())
+        last_value_view = View(
+            "last_request_count", "last request count", [METHOD_KEY],
+            REQUEST_COUNT_MEASURE, LastValueAggregation())
+        measure_to_view_map.register_view(last_value_view, mock.Mock())
+
+        count_vd, last_value_vd = \
+            measure_to_view_map._measure_to_view_data_list_map[
+                REQUEST_COUNT_MEASURE.name]
+        self.assertIsInstance(count_vd, ShardedViewData)
+        self.assertIs(type(last_value_vd), ViewData)
+
+    def test_set_options(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        measure_to_view_map.sharded = True
+        measure_to_view_map.delta = True
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, mock.Mock())
+
+        self.assertTrue(measure_to_view_map.sharded)
+        self.assertTrue(measure_to_view_map.delta)
+        [view_data] = measure_to_view_map._measure_to_view_data_list_map[
+            REQUEST_COUNT_MEASURE.name]
+        self.assertIsInstance(view_data, ShardedViewData)
+
+        # The registered view datas can't change
+        with self.assertRaises(ValueError):
+            measure_to_view_map.sharded = False
+        with self.assertRaises(ValueError):
+            measure_to_view_map.delta = False
+
+    def test_register_view_series_limits(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            sharded=True)
+        limited_view = View(
+            "limited_request_count", "limited request count", [METHOD_KEY],
+            REQUEST_COUNT_MEASURE, CountAggregation(), max_series=1)
+        measure_to_view_map.register_view(limited_view, mock.Mock())
+
+        [view_data] = measure_to_view_map._measure_to_view_data_list_map[
+            REQUEST_COUNT_MEASURE.name]
+        self.assertIs(type(view_data), ViewData)
+        self.assertEqual(1, view_data._max_series)
+
+    def test_get_metrics_series_limits(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        limited_view = View(
+            "limited_request_count", "limited request count", [METHOD_KEY],
+            REQUEST_COUNT_MEASURE, CountAggregation(), max_series=1)
+        measure_to_view_map.register_view(limited_view, mock.Mock())
+        for method in ("GET", "POST", "PUT"):
+            tag_map = mock.Mock()
+            tag_map.map = {METHOD_KEY: method}
+            measure_to_view_map.record(
+                tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+                timestamp=mock.Mock())
+
+        view_metric, overflow_metric, evicted_metric = \
+            measure_to_view_map.get_metrics(mock.Mock())
+        self.assertEqual(2, len(view_metric.time_series))
+        self.assertEqual(metric_utils.OVERFLOW_COUNT_METRIC_NAME,
+                         overflow_metric.descriptor.name)
+        [time_series] = overflow_metric.time_series
+        self.assertEqual("limited_request_count",
+                         time_series.label_values[0].value)
+        self.assertEqual(2, time_series.points[0].value.value)
+        self.assertEqual(metric_utils.EVICTED_SERIES_METRIC_NAME,
+                         evicted_metric.descriptor.name)
+        [time_series] = evicted_metric.time_series
+        self.assertEqual(0, time_series.points[0].value.value)
+
+    def test_get_metrics_delta(self):
+        for sharded in (False, True):
+            measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+                sharded=sharded, delta=True)
+            self.assertTrue(measure_to_view_map.delta)
+            measure_to_view_map.register_view(REQUEST_COUNT_VIEW, "start")
+
+            def record(method):
+                tag_map = mock.Mock()
+                tag_map.map = {METHOD_KEY: method}
+                measure_to_view_map.record(
+                    tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+                    timestamp=mock.Mock())
+
+            record("GET")
+            record("GET")
+            record("POST")
+            [metric] = measure_to_view_map.get_metrics(mock.Mock())
+            counts = {ts.label_values[0].value: ts.points[0].value.value
+                      for ts in metric.time_series}
+            self.assertEqual({"GET": 2, "POST": 1}, counts)
+            self.assertEqual("start", metric.time_series[0].start_timestamp)
+
+            # The idle POST series is not exported
+            record("GET")
+            [metric] = measure_to_view_map.get_metrics(mock.Mock())
+            [time_series] = metric.time_series
+            self.assertEqual("GET", time_series.label_values[0].value)
+            self.assertEqual(1, time_series.points[0].value.value)
+            self.assertNotEqual("start", time_series.start_timestamp)
+
+            metrics = measure_to_view_map.get_metrics(mock.Mock())
+            self.assertEqual([], list(metrics))
+
+    def test_get_metrics_delta_series_limits(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            delta=True)
+        limited_view = View(
+            "limited_request_count", "limited request count", [METHOD_KEY],
+            REQUEST_COUNT_MEASURE, CountAggregation(), max_series=1)
+        measure_to_view_map.register_view(limited_view, mock.Mock())
+        for method in ("GET", "POST"):
+            tag_map = mock.Mock()
+            tag_map.map = {METHOD_KEY: method}
+            measure_to_view_map.record(
+                tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+                timestamp=mock.Mock())
+
+        _, overflow_metric, _ = measure_to_view_map.get_metrics(mock.Mock())
+        [time_series] = overflow_metric.time_series
+        self.assertEqual(1, time_series.points[0].value.value)
+
+        # Without series, only the series limit metrics are exported
+        overflow_metric, _ = measure_to_view_map.get_metrics(mock.Mock())
+        [time_series] = overflow_metric.time_series
+        self.assertEqual(0, time_series.points[0].value.value)
+
+    def test_record_sharded(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            sharded=True)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, "start")
+        tag_map = mock.Mock()
+        tag_map.map = {METHOD_KEY: "GET"}
+        for _ in range(3):
+            measure_to_view_map.record(
+                tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+                timestamp=mock.Mock())
+
+        view_data = measure_to_view_map.get_view(REQUEST_COUNT_VIEW_NAME,
+                                                 mock.Mock())
+        self.assertIs(type(view_data), ViewData)
+        self.assertEqual(
+            3, view_data.tag_value_aggregation_data_map[("GET",)].count_data)
+
+        metrics = list(measure_to_view_map.get_metrics(mock.Mock()))
+        self.assertEqual(1, len(metrics))
+        [time_series] = metrics[0].time_series
+        self.assertEqual(3, time_series.points[0].value.value)
+
+    def test_record_sharded_exponential(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            sharded=True)
+        view = View(
+            "latency", "latency", [METHOD_KEY], REQUEST_COUNT_MEASURE,
+            ExponentialDistributionAggregation(max_buckets=4))
+        measure_to_view_map.register_view(view, "start")
+        tag_map = mock.Mock()
+        tag_map.map = {METHOD_KEY: "GET"}
+        for value in (1, 10, 100, 1000):
+            measure_to_view_map.record(
+                tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: value},
+                timestamp=mock.Mock())
+
+        view_data = measure_to_view_map.get_view("latency", mock.Mock())
+        agg_data = view_data.tag_value_aggregation_data_map[("GET",)]
+        self.assertEqual(4, agg_data.count_data)
+        self.assertEqual(-2, agg_data.scale)
+        self.assertEqual([1, 16, 256], agg_data.bounds)
+        self.assertEqual([0, 2, 1, 1], agg_data.counts_per_bucket)
+
     def test_register_view_with_exporter(self):
         exporter = mock.Mock()
         name = "testView"
@@ -390,6 +569,92 @@ class TestMeasureToViewMap(unittest.TestCase):
         measure_to_view_map.export(view_data)
         self.assertTrue(True)
 
+    def test_record_many(self):
+        exporter = mock.Mock()
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        measure_to_view_map.exporters.append(exporter)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, "start")
+        get_tags = mock.Mock()
+        get_tags.map = {METHOD_KEY: "GET"}
+        post_tags = mock.Mock()
+        post_tags.map = {METHOD_KEY: "POST"}
+        unregistered_measure = MeasureInt("unregistered", "", "1")
+
+        measure_to_view_map.record_many(
+            [(get_tags, {REQUEST_COUNT_MEASURE: 1}),
+             (post_tags, {REQUEST_COUNT_MEASURE: 1,
+                          unregistered_measure: 1}),
+             (get_tags, {REQUEST_COUNT_MEASURE: 1})],
+            timestamp=mock.Mock())
+
+        # All the recorded view datas are exported once.
+        exporter.export.assert_called_once()
+        [exported_vd] = exporter.export.call_args[0][0]
+        tvadm = exported_vd.tag_value_aggregation_data_map
+        self.assertEqual(2, tvadm[("GET",)].count_data)
+        self.assertEqual(1, tvadm[("POST",)].count_data)
+
+        measure_to_view_map.record_many([], timestamp=mock.Mock())
+        exporter.export.assert_called_once()
+
+    def test_record_many_deferred_export(self):
+        exporter = mock.Mock()
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            deferred_export=True)
+        measure_to_view_map.exporters.append(exporter)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, "start")
+        measure_to_view_map.record_many(
+            [(None, {REQUEST_COUNT_MEASURE: 1})], timestamp=mock.Mock())
+        exporter.export.assert_not_called()
+
+        measure_to_view_map.export_pending()
+        exporter.export.assert_called_once()
+
+    def test_record_deferred_export(self):
+        exporter = mock.Mock()
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            deferred_export=True)
+        measure_to_view_map.exporters.append(exporter)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, "start")
+        tag_map = mock.Mock()
+        tag_map.map = {METHOD_KEY: "GET"}
+        for _ in range(3):
+            measure_to_view_map.record(
+                tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+                timestamp=mock.Mock())
+        exporter.export.assert_not_called()
+
+        measure_to_view_map.export_pending()
+        exporter.export.assert_called_once()
+        [exported_vd] = exporter.export.call_args[0][0]
+        self.assertEqual(REQUEST_COUNT_VIEW, exported_vd.view)
+        self.assertEqual(
+            3, exported_vd.tag_value_aggregation_data_map[("GET",)].count_data)
+
+        # Nothing was recorded since the last export.
+        measure_to_view_map.export_pending()
+        exporter.export.assert_called_once()
+
+        # Turning deferred export off flushes the pending view data.
+        measure_to_view_map.record(
+            tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+            timestamp=mock.Mock())
+        measure_to_view_map.deferred_export = False
+        self.assertEqual(2, exporter.export.call_count)
+        measure_to_view_map.record(
+            tags=tag_map, measurement_map={REQUEST_COUNT_MEASURE: 1},
+            timestamp=mock.Mock())
+        self.assertEqual(3, exporter.export.call_count)
+
+    def test_record_deferred_export_no_exporters(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            deferred_export=True)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, "start")
+        measure_to_view_map.record(
+            tags=None, measurement_map={REQUEST_COUNT_MEASURE: 1},
+            timestamp=mock.Mock())
+        self.assertEqual({}, measure_to_view_map._pending_export)
+
     def test_export_duplicates_viewdata(self):
         """Check that we copy view data on export."""
         mtvm = measure_to_view_map_module.MeasureToViewMap()
@@ -410,3 +675,98 @@ class TestMeasureToViewMap(unittest.TestCase):
         self.assertIsNot(exported_vd1, exported_vd2)
         self.assertIsNot(exported_vd1.end_time, view_data.end_time)
         self.assertIsNot(exported_vd2.end_time, view_data.end_time)
+
+
+class TestBoundMeasure(unittest.TestCase):
+    def _get_count(self, measure_to_view_map, method,
+                   view_name=REQUEST_COUNT_VIEW_NAME):
+        view_data = measure_to_view_map.get_view(view_name, None)
+        agg_data = view_data.tag_value_aggregation_data_map.get((method,))
+        return None if agg_data is None else agg_data.count_data
+
+    def test_record(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, None)
+        tag_map = mock.Mock()
+        tag_map.map = {METHOD_KEY: "GET"}
+        bound = measure_to_view_map.bind(REQUEST_COUNT_MEASURE, tag_map)
+        self.assertIs(REQUEST_COUNT_MEASURE, bound.measure)
+        self.assertEqual({METHOD_KEY: "GET"}, bound.tags)
+
+        bound.record(1)
+        bound.record(1)
+        bound.record(-1)
+        self.assertEqual(2, self._get_count(measure_to_view_map, "GET"))
+        # The binding is complete once the series exists
+        version, [add_sample], _ = bound._binding
+        self.assertEqual(measure_to_view_map._views_version, version)
+
+    @mock.patch('opencensus.stats.measure_to_view_map.TagContext')
+    def test_record_context_tags(self, mock_tag_context):
+        tag_map = mock.Mock()
+        tag_map.map = {METHOD_KEY: "POST"}
+        mock_tag_context.get.return_value = tag_map
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, None)
+
+        measure_to_view_map.bind(REQUEST_COUNT_MEASURE).record(1)
+        self.assertEqual(1, self._get_count(measure_to_view_map, "POST"))
+
+    def test_record_later_views(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        bound = measure_to_view_map.bind(REQUEST_COUNT_MEASURE, None)
+        bound.record(1)
+        self.assertIsNone(measure_to_view_map.get_view(
+            REQUEST_COUNT_VIEW_NAME, None))
+
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, None)
+        bound.record(1)
+        self.assertEqual(1, self._get_count(measure_to_view_map, None))
+
+        sum_view = View("request_sum", "sum of requests", [METHOD_KEY],
+                        REQUEST_COUNT_MEASURE, SumAggregation())
+        measure_to_view_map.register_view(sum_view, None)
+        bound.record(2)
+        self.assertEqual(2, self._get_count(measure_to_view_map, None))
+        view_data = measure_to_view_map.get_view("request_sum", None)
+        self.assertEqual(
+            2, view_data.tag_value_aggregation_data_map[(None,)].sum_data)
+
+    def test_record_other_measure(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap()
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, None)
+        other_measure = MeasureInt(
+            REQUEST_COUNT_MEASURE.name, "another measure", "1")
+        bound = measure_to_view_map.bind(other_measure, None)
+        bound.record(1)
+        self.assertIsNone(self._get_count(measure_to_view_map, None))
+
+    def test_record_delta_sharded(self):
+        for kw in ({'delta': True}, {'sharded': True}):
+            measure_to_view_map = \
+                measure_to_view_map_module.MeasureToViewMap(**kw)
+            measure_to_view_map.register_view(REQUEST_COUNT_VIEW, None)
+            bound = measure_to_view_map.bind(REQUEST_COUNT_MEASURE, None)
+            bound.record(1)
+            list(measure_to_view_map.get_metrics(None))
+            bound.record(1)
+            bound.record(1)
+            [metric] = measure_to_view_map.get_metrics(None)
+            self.assertEqual(
+                2 if kw.get('delta') else 3,
+                metric.time_series[0].points[0].value.value)
+
+    def test_record_export(self):
+        measure_to_view_map = measure_to_view_map_module.MeasureToViewMap(
+            deferred_export=True)
+        exporter = mock.Mock()
+        measure_to_view_map.exporters.append(exporter)
+        measure_to_view_map.register_view(REQUEST_COUNT_VIEW, None)
+        bound = measure_to_view_map.bind(REQUEST_COUNT_MEASURE, None)
+        bound.record(1, attachments={"trace_id": "1"})
+        exporter.export.assert_not_called()
+
+        measure_to_view_map.export_pending()
+        [[view_data]], _ = exporter.export.call_args
+        self.assertEqual(
+            1, view_data.tag_value_aggregation_data_map[(None,)].count_data)
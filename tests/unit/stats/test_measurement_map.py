@@ -195,3 +195,31 @@ class TestMeasurementMap(unittest.TestCase):
         with logger_patch as another_mock_logger:
             measurement_map.measure_float_put(mock.Mock(), -1.0)
         another_mock_logger.warning.assert_called_once()
+
+    def test_record_many(self):
+        measure_to_view_map = mock.Mock()
+        attachments = {'One': 'one'}
+        measurement_map = measurement_map_module.MeasurementMap(
+            measure_to_view_map=measure_to_view_map, attachments=attachments)
+        measure = mock.Mock()
+        current_tags = TagMap(tags=[Tag('testtag1', 'testtag1val')])
+        TagContext.set(current_tags)
+        tags = TagMap(tags=[Tag('testtag1', 'testtag2val')])
+
+        with logger_patch as mock_logger:
+            measurement_map.record_many([
+                (tags, {measure: 1}),
+                (None, {measure: 2}),
+                (tags, {measure: -1}),
+                (None, {measure: 3}),
+            ])
+        mock_logger.warning.assert_called_once()
+
+        measure_to_view_map.record_many.assert_called_once_with(
+            measurements=[
+                (tags, {measure: 1}),
+                (current_tags, {measure: 2}),
+                (current_tags, {measure: 3}),
+            ],
+            timestamp=mock.ANY,
+            attachments=attachments)
@@ -55,7 +55,7 @@ class TestMetricUtils(unittest.TestCase):
 
         vd = mock.Mock(spec=view_data.ViewData)
         vd.view = vv
-        vd.start_time = start_time
+        vd.get_series_start_time.return_value = start_time
 
         mock_point = mock.Mock(spec=point.Point)
         mock_point.value = mock.Mock(spec=value_type)
@@ -81,6 +81,8 @@ class TestMetricUtils(unittest.TestCase):
         self.assertEqual(len(metric.time_series), 1)
         [ts] = metric.time_series
         self.assertEqual(ts.start_timestamp, start_time)
+        vd.get_series_start_time.assert_called_once_with(
+            (tag_value.TagValue('v1'), tag_value.TagValue('v2')))
         self.assertListEqual(
             [lv.value for lv in ts.label_values],
             ['v1', 'v2'])
@@ -104,6 +106,11 @@ class TestMetricUtils(unittest.TestCase):
                 aggregation.DistributionAggregation,
                 value.ValueDistribution,
                 metric_descriptor.MetricDescriptorType.CUMULATIVE_DISTRIBUTION
+            ],
+            [
+                aggregation.SummaryAggregation,
+                value.ValueSummary,
+                metric_descriptor.MetricDescriptorType.SUMMARY
             ]
         ]
         for args in args_list:
@@ -142,3 +149,61 @@ class TestMetricUtils(unittest.TestCase):
         self.assertEqual(len(ts.points), 1)
         [pt] = ts.points
         self.assertEqual(pt, mock_point)
+
+    @mock.patch('opencensus.common.utils.time_ns')
+    def test_view_data_to_metric_evicted_series(self, mock_time_ns):
+        vv = view.View(
+            'view1', 'description', [tag_key.TagKey('k1')],
+            measure.MeasureInt('measure1', 'description'),
+            aggregation.CountAggregation())
+        vd = view_data.ViewData(vv, None, None, max_series=1, evict_lru=True)
+        mock_time_ns.return_value = 10 ** 9
+        vd.start()
+        vd.record_tag_values(('a',), 1, None)
+        mock_time_ns.return_value = 2 * 10 ** 9
+        vd.record_tag_values(('b',), 1, None)
+        mock_time_ns.return_value = 3 * 10 ** 9
+        vd.record_tag_values(('a',), 1, None)
+
+        metric = metric_utils.view_data_to_metric(
+            vd, datetime.datetime(1970, 1, 1, 0, 0, 4))
+
+        # The re-created series doesn't claim the values of the evicted one
+        [ts] = metric.time_series
+        self.assertEqual(ts.label_values[0].value, 'a')
+        self.assertEqual(ts.start_timestamp, '1970-01-01T00:00:03.000000Z')
+        self.assertEqual(ts.points[0].value.value, 1)
+
+    def test_get_series_limit_metrics_empty(self):
+        self.assertEqual(
+            [], metric_utils.get_series_limit_metrics([], mock.Mock()))
+
+    def test_get_series_limit_metrics(self):
+        start_time = datetime.datetime(2019, 1, 25, 11, 12, 13)
+        current_time = datetime.datetime(2019, 1, 25, 12, 13, 14)
+        vd = mock.Mock(spec=view_data.ViewData)
+        vd.view = mock.Mock()
+        vd.view.name = 'view1'
+        vd.start_time = start_time
+        vd.overflow_count = 3
+        vd.evicted_count = 2
+
+        overflow_metric, evicted_metric = \
+            metric_utils.get_series_limit_metrics([vd], current_time)
+
+        for metric, expected in ((overflow_metric, 3), (evicted_metric, 2)):
+            self.assertEqual(
+                metric.descriptor.type,
+                metric_descriptor.MetricDescriptorType.CUMULATIVE_INT64)
+            self.assertEqual(metric.descriptor.label_keys,
+                             [metric_utils.VIEW_LABEL_KEY])
+            [ts] = metric.time_series
+            self.assertEqual(ts.start_timestamp, start_time)
+            self.assertEqual(ts.label_values[0].value, 'view1')
+            [pt] = ts.points
+            self.assertEqual(pt.timestamp, current_time)
+            self.assertEqual(pt.value.value, expected)
+        self.assertEqual(overflow_metric.descriptor.name,
+                         metric_utils.OVERFLOW_COUNT_METRIC_NAME)
+        self.assertEqual(evicted_metric.descriptor.name,
+                         metric_utils.EVICTED_SERIES_METRIC_NAME)
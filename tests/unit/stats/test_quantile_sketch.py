@@ -0,0 +1,133 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import sys
+import unittest
+
+from opencensus.stats import quantile_sketch
+
+
+def _exact_quantile(sorted_values, quantile):
+    return sorted_values[int(quantile * (len(sorted_values) - 1))]
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_constructor(self):
+        sketch = quantile_sketch.QuantileSketch()
+        self.assertEqual(sketch.relative_accuracy, 0.01)
+        self.assertEqual(sketch.max_buckets, 2048)
+        self.assertEqual(sketch.count, 0)
+        self.assertEqual(sketch.sum, 0)
+        self.assertEqual(sketch.zero_count, 0)
+        self.assertEqual(sketch.bucket_counts, {})
+        self.assertEqual(repr(sketch), 'QuantileSketch(0)')
+
+    def test_constructor_invalid(self):
+        with self.assertRaises(ValueError):
+            quantile_sketch.QuantileSketch(relative_accuracy=0)
+        with self.assertRaises(ValueError):
+            quantile_sketch.QuantileSketch(relative_accuracy=1)
+        with self.assertRaises(ValueError):
+            quantile_sketch.QuantileSketch(max_buckets=0)
+
+    def test_empty(self):
+        sketch = quantile_sketch.QuantileSketch()
+        self.assertIsNone(sketch.get_quantile(0.5))
+        self.assertIsNone(sketch.get_quantiles([0.5, 0.9]))
+
+    def test_add(self):
+        sketch = quantile_sketch.QuantileSketch()
+        for value in (1, 2, 0, -1, float('nan')):
+            sketch.add(value)
+        self.assertEqual(sketch.count, 5)
+        self.assertEqual(sketch.sum, 3)
+        self.assertEqual(sketch.zero_count, 3)
+        self.assertEqual(sum(sketch.bucket_counts.values()), 2)
+        self.assertEqual(sketch.get_quantile(0), 0)
+        self.assertEqual(sketch.get_quantile(0.5), 0)
+        self.assertAlmostEqual(sketch.get_quantile(1), 2, delta=0.02)
+
+    def test_add_infinity(self):
+        sketch = quantile_sketch.QuantileSketch()
+        for value in (1, float('inf'), sys.float_info.max):
+            sketch.add(value)
+        self.assertEqual(sketch.count, 3)
+        self.assertEqual(sketch.sum, float('inf'))
+        self.assertEqual(sketch.zero_count, 0)
+        self.assertEqual(sorted(sketch.bucket_counts.values()), [1, 2])
+        self.assertAlmostEqual(sketch.get_quantile(0), 1, delta=0.01)
+        self.assertAlmostEqual(sketch.get_quantile(1), sys.float_info.max,
+                               delta=0.01 * sys.float_info.max)
+
+    def test_relative_accuracy(self):
+        rng = random.Random(0)
+        values = [rng.lognormvariate(0, 3) for _ in range(10000)]
+        sketch = quantile_sketch.QuantileSketch(relative_accuracy=0.02)
+        for value in values:
+            sketch.add(value)
+        values.sort()
+        quantiles = [0, 0.01, 0.25, 0.5, 0.9, 0.99, 0.999, 1]
+        for quantile, estimate in zip(quantiles,
+                                      sketch.get_quantiles(quantiles)):
+            exact = _exact_quantile(values, quantile)
+            self.assertLessEqual(abs(estimate - exact), 0.02 * exact)
+
+    def test_collapse(self):
+        sketch = quantile_sketch.QuantileSketch(max_buckets=10)
+        for exponent in range(-50, 50):
+            sketch.add(2.0 ** exponent)
+        self.assertEqual(len(sketch.bucket_counts), 10)
+        self.assertEqual(sum(sketch.bucket_counts.values()), 100)
+        # The highest quantiles are unaffected
+        self.assertAlmostEqual(sketch.get_quantile(1), 2.0 ** 49,
+                               delta=0.01 * 2.0 ** 49)
+        self.assertGreater(sketch.get_quantile(0), 2.0 ** 30)
+
+    def test_merge(self):
+        rng = random.Random(0)
+        values = [rng.expovariate(0.1) for _ in range(1000)] + [0]
+        expected = quantile_sketch.QuantileSketch()
+        for value in values:
+            expected.add(value)
+
+        sketch = quantile_sketch.QuantileSketch()
+        other = quantile_sketch.QuantileSketch()
+        for value in values[:300]:
+            sketch.add(value)
+        for value in values[300:]:
+            other.add(value)
+        sketch.merge(other)
+
+        self.assertEqual(sketch.count, expected.count)
+        self.assertAlmostEqual(sketch.sum, expected.sum)
+        self.assertEqual(sketch.zero_count, expected.zero_count)
+        self.assertEqual(sketch.bucket_counts, expected.bucket_counts)
+
+    def test_merge_collapse(self):
+        sketch = quantile_sketch.QuantileSketch(max_buckets=3)
+        other = quantile_sketch.QuantileSketch(max_buckets=3)
+        for value in (1, 10, 100):
+            sketch.add(value)
+        for value in (1000, 10000):
+            other.add(value)
+        sketch.merge(other)
+        self.assertEqual(len(sketch.bucket_counts), 3)
+        self.assertEqual(sorted(sketch.bucket_counts.values()), [1, 1, 3])
+
+    def test_merge_different_accuracy(self):
+        sketch = quantile_sketch.QuantileSketch(relative_accuracy=0.01)
+        other = quantile_sketch.QuantileSketch(relative_accuracy=0.02)
+        with self.assertRaises(ValueError):
+            sketch.merge(other)
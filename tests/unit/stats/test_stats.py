@@ -46,6 +46,7 @@ class TestStats(unittest.TestCase):
         mock_view.measure = mock_measure
         mock_view.get_metric_descriptor.return_value = mock_md
         mock_view.columns = ['k1']
+        mock_view.limits_series = False
 
         stats.view_manager.measure_to_view_map.register_view(mock_view, Mock())
 
@@ -42,3 +42,27 @@ class TestStatsRecorder(unittest.TestCase):
             measurement_map.measurement_map,
             MeasurementMap(
                 measure_to_view_map=measure_to_view_map).measurement_map)
+
+    def test_record_many(self):
+        measure_to_view_map = mock.Mock()
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(measure_to_view_map)
+        stats_recorder = stats_recorder_module.StatsRecorder()
+        tags = mock.Mock()
+        measurements = [(tags, {mock.Mock(): 1})]
+        stats_recorder.record_many(measurements)
+
+        measure_to_view_map.record_many.assert_called_once_with(
+            measurements=measurements, timestamp=mock.ANY, attachments=None)
+
+    def test_bind(self):
+        measure_to_view_map = mock.Mock()
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(measure_to_view_map)
+        stats_recorder = stats_recorder_module.StatsRecorder()
+        measure = mock.Mock()
+        tags = mock.Mock()
+
+        self.assertIs(measure_to_view_map.bind.return_value,
+                      stats_recorder.bind(measure, tags))
+        measure_to_view_map.bind.assert_called_once_with(measure, tags)
@@ -42,6 +42,33 @@ class TestView(unittest.TestCase):
         self.assertEqual(measure, view.measure)
         self.assertEqual(aggregation, view.aggregation)
 
+    def test_constructor_series_limits(self):
+        view = view_module.View("name", "description", [], mock.Mock(),
+                                mock.Mock())
+        self.assertIsNone(view.max_series)
+        self.assertIsNone(view.idle_timeout)
+        self.assertFalse(view.evict_lru)
+        self.assertFalse(view.limits_series)
+
+        view = view_module.View("name", "description", [], mock.Mock(),
+                                mock.Mock(), max_series=10, evict_lru=True)
+        self.assertEqual(10, view.max_series)
+        self.assertTrue(view.evict_lru)
+        self.assertTrue(view.limits_series)
+
+        view = view_module.View("name", "description", [], mock.Mock(),
+                                mock.Mock(), idle_timeout=60)
+        self.assertEqual(60, view.idle_timeout)
+        self.assertTrue(view.limits_series)
+
+    def test_constructor_invalid_series_limits(self):
+        with self.assertRaises(ValueError):
+            view_module.View("name", "description", [], mock.Mock(),
+                             mock.Mock(), max_series=0)
+        with self.assertRaises(ValueError):
+            view_module.View("name", "description", [], mock.Mock(),
+                             mock.Mock(), evict_lru=True)
+
     def test_view_to_metric_descriptor(self):
         mock_measure = mock.Mock(spec=measure.MeasureFloat)
         mock_agg = mock.Mock(spec=aggregation.SumAggregation)
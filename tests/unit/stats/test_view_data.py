@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import threading
 import unittest
 from datetime import datetime
 
@@ -57,6 +59,17 @@ class TestViewData(unittest.TestCase):
 
         self.assertIsNotNone(view_data.end_time)
 
+    @mock.patch('opencensus.stats.view_data.utils.time_ns',
+                return_value=1546300800000001000)
+    def test_start_end_ns(self, time_mock):
+        view_data = view_data_module.ViewData(
+            view=mock.Mock(), start_time=None, end_time=None)
+        view_data.start()
+        view_data.end()
+        time_mock.return_value += 1000
+        self.assertEqual('2019-01-01T00:00:00.000001Z', view_data.start_time)
+        self.assertEqual('2019-01-01T00:00:00.000001Z', view_data.end_time)
+
     def test_get_tag_values(self):
         view = mock.Mock()
         start_time = datetime.utcnow()
@@ -315,3 +328,503 @@ class TestViewData(unittest.TestCase):
         self.assertTrue(tuple_vals in view_data.tag_value_aggregation_data_map)
         sum_data = view_data.tag_value_aggregation_data_map.get(tuple_vals)
         self.assertEqual(4, sum_data.sum_data)
+
+    def test_record_many(self):
+        measure = mock.Mock(spec=measure_module.MeasureInt)
+        sum_aggregation = aggregation_module.SumAggregation()
+        view = view_module.View("test_view", "description", ['key1'],
+                                measure, sum_aggregation)
+        view_data = view_data_module.ViewData(
+            view=view, start_time=None, end_time=None)
+        context1 = mock.Mock()
+        context1.map = {'key1': 'val1'}
+        context2 = mock.Mock()
+        context2.map = {'key1': 'val2', 'key2': 'val1'}
+
+        view_data.record_many(
+            [(context1, 1), (context2, 2), (None, 3), (context1, 4)],
+            timestamp=None)
+        view_data.record_many([(context2, 5)], timestamp=None)
+
+        tvadm = view_data.tag_value_aggregation_data_map
+        self.assertEqual(3, len(tvadm))
+        self.assertEqual(5, tvadm[('val1',)].sum_data)
+        self.assertEqual(7, tvadm[('val2',)].sum_data)
+        self.assertEqual(3, tvadm[(None,)].sum_data)
+
+    def test_group_by_tag_values(self):
+        view = mock.Mock()
+        view.columns = ['key1', 'key2']
+        view_data = view_data_module.ViewData(
+            view=view, start_time=None, end_time=None)
+        context = mock.Mock()
+        context.map = {'key2': 'val2'}
+
+        grouped = view_data.group_by_tag_values(
+            [(context, 1), (None, 2), (context, 3)])
+        self.assertEqual([((None, 'val2'), [1, 3]), ((None, None), [2])],
+                         list(grouped.items()))
+
+
+class TestViewDataBind(unittest.TestCase):
+    def _make_view(self, **kw):
+        return view_module.View(
+            "sum", "sum", ['key'],
+            measure_module.MeasureInt("measure", "description"),
+            aggregation_module.SumAggregation(), **kw)
+
+    def test_bind(self):
+        view_data = view_data_module.ViewData(self._make_view(), None, None)
+        self.assertIsNone(view_data.bind(('a',)))
+        self.assertEqual({}, view_data.tag_value_aggregation_data_map)
+
+        view_data.record_tag_values(('a',), 1, None)
+        add_sample = view_data.bind(('a',))
+        add_sample(2, None, None)
+        self.assertEqual(
+            3, view_data.tag_value_aggregation_data_map[('a',)].sum_data)
+
+    def test_bind_record_tag_values(self):
+        for kw in ({'delta': True}, {'max_series': 1}, {'idle_timeout': 1}):
+            view_data = view_data_module.ViewData(
+                self._make_view(), None, None, **kw)
+            add_sample = view_data.bind(('a',))
+            add_sample(1, None, None)
+            add_sample(2, None, None)
+            self.assertEqual(
+                3, view_data.tag_value_aggregation_data_map[('a',)].sum_data)
+
+
+class TestViewDataSeriesLimits(unittest.TestCase):
+    def _make_one(self, **kw):
+        view = view_module.View(
+            "count", "count", ['key'], mock.Mock(),
+            aggregation_module.CountAggregation())
+        return view_data_module.ViewData(view, None, None, **kw)
+
+    @staticmethod
+    def _record(view_data, value, count=1):
+        context = mock.Mock()
+        context.map = {'key': value}
+        for _ in range(count):
+            view_data.record(context, 1, None)
+
+    @staticmethod
+    def _get_counts(view_data):
+        return {
+            tag_values[0]: agg_data.count_data
+            for tag_values, agg_data in
+            view_data.tag_value_aggregation_data_map.items()}
+
+    def test_unlimited(self):
+        view_data = self._make_one()
+        for ii in range(10):
+            self._record(view_data, str(ii))
+        self.assertEqual(10, len(view_data.tag_value_aggregation_data_map))
+        self.assertEqual(0, view_data.overflow_count)
+        self.assertEqual(0, view_data.evict_idle_series())
+
+    def test_overflow(self):
+        view_data = self._make_one(max_series=2)
+        self._record(view_data, 'a', 2)
+        self._record(view_data, 'b')
+        self._record(view_data, 'c', 3)
+        self._record(view_data, 'd')
+        self._record(view_data, 'a')
+
+        self.assertEqual(
+            {'a': 3, 'b': 1, view_data_module.OVERFLOW_TAG_VALUE: 4},
+            self._get_counts(view_data))
+        self.assertEqual(4, view_data.overflow_count)
+        self.assertEqual(0, view_data.evicted_count)
+
+    def test_overflow_record_many(self):
+        view_data = self._make_one(max_series=1)
+        context_a = mock.Mock()
+        context_a.map = {'key': 'a'}
+        context_b = mock.Mock()
+        context_b.map = {'key': 'b'}
+
+        view_data.record_many(
+            [(context_a, 1), (context_b, 1), (context_b, 1)], None)
+
+        self.assertEqual(
+            {'a': 1, view_data_module.OVERFLOW_TAG_VALUE: 2},
+            self._get_counts(view_data))
+        self.assertEqual(2, view_data.overflow_count)
+
+    def test_evict_lru(self):
+        view_data = self._make_one(max_series=2, evict_lru=True)
+        self._record(view_data, 'a')
+        self._record(view_data, 'b')
+        self._record(view_data, 'a')
+        self._record(view_data, 'c')
+
+        self.assertEqual({'a': 2, 'c': 1}, self._get_counts(view_data))
+        self.assertEqual(1, view_data.evicted_count)
+        self.assertEqual(0, view_data.overflow_count)
+
+        # An evicted series starts over
+        self._record(view_data, 'b')
+        self.assertEqual({'c': 1, 'b': 1}, self._get_counts(view_data))
+        self.assertEqual(2, view_data.evicted_count)
+
+    @mock.patch('opencensus.common.utils.time_ns')
+    def test_series_start_time_after_eviction(self, mock_time_ns):
+        view_data = self._make_one(max_series=2, evict_lru=True)
+        mock_time_ns.return_value = 1 * 10 ** 9
+        view_data.start()
+        self._record(view_data, 'a')
+        self._record(view_data, 'b')
+        mock_time_ns.return_value = 2 * 10 ** 9
+        self._record(view_data, 'c')
+        mock_time_ns.return_value = 3 * 10 ** 9
+        self._record(view_data, 'a')
+
+        self.assertEqual({'c': 1, 'a': 1}, self._get_counts(view_data))
+        # Only the series created after an eviction have their own start
+        self.assertEqual('1970-01-01T00:00:02.000000Z',
+                         view_data.get_series_start_time(('c',)))
+        self.assertEqual('1970-01-01T00:00:03.000000Z',
+                         view_data.get_series_start_time(('a',)))
+        self.assertEqual('1970-01-01T00:00:01.000000Z',
+                         view_data.get_series_start_time(('d',)))
+
+        # The start times go with the series taken as a delta
+        delta = view_data.take_delta()
+        self.assertEqual('1970-01-01T00:00:03.000000Z',
+                         delta.get_series_start_time(('a',)))
+        self.assertEqual('1970-01-01T00:00:03.000000Z',
+                         view_data.get_series_start_time(('a',)))
+
+    def test_evict_threads(self):
+        for kw in ({'idle_timeout': 0}, {'max_series': 5, 'evict_lru': True},
+                   {'max_series': 5, 'idle_timeout': 0}):
+            view_data = self._make_one(**kw)
+            errors = []
+            stop = threading.Event()
+
+            def record(offset):
+                try:
+                    for ii in range(2000):
+                        self._record(view_data, str((ii + offset) % 10))
+                except Exception as ex:  # pragma: NO COVER
+                    errors.append(ex)
+
+            def evict():
+                try:
+                    while not stop.is_set():
+                        view_data.evict_idle_series()
+                except Exception as ex:  # pragma: NO COVER
+                    errors.append(ex)
+
+            recorders = [threading.Thread(target=record, args=(offset,))
+                         for offset in range(3)]
+            evicter = threading.Thread(target=evict)
+            evicter.start()
+            for thread in recorders:
+                thread.start()
+            for thread in recorders:
+                thread.join()
+            stop.set()
+            evicter.join()
+
+            self.assertEqual([], errors)
+            self.assertEqual(
+                set(view_data._last_recorded_ns),
+                set(view_data.tag_value_aggregation_data_map) -
+                {view_data._overflow_tag_values})
+
+    @mock.patch('opencensus.common.utils.monotonic_ns')
+    def test_evict_idle(self, mock_monotonic_ns):
+        view_data = self._make_one(idle_timeout=10)
+        mock_monotonic_ns.return_value = 0
+        self._record(view_data, 'a')
+        self._record(view_data, 'b')
+        mock_monotonic_ns.return_value = 5 * 10 ** 9
+        self._record(view_data, 'a')
+
+        mock_monotonic_ns.return_value = 10 * 10 ** 9
+        self.assertEqual(1, view_data.evict_idle_series())
+        self.assertEqual({'a': 2}, self._get_counts(view_data))
+
+        mock_monotonic_ns.return_value = 20 * 10 ** 9
+        self.assertEqual(1, view_data.evict_idle_series())
+        self.assertEqual({}, self._get_counts(view_data))
+        self.assertEqual(2, view_data.evicted_count)
+
+    @mock.patch('opencensus.common.utils.monotonic_ns')
+    def test_evict_idle_for_new_series(self, mock_monotonic_ns):
+        view_data = self._make_one(max_series=1, idle_timeout=10)
+        mock_monotonic_ns.return_value = 0
+        self._record(view_data, 'a')
+        mock_monotonic_ns.return_value = 5 * 10 ** 9
+        self._record(view_data, 'b')
+        mock_monotonic_ns.return_value = 10 * 10 ** 9
+        self._record(view_data, 'c')
+
+        self.assertEqual(
+            {'c': 1, view_data_module.OVERFLOW_TAG_VALUE: 1},
+            self._get_counts(view_data))
+        self.assertEqual(1, view_data.overflow_count)
+        self.assertEqual(1, view_data.evicted_count)
+
+    def test_overflow_tag_values(self):
+        view = view_module.View(
+            "count", "count", ['key1', 'key2'], mock.Mock(),
+            aggregation_module.CountAggregation())
+        view_data = view_data_module.ViewData(view, None, None, max_series=1)
+        view_data.record(None, 1, None)
+        context = mock.Mock()
+        context.map = {'key1': 'a'}
+        view_data.record(context, 1, None)
+
+        overflow = view_data_module.OVERFLOW_TAG_VALUE
+        self.assertEqual(
+            {(None, None), (overflow, overflow)},
+            set(view_data.tag_value_aggregation_data_map))
+
+
+class TestViewDataDelta(unittest.TestCase):
+    def _make_view(self, **kw):
+        return view_module.View(
+            "sum", "sum", ['key'],
+            measure_module.MeasureInt("measure", "description"),
+            aggregation_module.SumAggregation(), **kw)
+
+    @staticmethod
+    def _get_sums(view_data):
+        return {
+            tag_values[0]: agg_data.sum_data
+            for tag_values, agg_data in
+            view_data.tag_value_aggregation_data_map.items()}
+
+    @mock.patch('opencensus.common.utils.time_ns')
+    def test_take_delta(self, mock_time_ns):
+        view_data = view_data_module.ViewData(
+            self._make_view(), 'start', None, delta=True)
+        context = mock.Mock()
+        context.map = {'key': 'a'}
+        view_data.record(context, 1, None)
+        view_data.record_many([(context, 2), (None, 3)], None)
+
+        mock_time_ns.return_value = 10 ** 9
+        delta = view_data.take_delta()
+        self.assertEqual({'a': 3, None: 3}, self._get_sums(delta))
+        self.assertEqual('start', delta.start_time)
+        self.assertEqual('1970-01-01T00:00:01.000000Z', delta.end_time)
+        self.assertEqual({}, view_data.tag_value_aggregation_data_map)
+        self.assertEqual('1970-01-01T00:00:01.000000Z',
+                         view_data.start_time)
+
+        # Series that are not recorded in an interval are dropped
+        view_data.record(context, 4, None)
+        mock_time_ns.return_value = 2 * 10 ** 9
+        delta = view_data.take_delta()
+        self.assertEqual({'a': 4}, self._get_sums(delta))
+        self.assertEqual('1970-01-01T00:00:01.000000Z', delta.start_time)
+        self.assertEqual('1970-01-01T00:00:02.000000Z', delta.end_time)
+
+        delta = view_data.take_delta()
+        self.assertEqual({}, delta.tag_value_aggregation_data_map)
+
+    def test_take_delta_threads(self):
+        view_data = view_data_module.ViewData(
+            self._make_view(), None, None, delta=True)
+        deltas = []
+
+        def record():
+            for _ in range(1000):
+                view_data.record(None, 1, None)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            deltas.append(view_data.take_delta())
+        for thread in threads:
+            thread.join()
+        deltas.append(view_data.take_delta())
+
+        self.assertEqual(
+            4000, sum(self._get_sums(delta).get(None, 0) for delta in deltas))
+
+    def test_take_delta_series_limits(self):
+        view_data = view_data_module.ViewData(
+            self._make_view(max_series=1), None, None, max_series=1,
+            evict_lru=False, delta=True)
+        for value in ('a', 'b', 'c'):
+            context = mock.Mock()
+            context.map = {'key': value}
+            view_data.record(context, 1, None)
+
+        delta = view_data.take_delta()
+        self.assertEqual(
+            {'a': 1, view_data_module.OVERFLOW_TAG_VALUE: 2},
+            self._get_sums(delta))
+        self.assertEqual(2, delta.overflow_count)
+        self.assertEqual(0, view_data.overflow_count)
+
+        # The limit applies to the series of each interval
+        context = mock.Mock()
+        context.map = {'key': 'b'}
+        view_data.record(context, 1, None)
+        self.assertEqual({'b': 1}, self._get_sums(view_data))
+
+
+class TestShardedViewData(unittest.TestCase):
+    def _make_view(self, aggregation=None):
+        measure = measure_module.MeasureInt("test_measure", "description")
+        if aggregation is None:
+            aggregation = aggregation_module.SumAggregation()
+        return view_module.View("test_view", "description", ['key1'],
+                                measure, aggregation)
+
+    def test_record(self):
+        view = self._make_view()
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time=None, end_time=None)
+        self.assertEqual({}, view_data.tag_value_aggregation_data_map)
+
+        context = mock.Mock()
+        context.map = {'key1': 'val1', 'key2': 'val2'}
+        view_data.record(context=context, value=2, timestamp=None)
+        view_data.record(context=context, value=3, timestamp=None)
+        view_data.record(context=None, value=4, timestamp=None)
+
+        tvadm = view_data.tag_value_aggregation_data_map
+        self.assertEqual(5, tvadm[('val1',)].sum_data)
+        self.assertEqual(4, tvadm[(None,)].sum_data)
+
+        # Reads return a copy, so changing it doesn't affect the shards.
+        tvadm[('val1',)].add_sample(10)
+        self.assertEqual(
+            5, view_data.tag_value_aggregation_data_map[('val1',)].sum_data)
+
+    def test_record_threads(self):
+        view = self._make_view(aggregation_module.DistributionAggregation(
+            [1, 2, 4]))
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time=None, end_time=None)
+        context = mock.Mock()
+        context.map = {'key1': 'val1'}
+
+        def record():
+            for value in range(5):
+                view_data.record(context=context, value=value, timestamp=None)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        dist = view_data.tag_value_aggregation_data_map[('val1',)]
+        self.assertEqual(20, dist.count_data)
+        self.assertEqual([4, 4, 8, 4], dist.counts_per_bucket)
+        self.assertAlmostEqual(2, dist.mean_data)
+        self.assertAlmostEqual(40, dist.sum_of_sqd_deviations)
+        # The shards of the exited threads were folded when read
+        self.assertEqual([], view_data._shards)
+
+    def test_dead_thread_shards(self):
+        view = self._make_view()
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time=None, end_time=None)
+        view_data.record_tag_values(('val1',), 1, None)
+
+        for value in range(10):
+            thread = threading.Thread(
+                target=view_data.record_tag_values,
+                args=(('val{}'.format(value % 2),), value, None))
+            thread.start()
+            thread.join()
+            # Each thread folds the shards of the previous ones
+            self.assertLessEqual(len(view_data._shards), 2)
+
+        tvadm = view_data.tag_value_aggregation_data_map
+        self.assertEqual(20, tvadm[('val0',)].sum_data)
+        self.assertEqual(26, tvadm[('val1',)].sum_data)
+        self.assertEqual(1, len(view_data._shards))
+
+        delta = view_data.take_delta()
+        self.assertEqual(
+            26, delta.tag_value_aggregation_data_map[('val1',)].sum_data)
+        self.assertEqual({}, view_data.tag_value_aggregation_data_map)
+
+    def test_record_many(self):
+        view = self._make_view(aggregation_module.DistributionAggregation(
+            [2]))
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time=None, end_time=None)
+        context = mock.Mock()
+        context.map = {'key1': 'val1'}
+        view_data.record(context=context, value=1, timestamp=None)
+        view_data.record_many([(context, 2), (None, 3), (context, 3)],
+                              timestamp=None)
+
+        tvadm = view_data.tag_value_aggregation_data_map
+        self.assertEqual([1, 2], tvadm[('val1',)].counts_per_bucket)
+        self.assertEqual(2, tvadm[('val1',)].mean_data)
+        self.assertEqual([0, 1], tvadm[(None,)].counts_per_bucket)
+
+    def test_copy(self):
+        view = self._make_view()
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time=mock.Mock(), end_time=mock.Mock())
+        view_data.record(context=None, value=2, timestamp=None)
+
+        view_data_copy = copy.copy(view_data)
+        self.assertIs(type(view_data_copy), view_data_module.ViewData)
+        self.assertEqual(view_data.start_time, view_data_copy.start_time)
+        self.assertEqual(view_data.end_time, view_data_copy.end_time)
+        view_data.record(context=None, value=2, timestamp=None)
+        self.assertEqual(
+            2,
+            view_data_copy.tag_value_aggregation_data_map[(None,)].sum_data)
+
+    def test_take_delta(self):
+        view = self._make_view()
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time='start', end_time=None)
+        context = mock.Mock()
+        context.map = {'key1': 'val1'}
+
+        def record():
+            view_data.record(context=context, value=2, timestamp=None)
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        thread.join()
+        record()
+        view_data.record(context=None, value=1, timestamp=None)
+
+        delta = view_data.take_delta()
+        self.assertIs(type(delta), view_data_module.ViewData)
+        self.assertEqual('start', delta.start_time)
+        tvadm = delta.tag_value_aggregation_data_map
+        self.assertEqual(4, tvadm[('val1',)].sum_data)
+        self.assertEqual(1, tvadm[(None,)].sum_data)
+        self.assertEqual({}, view_data.tag_value_aggregation_data_map)
+        self.assertEqual(delta.end_time, view_data.start_time)
+
+        record()
+        delta = view_data.take_delta()
+        self.assertEqual(
+            2, delta.tag_value_aggregation_data_map[('val1',)].sum_data)
+        self.assertEqual(1, len(delta.tag_value_aggregation_data_map))
+
+    def test_bind(self):
+        view = self._make_view()
+        view_data = view_data_module.ShardedViewData(
+            view=view, start_time=None, end_time=None)
+        add_sample = view_data.bind(('val1',))
+
+        thread = threading.Thread(target=add_sample, args=(2, None, None))
+        thread.start()
+        thread.join()
+        add_sample(3, None, None)
+
+        self.assertEqual(
+            5, view_data.tag_value_aggregation_data_map[('val1',)].sum_data)
+        self.assertEqual(1, len(view_data._shards))
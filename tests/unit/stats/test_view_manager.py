@@ -40,6 +40,7 @@ class TestViewManager(unittest.TestCase):
 
     def test_register_view(self):
         view = mock.Mock()
+        view.limits_series = False
         execution_context.clear()
         execution_context.set_measure_to_view_map(MeasureToViewMap())
         view_manager = view_manager_module.ViewManager()
@@ -101,3 +102,85 @@ class TestViewManager(unittest.TestCase):
 
         view_manager.get_all_exported_views()
         self.assertTrue(view_manager_mock.get_all_exported_views.called)
+
+    def test_defer_export(self):
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(MeasureToViewMap())
+        view_manager = view_manager_module.ViewManager()
+
+        with mock.patch('atexit.register'):
+            self.assertIsNone(view_manager.defer_export())
+        self.assertTrue(view_manager.measure_to_view_map.deferred_export)
+
+        with mock.patch('opencensus.stats.view_manager.transport'
+                        '.PeriodicMetricTask') as task_mock:
+            task = view_manager.defer_export(interval=10)
+            # The export task is only started once.
+            self.assertIs(task, view_manager.defer_export(interval=10))
+        task_mock.assert_called_once_with(
+            10, view_manager.measure_to_view_map.export_pending,
+            name='ViewManager')
+        task.start.assert_called_once_with()
+
+    def test_options(self):
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(MeasureToViewMap())
+        view_manager = view_manager_module.ViewManager()
+
+        self.assertFalse(view_manager.sharded)
+        self.assertFalse(view_manager.delta)
+        view_manager.sharded = True
+        view_manager.delta = True
+
+        self.assertTrue(view_manager.measure_to_view_map.sharded)
+        self.assertTrue(view_manager.measure_to_view_map.delta)
+        self.assertTrue(view_manager.sharded)
+        self.assertTrue(view_manager.delta)
+
+    def test_defer_export_at_exit(self):
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(MeasureToViewMap())
+        view_manager = view_manager_module.ViewManager()
+
+        with mock.patch('atexit.register') as register_mock:
+            view_manager.defer_export()
+            view_manager.defer_export()
+        register_mock.assert_called_once_with(
+            view_manager_module._export_pending_at_exit, mock.ANY)
+
+        # The exit handler doesn't keep the view manager alive
+        exit_func, weak_export_pending = register_mock.call_args[0]
+        with mock.patch.object(view_manager.measure_to_view_map,
+                               'export_pending') as export_mock:
+            exit_func(weak_export_pending)
+            export_mock.assert_called_once_with()
+            del view_manager
+            exit_func(weak_export_pending)
+            export_mock.assert_called_once_with()
+
+    def test_stop_deferred_export(self):
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(MeasureToViewMap())
+        view_manager = view_manager_module.ViewManager()
+        measure_to_view_map = view_manager.measure_to_view_map
+
+        with mock.patch('opencensus.stats.view_manager.transport'
+                        '.PeriodicMetricTask'), \
+                mock.patch('atexit.register'):
+            task = view_manager.defer_export(interval=10)
+        with mock.patch.object(measure_to_view_map,
+                               'export_pending') as export_mock:
+            view_manager.stop_deferred_export()
+
+        task.close.assert_called_once_with()
+        export_mock.assert_called_once_with()
+        self.assertFalse(measure_to_view_map.deferred_export)
+        self.assertIsNone(view_manager._export_task)
+
+    def test_export_pending(self):
+        measure_to_view_map = mock.Mock()
+        execution_context.clear()
+        execution_context.set_measure_to_view_map(measure_to_view_map)
+        view_manager = view_manager_module.ViewManager()
+        view_manager.export_pending()
+        measure_to_view_map.export_pending.assert_called_once_with()
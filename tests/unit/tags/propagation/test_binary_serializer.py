@@ -70,3 +70,76 @@ class TestBinarySerializer(unittest.TestCase):
             [('key1', 'val1')])
 
         self.assertEqual(frozenset(tag_context.map), frozenset(expected_dict))
+
+    def test_to_byte_array_multi_byte_length(self):
+        from opencensus.tags.tag_map import TagMap
+
+        value = 'v' * 200
+        tag_context = TagMap(tags=[Tag(TagKey('key1'), TagValue(value))])
+        propagator = binary_serializer.BinarySerializer()
+        binary = propagator.to_byte_array(tag_context)
+
+        expected_binary = b'\x00\x00\x04key1\xc8\x01' + value.encode('ascii')
+        self.assertEqual(binary, expected_binary)
+        self.assertEqual(
+            propagator.from_byte_array(binary).map, {'key1': value})
+
+    def test_from_byte_array_truncated_string(self):
+        propagator = binary_serializer.BinarySerializer()
+        with self.assertRaises(ValueError):
+            propagator.from_byte_array(bytearray(b'\x00\x00\x04key1\x04va'))
+
+    def test_from_byte_array_truncated_varint(self):
+        propagator = binary_serializer.BinarySerializer()
+        with self.assertRaises(ValueError):
+            propagator.from_byte_array(bytearray(b'\x00\x00\x04key1\xc8'))
+
+    def test_from_byte_array_varint_too_long(self):
+        propagator = binary_serializer.BinarySerializer()
+        with self.assertRaises(ValueError):
+            propagator.from_byte_array(
+                bytearray(b'\x00\x00\xff\xff\xff\xff\xff\x01'))
+
+    def test_from_byte_array_bytes(self):
+        propagator = binary_serializer.BinarySerializer()
+        tag_context = propagator.from_byte_array(b'\x00\x00\x01k\x01v')
+        self.assertEqual(tag_context.map, {'k': 'v'})
+
+    def test_round_trip_fuzz(self):
+        import random
+        import string
+
+        from opencensus.tags.tag_map import TagMap
+
+        rand = random.Random(0)
+        chars = string.ascii_letters + string.digits + string.punctuation
+        propagator = binary_serializer.BinarySerializer()
+        for _ in range(200):
+            tags = []
+            for _ in range(rand.randint(0, 16)):
+                key = ''.join(rand.choice(chars)
+                              for _ in range(rand.randint(1, 255)))
+                value = ''.join(rand.choice(chars + ' ')
+                                for _ in range(rand.randint(0, 255)))
+                tags.append(Tag(TagKey(key), TagValue(value)))
+            tag_context = TagMap(tags=tags)
+            binary = propagator.to_byte_array(tag_context)
+            if binary is None:
+                continue
+            self.assertEqual(
+                propagator.from_byte_array(binary).map, tag_context.map)
+
+    def test_from_byte_array_random_bytes(self):
+        import random
+
+        rand = random.Random(0)
+        propagator = binary_serializer.BinarySerializer()
+        for _ in range(500):
+            binary = bytearray(
+                [0] + [rand.randint(0, 255)
+                       for _ in range(rand.randint(0, 64))])
+            try:
+                tag_context = propagator.from_byte_array(binary)
+            except ValueError:
+                continue
+            self.assertIsInstance(tag_context.map, dict)
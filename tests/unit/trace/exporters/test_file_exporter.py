@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import json
 import os
+import shutil
+import tempfile
 import unittest
 
+import mock
+
 
 class TestFileExporter(unittest.TestCase):
     @staticmethod
@@ -41,6 +47,40 @@ class TestFileExporter(unittest.TestCase):
         assert os.path.exists(file_name) == 1
         os.remove(file_name)
 
+    def test_emit_encoder(self):
+        from opencensus.trace import span_context, span_data, span_encoder
+
+        span_datas = [span_data.SpanData(
+            name='span',
+            context=span_context.SpanContext(
+                trace_id='2dd43a1d6b2549c6bc2a1a54c2fc0b05'),
+            span_id='6e0c63257de34c92',
+            parent_span_id=None,
+            attributes={'key': 'value'},
+            start_time='2020-09-13T12:26:40.123456Z',
+            end_time='2020-09-13T12:26:41.123456Z',
+            child_span_count=0,
+            stack_trace=None,
+            annotations=None,
+            message_events=None,
+            links=None,
+            status=None,
+            same_process_as_parent_span=None,
+            span_kind=0,
+        )]
+        file_name = 'file_name'
+        exporter = self._make_one(
+            file_name=file_name,
+            encoder=span_encoder.StreamingLegacyJsonEncoder())
+
+        exporter.emit(span_datas)
+        with open(file_name) as file:
+            content = file.read()
+        os.remove(file_name)
+
+        self.assertEqual(
+            content, span_encoder.LegacyJsonEncoder().encode(span_datas))
+
     def test_export(self):
         file_name = 'file_name'
         exporter = self._make_one(file_name=file_name, transport=MockTransport)
@@ -50,6 +90,372 @@ class TestFileExporter(unittest.TestCase):
         self.assertTrue(exporter.transport.export_called)
 
 
+def _make_span_data(span_id, name='span'):
+    from opencensus.trace import span_context, span_data
+
+    return span_data.SpanData(
+        name=name,
+        context=span_context.SpanContext(
+            trace_id='2dd43a1d6b2549c6bc2a1a54c2fc0b05'),
+        span_id=span_id,
+        parent_span_id=None,
+        attributes=None,
+        start_time='2020-09-13T12:26:40.123456Z',
+        end_time='2020-09-13T12:26:41.123456Z',
+        child_span_count=0,
+        stack_trace=None,
+        annotations=None,
+        message_events=None,
+        links=None,
+        status=None,
+        same_process_as_parent_span=None,
+        span_kind=0,
+    )
+
+
+class TestStreamingFileExporter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.directory, 'traces.json')
+        self.exporters = []
+
+    def tearDown(self):
+        for exporter in self.exporters:
+            exporter.close()
+        shutil.rmtree(self.directory)
+
+    def _make_one(self, **kw):
+        from opencensus.trace.file_exporter import StreamingFileExporter
+
+        kw.setdefault('file_name', self.file_name)
+        exporter = StreamingFileExporter(**kw)
+        self.exporters.append(exporter)
+        return exporter
+
+    def _read_span_ids(self, file_name):
+        opener = gzip.open if file_name.endswith('.gz') else open
+        with opener(file_name, 'rb') as file:
+            records = [json.loads(line.decode('utf-8')) for line in file]
+        return [span['spanId'] for record in records
+                for span in record['spans']]
+
+    def _get_segments(self):
+        return sorted(name for name in os.listdir(self.directory)
+                      if name != 'traces.json')
+
+    def test_constructor(self):
+        from opencensus.common.transports import sync
+        from opencensus.trace import span_encoder
+
+        exporter = self._make_one()
+
+        self.assertEqual(exporter.file_name, self.file_name)
+        self.assertIsInstance(exporter.transport, sync.SyncTransport)
+        self.assertIsInstance(
+            exporter.encoder, span_encoder.StreamingLegacyJsonEncoder)
+        self.assertFalse(os.path.exists(self.file_name))
+
+    def test_emit(self):
+        from opencensus.trace import span_encoder
+
+        span_datas = [_make_span_data('1'), _make_span_data('2')]
+        exporter = self._make_one()
+
+        exporter.emit(span_datas)
+        exporter.emit([_make_span_data('3')])
+
+        # Flushed without closing the file
+        with open(self.file_name) as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines, [
+            span_encoder.LegacyJsonEncoder().encode([span_data])
+            for span_data in span_datas + [_make_span_data('3')]
+        ])
+
+    def test_emit_empty(self):
+        exporter = self._make_one()
+
+        exporter.emit([])
+
+        self.assertFalse(os.path.exists(self.file_name))
+
+    def test_close_reopen(self):
+        exporter = self._make_one()
+
+        exporter.emit([_make_span_data('1')])
+        exporter.close()
+        exporter.close()
+        exporter.emit([_make_span_data('2')])
+        exporter.close()
+
+        self.assertEqual(self._read_span_ids(self.file_name), ['1', '2'])
+
+    def test_export(self):
+        exporter = self._make_one()
+
+        exporter.export([_make_span_data('1')])
+
+        self.assertEqual(self._read_span_ids(self.file_name), ['1'])
+
+    def test_rotate_max_bytes(self):
+        exporter = self._make_one()
+        exporter.emit([_make_span_data('0')])
+        record_size = os.path.getsize(self.file_name)
+        exporter.close()
+        os.remove(self.file_name)
+        exporter.max_bytes = 2 * record_size
+
+        exporter.emit([_make_span_data(str(i)) for i in range(5)])
+
+        segments = self._get_segments()
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(
+            [self._read_span_ids(os.path.join(self.directory, segment))
+             for segment in segments],
+            [['0', '1'], ['2', '3']])
+        self.assertEqual(self._read_span_ids(self.file_name), ['4'])
+
+    def test_rotate_max_bytes_existing_file(self):
+        with open(self.file_name, 'w') as file:
+            file.write('x' * 100 + '\n')
+        exporter = self._make_one(max_bytes=100)
+
+        exporter.emit([_make_span_data('1')])
+
+        self.assertEqual(len(self._get_segments()), 1)
+        self.assertEqual(self._read_span_ids(self.file_name), ['1'])
+
+    def test_rotate_large_record(self):
+        exporter = self._make_one(max_bytes=1)
+
+        exporter.emit([_make_span_data('1')])
+
+        # A record larger than max_bytes is written to an empty file
+        self.assertEqual(self._get_segments(), [])
+        self.assertEqual(self._read_span_ids(self.file_name), ['1'])
+
+    @mock.patch('opencensus.common.utils.monotonic_ns')
+    def test_rotate_interval(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        exporter = self._make_one(rotate_interval=10)
+        exporter.emit([_make_span_data('1')])
+        mock_monotonic_ns.return_value = 9 * 10 ** 9
+        exporter.emit([_make_span_data('2')])
+
+        self.assertEqual(self._get_segments(), [])
+
+        mock_monotonic_ns.return_value = 10 * 10 ** 9
+        exporter.emit([_make_span_data('3')])
+
+        segments = self._get_segments()
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(
+            self._read_span_ids(os.path.join(self.directory, segments[0])),
+            ['1', '2'])
+        self.assertEqual(self._read_span_ids(self.file_name), ['3'])
+
+    def test_rotate_compress(self):
+        exporter = self._make_one(max_bytes=1, compress=True)
+
+        exporter.emit([_make_span_data('1'), _make_span_data('2')])
+
+        segments = self._get_segments()
+        self.assertEqual(len(segments), 1)
+        self.assertTrue(segments[0].endswith('.gz'))
+        self.assertEqual(
+            self._read_span_ids(os.path.join(self.directory, segments[0])),
+            ['1'])
+        self.assertEqual(self._read_span_ids(self.file_name), ['2'])
+
+    def test_rotate_backup_count(self):
+        exporter = self._make_one(max_bytes=1, backup_count=2)
+
+        exporter.emit([_make_span_data(str(i)) for i in range(5)])
+
+        segments = self._get_segments()
+        self.assertEqual(
+            [self._read_span_ids(os.path.join(self.directory, segment))
+             for segment in segments],
+            [['2'], ['3']])
+        self.assertEqual(self._read_span_ids(self.file_name), ['4'])
+
+    def test_rotate_backup_count_other_files(self):
+        other_files = [
+            'spans.json',
+            'traces.json.bak',
+            'traces.json.1.gz',
+            'traces.json.20210513T000000.000000Z.tmp',
+        ]
+        for name in other_files:
+            with open(os.path.join(self.directory, name), 'w'):
+                pass
+        exporter = self._make_one(max_bytes=1, backup_count=1)
+
+        exporter.emit([_make_span_data(str(i)) for i in range(3)])
+
+        segments = [name for name in self._get_segments()
+                    if name not in other_files]
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(
+            self._read_span_ids(os.path.join(self.directory, segments[0])),
+            ['1'])
+        self.assertEqual(
+            sorted(other_files),
+            sorted(name for name in self._get_segments()
+                   if name not in segments))
+
+    def test_compress_without_lock(self):
+        exporter = self._make_one(max_bytes=1, compress=True)
+        locked = []
+        gzip_open = gzip.open
+
+        def mock_gzip_open(*args, **kwargs):
+            locked.append(exporter._lock.locked())
+            return gzip_open(*args, **kwargs)
+
+        with mock.patch('gzip.open', side_effect=mock_gzip_open):
+            exporter.emit([_make_span_data(str(i)) for i in range(2)])
+
+        self.assertEqual(locked, [False])
+        self.assertEqual(len(self._get_segments()), 1)
+
+    def test_compress_serialized(self):
+        exporter = self._make_one(max_bytes=1, compress=True)
+        locked = []
+        gzip_open = gzip.open
+
+        def mock_gzip_open(*args, **kwargs):
+            locked.append(exporter._segments_lock.locked())
+            return gzip_open(*args, **kwargs)
+
+        with mock.patch('gzip.open', side_effect=mock_gzip_open):
+            exporter.emit([_make_span_data(str(i)) for i in range(2)])
+
+        self.assertEqual(locked, [True])
+
+    def test_compress_pruned_segment(self):
+        exporter = self._make_one(compress=True, backup_count=1)
+        segment = self.file_name + '.20210513T000000.000000Z'
+
+        exporter._finish_segment(segment)
+
+        self.assertEqual(self._get_segments(), [])
+
+    def test_compress_backup_count_threads(self):
+        import threading
+
+        exporter = self._make_one(max_bytes=1, compress=True, backup_count=1)
+        errors = []
+
+        def emit(thread):
+            try:
+                for i in range(20):
+                    exporter.emit([_make_span_data('{}-{}'.format(thread, i))])
+            except Exception as e:  # pragma: NO COVER
+                errors.append(e)
+
+        threads = [threading.Thread(target=emit, args=(thread,))
+                   for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        segments = self._get_segments()
+        self.assertEqual(len(segments), 1)
+        self.assertTrue(segments[0].endswith('.gz'))
+
+    def test_close_at_exit(self):
+        from opencensus.trace import file_exporter
+
+        exporter = self._make_one()
+        exporter.emit([_make_span_data('1')])
+
+        file_exporter._close_streaming_exporters()
+
+        self.assertIsNone(exporter._file)
+        self.assertEqual(self._read_span_ids(self.file_name), ['1'])
+
+    def test_not_kept_alive_for_exit(self):
+        import gc
+        import weakref
+
+        from opencensus.trace.file_exporter import StreamingFileExporter
+
+        exporter = StreamingFileExporter(file_name=self.file_name)
+        exporter.emit([_make_span_data('1')])
+        exporter_ref = weakref.ref(exporter)
+
+        del exporter
+        gc.collect()
+
+        self.assertIsNone(exporter_ref())
+        self.assertEqual(self._read_span_ids(self.file_name), ['1'])
+
+    def test_rotate_same_time(self):
+        import datetime
+
+        now = datetime.datetime(2021, 5, 13)
+        exporter = self._make_one(max_bytes=1)
+
+        with mock.patch('datetime.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = now
+            exporter.emit([_make_span_data(str(i)) for i in range(3)])
+
+        self.assertEqual(self._get_segments(), [
+            'traces.json.20210513T000000.000000Z',
+            'traces.json.20210513T000000.000000Z_',
+        ])
+
+    @mock.patch('os.fsync')
+    def test_fsync_never(self, mock_fsync):
+        exporter = self._make_one(max_bytes=1)
+
+        exporter.emit([_make_span_data('1'), _make_span_data('2')])
+        exporter.close()
+
+        mock_fsync.assert_not_called()
+
+    @mock.patch('os.fsync')
+    def test_fsync_every_batch(self, mock_fsync):
+        exporter = self._make_one(fsync_interval=0)
+
+        exporter.emit([_make_span_data('1')])
+        exporter.emit([_make_span_data('2')])
+
+        self.assertEqual(mock_fsync.call_count, 2)
+
+    @mock.patch('os.fsync')
+    @mock.patch('opencensus.common.utils.monotonic_ns')
+    def test_fsync_interval(self, mock_monotonic_ns, mock_fsync):
+        mock_monotonic_ns.return_value = 0
+        exporter = self._make_one(fsync_interval=1, max_bytes=10 ** 6)
+        exporter.emit([_make_span_data('1')])
+        mock_monotonic_ns.return_value = 5 * 10 ** 8
+        exporter.emit([_make_span_data('2')])
+
+        mock_fsync.assert_not_called()
+
+        mock_monotonic_ns.return_value = 10 ** 9
+        exporter.emit([_make_span_data('3')])
+
+        self.assertEqual(mock_fsync.call_count, 1)
+
+        exporter.close()
+
+        self.assertEqual(mock_fsync.call_count, 2)
+
+    @mock.patch('os.fsync')
+    def test_fsync_rotate(self, mock_fsync):
+        exporter = self._make_one(max_bytes=1, fsync_interval=3600)
+
+        exporter.emit([_make_span_data('1'), _make_span_data('2')])
+
+        # Before rotating, not after the batch
+        self.assertEqual(mock_fsync.call_count, 1)
+
+
 class MockTransport(object):
     def __init__(self, exporter=None):
         self.export_called = False
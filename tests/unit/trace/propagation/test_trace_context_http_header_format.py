@@ -163,6 +163,68 @@ class TestTraceContextPropagator(unittest.TestCase):
 
         self.assertNotEqual(span_context.trace_id, trace_id)
 
+    def test_header_whitespace_and_flags(self):
+        propagator = trace_context_http_header_format.\
+            TraceContextPropagator()
+
+        span_context = propagator.from_headers({
+            'traceparent':
+            ' \t00-12345678901234567890123456789012-1234567890123456-0f\t ',
+        })
+
+        self.assertEqual(span_context.trace_id,
+                         '12345678901234567890123456789012')
+        self.assertTrue(span_context.trace_options.enabled)
+
+        span_context = propagator.from_headers({
+            'traceparent':
+            '00-12345678901234567890123456789012-1234567890123456-02',
+        })
+        self.assertFalse(span_context.trace_options.enabled)
+
+    def test_header_future_version(self):
+        propagator = trace_context_http_header_format.\
+            TraceContextPropagator()
+
+        span_context = propagator.from_headers({
+            'traceparent':
+            'cc-12345678901234567890123456789012-1234567890123456-01-what',
+        })
+        self.assertEqual(span_context.span_id, '1234567890123456')
+
+        span_context = propagator.from_headers({
+            'traceparent':
+            'cc-12345678901234567890123456789012-1234567890123456-01what',
+        })
+        self.assertIsNone(span_context.span_id)
+
+    def test_parse_traceparent_invalid(self):
+        for header in (
+                '',
+                '00-12345678901234567890123456789012-1234567890123456',
+                '00-1234567890123456789012345678901z-1234567890123456-00',
+                '00-12345678901234567890123456789012-123456789012345Z-00',
+                '0-012345678901234567890123456789012-1234567890123456-00',
+                '00_12345678901234567890123456789012-1234567890123456-00',
+                '00-12345678901234567890123456789012-1234567890123456-00\n',
+                '00-12345678901234567890123456789012-1234567890123456-00-\n',
+        ):
+            self.assertIsNone(
+                trace_context_http_header_format._parse_traceparent(header),
+                header)
+
+    def test_from_headers_tracestate_invalid(self):
+        propagator = trace_context_http_header_format.\
+            TraceContextPropagator()
+
+        span_context = propagator.from_headers({
+            'traceparent':
+            '00-12345678901234567890123456789012-1234567890123456-00',
+            'tracestate': 'foo=1,#=2',
+        })
+
+        self.assertIsNone(span_context.tracestate)
+
     def test_to_headers_without_tracestate(self):
         from opencensus.trace import span_context
         from opencensus.trace import trace_options
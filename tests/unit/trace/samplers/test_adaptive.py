@@ -0,0 +1,118 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+from opencensus.trace import samplers
+
+# The lower 8 bytes are about a quarter of the maximum
+TRACE_ID = 'f8739df974a4481f4000000000000000'
+
+
+def make_context(enabled=False):
+    mock_context = mock.Mock()
+    mock_context.trace_id = TRACE_ID
+    mock_context.trace_options.get_enabled.return_value = enabled
+    return mock_context
+
+
+@mock.patch('opencensus.common.utils.monotonic_ns')
+class TestAdaptiveSampler(unittest.TestCase):
+
+    def test_constructor_invalid(self, mock_monotonic_ns):
+        with self.assertRaises(ValueError):
+            samplers.AdaptiveSampler(-1)
+        with self.assertRaises(ValueError):
+            samplers.AdaptiveSampler(1, min_rate=0.5, max_rate=0.1)
+        with self.assertRaises(ValueError):
+            samplers.AdaptiveSampler(1, max_rate=2)
+        with self.assertRaises(ValueError):
+            samplers.AdaptiveSampler(1, high_load=1)
+
+    def test_constructor_default(self, mock_monotonic_ns):
+        sampler = samplers.AdaptiveSampler(1)
+        self.assertAlmostEqual(sampler.rate, samplers.DEFAULT_SAMPLING_RATE)
+
+        sampler = samplers.AdaptiveSampler(1, initial_rate=0.5, max_rate=0.1)
+        self.assertAlmostEqual(sampler.rate, 0.1)
+
+    def test_adjust(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        sampler = samplers.AdaptiveSampler(10, initial_rate=1, interval=2)
+        context = make_context()
+
+        for _ in range(99):
+            self.assertTrue(sampler.should_sample(context))
+
+        # 100 requests in 2 seconds, for 10 traces per second
+        mock_monotonic_ns.return_value = int(2e9)
+        self.assertFalse(sampler.should_sample(context))
+        self.assertAlmostEqual(sampler.rate, 0.2)
+
+        # Traffic dropped
+        mock_monotonic_ns.return_value = int(5e9)
+        self.assertTrue(sampler.should_sample(context))
+        self.assertAlmostEqual(sampler.rate, 1)
+
+    def test_adjust_clamped(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        sampler = samplers.AdaptiveSampler(
+            1, initial_rate=1, min_rate=0.3, interval=1)
+
+        for _ in range(100):
+            sampler.should_sample(make_context())
+        mock_monotonic_ns.return_value = int(1e9)
+        self.assertTrue(sampler.should_sample(make_context()))
+        self.assertAlmostEqual(sampler.rate, 0.3)
+
+    def test_adjust_load(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        load = mock.Mock(return_value=0.5)
+        sampler = samplers.AdaptiveSampler(
+            100, initial_rate=1, interval=1, load=load, high_load=0.5)
+
+        mock_monotonic_ns.return_value = int(1e9)
+        sampler.should_sample(make_context())
+        self.assertAlmostEqual(sampler.rate, 1)
+
+        load.return_value = 0.75
+        mock_monotonic_ns.return_value = int(2e9)
+        sampler.should_sample(make_context())
+        self.assertAlmostEqual(sampler.rate, 0.5)
+
+        load.return_value = 1
+        mock_monotonic_ns.return_value = int(3e9)
+        self.assertFalse(sampler.should_sample(make_context()))
+        self.assertEqual(sampler.rate, 0)
+
+    @mock.patch('opencensus.trace.samplers.logger')
+    def test_adjust_load_failed(self, mock_logger, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        load = mock.Mock(side_effect=Exception)
+        sampler = samplers.AdaptiveSampler(
+            100, initial_rate=0.5, interval=1, load=load)
+
+        mock_monotonic_ns.return_value = int(1e9)
+        sampler.should_sample(make_context())
+
+        self.assertAlmostEqual(sampler.rate, 1)
+        self.assertTrue(mock_logger.exception.called)
+
+    def test_should_sample_enabled(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        sampler = samplers.AdaptiveSampler(1, initial_rate=0)
+        self.assertFalse(sampler.should_sample(make_context()))
+        self.assertTrue(sampler.should_sample(make_context(enabled=True)))
@@ -28,3 +28,10 @@ class TestBaseSampler(unittest.TestCase):
 
         with self.assertRaises(NotImplementedError):
             sampler.should_sample(mock_context)
+
+    def test_should_sample_request(self):
+        from opencensus.trace import samplers
+
+        sampler = samplers.AlwaysOnSampler()
+        self.assertTrue(sampler.should_sample_request(
+            mock.Mock(), 'span', {'http.path': '/'}))
@@ -0,0 +1,75 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+from opencensus.trace import samplers
+
+
+def make_context(enabled=False):
+    mock_context = mock.Mock()
+    mock_context.trace_id = 'f8739df974a4481f98748cd92b27177d'
+    mock_context.trace_options.get_enabled.return_value = enabled
+    return mock_context
+
+
+@mock.patch('opencensus.common.utils.monotonic_ns')
+class TestRateLimitingSampler(unittest.TestCase):
+
+    def test_constructor_invalid(self, mock_monotonic_ns):
+        with self.assertRaises(ValueError):
+            samplers.RateLimitingSampler(-1)
+
+    def test_constructor_default_burst(self, mock_monotonic_ns):
+        self.assertEqual(samplers.RateLimitingSampler(10).burst, 10)
+        self.assertEqual(samplers.RateLimitingSampler(0.5).burst, 1)
+
+    def test_should_sample(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        sampler = samplers.RateLimitingSampler(2)
+        context = make_context()
+
+        self.assertEqual(
+            [sampler.should_sample(context) for _ in range(3)],
+            [True, True, False])
+
+        # Half a second later there's one new token
+        mock_monotonic_ns.return_value = int(0.5e9)
+        self.assertEqual(
+            [sampler.should_sample(context) for _ in range(2)],
+            [True, False])
+
+        # The bucket doesn't fill beyond the burst
+        mock_monotonic_ns.return_value = int(100e9)
+        self.assertEqual(
+            [sampler.should_sample(context) for _ in range(3)],
+            [True, True, False])
+
+    def test_should_sample_zero(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        sampler = samplers.RateLimitingSampler(0, burst=0)
+
+        mock_monotonic_ns.return_value = int(100e9)
+        self.assertFalse(sampler.should_sample(make_context()))
+
+    def test_should_sample_enabled(self, mock_monotonic_ns):
+        mock_monotonic_ns.return_value = 0
+        sampler = samplers.RateLimitingSampler(1)
+        context = make_context()
+        self.assertTrue(sampler.should_sample(context))
+
+        self.assertTrue(sampler.should_sample(make_context(enabled=True)))
+        self.assertFalse(sampler.should_sample(context))
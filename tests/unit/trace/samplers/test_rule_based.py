@@ -0,0 +1,139 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+from opencensus.trace import samplers
+from opencensus.trace.samplers import rule_based
+
+
+def make_context():
+    mock_context = mock.Mock()
+    mock_context.trace_id = 'f8739df974a4481f98748cd92b27177d'
+    mock_context.trace_options.get_enabled.return_value = False
+    return mock_context
+
+
+class TestSamplingRule(unittest.TestCase):
+
+    def test_constructor_rate(self):
+        rule = rule_based.SamplingRule(0.5)
+        self.assertIsInstance(rule.sampler, samplers.ProbabilitySampler)
+        self.assertEqual(rule.sampler.rate, 0.5)
+
+        sampler = samplers.AlwaysOnSampler()
+        self.assertIs(rule_based.SamplingRule(sampler).sampler, sampler)
+
+    def test_matches_all(self):
+        rule = rule_based.SamplingRule(1)
+        self.assertTrue(rule.matches(None, {}))
+
+    def test_matches(self):
+        rule = rule_based.SamplingRule(
+            1,
+            name='checkout',
+            route='/checkout/<id>',
+            methods=['post'],
+            attributes={'tenant': 'a'})
+        attributes = {
+            'http.method': 'POST',
+            'http.route': '/checkout/<id>',
+            'tenant': 'a',
+        }
+
+        self.assertTrue(rule.matches('checkout', attributes))
+        self.assertFalse(rule.matches('other', attributes))
+        for key, value in (('http.method', 'GET'),
+                           ('http.route', '/'),
+                           ('tenant', 'b')):
+            mismatch = dict(attributes)
+            mismatch[key] = value
+            self.assertFalse(rule.matches('checkout', mismatch))
+        missing = dict(attributes)
+        del missing['tenant']
+        self.assertFalse(rule.matches('checkout', missing))
+
+
+class TestRuleBasedSampler(unittest.TestCase):
+
+    def test_constructor_default(self):
+        sampler = rule_based.RuleBasedSampler([])
+        self.assertIsInstance(sampler.default, samplers.ProbabilitySampler)
+
+    def test_get_sampler_path_prefix(self):
+        health = samplers.AlwaysOffSampler()
+        api = samplers.AlwaysOnSampler()
+        users = samplers.ProbabilitySampler(0.5)
+        default = samplers.ProbabilitySampler(0.1)
+        sampler = rule_based.RuleBasedSampler([
+            rule_based.SamplingRule(health, path_prefix='/healthz'),
+            rule_based.SamplingRule(
+                users, path_prefix='/api/users', methods=['GET']),
+            rule_based.SamplingRule(api, path_prefix='/api/'),
+        ], default=default)
+
+        def get_sampler(path, method='GET'):
+            return sampler.get_sampler(
+                attributes={'http.path': path, 'http.method': method})
+
+        self.assertIs(get_sampler('/healthz'), health)
+        self.assertIs(get_sampler('/healthz/ready'), health)
+        self.assertIs(get_sampler('/healthzz'), default)
+        self.assertIs(get_sampler('/api/users/1'), users)
+        self.assertIs(get_sampler('/api/users/1', 'POST'), api)
+        self.assertIs(get_sampler('/api/orders'), api)
+        self.assertIs(get_sampler('/'), default)
+        self.assertIs(sampler.get_sampler(), default)
+
+    def test_get_sampler_order(self):
+        first = samplers.AlwaysOffSampler()
+        sampler = rule_based.RuleBasedSampler([
+            rule_based.SamplingRule(first, methods=['GET']),
+            rule_based.SamplingRule(1, path_prefix='/api'),
+            rule_based.SamplingRule(0.5, path_prefix='/'),
+        ])
+
+        self.assertIs(sampler.get_sampler(attributes={
+            'http.path': '/api', 'http.method': 'GET'}), first)
+        self.assertEqual(sampler.get_sampler(attributes={
+            'http.path': '/api', 'http.method': 'POST'}).rate, 1)
+        self.assertEqual(sampler.get_sampler(attributes={
+            'http.path': '/other', 'http.method': 'POST'}).rate, 0.5)
+
+    def test_get_sampler_name(self):
+        sampler = rule_based.RuleBasedSampler([
+            rule_based.SamplingRule(0, name='[GET]/healthz'),
+        ], default=samplers.AlwaysOnSampler())
+
+        self.assertEqual(sampler.get_sampler('[GET]/healthz').rate, 0)
+        self.assertIs(sampler.get_sampler('[GET]/'), sampler.default)
+
+    def test_should_sample(self):
+        sampler = rule_based.RuleBasedSampler(
+            [rule_based.SamplingRule(1)],
+            default=samplers.AlwaysOffSampler())
+
+        self.assertFalse(sampler.should_sample(make_context()))
+        self.assertTrue(sampler.should_sample_request(
+            make_context(), attributes={'http.path': '/'}))
+
+    def test_should_sample_request_default(self):
+        sampler = rule_based.RuleBasedSampler(
+            [rule_based.SamplingRule(1, path_prefix='/api')],
+            default=samplers.AlwaysOffSampler())
+
+        self.assertFalse(sampler.should_sample_request(
+            make_context(), attributes={'http.path': '/'}))
@@ -0,0 +1,110 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import unittest
+
+import mock
+
+from opencensus.trace import id_generator as id_generator_module
+from opencensus.trace import span_context as span_context_module
+
+TRACE_ID_RE = re.compile('^[0-9a-f]{32}$')
+SPAN_ID_RE = re.compile('^[0-9a-f]{16}$')
+
+
+class TestIdGenerator(unittest.TestCase):
+
+    def test_not_implemented(self):
+        generator = id_generator_module.IdGenerator()
+        with self.assertRaises(NotImplementedError):
+            generator.generate_trace_id()
+        with self.assertRaises(NotImplementedError):
+            generator.generate_span_id()
+
+
+class TestRandomIdGenerator(unittest.TestCase):
+
+    def test_generate_ids(self):
+        generator = id_generator_module.RandomIdGenerator()
+        trace_id = generator.generate_trace_id()
+        span_id = generator.generate_span_id()
+
+        self.assertIsNotNone(TRACE_ID_RE.match(trace_id))
+        self.assertIsNotNone(SPAN_ID_RE.match(span_id))
+
+    @mock.patch('opencensus.trace.id_generator.random.getrandbits',
+                side_effect=[0, 1])
+    def test_skip_invalid_trace_id(self, getrandbits_mock):
+        generator = id_generator_module.RandomIdGenerator()
+        self.assertEqual(generator.generate_trace_id(), '0' * 31 + '1')
+
+    @mock.patch('opencensus.trace.id_generator.random.getrandbits',
+                side_effect=[0, 1])
+    def test_skip_invalid_span_id(self, getrandbits_mock):
+        generator = id_generator_module.RandomIdGenerator()
+        self.assertEqual(generator.generate_span_id(), '0' * 15 + '1')
+
+
+class TestUrandomIdGenerator(unittest.TestCase):
+
+    def test_generate_ids(self):
+        generator = id_generator_module.UrandomIdGenerator(pool_size=64)
+        trace_ids = [generator.generate_trace_id() for _ in range(10)]
+        span_ids = [generator.generate_span_id() for _ in range(10)]
+
+        for trace_id in trace_ids:
+            self.assertIsNotNone(TRACE_ID_RE.match(trace_id))
+        for span_id in span_ids:
+            self.assertIsNotNone(SPAN_ID_RE.match(span_id))
+        self.assertEqual(len(set(trace_ids)), 10)
+        self.assertEqual(len(set(span_ids)), 10)
+
+    @mock.patch('opencensus.trace.id_generator.os.urandom')
+    def test_skip_invalid_ids(self, urandom_mock):
+        urandom_mock.side_effect = [
+            b'\x00' * 16 + b'\x01' * 16,
+            b'\x00' * 8 + b'\x02' * 8,
+        ]
+        generator = id_generator_module.UrandomIdGenerator(pool_size=32)
+
+        self.assertEqual(generator.generate_trace_id(), '01' * 16)
+        self.assertEqual(generator.generate_span_id(), '02' * 8)
+
+    @mock.patch('opencensus.trace.id_generator.os.urandom')
+    def test_reset(self, urandom_mock):
+        urandom_mock.side_effect = [b'\x01' * 16, b'\x02' * 16]
+        generator = id_generator_module.UrandomIdGenerator(pool_size=16)
+
+        self.assertEqual(generator.generate_span_id(), '01' * 8)
+        id_generator_module._reset_pooled_generators()
+        self.assertEqual(generator.generate_span_id(), '02' * 8)
+
+
+class TestSetIdGenerator(unittest.TestCase):
+
+    def test_set_id_generator(self):
+        default = id_generator_module.get_id_generator()
+        generator = mock.Mock()
+        generator.generate_trace_id.return_value = 'a' * 32
+        generator.generate_span_id.return_value = 'b' * 16
+
+        id_generator_module.set_id_generator(generator)
+        try:
+            self.assertIs(id_generator_module.get_id_generator(), generator)
+            self.assertEqual(
+                span_context_module.generate_trace_id(), 'a' * 32)
+            self.assertEqual(span_context_module.generate_span_id(), 'b' * 16)
+        finally:
+            id_generator_module.set_id_generator(default)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import threading
 import unittest
 from collections import OrderedDict
 
@@ -20,7 +21,7 @@ import mock
 from google.rpc import code_pb2
 
 from opencensus.common import utils
-from opencensus.trace.span import BoundedDict, BoundedList
+from opencensus.trace.span import BoundedDict, BoundedList, Span
 from opencensus.trace.stack_trace import StackTrace
 from opencensus.trace.status import Status
 from opencensus.trace.time_event import Annotation, MessageEvent
@@ -206,6 +207,38 @@ class TestSpan(unittest.TestCase):
         span.start()
         self.assertIsNotNone(span.start_time)
 
+    @mock.patch('opencensus.trace.span.utils.time_ns',
+                return_value=1546300800000001000)
+    @mock.patch('opencensus.trace.span.utils.monotonic_ns')
+    def test_start_finish_ns(self, monotonic_mock, time_mock):
+        span = self._make_one('root_span')
+        monotonic_mock.return_value = 500
+        span.start()
+        self.assertEqual(1546300800000001000, span.start_time_ns)
+        self.assertIsNone(span.end_time_ns)
+
+        # The end time is measured on the monotonic clock.
+        time_mock.return_value = 0
+        monotonic_mock.return_value = 2500
+        span.finish()
+        self.assertEqual(1546300800000003000, span.end_time_ns)
+        self.assertEqual('2019-01-01T00:00:00.000001Z', span.start_time)
+        self.assertEqual('2019-01-01T00:00:00.000003Z', span.end_time)
+
+    @mock.patch('opencensus.trace.span.utils.time_ns',
+                return_value=1546300800000001000)
+    def test_set_times(self, time_mock):
+        span = self._make_one('root_span',
+                              start_time='2019-01-01T00:00:00.000000Z')
+        self.assertIsNone(span.start_time_ns)
+
+        span.finish()
+        self.assertEqual(1546300800000001000, span.end_time_ns)
+
+        span.end_time = '2019-01-01T00:00:01.000000Z'
+        self.assertIsNone(span.end_time_ns)
+        self.assertEqual('2019-01-01T00:00:01.000000Z', span.end_time)
+
     def test_finish_without_context_tracer(self):
         span_name = 'root_span'
         span = self._make_one(span_name)
@@ -448,6 +481,51 @@ class Test_format_span_json(unittest.TestCase):
         self.assertEqual(span_json, expected_span_json)
 
 
+class TestCompactSpan(TestSpan):
+
+    @staticmethod
+    def _get_target_class():
+        from opencensus.trace.span import CompactSpan
+
+        return CompactSpan
+
+    def test_lazy_collections(self):
+        span = self._make_one('test_span_name')
+
+        self.assertIsNone(span._attributes)
+        self.assertIsNone(span._annotations)
+        self.assertIsNone(span._message_events)
+        self.assertIsNone(span._links)
+        self.assertIsNone(span._status)
+        with self.assertRaises(AttributeError):
+            span.__dict__
+
+        span.add_attribute('key', 'value')
+        span.add_annotation('description')
+        span.add_message_event(mock.Mock())
+        self.assertIsNone(span._links)
+        self.assertTrue(span.status.is_ok)
+
+        # The collections of a span share its lock
+        self.assertIs(span.attributes._lock, span._lock)
+        self.assertIs(span.annotations._lock, span._lock)
+        self.assertIs(span.message_events._lock, span._lock)
+        self.assertIs(span.links._lock, span._lock)
+
+    def test_child_span_class(self):
+        span = self._make_one('test_span_name')
+        self.assertIsInstance(span.span(), self._get_target_class())
+
+    def test_on_create(self):
+        callback = mock.Mock()
+        self._get_target_class().on_create(callback)
+        try:
+            span = self._make_one('test_span_name')
+        finally:
+            Span._on_create_callbacks.remove(callback)
+        callback.assert_called_once_with(span)
+
+
 class TestBoundedList(unittest.TestCase):
 
     def test_append(self):
@@ -485,6 +563,12 @@ class TestBoundedList(unittest.TestCase):
         bl = BoundedList.from_seq(3, [1, 2, 3])
         self.assertEqual(list(bl), [1, 2, 3])
 
+    def test_shared_lock(self):
+        lock = threading.Lock()
+        self.assertIs(BoundedList(3, lock)._lock, lock)
+        self.assertIs(BoundedList.from_seq(3, [1], lock)._lock, lock)
+        self.assertIsNot(BoundedList(3)._lock, BoundedList(3)._lock)
+
 
 class TestBoundedDict(unittest.TestCase):
 
@@ -14,6 +14,8 @@
 
 import unittest
 
+import mock
+
 from opencensus.trace import span_context as span_context_module
 from opencensus.trace.trace_options import TraceOptions
 from opencensus.trace.tracestate import Tracestate
@@ -38,6 +40,19 @@ class TestSpanContext(unittest.TestCase):
         self.assertEqual(span_context.trace_id, self.trace_id)
         self.assertEqual(span_context.span_id, self.span_id)
 
+    def test_constructor_generated_trace_id(self):
+        generator = mock.Mock()
+        generator.generate_trace_id.return_value = self.trace_id
+        check_trace_id = mock.patch.object(
+            self._get_target_class(), '_check_trace_id')
+
+        with mock.patch('opencensus.trace.id_generator._id_generator',
+                        generator), check_trace_id as check_mock:
+            span_context = self._make_one()
+
+        self.assertEqual(span_context.trace_id, self.trace_id)
+        self.assertFalse(check_mock.called)
+
     def test__repr__(self):
         span_context = self._make_one(
             trace_id=self.trace_id,
@@ -65,6 +65,30 @@ class TestSpanData(unittest.TestCase):
         with self.assertRaises(AttributeError):
             span_data.new_attr = 'a'
 
+    def test_span_data_ns_times(self):
+        span_data = span_data_module.SpanData(
+            name='root',
+            context=None,
+            span_id='6e0c63257de34c92',
+            parent_span_id=None,
+            attributes=None,
+            start_time=None,
+            end_time='2019-01-01T00:00:02.000000Z',
+            stack_trace=None,
+            links=None,
+            status=None,
+            annotations=None,
+            message_events=None,
+            same_process_as_parent_span=None,
+            child_span_count=None,
+            span_kind=0,
+            start_time_ns=1546300800000001000,
+            end_time_ns=1546300800000003000,
+        )
+        self.assertEqual('2019-01-01T00:00:00.000001Z', span_data.start_time)
+        # An explicit time string takes precedence.
+        self.assertEqual('2019-01-01T00:00:02.000000Z', span_data.end_time)
+
     def test_format_legacy_trace_json(self):
         trace_id = '2dd43a1d6b2549c6bc2a1a54c2fc0b05'
         span_data = span_data_module.SpanData(
@@ -0,0 +1,126 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from six import StringIO
+
+import datetime
+import json
+import unittest
+
+from opencensus.trace import link, span_context
+from opencensus.trace import span_data as span_data_module
+from opencensus.trace import span_encoder, stack_trace, status, time_event
+
+TRACE_ID = '2dd43a1d6b2549c6bc2a1a54c2fc0b05'
+
+
+def make_span_data(**kwargs):
+    fields = dict(
+        name='root',
+        context=span_context.SpanContext(trace_id=TRACE_ID),
+        span_id='6e0c63257de34c92',
+        parent_span_id=None,
+        attributes=None,
+        start_time=None,
+        end_time=None,
+        child_span_count=0,
+        stack_trace=None,
+        annotations=None,
+        message_events=None,
+        links=None,
+        status=None,
+        same_process_as_parent_span=None,
+        span_kind=0,
+        start_time_ns=1600000000123456789,
+        end_time_ns=1600000001123456789,
+    )
+    fields.update(kwargs)
+    return span_data_module.SpanData(**fields)
+
+
+class TestStreamingLegacyJsonEncoder(unittest.TestCase):
+    def assert_same_json(self, span_datas):
+        expected = span_encoder.LegacyJsonEncoder().encode(span_datas)
+        encoded = span_encoder.StreamingLegacyJsonEncoder().encode(
+            span_datas)
+        self.assertEqual(encoded, expected)
+        self.assertEqual(
+            json.loads(encoded),
+            span_data_module.format_legacy_trace_json(span_datas))
+
+    def test_empty(self):
+        self.assert_same_json([])
+
+    def test_minimal_span(self):
+        self.assert_same_json([make_span_data()])
+
+    def test_all_fields(self):
+        self.assert_same_json([
+            make_span_data(
+                parent_span_id='6e0c63257de34c93',
+                attributes={
+                    'string': 'value',
+                    'unicode': u'été "quoted"\n',
+                    'long': 'v' * 300,
+                    'k' * 300: 'long key',
+                    'int': 42,
+                    'float': 1.5,
+                    'true': True,
+                    'false': False,
+                    'none': None,
+                },
+                start_time='2020-09-13T12:26:40.123456Z',
+                end_time='2020-09-13T12:26:41.123456Z',
+                stack_trace=stack_trace.StackTrace(
+                    stack_trace_hash_id='111'),
+                links=[link.Link('1111', span_id='6e0c63257de34c92')],
+                status=status.Status(code=0, message='pok'),
+                annotations=[
+                    time_event.Annotation(
+                        timestamp=datetime.datetime(1970, 1, 1),
+                        description='description'),
+                ],
+                message_events=[
+                    time_event.MessageEvent(
+                        timestamp=datetime.datetime(1970, 1, 1), id=0),
+                ],
+                same_process_as_parent_span=False,
+                child_span_count=2,
+                span_kind=1,
+            ),
+            make_span_data(name=u'child ☃', span_id='6e0c63257de34c94',
+                           parent_span_id='6e0c63257de34c92',
+                           attributes={}),
+        ])
+
+    def test_missing_trace_id(self):
+        encoder = span_encoder.StreamingLegacyJsonEncoder()
+        with self.assertRaises(AssertionError):
+            encoder.encode([make_span_data(context=None)])
+
+    def test_write(self):
+        span_datas = [make_span_data(), make_span_data(span_id='1')]
+        file = StringIO()
+        span_encoder.StreamingLegacyJsonEncoder().write(span_datas, file)
+
+        self.assertEqual(
+            file.getvalue(),
+            span_encoder.LegacyJsonEncoder().encode(span_datas))
+
+
+class TestEncodeJson(unittest.TestCase):
+    def test_encode_json(self):
+        for value in ('value', u'é\n', None, 1, 1.5, True, [1]):
+            self.assertEqual(span_encoder.encode_json(value),
+                             json.dumps(value))
@@ -0,0 +1,253 @@
+# Copyright 2021, OpenCensus Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+from google.rpc import code_pb2
+
+from opencensus.trace import span_data as span_data_module
+from opencensus.trace import tail_sampling
+from opencensus.trace.span_context import SpanContext
+from opencensus.trace.status import Status
+
+# The lower half of these trace IDs is below and above a 5% rate.
+KEPT_TRACE_ID = '6e0c63257de34c92' + '0000000000000001'
+DROPPED_TRACE_ID = '6e0c63257de34c92' + 'ffffffffffffffff'
+START_NS = 1546300800000000000
+
+
+def make_span_data(trace_id=DROPPED_TRACE_ID, span_id='6e0c63257de34c92',
+                   parent_span_id='0000000000000001', duration=0.001,
+                   status=None, attributes=None):
+    return span_data_module.SpanData(
+        name='span',
+        context=SpanContext(trace_id=trace_id),
+        span_id=span_id,
+        parent_span_id=parent_span_id,
+        attributes=attributes,
+        start_time=None,
+        end_time=None,
+        child_span_count=0,
+        stack_trace=None,
+        annotations=None,
+        message_events=None,
+        links=None,
+        status=status,
+        same_process_as_parent_span=None,
+        span_kind=0,
+        start_time_ns=START_NS,
+        end_time_ns=START_NS + int(duration * 1e9),
+    )
+
+
+class TestGetTraceDuration(unittest.TestCase):
+
+    def test_get_trace_duration(self):
+        sd1 = make_span_data(duration=0.5)
+        sd2 = make_span_data(duration=2)
+        self.assertAlmostEqual(
+            tail_sampling.get_trace_duration([sd1, sd2]), 2)
+
+    def test_get_trace_duration_strings(self):
+        sd = make_span_data()._replace(
+            start_time='2019-01-01T00:00:00.000000Z',
+            end_time='2019-01-01T00:00:01.500000Z',
+            start_time_ns=None,
+            end_time_ns=None)
+        self.assertAlmostEqual(tail_sampling.get_trace_duration([sd]), 1.5)
+
+    def test_get_trace_duration_no_times(self):
+        sd = make_span_data()._replace(start_time_ns=None, end_time_ns=None)
+        self.assertEqual(tail_sampling.get_trace_duration([sd]), 0)
+
+
+class TestPolicies(unittest.TestCase):
+
+    def test_policy(self):
+        with self.assertRaises(NotImplementedError):
+            tail_sampling.Policy().should_keep([])
+
+    def test_error_policy(self):
+        policy = tail_sampling.ErrorPolicy()
+        ok = make_span_data(status=Status.as_ok())
+        error = make_span_data(status=Status(code_pb2.INTERNAL))
+
+        self.assertFalse(policy.should_keep([ok, make_span_data()]))
+        self.assertTrue(policy.should_keep([ok, error]))
+
+    def test_latency_policy_invalid(self):
+        with self.assertRaises(ValueError):
+            tail_sampling.LatencyPolicy()
+        with self.assertRaises(ValueError):
+            tail_sampling.LatencyPolicy(percentile=100)
+
+    def test_latency_policy_threshold(self):
+        policy = tail_sampling.LatencyPolicy(threshold=1)
+
+        self.assertFalse(policy.should_keep([make_span_data(duration=0.5)]))
+        self.assertTrue(policy.should_keep([make_span_data(duration=1)]))
+
+    def test_latency_policy_percentile(self):
+        policy = tail_sampling.LatencyPolicy(percentile=90, window=10)
+
+        # Nothing to compare the first trace to
+        self.assertFalse(policy.should_keep([make_span_data(duration=10)]))
+        kept = [policy.should_keep([make_span_data(duration=ii / 100.)])
+                for ii in range(1, 21)]
+
+        self.assertEqual(len(policy._durations), 10)
+        self.assertEqual(policy._sorted_durations,
+                         sorted(policy._durations))
+        # Only the slowest traces are kept once the slow first trace left
+        # the window.
+        self.assertEqual(kept[10:], [True] * 10)
+        self.assertFalse(policy.should_keep([make_span_data(duration=0)]))
+
+    def test_attribute_policy(self):
+        policy = tail_sampling.AttributePolicy('http.route')
+        self.assertFalse(policy.should_keep([make_span_data()]))
+        self.assertTrue(policy.should_keep(
+            [make_span_data(attributes={'http.route': '/'})]))
+
+        policy = tail_sampling.AttributePolicy(
+            'http.status_code', values=[500, 503])
+        self.assertFalse(policy.should_keep(
+            [make_span_data(attributes={'http.status_code': 200})]))
+        self.assertTrue(policy.should_keep(
+            [make_span_data(attributes={'http.status_code': 503})]))
+
+
+class TestTailSamplingExporter(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch(
+            'opencensus.trace.tail_sampling.PeriodicTask', autospec=True)
+        self.mock_task = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.exporter = mock.Mock()
+
+    def test_constructor_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            tail_sampling.TailSamplingExporter(self.exporter, rate=2)
+
+    def test_rate(self):
+        sampler = tail_sampling.TailSamplingExporter(self.exporter)
+        kept = make_span_data(trace_id=KEPT_TRACE_ID, parent_span_id=None)
+        dropped = make_span_data(parent_span_id=None)
+
+        sampler.export([kept, dropped])
+
+        self.exporter.export.assert_called_once_with([kept])
+        self.assertEqual(sampler.traces_kept, 1)
+        self.assertEqual(sampler.traces_dropped, 1)
+        self.assertTrue(self.mock_task.return_value.start.called)
+
+    def test_buffer_until_root(self):
+        sampler = tail_sampling.TailSamplingExporter(
+            self.exporter, policies=[tail_sampling.ErrorPolicy()])
+        child = make_span_data(status=Status(code_pb2.INTERNAL))
+        root = make_span_data(parent_span_id=None)
+
+        sampler.export([child])
+        self.assertFalse(self.exporter.export.called)
+
+        sampler.export([root])
+        self.exporter.export.assert_called_once_with([child, root])
+
+        # Late spans follow the decision
+        late = make_span_data()
+        sampler.export([late])
+        self.exporter.export.assert_called_with([late])
+
+    def test_same_process_as_parent_span(self):
+        sampler = tail_sampling.TailSamplingExporter(self.exporter, rate=1)
+        root = make_span_data()._replace(same_process_as_parent_span=False)
+
+        sampler.export([root])
+
+        self.exporter.export.assert_called_once_with([root])
+
+    def test_decision_wait(self):
+        sampler = tail_sampling.TailSamplingExporter(
+            self.exporter, rate=1, decision_wait=10)
+        span_data = make_span_data()
+
+        with mock.patch('time.time', return_value=100):
+            sampler.export([span_data])
+        with mock.patch('time.time', return_value=105):
+            sampler._decide_expired()
+        self.assertFalse(self.exporter.export.called)
+
+        with mock.patch('time.time', return_value=110):
+            sampler._decide_expired()
+        self.exporter.export.assert_called_once_with([span_data])
+
+    def test_max_traces(self):
+        sampler = tail_sampling.TailSamplingExporter(
+            self.exporter, rate=1, max_traces=1)
+        first = make_span_data(trace_id=KEPT_TRACE_ID)
+        second = make_span_data()
+
+        sampler.export([first])
+        sampler.export([second])
+
+        self.exporter.export.assert_called_once_with([first])
+        self.assertEqual(list(sampler._traces), [DROPPED_TRACE_ID])
+
+    def test_max_spans_per_trace(self):
+        sampler = tail_sampling.TailSamplingExporter(
+            self.exporter, rate=1, max_spans_per_trace=1)
+        child = make_span_data()
+        root = make_span_data(parent_span_id=None)
+
+        sampler.export([child, root])
+
+        self.exporter.export.assert_called_once_with([child])
+        self.assertEqual(sampler.spans_dropped, 1)
+
+    @mock.patch('opencensus.trace.tail_sampling.logger')
+    def test_policy_failed(self, mock_logger):
+        policy = mock.Mock()
+        policy.should_keep.side_effect = Exception
+        sampler = tail_sampling.TailSamplingExporter(
+            self.exporter, policies=[policy, tail_sampling.ErrorPolicy()])
+
+        sampler.emit([make_span_data(parent_span_id=None,
+                                     status=Status(code_pb2.INTERNAL))])
+
+        self.assertTrue(mock_logger.exception.called)
+        self.assertTrue(self.exporter.export.called)
+
+    @mock.patch('opencensus.trace.tail_sampling.logger')
+    def test_decide_expired_failed(self, mock_logger):
+        self.exporter.export.side_effect = Exception
+        sampler = tail_sampling.TailSamplingExporter(
+            self.exporter, rate=1, decision_wait=0)
+        sampler._traces[KEPT_TRACE_ID] = tail_sampling._TraceBuffer(0)
+        sampler._traces[KEPT_TRACE_ID].span_datas.append(make_span_data())
+
+        sampler._decide_expired()
+
+        self.assertTrue(mock_logger.exception.called)
+
+    def test_flush(self):
+        sampler = tail_sampling.TailSamplingExporter(self.exporter, rate=1)
+        span_data = make_span_data()
+        sampler.export([span_data])
+
+        sampler.flush()
+
+        self.exporter.export.assert_called_once_with([span_data])
+        self.assertEqual(len(sampler._traces), 0)
@@ -93,6 +93,22 @@ class TestTracer(unittest.TestCase):
 
         self.assertFalse(sampled)
 
+    def test_should_sample_request(self):
+        sampler = mock.Mock(spec=samplers.Sampler)
+        sampler.should_sample_request.return_value = True
+        span_context = mock.Mock()
+        attributes = {'http.path': '/'}
+        tracer = tracer_module.Tracer(
+            span_context=span_context,
+            sampler=sampler,
+            sampling_name='span',
+            sampling_attributes=attributes)
+
+        self.assertTrue(tracer.should_sample())
+        sampler.should_sample_request.assert_called_with(
+            span_context, 'span', attributes)
+        self.assertFalse(sampler.should_sample.called)
+
     def test_get_tracer_noop_tracer(self):
         from opencensus.trace.tracers import noop_tracer
         sampler = mock.Mock()
@@ -115,6 +131,15 @@ class TestTracer(unittest.TestCase):
         assert isinstance(result, context_tracer.ContextTracer)
         self.assertTrue(tracer.span_context.trace_options.enabled)
 
+    def test_get_tracer_span_class(self):
+        from opencensus.trace.span import CompactSpan
+
+        sampler = mock.Mock()
+        sampler.should_sample.return_value = True
+        tracer = tracer_module.Tracer(sampler=sampler, span_class=CompactSpan)
+
+        self.assertIs(tracer.tracer.span_class, CompactSpan)
+
     def test_finish_not_sampled(self):
         from opencensus.trace.tracers import noop_tracer
 
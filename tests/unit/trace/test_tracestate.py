@@ -14,6 +14,9 @@
 
 import unittest
 
+import mock
+
+from opencensus.trace.propagation import tracestate_string_format
 from opencensus.trace.propagation.tracestate_string_format import (
     TracestateStringFormatter,
 )
@@ -79,6 +82,33 @@ class TestTracestate(unittest.TestCase):
 
         self.assertRaises(ValueError, lambda: formatter.from_string('#=#'))
 
+    def test_method_from_string_empty_members(self):
+        state = formatter.from_string(' foo=1 ,, \t,bar=2,')
+        self.assertEqual(formatter.to_string(state), 'foo=1,bar=2')
+
+    def test_method_from_string_invalid(self):
+        for header in ('foo', 'foo=1,bar', 'foo=bar=baz', 'foo=1\n',
+                       'FOO=1', 'foo=1,foo=2', 'foo=1 x,bar=\x01'):
+            self.assertRaises(ValueError, formatter.from_string, header)
+
+    def test_method_from_string_cache(self):
+        with mock.patch.object(tracestate_string_format, '_CACHE_SIZE', 2), \
+                mock.patch.object(tracestate_string_format, '_cache',
+                                  tracestate_string_format.OrderedDict()):
+            cache = tracestate_string_format._cache
+            first = formatter.from_string('foo=1')
+            # Tracestates from the cache can be changed independently
+            first['foo'] = '2'
+            self.assertEqual(formatter.from_string('foo=1')['foo'], '1')
+
+            self.assertRaises(ValueError, formatter.from_string, '#')
+            self.assertRaises(ValueError, formatter.from_string, '#')
+            self.assertEqual(list(cache), ['foo=1', '#'])
+
+            formatter.from_string('foo=1')
+            formatter.from_string('bar=1')
+            self.assertEqual(list(cache), ['foo=1', 'bar=1'])
+
     def test_method_get(self):
         state = formatter.from_string('foo=1, bar=2, baz=3')
         self.assertEqual(state.get('bar'), '2')
@@ -137,6 +167,10 @@ class TestTracestate(unittest.TestCase):
         self.assertRaises(ValueError, lambda: state.__setitem__('123', 'abc'))
         # key SHOULD NOT have uppercase
         self.assertRaises(ValueError, lambda: state.__setitem__('FOO', 'abc'))
+        # key SHOULD NOT have anything after a valid key
+        self.assertRaises(ValueError,
+                          lambda: state.__setitem__('foo bar', 'abc'))
+        self.assertRaises(ValueError, lambda: state.__setitem__('foo\n', 'a'))
 
         # value SHOULD be string
         self.assertRaises(ValueError, lambda: state.__setitem__('foo', 123))
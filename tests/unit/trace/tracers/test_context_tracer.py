@@ -104,6 +104,22 @@ class TestContextTracer(unittest.TestCase):
 
         self.assertEqual(tracer._spans_list, [])
 
+    def test_finish_with_compact_subspans(self):
+        exporter = mock.Mock()
+        tracer = context_tracer.ContextTracer(
+            exporter=exporter, span_class=span.CompactSpan)
+        parent = tracer.start_span('parent')
+        child = tracer.start_span('child')
+        self.assertIsInstance(parent, span.CompactSpan)
+        self.assertIs(child.parent_span, parent)
+
+        tracer.end_span()
+        self.assertIs(tracer.current_span(), parent)
+        tracer.finish()
+
+        self.assertEqual(tracer._spans_list, [])
+        self.assertEqual(exporter.export.call_count, 2)
+
     def test_end_leftover_spans(self):
         tracer = context_tracer.ContextTracer()
         tracer._spans_list = [span.Span(name='span')]